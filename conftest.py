@@ -0,0 +1,104 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import re
+
+import brownie.exceptions
+import brownie.network.contract
+import brownie.network.transaction
+import pytest
+from brownie._config import CONFIG
+
+from tools.error_decoder import decode_error_code
+
+_decode_typed_error = brownie.exceptions.decode_typed_error
+
+
+def decode_typed_error(data: str) -> str:
+    """revertデータをエラーコードに変換する
+
+    コントラクトはエラーコードをカスタムエラー IbetError(uint256) で返す。
+    Brownieは "IbetError: 110401" の形式でrevert理由を出力するため、
+    エラーコード（"110401"）に変換して brownie.reverts(revert_msg=...) で検証できるようにする。
+    """
+    code = decode_error_code(data)
+    return code if code is not None else _decode_typed_error(data)
+
+
+# transaction / contract モジュールは decode_typed_error を名前でインポートしているため、
+# インポート先のモジュールの属性も置き換える
+brownie.exceptions.decode_typed_error = decode_typed_error
+brownie.network.transaction.decode_typed_error = decode_typed_error
+brownie.network.contract.decode_typed_error = decode_typed_error
+
+
+def pytest_addoption(parser):
+    # テストを実行するEVM
+    parser.addoption(
+        "--evm-backend",
+        action="store",
+        choices=["hardhat", "eth-tester"],
+        default="hardhat",
+        help="EVM to run the tests against: a Hardhat node (JSON-RPC) "
+        "or an in-process eth-tester (py-evm) chain",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """テストを実行するEVMを設定する
+
+    - eth-tester: Hardhatノードを起動せず、テストプロセス内のEVMに接続する
+    - hardhat: pytest-xdistのワーカーごとに専用のHardhatノードを割り当てる
+
+    Brownieはワーカー番号をノードのポートに加算し、接続時にノードを起動する。
+    起動したノードはセッション終了時にBrownieが停止する。
+    アカウント（accountsフィクスチャ）は接続したノードから読み込まれるため、ワーカーごとに独立する。
+
+    NOTE: 既定のポート（8545）で起動済みのノードと衝突しないよう、ワーカーのポートは1つずらす
+    """
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None:
+        network_id = workerinput.get("network")
+    else:
+        network_id = (config.getoption("network", None) or [None])[0]
+    if network_id is None:
+        network_id = CONFIG.settings["networks"]["default"]
+    network = CONFIG.networks.get(network_id, {})
+    if "cmd" not in network:
+        # ノードを起動しないネットワーク（live）は対象外
+        return
+
+    if config.getoption("evm_backend") == "eth-tester":
+        from tests import eth_tester_backend
+
+        eth_tester_backend.register()
+        network["cmd"] = eth_tester_backend.LAUNCH_COMMAND
+        # 起動済みのノードに接続しないよう、接続できないホストを指定する
+        network["host"] = "http://127.0.0.1:0"
+        return
+
+    if workerinput is None:
+        return
+
+    cmd_settings = network.setdefault("cmd_settings", {})
+    cmd_settings["port"] = int(cmd_settings.get("port", 8545)) + 1
+
+    # 接続先のポートはcmd_settingsのポートを利用させる
+    network["host"] = re.sub(r":\d+/?$", "", network["host"])
@@ -39,7 +39,8 @@ contract Ownable {
 
     /// @notice オーナー権限チェック
     modifier onlyOwner() {
-        require(msg.sender == owner, ErrorCode.ERR_Ownable_onlyOwner_500001);
+        if (msg.sender != owner)
+            revert IbetError(ErrorCode.ERR_Ownable_onlyOwner_500001);
         _;
     }
 
@@ -47,10 +48,8 @@ contract Ownable {
     /// @dev オーナーのみ実行可能
     /// @param newOwner 新しいオーナー
     function transferOwnership(address newOwner) public onlyOwner {
-        require(
-            newOwner != address(0),
-            ErrorCode.ERR_Ownable_transferOwnership_500101
-        );
+        if (newOwner == address(0))
+            revert IbetError(ErrorCode.ERR_Ownable_transferOwnership_500101);
         emit OwnershipTransferred(owner, newOwner);
         owner = newOwner;
     }
@@ -21,10 +21,13 @@ pragma solidity ^0.8.23;
 
 import "../access/Ownable.sol";
 import "../utils/Errors.sol";
+import "../utils/UintList.sol";
 
 /// @title DVPコントラクトのステートを永続化するためのEternalStorage
 /// @dev Storageのアクセスは認可したDVPコントラクトに限定する
 contract DVPStorage is Ownable {
+    using UintList for UintList.List;
+
     constructor() {}
 
     // -------------------------------------------------------------------
@@ -43,10 +46,8 @@ contract DVPStorage is Ownable {
 
     /// @dev 実行者が最新バージョンのDVPコントラクトアドレスであることをチェック
     modifier onlyLatestVersion() {
-        require(
-            msg.sender == latestVersion,
-            ErrorCode.ERR_DVPStorage_onlyLatestVersion_250001
-        );
+        if (msg.sender != latestVersion)
+            revert IbetError(ErrorCode.ERR_DVPStorage_onlyLatestVersion_250001);
         _;
     }
 
@@ -173,6 +174,19 @@ contract DVPStorage is Ownable {
         bool _confirmed,
         bool _valid
     ) public onlyLatestVersion {
+        // 無効になった場合、または当事者が変わった場合はインデックスから削除する
+        bool _indexed = openDeliveryIndexed[_deliveryId];
+        if (
+            _indexed &&
+            (!_valid ||
+                delivery[_deliveryId].seller != _seller ||
+                delivery[_deliveryId].buyer != _buyer ||
+                delivery[_deliveryId].agent != _agent)
+        ) {
+            removeOpenDelivery(_deliveryId);
+            _indexed = false;
+        }
+
         delivery[_deliveryId].token = _token;
         delivery[_deliveryId].seller = _seller;
         delivery[_deliveryId].buyer = _buyer;
@@ -180,6 +194,10 @@ contract DVPStorage is Ownable {
         delivery[_deliveryId].agent = _agent;
         delivery[_deliveryId].confirmed = _confirmed;
         delivery[_deliveryId].valid = _valid;
+
+        if (_valid && !_indexed) {
+            addOpenDelivery(_deliveryId);
+        }
     }
 
     /// @notice DVP情報の取得
@@ -216,4 +234,113 @@ contract DVPStorage is Ownable {
             delivery[_deliveryId].valid
         );
     }
+
+    // -------------------------------------------------------------------
+    // 未完了のDVP情報のインデックス
+    // -------------------------------------------------------------------
+
+    /// 決済エージェント別の未完了の決済ID
+    /// agent => UintList.List
+    mapping(address => UintList.List) private agentOpenDeliveries;
+
+    /// 売り方別の未完了の決済ID
+    /// seller => UintList.List
+    mapping(address => UintList.List) private sellerOpenDeliveries;
+
+    /// 買い方別の未完了の決済ID
+    /// buyer => UintList.List
+    mapping(address => UintList.List) private buyerOpenDeliveries;
+
+    /// インデックスへの登録状態
+    /// deliveryId => 登録済み
+    mapping(uint256 => bool) private openDeliveryIndexed;
+
+    /// @notice 決済エージェント別の未完了の決済数の参照
+    /// @param _agent 決済エージェント
+    /// @return 未完了の決済数
+    function getOpenDeliveryCountByAgent(
+        address _agent
+    ) public view returns (uint256) {
+        return agentOpenDeliveries[_agent].length();
+    }
+
+    /// @notice 決済エージェント別の未完了の決済IDの範囲参照
+    /// @dev 範囲外の場合は取得可能な件数のみを返す
+    /// @param _agent 決済エージェント
+    /// @param _offset 開始位置
+    /// @param _limit 最大取得件数
+    /// @return 決済IDのリスト
+    function getOpenDeliveriesByAgent(
+        address _agent,
+        uint256 _offset,
+        uint256 _limit
+    ) public view returns (uint256[] memory) {
+        return agentOpenDeliveries[_agent].slice(_offset, _limit);
+    }
+
+    /// @notice 売り方別の未完了の決済数の参照
+    /// @param _seller 売り方
+    /// @return 未完了の決済数
+    function getOpenDeliveryCountBySeller(
+        address _seller
+    ) public view returns (uint256) {
+        return sellerOpenDeliveries[_seller].length();
+    }
+
+    /// @notice 売り方別の未完了の決済IDの範囲参照
+    /// @dev 範囲外の場合は取得可能な件数のみを返す
+    /// @param _seller 売り方
+    /// @param _offset 開始位置
+    /// @param _limit 最大取得件数
+    /// @return 決済IDのリスト
+    function getOpenDeliveriesBySeller(
+        address _seller,
+        uint256 _offset,
+        uint256 _limit
+    ) public view returns (uint256[] memory) {
+        return sellerOpenDeliveries[_seller].slice(_offset, _limit);
+    }
+
+    /// @notice 買い方別の未完了の決済数の参照
+    /// @param _buyer 買い方
+    /// @return 未完了の決済数
+    function getOpenDeliveryCountByBuyer(
+        address _buyer
+    ) public view returns (uint256) {
+        return buyerOpenDeliveries[_buyer].length();
+    }
+
+    /// @notice 買い方別の未完了の決済IDの範囲参照
+    /// @dev 範囲外の場合は取得可能な件数のみを返す
+    /// @param _buyer 買い方
+    /// @param _offset 開始位置
+    /// @param _limit 最大取得件数
+    /// @return 決済IDのリスト
+    function getOpenDeliveriesByBuyer(
+        address _buyer,
+        uint256 _offset,
+        uint256 _limit
+    ) public view returns (uint256[] memory) {
+        return buyerOpenDeliveries[_buyer].slice(_offset, _limit);
+    }
+
+    /// @dev 決済IDを各インデックスに追加する
+    /// @param _deliveryId 決済ID
+    function addOpenDelivery(uint256 _deliveryId) private {
+        Delivery storage _delivery = delivery[_deliveryId];
+        agentOpenDeliveries[_delivery.agent].add(_deliveryId);
+        sellerOpenDeliveries[_delivery.seller].add(_deliveryId);
+        buyerOpenDeliveries[_delivery.buyer].add(_deliveryId);
+        openDeliveryIndexed[_deliveryId] = true;
+    }
+
+    /// @dev 決済IDを各インデックスから削除する
+    /// @param _deliveryId 決済ID
+    function removeOpenDelivery(uint256 _deliveryId) private {
+        Delivery storage _delivery = delivery[_deliveryId];
+        agentOpenDeliveries[_delivery.agent].remove(_deliveryId);
+        sellerOpenDeliveries[_delivery.seller].remove(_deliveryId);
+        buyerOpenDeliveries[_delivery.buyer].remove(_deliveryId);
+        openDeliveryIndexed[_deliveryId] = false;
+    }
 }
@@ -21,10 +21,13 @@ pragma solidity ^0.8.23;
 
 import "../access/Ownable.sol";
 import "../utils/Errors.sol";
+import "../utils/UintList.sol";
 
 /// @title Escrowコントラクトのステートを永続化するためのEternalStorage
 /// @dev Storageのアクセスは認可したEscrowコントラクトに限定する
 contract EscrowStorage is Ownable {
+    using UintList for UintList.List;
+
     constructor() {}
 
     // -------------------------------------------------------------------
@@ -43,10 +46,10 @@ contract EscrowStorage is Ownable {
 
     /// @dev 実行者が最新バージョンのEscrowアドレスであることをチェック
     modifier onlyLatestVersion() {
-        require(
-            msg.sender == latestVersion,
-            ErrorCode.ERR_EscrowStorage_onlyLatestVersion_220001
-        );
+        if (msg.sender != latestVersion)
+            revert IbetError(
+                ErrorCode.ERR_EscrowStorage_onlyLatestVersion_220001
+            );
         _;
     }
 
@@ -242,12 +245,25 @@ contract EscrowStorage is Ownable {
         bool _escrowFinished,
         bool _approved
     ) public onlyLatestVersion {
+        // 承認待ちではなくなった場合、またはトークンが変わった場合はインデックスから削除する
+        bool _pending = _valid && _escrowFinished && !_approved;
+        address _indexedToken = applicationsForTransfer[_escrowId].token;
+        bool _indexed = pendingApplications[_indexedToken].contains(_escrowId);
+        if (_indexed && (!_pending || _indexedToken != _token)) {
+            pendingApplications[_indexedToken].remove(_escrowId);
+            _indexed = false;
+        }
+
         applicationsForTransfer[_escrowId].token = _token;
         applicationsForTransfer[_escrowId].applicationData = _applicationData;
         applicationsForTransfer[_escrowId].approvalData = _approvalData;
         applicationsForTransfer[_escrowId].valid = _valid;
         applicationsForTransfer[_escrowId].escrowFinished = _escrowFinished;
         applicationsForTransfer[_escrowId].approved = _approved;
+
+        if (_pending && !_indexed) {
+            pendingApplications[_token].add(_escrowId);
+        }
     }
 
     /// @notice 移転申請情報参照
@@ -281,4 +297,35 @@ contract EscrowStorage is Ownable {
             applicationsForTransfer[_escrowId].approved
         );
     }
+
+    // -------------------------------------------------------------------
+    // 承認待ちの移転申請のインデックス
+    // -------------------------------------------------------------------
+
+    /// トークン別の承認待ちの移転申請（申請有効、エスクロー完了済、かつ未承認）
+    /// token => UintList.List
+    mapping(address => UintList.List) private pendingApplications;
+
+    /// @notice トークン別の承認待ちの移転申請数の参照
+    /// @param _token トークンアドレス
+    /// @return 承認待ちの移転申請数
+    function getPendingApplicationCount(
+        address _token
+    ) public view returns (uint256) {
+        return pendingApplications[_token].length();
+    }
+
+    /// @notice トークン別の承認待ちの移転申請の範囲参照
+    /// @dev 範囲外の場合は取得可能な件数のみを返す
+    /// @param _token トークンアドレス
+    /// @param _offset 開始位置
+    /// @param _limit 最大取得件数
+    /// @return escrowIds エスクローIDのリスト
+    function getPendingApplications(
+        address _token,
+        uint256 _offset,
+        uint256 _limit
+    ) public view returns (uint256[] memory escrowIds) {
+        return pendingApplications[_token].slice(_offset, _limit);
+    }
 }
@@ -43,10 +43,10 @@ contract ExchangeStorage is Ownable {
 
     /// @dev 実行者が最新バージョンのExchangeアドレスであることをチェック
     modifier onlyLatestVersion() {
-        require(
-            msg.sender == latestVersion,
-            ErrorCode.ERR_ExchangeStorage_onlyLatestVersion_200001
-        );
+        if (msg.sender != latestVersion)
+            revert IbetError(
+                ErrorCode.ERR_ExchangeStorage_onlyLatestVersion_200001
+            );
         _;
     }
 
@@ -0,0 +1,81 @@
+/**
+ * Copyright BOOSTRY Co., Ltd.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ *
+ * You may obtain a copy of the License at
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing,
+ * software distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ */
+
+pragma solidity ^0.8.23;
+
+/// @title ExchangeStorageV2のModel
+/// @dev 構造体はスロット数が最小となるようにフィールドを並べている
+contract ExchangeStorageModel {
+    // 注文情報
+    // slot0: owner(20) + isBuy(1) + canceled(1) + latestAgreementId(8)
+    // slot1: token
+    // slot2: agent
+    // slot3: amount
+    // slot4: price
+    struct Order {
+        address owner; // 注文実行者
+        bool isBuy; // 売買区分（買：True）
+        bool canceled; // キャンセル済み状態
+        uint64 latestAgreementId; // 直近約定ID
+        address token; // トークンアドレス
+        address agent; // 決済業者のアドレス
+        uint256 amount; // 注文数量
+        uint256 price; // 注文単価
+    }
+
+    // 約定情報
+    // slot0: counterpart(20) + canceled(1) + paid(1) + expiry(8)
+    // slot1: amount
+    // slot2: price
+    struct Agreement {
+        address counterpart; // 約定相手
+        bool canceled; // キャンセル済み状態
+        bool paid; // 支払済状態
+        uint64 expiry; // 有効期限（約定から１４日）
+        uint256 amount; // 約定数量
+        uint256 price; // 約定単価
+    }
+
+    // 板情報の価格帯
+    // 同一価格の未約定注文を注文順（FIFO）の双方向リストで保持する
+    // 価格帯同士は優先順（買：高い順、売：安い順）の双方向リストで連結する
+    // slot0: headOrderId
+    // slot1: tailOrderId
+    // slot2: betterPrice
+    // slot3: worsePrice
+    // slot4: hasBetter(1) + hasWorse(1)
+    struct PriceLevel {
+        uint256 headOrderId; // 先頭の注文ID（0の場合は価格帯なし）
+        uint256 tailOrderId; // 末尾の注文ID
+        uint256 betterPrice; // 一つ優先度の高い価格帯の価格
+        uint256 worsePrice; // 一つ優先度の低い価格帯の価格
+        bool hasBetter; // 優先度の高い価格帯の有無
+        bool hasWorse; // 優先度の低い価格帯の有無
+    }
+
+    // 板情報（トークン・売買区分別）
+    // slot0: bestPrice
+    // slot1: openOrderCount
+    // slot2: hasBest(1)
+    struct OrderBookSide {
+        uint256 bestPrice; // 最良気配の価格
+        uint256 openOrderCount; // 未約定注文数
+        bool hasBest; // 最良気配の有無
+    }
+}
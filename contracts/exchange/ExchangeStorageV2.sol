@@ -0,0 +1,844 @@
+/**
+ * Copyright BOOSTRY Co., Ltd.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ *
+ * You may obtain a copy of the License at
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing,
+ * software distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ */
+
+pragma solidity ^0.8.23;
+
+import "OpenZeppelin/openzeppelin-contracts@4.9.3/contracts/utils/math/SafeCast.sol";
+import "./ExchangeStorage.sol";
+import "./ExchangeStorageModel.sol";
+import "../access/Ownable.sol";
+import "../utils/Errors.sol";
+
+/// @title Exchangeコントラクトの取引情報を永続化するためのEternalStorage（V2）
+/// @dev Storageのアクセスは認可したExchangeコントラクト限定
+/// @dev 注文情報・約定情報はパックされた構造体単位で読み書きする
+contract ExchangeStorageV2 is Ownable, ExchangeStorageModel {
+    constructor() {}
+
+    // -------------------------------------------------------------------
+    // 最新バージョンのExchangeコントラクトアドレス
+    // -------------------------------------------------------------------
+
+    // 最新バージョンのExchangeコントラクトアドレス
+    address public latestVersion;
+
+    /// @notice Exchangeコントラクトのバージョン更新
+    /// @dev コントラクトオーナーのみ実行が可能
+    /// @param _newVersion 新しいExchangeコントラクトのアドレス
+    function upgradeVersion(address _newVersion) public onlyOwner {
+        latestVersion = _newVersion;
+    }
+
+    /// @dev 実行者が最新バージョンのExchangeアドレスであることをチェック
+    modifier onlyLatestVersion() {
+        if (msg.sender != latestVersion)
+            revert IbetError(
+                ErrorCode.ERR_ExchangeStorageV2_onlyLatestVersion_270001
+            );
+        _;
+    }
+
+    // -------------------------------------------------------------------
+    // 残高数量
+    // -------------------------------------------------------------------
+
+    // 残高情報
+    // account => token => balance
+    mapping(address => mapping(address => uint256)) private balances;
+
+    /// @notice 残高の更新
+    /// @dev 最新バージョンのExchangeコントラクトのみ実行が可能
+    /// @param _account アドレス
+    /// @param _token トークンアドレス
+    /// @param _value 更新後の残高数量
+    /// @return 処理結果
+    function setBalance(
+        address _account,
+        address _token,
+        uint256 _value
+    ) public onlyLatestVersion returns (bool) {
+        balances[_account][_token] = _value;
+        return true;
+    }
+
+    /// @notice 残高数量の参照
+    /// @param _account アドレス
+    /// @param _token トークンアドレス
+    /// @return 残高数量
+    function getBalance(
+        address _account,
+        address _token
+    ) public view returns (uint256) {
+        return balances[_account][_token];
+    }
+
+    // -------------------------------------------------------------------
+    // 拘束数量
+    // -------------------------------------------------------------------
+
+    // 拘束数量
+    // account => token => order commitment
+    mapping(address => mapping(address => uint256)) private commitments;
+
+    /// @notice 拘束数量の更新
+    /// @dev 最新バージョンのExchangeコントラクトのみ実行が可能
+    /// @param _account アドレス
+    /// @param _token トークンアドレス
+    /// @param _value 更新後の残高数量
+    function setCommitment(
+        address _account,
+        address _token,
+        uint256 _value
+    ) public onlyLatestVersion {
+        commitments[_account][_token] = _value;
+    }
+
+    /// @notice 拘束数量の参照
+    /// @param _account アドレス
+    /// @param _token トークンアドレス
+    /// @return 拘束数量
+    function getCommitment(
+        address _account,
+        address _token
+    ) public view returns (uint256) {
+        return commitments[_account][_token];
+    }
+
+    // -------------------------------------------------------------------
+    // 注文情報
+    // -------------------------------------------------------------------
+
+    // 注文情報
+    // orderId => order
+    mapping(uint256 => ExchangeStorageModel.Order) private orderBook;
+
+    /// @notice 注文情報の更新
+    /// @dev 最新バージョンのExchangeコントラクトのみ実行が可能
+    /// @param _orderId 注文ID
+    /// @param _order 注文情報
+    function setOrder(
+        uint256 _orderId,
+        ExchangeStorageModel.Order memory _order
+    ) public onlyLatestVersion {
+        orderBook[_orderId] = _order;
+        syncOpenOrder(_orderId, 0, MAX_PRICE_LEVEL_SEARCH);
+    }
+
+    /// @notice 注文情報の更新（価格帯の挿入位置のヒント指定）
+    /// @dev 最新バージョンのExchangeコントラクトのみ実行が可能
+    /// @param _orderId 注文ID
+    /// @param _order 注文情報
+    /// @param _hintPrice 挿入位置の近傍の価格帯の価格（getPriceLevelHint）
+    function setOrderWithHint(
+        uint256 _orderId,
+        ExchangeStorageModel.Order memory _order,
+        uint256 _hintPrice
+    ) public onlyLatestVersion {
+        orderBook[_orderId] = _order;
+        syncOpenOrder(_orderId, _hintPrice, MAX_PRICE_LEVEL_SEARCH);
+    }
+
+    /// @notice 注文情報の参照
+    /// @param _orderId 注文ID
+    /// @return 注文情報
+    function getOrder(
+        uint256 _orderId
+    ) public view returns (ExchangeStorageModel.Order memory) {
+        return orderBook[_orderId];
+    }
+
+    // -------------------------------------------------------------------
+    // 直近注文ID
+    // -------------------------------------------------------------------
+
+    // 直近注文ID
+    uint256 private latestOrderId = 0;
+
+    /// @notice 直近注文IDの更新
+    /// @dev 最新バージョンのExchangeコントラクトのみ実行が可能
+    /// @param _latestOrderId 直近注文ID
+    function setLatestOrderId(uint256 _latestOrderId) public onlyLatestVersion {
+        latestOrderId = _latestOrderId;
+    }
+
+    /// @notice 直近注文IDの参照
+    /// @return 直近注文ID
+    function getLatestOrderId() public view returns (uint256) {
+        return latestOrderId;
+    }
+
+    // -------------------------------------------------------------------
+    // 約定情報
+    // -------------------------------------------------------------------
+
+    // 約定情報
+    // orderId => agreementId => Agreement
+    mapping(uint256 => mapping(uint256 => ExchangeStorageModel.Agreement))
+        private agreements;
+
+    /// @notice 約定情報の更新
+    /// @dev 最新バージョンのExchangeコントラクトのみ実行が可能
+    /// @param _orderId 注文ID
+    /// @param _agreementId 約定ID
+    /// @param _agreement 約定情報
+    function setAgreement(
+        uint256 _orderId,
+        uint256 _agreementId,
+        ExchangeStorageModel.Agreement memory _agreement
+    ) public onlyLatestVersion {
+        agreements[_orderId][_agreementId] = _agreement;
+    }
+
+    /// @notice 約定情報の参照
+    /// @param _orderId 注文ID
+    /// @param _agreementId 約定ID
+    /// @return 約定情報
+    function getAgreement(
+        uint256 _orderId,
+        uint256 _agreementId
+    ) public view returns (ExchangeStorageModel.Agreement memory) {
+        return agreements[_orderId][_agreementId];
+    }
+
+    /// @notice 直近約定IDの参照
+    /// @dev 直近約定IDは注文情報のslot0にパックして保持している
+    /// @param _orderId 注文ID
+    /// @return 直近約定ID
+    function getLatestAgreementId(
+        uint256 _orderId
+    ) public view returns (uint256) {
+        return orderBook[_orderId].latestAgreementId;
+    }
+
+    // -------------------------------------------------------------------
+    // 注文情報・約定情報の一括アクセス
+    // -------------------------------------------------------------------
+
+    /// @notice 注文情報と約定情報の一括更新
+    /// @dev 最新バージョンのExchangeコントラクトのみ実行が可能
+    /// @param _orderId 注文ID
+    /// @param _order 注文情報
+    /// @param _agreementId 約定ID
+    /// @param _agreement 約定情報
+    function setOrderAndAgreement(
+        uint256 _orderId,
+        ExchangeStorageModel.Order memory _order,
+        uint256 _agreementId,
+        ExchangeStorageModel.Agreement memory _agreement
+    ) public onlyLatestVersion {
+        orderBook[_orderId] = _order;
+        agreements[_orderId][_agreementId] = _agreement;
+        syncOpenOrder(_orderId, 0, MAX_PRICE_LEVEL_SEARCH);
+    }
+
+    /// @notice 注文情報と約定情報の一括更新（価格帯の挿入位置のヒント指定）
+    /// @dev 最新バージョンのExchangeコントラクトのみ実行が可能
+    /// @param _orderId 注文ID
+    /// @param _order 注文情報
+    /// @param _agreementId 約定ID
+    /// @param _agreement 約定情報
+    /// @param _hintPrice 挿入位置の近傍の価格帯の価格（getPriceLevelHint）
+    function setOrderAndAgreementWithHint(
+        uint256 _orderId,
+        ExchangeStorageModel.Order memory _order,
+        uint256 _agreementId,
+        ExchangeStorageModel.Agreement memory _agreement,
+        uint256 _hintPrice
+    ) public onlyLatestVersion {
+        orderBook[_orderId] = _order;
+        agreements[_orderId][_agreementId] = _agreement;
+        syncOpenOrder(_orderId, _hintPrice, MAX_PRICE_LEVEL_SEARCH);
+    }
+
+    /// @notice 注文情報と約定情報の一括参照
+    /// @param _orderId 注文ID
+    /// @param _agreementId 約定ID
+    /// @return 注文情報
+    /// @return 約定情報
+    function getOrderAndAgreement(
+        uint256 _orderId,
+        uint256 _agreementId
+    )
+        public
+        view
+        returns (
+            ExchangeStorageModel.Order memory,
+            ExchangeStorageModel.Agreement memory
+        )
+    {
+        return (orderBook[_orderId], agreements[_orderId][_agreementId]);
+    }
+
+    // -------------------------------------------------------------------
+    // 現在値
+    // -------------------------------------------------------------------
+
+    // 現在値
+    // token => latest_price
+    mapping(address => uint256) private lastPrice;
+
+    /// @notice 現在値の更新
+    /// @dev 最新バージョンのExchangeコントラクトのみ実行が可能
+    /// @param _token トークンアドレス
+    /// @param _value 現在値
+    function setLastPrice(
+        address _token,
+        uint256 _value
+    ) public onlyLatestVersion {
+        lastPrice[_token] = _value;
+    }
+
+    /// @notice 現在値の参照
+    /// @param _token トークンアドレス
+    /// @return 現在値
+    function getLastPrice(address _token) public view returns (uint256) {
+        return lastPrice[_token];
+    }
+
+    // -------------------------------------------------------------------
+    // 板情報（未約定注文のインデックス）
+    // -------------------------------------------------------------------
+
+    // 板情報
+    // token => isBuy => OrderBookSide
+    mapping(address => mapping(bool => ExchangeStorageModel.OrderBookSide))
+        private orderBookSides;
+
+    // 価格帯情報
+    // token => isBuy => price => PriceLevel
+    mapping(address => mapping(bool => mapping(uint256 => ExchangeStorageModel.PriceLevel)))
+        private priceLevels;
+
+    // 同一価格帯内の前後の注文ID（0の場合は無し）
+    // orderId => orderId
+    mapping(uint256 => uint256) private prevOpenOrderId;
+    mapping(uint256 => uint256) private nextOpenOrderId;
+
+    // 板への登録状態
+    // orderId => 登録済み
+    mapping(uint256 => bool) private openOrderIndexed;
+
+    /// 価格帯の挿入位置の探索で辿る価格帯数の上限
+    /// @dev 上限を超える場合は挿入位置の近傍のヒントの指定が必要となる
+    uint256 public constant MAX_PRICE_LEVEL_SEARCH = 32;
+
+    /// @notice 最良気配の参照
+    /// @dev 買注文は最も高い価格、売注文は最も安い価格の価格帯を最良気配とする
+    /// @param _token トークンアドレス
+    /// @param _isBuy 売買区分（買：True）
+    /// @return price 最良気配の価格
+    /// @return orderId 最良気配で最も早い注文の注文ID（未約定注文が無い場合は0）
+    function getBestOrder(
+        address _token,
+        bool _isBuy
+    ) public view returns (uint256 price, uint256 orderId) {
+        ExchangeStorageModel.OrderBookSide storage side = orderBookSides[
+            _token
+        ][_isBuy];
+        if (!side.hasBest) {
+            return (0, 0);
+        }
+        price = side.bestPrice;
+        orderId = priceLevels[_token][_isBuy][price].headOrderId;
+    }
+
+    /// @notice 未約定注文数の参照
+    /// @param _token トークンアドレス
+    /// @param _isBuy 売買区分（買：True）
+    /// @return 未約定注文数
+    function getOpenOrderCount(
+        address _token,
+        bool _isBuy
+    ) public view returns (uint256) {
+        return orderBookSides[_token][_isBuy].openOrderCount;
+    }
+
+    /// @notice 未約定注文の範囲参照
+    /// @dev 価格優先・時間優先の順で、カーソルの注文の次の注文から注文IDを返す
+    /// @dev 次のページは前のページの最後の注文IDをカーソルとして取得する
+    /// @param _token トークンアドレス
+    /// @param _isBuy 売買区分（買：True）
+    /// @param _cursorOrderId カーソルの注文ID（0の場合は最良気配の先頭から取得）
+    /// @param _limit 最大取得件数
+    /// @return orderIds 注文IDのリスト
+    function getOpenOrders(
+        address _token,
+        bool _isBuy,
+        uint256 _cursorOrderId,
+        uint256 _limit
+    ) public view returns (uint256[] memory orderIds) {
+        mapping(uint256 => ExchangeStorageModel.PriceLevel)
+            storage levels = priceLevels[_token][_isBuy];
+
+        uint256 _price;
+        uint256 _orderId;
+        if (_cursorOrderId == 0) {
+            _price = orderBookSides[_token][_isBuy].bestPrice;
+            _orderId = levels[_price].headOrderId;
+        } else {
+            // チェック：カーソルの注文が対象の板に登録されていること
+            ExchangeStorageModel.Order storage cursor = orderBook[
+                _cursorOrderId
+            ];
+            if (
+                !openOrderIndexed[_cursorOrderId] ||
+                cursor.token != _token ||
+                cursor.isBuy != _isBuy
+            )
+                revert IbetError(
+                    ErrorCode.ERR_ExchangeStorageV2_getOpenOrders_270401
+                );
+            (_price, _orderId) = nextOpenOrder(
+                levels,
+                cursor.price,
+                _cursorOrderId
+            );
+        }
+
+        uint256 _openOrderCount = orderBookSides[_token][_isBuy].openOrderCount;
+        if (_limit > _openOrderCount) {
+            _limit = _openOrderCount;
+        }
+        uint256[] memory _buffer = new uint256[](_limit);
+        uint256 _count = 0;
+        while (_count < _limit && _orderId != 0) {
+            _buffer[_count++] = _orderId;
+            (_price, _orderId) = nextOpenOrder(levels, _price, _orderId);
+        }
+
+        orderIds = new uint256[](_count);
+        for (uint256 i = 0; i < _count; i++) {
+            orderIds[i] = _buffer[i];
+        }
+    }
+
+    /// @notice 価格帯の挿入位置のヒントの参照
+    /// @dev 指定した価格より優先度の高い価格帯のうち、最も優先度の低い価格帯の価格を返す
+    /// @dev setOrderWithHint等に指定すると、価格帯の挿入位置の探索を省略できる
+    /// @param _token トークンアドレス
+    /// @param _isBuy 売買区分（買：True）
+    /// @param _price 価格
+    /// @return 挿入位置の直前の価格帯の価格（該当する価格帯が無い場合は0）
+    function getPriceLevelHint(
+        address _token,
+        bool _isBuy,
+        uint256 _price
+    ) public view returns (uint256) {
+        ExchangeStorageModel.OrderBookSide storage side = orderBookSides[
+            _token
+        ][_isBuy];
+        if (!side.hasBest || !isBetterPrice(_isBuy, side.bestPrice, _price)) {
+            return 0;
+        }
+        mapping(uint256 => ExchangeStorageModel.PriceLevel)
+            storage levels = priceLevels[_token][_isBuy];
+        uint256 _cursor = side.bestPrice;
+        while (
+            levels[_cursor].hasWorse &&
+            isBetterPrice(_isBuy, levels[_cursor].worsePrice, _price)
+        ) {
+            _cursor = levels[_cursor].worsePrice;
+        }
+        return _cursor;
+    }
+
+    /// @dev 価格優先・時間優先の順で次の未約定注文を取得する
+    /// @param levels 価格帯情報
+    /// @param _price 注文の価格
+    /// @param _orderId 注文ID
+    /// @return 次の注文の価格
+    /// @return 次の注文ID（次の注文が無い場合は0）
+    function nextOpenOrder(
+        mapping(uint256 => ExchangeStorageModel.PriceLevel) storage levels,
+        uint256 _price,
+        uint256 _orderId
+    ) private view returns (uint256, uint256) {
+        uint256 _next = nextOpenOrderId[_orderId];
+        if (_next == 0 && levels[_price].hasWorse) {
+            _price = levels[_price].worsePrice;
+            _next = levels[_price].headOrderId;
+        }
+        return (_price, _next);
+    }
+
+    /// @dev 注文情報の更新に合わせて板情報を更新する
+    /// @dev キャンセルされておらず注文数量が残っている注文のみを板に登録する
+    /// @param _orderId 注文ID
+    /// @param _hintPrice 価格帯の挿入位置のヒント
+    /// @param _maxSearch 挿入位置の探索で辿る価格帯数の上限
+    function syncOpenOrder(
+        uint256 _orderId,
+        uint256 _hintPrice,
+        uint256 _maxSearch
+    ) private {
+        ExchangeStorageModel.Order storage order = orderBook[_orderId];
+        bool _isOpen = _orderId != 0 && !order.canceled && order.amount > 0;
+        if (_isOpen == openOrderIndexed[_orderId]) {
+            return;
+        }
+        if (_isOpen) {
+            addOpenOrder(
+                order.token,
+                order.isBuy,
+                order.price,
+                _orderId,
+                _hintPrice,
+                _maxSearch
+            );
+        } else {
+            removeOpenOrder(order.token, order.isBuy, order.price, _orderId);
+        }
+        openOrderIndexed[_orderId] = _isOpen;
+    }
+
+    /// @dev 価格帯の末尾に注文を追加する
+    /// @param _token トークンアドレス
+    /// @param _isBuy 売買区分（買：True）
+    /// @param _price 注文単価
+    /// @param _orderId 注文ID
+    /// @param _hintPrice 価格帯の挿入位置のヒント
+    /// @param _maxSearch 挿入位置の探索で辿る価格帯数の上限
+    function addOpenOrder(
+        address _token,
+        bool _isBuy,
+        uint256 _price,
+        uint256 _orderId,
+        uint256 _hintPrice,
+        uint256 _maxSearch
+    ) private {
+        ExchangeStorageModel.PriceLevel storage level = priceLevels[_token][
+            _isBuy
+        ][_price];
+        if (level.headOrderId == 0) {
+            insertPriceLevel(_token, _isBuy, _price, _hintPrice, _maxSearch);
+            level.headOrderId = _orderId;
+        } else {
+            nextOpenOrderId[level.tailOrderId] = _orderId;
+            prevOpenOrderId[_orderId] = level.tailOrderId;
+        }
+        level.tailOrderId = _orderId;
+        orderBookSides[_token][_isBuy].openOrderCount++;
+    }
+
+    /// @dev 価格帯から注文を削除する
+    /// @dev 価格帯の注文が無くなった場合は価格帯も削除する
+    /// @param _token トークンアドレス
+    /// @param _isBuy 売買区分（買：True）
+    /// @param _price 注文単価
+    /// @param _orderId 注文ID
+    function removeOpenOrder(
+        address _token,
+        bool _isBuy,
+        uint256 _price,
+        uint256 _orderId
+    ) private {
+        ExchangeStorageModel.PriceLevel storage level = priceLevels[_token][
+            _isBuy
+        ][_price];
+        uint256 _prev = prevOpenOrderId[_orderId];
+        uint256 _next = nextOpenOrderId[_orderId];
+        if (_prev == 0) {
+            level.headOrderId = _next;
+        } else {
+            nextOpenOrderId[_prev] = _next;
+        }
+        if (_next == 0) {
+            level.tailOrderId = _prev;
+        } else {
+            prevOpenOrderId[_next] = _prev;
+        }
+        delete prevOpenOrderId[_orderId];
+        delete nextOpenOrderId[_orderId];
+        orderBookSides[_token][_isBuy].openOrderCount--;
+
+        if (level.headOrderId == 0) {
+            removePriceLevel(_token, _isBuy, _price);
+        }
+    }
+
+    /// @dev 価格帯を優先順の位置に挿入する
+    /// @dev ヒントの価格帯が存在する場合はヒントから、存在しない場合は最良気配から挿入位置を探索する
+    /// @dev ヒントが挿入位置の直前の価格帯の場合、探索はO(1)で完了する
+    /// @dev 辿った価格帯数が上限を超える場合はREVERTする
+    /// @param _token トークンアドレス
+    /// @param _isBuy 売買区分（買：True）
+    /// @param _price 価格
+    /// @param _hintPrice 挿入位置の近傍の価格帯の価格
+    /// @param _maxSearch 挿入位置の探索で辿る価格帯数の上限
+    function insertPriceLevel(
+        address _token,
+        bool _isBuy,
+        uint256 _price,
+        uint256 _hintPrice,
+        uint256 _maxSearch
+    ) private {
+        ExchangeStorageModel.OrderBookSide storage side = orderBookSides[
+            _token
+        ][_isBuy];
+        mapping(uint256 => ExchangeStorageModel.PriceLevel)
+            storage levels = priceLevels[_token][_isBuy];
+        ExchangeStorageModel.PriceLevel storage level = levels[_price];
+
+        // 最良気配として先頭に挿入
+        if (!side.hasBest || isBetterPrice(_isBuy, _price, side.bestPrice)) {
+            if (side.hasBest) {
+                level.hasWorse = true;
+                level.worsePrice = side.bestPrice;
+                levels[side.bestPrice].hasBetter = true;
+                levels[side.bestPrice].betterPrice = _price;
+            }
+            side.bestPrice = _price;
+            side.hasBest = true;
+            return;
+        }
+
+        // 挿入位置の直前（より優先度の高い価格帯）を探索
+        uint256 _cursor = side.bestPrice;
+        uint256 _searched = 0;
+        if (levels[_hintPrice].headOrderId != 0) {
+            // ヒントの価格帯から優先度の高い方向へ探索
+            // 最良気配は挿入する価格より優先度が高いため、最良気配までに探索が終了する
+            _cursor = _hintPrice;
+            while (!isBetterPrice(_isBuy, _cursor, _price)) {
+                _cursor = levels[_cursor].betterPrice;
+                _searched = countSearch(_searched, _maxSearch);
+            }
+        }
+        while (
+            levels[_cursor].hasWorse &&
+            isBetterPrice(_isBuy, levels[_cursor].worsePrice, _price)
+        ) {
+            _cursor = levels[_cursor].worsePrice;
+            _searched = countSearch(_searched, _maxSearch);
+        }
+
+        ExchangeStorageModel.PriceLevel storage better = levels[_cursor];
+        if (better.hasWorse) {
+            level.hasWorse = true;
+            level.worsePrice = better.worsePrice;
+            levels[better.worsePrice].betterPrice = _price;
+        }
+        level.hasBetter = true;
+        level.betterPrice = _cursor;
+        better.hasWorse = true;
+        better.worsePrice = _price;
+    }
+
+    /// @dev 挿入位置の探索で辿った価格帯数を数える
+    /// @param _searched 辿った価格帯数
+    /// @param _maxSearch 辿る価格帯数の上限
+    /// @return 更新後の辿った価格帯数
+    function countSearch(
+        uint256 _searched,
+        uint256 _maxSearch
+    ) private pure returns (uint256) {
+        if (_searched >= _maxSearch)
+            revert IbetError(
+                ErrorCode.ERR_ExchangeStorageV2_insertPriceLevel_270501
+            );
+        return _searched + 1;
+    }
+
+    /// @dev 価格帯を削除する
+    /// @param _token トークンアドレス
+    /// @param _isBuy 売買区分（買：True）
+    /// @param _price 価格
+    function removePriceLevel(
+        address _token,
+        bool _isBuy,
+        uint256 _price
+    ) private {
+        mapping(uint256 => ExchangeStorageModel.PriceLevel)
+            storage levels = priceLevels[_token][_isBuy];
+        ExchangeStorageModel.PriceLevel storage level = levels[_price];
+
+        if (level.hasBetter) {
+            ExchangeStorageModel.PriceLevel storage better = levels[
+                level.betterPrice
+            ];
+            better.hasWorse = level.hasWorse;
+            better.worsePrice = level.worsePrice;
+        } else {
+            ExchangeStorageModel.OrderBookSide storage side = orderBookSides[
+                _token
+            ][_isBuy];
+            side.hasBest = level.hasWorse;
+            side.bestPrice = level.worsePrice;
+        }
+        if (level.hasWorse) {
+            ExchangeStorageModel.PriceLevel storage worse = levels[
+                level.worsePrice
+            ];
+            worse.hasBetter = level.hasBetter;
+            worse.betterPrice = level.betterPrice;
+        }
+        delete levels[_price];
+    }
+
+    /// @dev 価格の優先度比較
+    /// @param _isBuy 売買区分（買：True）
+    /// @param _price 比較する価格
+    /// @param _other 比較対象の価格
+    /// @return _priceの方が優先度が高い場合True
+    function isBetterPrice(
+        bool _isBuy,
+        uint256 _price,
+        uint256 _other
+    ) private pure returns (bool) {
+        return _isBuy ? _price > _other : _price < _other;
+    }
+
+    // -------------------------------------------------------------------
+    // 旧バージョン（ExchangeStorage）からの移行
+    // -------------------------------------------------------------------
+
+    /// @dev Exchangeコントラクトと接続される前であることをチェック
+    modifier onlyMigrationPeriod() {
+        if (latestVersion != address(0))
+            revert IbetError(
+                ErrorCode.ERR_ExchangeStorageV2_onlyMigrationPeriod_270101
+            );
+        _;
+    }
+
+    /// @notice 注文情報・約定情報の移行
+    /// @dev コントラクトオーナーのみ実行が可能
+    /// @dev Exchangeコントラクトとの接続（upgradeVersion）前のみ実行が可能
+    /// @dev 件数が多い場合は注文IDの範囲を分割して実行する
+    /// @param _oldStorage 移行元のExchangeStorageアドレス
+    /// @param _fromOrderId 移行対象の注文ID（開始）
+    /// @param _toOrderId 移行対象の注文ID（終了）
+    function migrateOrders(
+        address _oldStorage,
+        uint256 _fromOrderId,
+        uint256 _toOrderId
+    ) public onlyOwner onlyMigrationPeriod {
+        ExchangeStorage oldStorage = ExchangeStorage(_oldStorage);
+        uint256 oldLatestOrderId = oldStorage.getLatestOrderId();
+        if (_fromOrderId > _toOrderId || _toOrderId > oldLatestOrderId)
+            revert IbetError(
+                ErrorCode.ERR_ExchangeStorageV2_migrateOrders_270201
+            );
+
+        for (uint256 i = _fromOrderId; i <= _toOrderId; i++) {
+            uint256 _latestAgreementId = _migrateOrder(oldStorage, i);
+            for (uint256 j = 1; j <= _latestAgreementId; j++) {
+                _migrateAgreement(oldStorage, i, j);
+            }
+        }
+        latestOrderId = oldLatestOrderId;
+    }
+
+    /// @notice 残高数量・拘束数量の移行
+    /// @dev コントラクトオーナーのみ実行が可能
+    /// @dev Exchangeコントラクトとの接続（upgradeVersion）前のみ実行が可能
+    /// @param _oldStorage 移行元のExchangeStorageアドレス
+    /// @param _accounts アドレスのリスト
+    /// @param _tokens トークンアドレスのリスト（_accountsと同じ順序）
+    function migrateBalances(
+        address _oldStorage,
+        address[] calldata _accounts,
+        address[] calldata _tokens
+    ) public onlyOwner onlyMigrationPeriod {
+        if (_accounts.length != _tokens.length)
+            revert IbetError(
+                ErrorCode.ERR_ExchangeStorageV2_migrateBalances_270301
+            );
+
+        ExchangeStorage oldStorage = ExchangeStorage(_oldStorage);
+        for (uint256 i = 0; i < _accounts.length; i++) {
+            balances[_accounts[i]][_tokens[i]] = oldStorage.getBalance(
+                _accounts[i],
+                _tokens[i]
+            );
+            commitments[_accounts[i]][_tokens[i]] = oldStorage.getCommitment(
+                _accounts[i],
+                _tokens[i]
+            );
+        }
+    }
+
+    /// @notice 現在値の移行
+    /// @dev コントラクトオーナーのみ実行が可能
+    /// @dev Exchangeコントラクトとの接続（upgradeVersion）前のみ実行が可能
+    /// @param _oldStorage 移行元のExchangeStorageアドレス
+    /// @param _tokens トークンアドレスのリスト
+    function migrateLastPrices(
+        address _oldStorage,
+        address[] calldata _tokens
+    ) public onlyOwner onlyMigrationPeriod {
+        ExchangeStorage oldStorage = ExchangeStorage(_oldStorage);
+        for (uint256 i = 0; i < _tokens.length; i++) {
+            lastPrice[_tokens[i]] = oldStorage.getLastPrice(_tokens[i]);
+        }
+    }
+
+    /// @dev 注文情報の移行
+    /// @param _oldStorage 移行元のExchangeStorage
+    /// @param _orderId 注文ID
+    /// @return 直近約定ID
+    function _migrateOrder(
+        ExchangeStorage _oldStorage,
+        uint256 _orderId
+    ) private returns (uint256) {
+        ExchangeStorageModel.Order storage order = orderBook[_orderId];
+        (
+            order.owner,
+            order.token,
+            order.amount,
+            order.price,
+            order.isBuy,
+            order.agent,
+            order.canceled
+        ) = _oldStorage.getOrder(_orderId);
+
+        uint256 _latestAgreementId = _oldStorage.getLatestAgreementId(
+            _orderId
+        );
+        order.latestAgreementId = SafeCast.toUint64(_latestAgreementId);
+        // 移行はExchangeコントラクトと接続する前にオーナーのみが実行するため、
+        // 探索する価格帯数を制限しない
+        syncOpenOrder(_orderId, 0, type(uint256).max);
+        return _latestAgreementId;
+    }
+
+    /// @dev 約定情報の移行
+    /// @param _oldStorage 移行元のExchangeStorage
+    /// @param _orderId 注文ID
+    /// @param _agreementId 約定ID
+    function _migrateAgreement(
+        ExchangeStorage _oldStorage,
+        uint256 _orderId,
+        uint256 _agreementId
+    ) private {
+        ExchangeStorageModel.Agreement storage agreement = agreements[
+            _orderId
+        ][_agreementId];
+        uint256 _expiry;
+        (
+            agreement.counterpart,
+            agreement.amount,
+            agreement.price,
+            agreement.canceled,
+            agreement.paid,
+            _expiry
+        ) = _oldStorage.getAgreement(_orderId, _agreementId);
+        agreement.expiry = SafeCast.toUint64(_expiry);
+    }
+}
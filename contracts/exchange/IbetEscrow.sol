@@ -159,19 +159,16 @@ contract IbetEscrow is Ownable, IbetExchangeInterface {
         string memory _data
     ) public returns (bool) {
         // チェック：数量がゼロより大きいこと
-        require(_amount > 0, ErrorCode.ERR_IbetEscrow_createEscrow_230001);
+        if (_amount == 0)
+            revert IbetError(ErrorCode.ERR_IbetEscrow_createEscrow_230001);
 
         // チェック：数量が残高以下であること
-        require(
-            balanceOf(msg.sender, _token) >= _amount,
-            ErrorCode.ERR_IbetEscrow_createEscrow_230002
-        );
+        if (balanceOf(msg.sender, _token) < _amount)
+            revert IbetError(ErrorCode.ERR_IbetEscrow_createEscrow_230002);
 
         // チェック：トークンのステータスが有効であること
-        require(
-            IbetStandardTokenInterface(_token).status() == true,
-            ErrorCode.ERR_IbetEscrow_createEscrow_230003
-        );
+        if (!IbetStandardTokenInterface(_token).status())
+            revert IbetError(ErrorCode.ERR_IbetEscrow_createEscrow_230003);
 
         // 更新：エスクローIDをカウントアップ
         uint256 _escrowId =
@@ -221,10 +218,8 @@ contract IbetEscrow is Ownable, IbetExchangeInterface {
     /// @param _escrowId エスクローID
     function cancelEscrow(uint256 _escrowId) public returns (bool) {
         // チェック：エスクローIDが直近ID以下であること
-        require(
-            _escrowId <= EscrowStorage(storageAddress).getLatestEscrowId(),
-            ErrorCode.ERR_IbetEscrow_cancelEscrow_230101
-        );
+        if (_escrowId > EscrowStorage(storageAddress).getLatestEscrowId())
+            revert IbetError(ErrorCode.ERR_IbetEscrow_cancelEscrow_230101);
 
         Escrow memory escrow;
         (
@@ -237,22 +232,16 @@ contract IbetEscrow is Ownable, IbetExchangeInterface {
         ) = EscrowStorage(storageAddress).getEscrow(_escrowId);
 
         // チェック：エスクローが有効であること
-        require(
-            escrow.valid == true,
-            ErrorCode.ERR_IbetEscrow_cancelEscrow_230102
-        );
+        if (!escrow.valid)
+            revert IbetError(ErrorCode.ERR_IbetEscrow_cancelEscrow_230102);
 
         // チェック：msg.senderがエスクローのsender、またはagentであること
-        require(
-            msg.sender == escrow.sender || msg.sender == escrow.agent,
-            ErrorCode.ERR_IbetEscrow_cancelEscrow_230103
-        );
+        if (msg.sender != escrow.sender && msg.sender != escrow.agent)
+            revert IbetError(ErrorCode.ERR_IbetEscrow_cancelEscrow_230103);
 
         // チェック：トークンのステータスが有効であること
-        require(
-            IbetStandardTokenInterface(escrow.token).status() == true,
-            ErrorCode.ERR_IbetEscrow_cancelEscrow_230104
-        );
+        if (!IbetStandardTokenInterface(escrow.token).status())
+            revert IbetError(ErrorCode.ERR_IbetEscrow_cancelEscrow_230104);
 
         // 更新：残高
         EscrowStorage(storageAddress).setBalance(
@@ -296,10 +285,8 @@ contract IbetEscrow is Ownable, IbetExchangeInterface {
     /// @param _escrowId エスクローID
     function finishEscrow(uint256 _escrowId) public returns (bool) {
         // チェック：エスクローIDが直近ID以下であること
-        require(
-            _escrowId <= EscrowStorage(storageAddress).getLatestEscrowId(),
-            ErrorCode.ERR_IbetEscrow_finishEscrow_230201
-        );
+        if (_escrowId > EscrowStorage(storageAddress).getLatestEscrowId())
+            revert IbetError(ErrorCode.ERR_IbetEscrow_finishEscrow_230201);
 
         Escrow memory escrow;
         (
@@ -312,22 +299,16 @@ contract IbetEscrow is Ownable, IbetExchangeInterface {
         ) = EscrowStorage(storageAddress).getEscrow(_escrowId);
 
         // チェック：エスクローが取消済みではないこと
-        require(
-            escrow.valid == true,
-            ErrorCode.ERR_IbetEscrow_finishEscrow_230202
-        );
+        if (!escrow.valid)
+            revert IbetError(ErrorCode.ERR_IbetEscrow_finishEscrow_230202);
 
         // チェック：msg.senderがエスクローのagentであること
-        require(
-            escrow.agent == msg.sender,
-            ErrorCode.ERR_IbetEscrow_finishEscrow_230203
-        );
+        if (escrow.agent != msg.sender)
+            revert IbetError(ErrorCode.ERR_IbetEscrow_finishEscrow_230203);
 
         // チェック：トークンのステータスが有効であること
-        require(
-            IbetStandardTokenInterface(escrow.token).status() == true,
-            ErrorCode.ERR_IbetEscrow_finishEscrow_230204
-        );
+        if (!IbetStandardTokenInterface(escrow.token).status())
+            revert IbetError(ErrorCode.ERR_IbetEscrow_finishEscrow_230204);
 
         // 更新：残高
         EscrowStorage(storageAddress).setBalance(
@@ -391,7 +372,8 @@ contract IbetEscrow is Ownable, IbetExchangeInterface {
     function withdraw(address _token) public override returns (bool) {
         uint256 balance = balanceOf(msg.sender, _token);
 
-        require(balance > 0, ErrorCode.ERR_IbetEscrow_withdraw_230301);
+        if (balance == 0)
+            revert IbetError(ErrorCode.ERR_IbetEscrow_withdraw_230301);
 
         // 更新処理：トークン引き出し（送信）
         IbetStandardTokenInterface(_token).transfer(msg.sender, balance);
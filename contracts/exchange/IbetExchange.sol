@@ -19,8 +19,10 @@
 
 pragma solidity ^0.8.23;
 
+import "OpenZeppelin/openzeppelin-contracts@4.9.3/contracts/utils/math/SafeCast.sol";
 import "OpenZeppelin/openzeppelin-contracts@4.9.3/contracts/utils/math/SafeMath.sol";
-import "./ExchangeStorage.sol";
+import "./ExchangeStorageModel.sol";
+import "./ExchangeStorageV2.sol";
 import "../access/Ownable.sol";
 import "../utils/Errors.sol";
 import "../payment/PaymentGateway.sol";
@@ -28,7 +30,11 @@ import "../../interfaces/IbetExchangeInterface.sol";
 import "../../interfaces/IbetStandardTokenInterface.sol";
 
 /// @title ibet Decentralized Exchange
-contract IbetExchange is Ownable, IbetExchangeInterface {
+contract IbetExchange is
+    Ownable,
+    IbetExchangeInterface,
+    ExchangeStorageModel
+{
     using SafeMath for uint256;
 
     // 約定明細の有効期限
@@ -116,7 +122,7 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
 
     // [CONSTRUCTOR]
     /// @param _paymentGatewayAddress PaymentGatewayコントラクトアドレス
-    /// @param _storageAddress ExchangeStorageコントラクトアドレス
+    /// @param _storageAddress ExchangeStorageV2コントラクトアドレス
     constructor(address _paymentGatewayAddress, address _storageAddress) {
         paymentGatewayAddress = _paymentGatewayAddress;
         storageAddress = _storageAddress;
@@ -126,27 +132,6 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
     // Function: Storage
     // ---------------------------------------------------------------
 
-    // 注文情報
-    struct Order {
-        address owner; // 注文実行者
-        address token; // トークンアドレス
-        uint256 amount; // 注文数量
-        uint256 price; // 注文単価
-        bool isBuy; // 売買区分（買い：True）
-        address agent; // 決済業者のアドレス
-        bool canceled; // キャンセル済みフラグ
-    }
-
-    // 約定情報
-    struct Agreement {
-        address counterpart; // 約定相手
-        uint256 amount; // 約定数量
-        uint256 price; // 約定単価
-        bool canceled; // キャンセル済みフラグ
-        bool paid; // 支払済フラグ
-        uint256 expiry; // 有効期限（約定から１４日）
-    }
-
     /// @notice 注文情報取得
     /// @param _orderId 注文ID
     /// @return owner 注文実行者
@@ -171,38 +156,46 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
             bool canceled
         )
     {
-        return ExchangeStorage(storageAddress).getOrder(_orderId);
+        ExchangeStorageModel.Order memory order = ExchangeStorageV2(
+            storageAddress
+        ).getOrder(_orderId);
+        return (
+            order.owner,
+            order.token,
+            order.amount,
+            order.price,
+            order.isBuy,
+            order.agent,
+            order.canceled
+        );
     }
 
     /// @notice 注文情報更新
     /// @param _orderId 注文ID
-    /// @param _owner 注文実行者
-    /// @param _token トークンアドレス
-    /// @param _amount 注文数量
-    /// @param _price 注文単価
-    /// @param _isBuy 売買区分
-    /// @param _agent 決済業者のアドレス
-    /// @param _canceled キャンセル済み状態
+    /// @param _order 注文情報
     /// @return 処理結果
     function setOrder(
         uint256 _orderId,
-        address _owner,
-        address _token,
-        uint256 _amount,
-        uint256 _price,
-        bool _isBuy,
-        address _agent,
-        bool _canceled
+        ExchangeStorageModel.Order memory _order
     ) private returns (bool) {
-        ExchangeStorage(storageAddress).setOrder(
+        ExchangeStorageV2(storageAddress).setOrder(_orderId, _order);
+        return true;
+    }
+
+    /// @notice 注文情報更新（価格帯の挿入位置のヒント指定）
+    /// @param _orderId 注文ID
+    /// @param _order 注文情報
+    /// @param _hintPrice 価格帯の挿入位置のヒント
+    /// @return 処理結果
+    function setOrderWithHint(
+        uint256 _orderId,
+        ExchangeStorageModel.Order memory _order,
+        uint256 _hintPrice
+    ) private returns (bool) {
+        ExchangeStorageV2(storageAddress).setOrderWithHint(
             _orderId,
-            _owner,
-            _token,
-            _amount,
-            _price,
-            _isBuy,
-            _agent,
-            _canceled
+            _order,
+            _hintPrice
         );
         return true;
     }
@@ -230,43 +223,102 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
             bool _paid,
             uint256 _expiry
         )
+    {
+        ExchangeStorageModel.Agreement memory agreement = ExchangeStorageV2(
+            storageAddress
+        ).getAgreement(_orderId, _agreementId);
+        return (
+            agreement.counterpart,
+            agreement.amount,
+            agreement.price,
+            agreement.canceled,
+            agreement.paid,
+            agreement.expiry
+        );
+    }
+
+    /// @notice 約定情報更新
+    /// @param _orderId 注文ID
+    /// @param _agreementId 約定ID
+    /// @param _agreement 約定情報
+    /// @return 処理結果
+    function setAgreement(
+        uint256 _orderId,
+        uint256 _agreementId,
+        ExchangeStorageModel.Agreement memory _agreement
+    ) private returns (bool) {
+        ExchangeStorageV2(storageAddress).setAgreement(
+            _orderId,
+            _agreementId,
+            _agreement
+        );
+        return true;
+    }
+
+    /// @notice 注文情報・約定情報取得（一括）
+    /// @param _orderId 注文ID
+    /// @param _agreementId 約定ID
+    /// @return 注文情報
+    /// @return 約定情報
+    function getOrderAndAgreement(
+        uint256 _orderId,
+        uint256 _agreementId
+    )
+        private
+        view
+        returns (
+            ExchangeStorageModel.Order memory,
+            ExchangeStorageModel.Agreement memory
+        )
     {
         return
-            ExchangeStorage(storageAddress).getAgreement(
+            ExchangeStorageV2(storageAddress).getOrderAndAgreement(
                 _orderId,
                 _agreementId
             );
     }
 
-    /// @notice 約定情報更新
+    /// @notice 注文情報・約定情報更新（一括）
     /// @param _orderId 注文ID
+    /// @param _order 注文情報
     /// @param _agreementId 約定ID
-    /// @param _counterpart 約定相手
-    /// @param _amount 約定数量
-    /// @param _price 約定単価
-    /// @param _canceled キャンセル済み状態
-    /// @param _paid 支払済状態
-    /// @param _expiry 有効期限
+    /// @param _agreement 約定情報
     /// @return 処理結果
-    function setAgreement(
+    function setOrderAndAgreement(
         uint256 _orderId,
+        ExchangeStorageModel.Order memory _order,
         uint256 _agreementId,
-        address _counterpart,
-        uint256 _amount,
-        uint256 _price,
-        bool _canceled,
-        bool _paid,
-        uint256 _expiry
+        ExchangeStorageModel.Agreement memory _agreement
     ) private returns (bool) {
-        ExchangeStorage(storageAddress).setAgreement(
+        ExchangeStorageV2(storageAddress).setOrderAndAgreement(
             _orderId,
+            _order,
             _agreementId,
-            _counterpart,
-            _amount,
-            _price,
-            _canceled,
-            _paid,
-            _expiry
+            _agreement
+        );
+        return true;
+    }
+
+    /// @notice 注文情報・約定情報更新（一括、価格帯の挿入位置のヒント指定）
+    /// @param _orderId 注文ID
+    /// @param _order 注文情報
+    /// @param _agreementId 約定ID
+    /// @param _agreement 約定情報
+    /// @param _hintPrice 価格帯の挿入位置のヒント
+    /// @return 処理結果
+    function setOrderAndAgreementWithHint(
+        uint256 _orderId,
+        ExchangeStorageModel.Order memory _order,
+        uint256 _agreementId,
+        ExchangeStorageModel.Agreement memory _agreement,
+        uint256 _hintPrice
+    ) private returns (bool) {
+        ExchangeStorageV2(storageAddress).setOrderAndAgreementWithHint(
+            _orderId,
+            _order,
+            _agreementId,
+            _agreement,
+            _hintPrice
         );
         return true;
     }
@@ -274,14 +326,14 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
     /// @notice 直近注文ID取得
     /// @return 直近注文ID
     function latestOrderId() public view returns (uint256) {
-        return ExchangeStorage(storageAddress).getLatestOrderId();
+        return ExchangeStorageV2(storageAddress).getLatestOrderId();
     }
 
     /// @notice 直近注文ID更新
     /// @param _value 更新後の直近注文ID
     /// @return 処理結果
     function setLatestOrderId(uint256 _value) private returns (bool) {
-        ExchangeStorage(storageAddress).setLatestOrderId(_value);
+        ExchangeStorageV2(storageAddress).setLatestOrderId(_value);
         return true;
     }
 
@@ -289,19 +341,7 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
     /// @param _orderId 注文ID
     /// @return 直近約定ID
     function latestAgreementId(uint256 _orderId) public view returns (uint256) {
-        return ExchangeStorage(storageAddress).getLatestAgreementId(_orderId);
-    }
-
-    /// @notice 直近約定ID更新
-    /// @param _orderId 注文ID
-    /// @param _value 更新後の直近約定ID
-    /// @return 処理結果
-    function setLatestAgreementId(
-        uint256 _orderId,
-        uint256 _value
-    ) private returns (bool) {
-        ExchangeStorage(storageAddress).setLatestAgreementId(_orderId, _value);
-        return true;
+        return ExchangeStorageV2(storageAddress).getLatestAgreementId(_orderId);
     }
 
     /// @notice 残高参照
@@ -312,7 +352,7 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
         address _account,
         address _token
     ) public view override returns (uint256) {
-        return ExchangeStorage(storageAddress).getBalance(_account, _token);
+        return ExchangeStorageV2(storageAddress).getBalance(_account, _token);
     }
 
     /// @notice 残高数量更新
@@ -326,7 +366,7 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
         uint256 _value
     ) private returns (bool) {
         return
-            ExchangeStorage(storageAddress).setBalance(
+            ExchangeStorageV2(storageAddress).setBalance(
                 _account,
                 _token,
                 _value
@@ -341,7 +381,8 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
         address _account,
         address _token
     ) public view override returns (uint256) {
-        return ExchangeStorage(storageAddress).getCommitment(_account, _token);
+        return
+            ExchangeStorageV2(storageAddress).getCommitment(_account, _token);
     }
 
     /// @notice 拘束数量更新
@@ -354,7 +395,11 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
         address _token,
         uint256 _value
     ) private returns (bool) {
-        ExchangeStorage(storageAddress).setCommitment(_account, _token, _value);
+        ExchangeStorageV2(storageAddress).setCommitment(
+            _account,
+            _token,
+            _value
+        );
         return true;
     }
 
@@ -362,7 +407,7 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
     /// @param _token トークンアドレス
     /// @return 現在値
     function lastPrice(address _token) public view returns (uint256) {
-        return ExchangeStorage(storageAddress).getLastPrice(_token);
+        return ExchangeStorageV2(storageAddress).getLastPrice(_token);
     }
 
     /// @notice 現在値更新
@@ -373,15 +418,92 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
         address _token,
         uint256 _value
     ) private returns (bool) {
-        ExchangeStorage(storageAddress).setLastPrice(_token, _value);
+        ExchangeStorageV2(storageAddress).setLastPrice(_token, _value);
         return true;
     }
 
+    /// @notice 最良買気配取得
+    /// @param _token トークンアドレス
+    /// @return price 最も高い買注文の単価
+    /// @return orderId 最良買気配で最も早い注文の注文ID（買注文が無い場合は0）
+    function getBestBid(
+        address _token
+    ) public view returns (uint256 price, uint256 orderId) {
+        return ExchangeStorageV2(storageAddress).getBestOrder(_token, true);
+    }
+
+    /// @notice 最良売気配取得
+    /// @param _token トークンアドレス
+    /// @return price 最も安い売注文の単価
+    /// @return orderId 最良売気配で最も早い注文の注文ID（売注文が無い場合は0）
+    function getBestAsk(
+        address _token
+    ) public view returns (uint256 price, uint256 orderId) {
+        return ExchangeStorageV2(storageAddress).getBestOrder(_token, false);
+    }
+
+    /// @notice 未約定注文数取得
+    /// @param _token トークンアドレス
+    /// @param _isBuy 売買区分（買：True）
+    /// @return 未約定注文数
+    function getOpenOrderCount(
+        address _token,
+        bool _isBuy
+    ) public view returns (uint256) {
+        return
+            ExchangeStorageV2(storageAddress).getOpenOrderCount(_token, _isBuy);
+    }
+
+    /// @notice 未約定注文の範囲取得
+    /// @dev 価格優先・時間優先の順で、カーソルの注文の次の注文から注文IDを返す
+    /// @dev 次のページは前のページの最後の注文IDをカーソルとして取得する
+    /// @param _token トークンアドレス
+    /// @param _isBuy 売買区分（買：True）
+    /// @param _cursorOrderId カーソルの注文ID（0の場合は最良気配の先頭から取得）
+    /// @param _limit 最大取得件数
+    /// @return 注文IDのリスト
+    function getOpenOrders(
+        address _token,
+        bool _isBuy,
+        uint256 _cursorOrderId,
+        uint256 _limit
+    ) public view returns (uint256[] memory) {
+        return
+            ExchangeStorageV2(storageAddress).getOpenOrders(
+                _token,
+                _isBuy,
+                _cursorOrderId,
+                _limit
+            );
+    }
+
+    /// @notice 価格帯の挿入位置のヒント取得
+    /// @dev createOrderWithHint、cancelAgreementWithHint、
+    ///      bulkCancelAgreementWithHint に指定するヒントを返す
+    /// @param _token トークンアドレス
+    /// @param _isBuy 売買区分（買：True）
+    /// @param _price 注文単価
+    /// @return 挿入位置の直前の価格帯の価格
+    function getPriceLevelHint(
+        address _token,
+        bool _isBuy,
+        uint256 _price
+    ) public view returns (uint256) {
+        return
+            ExchangeStorageV2(storageAddress).getPriceLevelHint(
+                _token,
+                _isBuy,
+                _price
+            );
+    }
+
     // ---------------------------------------------------------------
     // Function: Logic
     // ---------------------------------------------------------------
 
     /// @notice Make注文
+    /// @dev 新しい価格帯の挿入位置が最良気配から遠い場合はREVERTするため、
+    ///      createOrderWithHintを利用する
     /// @param _token トークンアドレス
     /// @param _amount 注文数量
     /// @param _price 注文単価
@@ -394,6 +516,27 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
         uint256 _price,
         bool _isBuy,
         address _agent
+    ) public returns (bool) {
+        return createOrderWithHint(_token, _amount, _price, _isBuy, _agent, 0);
+    }
+
+    /// @notice Make注文（価格帯の挿入位置のヒント指定）
+    /// @dev 新しい価格帯を作成する場合、ヒントから挿入位置を探索する
+    /// @dev ヒントの価格帯が存在しない場合は最良気配から探索する
+    /// @param _token トークンアドレス
+    /// @param _amount 注文数量
+    /// @param _price 注文単価
+    /// @param _isBuy 売買区分
+    /// @param _agent 収納代行業者のアドレス
+    /// @param _hintPrice 価格帯の挿入位置のヒント（getPriceLevelHint）
+    /// @return 処理結果
+    function createOrderWithHint(
+        address _token,
+        uint256 _amount,
+        uint256 _price,
+        bool _isBuy,
+        address _agent,
+        uint256 _hintPrice
     ) public returns (bool) {
         if (_isBuy == true) {
             // 買注文の場合
@@ -409,7 +552,7 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
                 isContract(msg.sender) == true ||
                 validateAgent(_agent) == false
             ) {
-                revert(ErrorCode.ERR_IbetExchange_createOrder_210001);
+                revert IbetError(ErrorCode.ERR_IbetExchange_createOrder_210001);
             }
         }
 
@@ -439,16 +582,17 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
         // 更新処理：注文IDをカウントアップ -> 注文情報を挿入
         uint256 orderId = latestOrderId() + 1;
         setLatestOrderId(orderId);
-        setOrder(
-            orderId,
-            msg.sender,
-            _token,
-            _amount,
-            _price,
-            _isBuy,
-            _agent,
-            false
-        );
+        ExchangeStorageModel.Order memory order = ExchangeStorageModel.Order({
+            owner: msg.sender,
+            isBuy: _isBuy,
+            canceled: false,
+            latestAgreementId: 0,
+            token: _token,
+            agent: _agent,
+            amount: _amount,
+            price: _price
+        });
+        setOrderWithHint(orderId, order, _hintPrice);
 
         // 更新処理：売り注文の場合、預かりを拘束
         if (!_isBuy) {
@@ -483,39 +627,24 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
     /// @return 処理結果
     function cancelOrder(uint256 _orderId) public returns (bool) {
         // チェック：指定した注文番号は直近の注文ID以下であること
-        require(
-            _orderId <= latestOrderId(),
-            ErrorCode.ERR_IbetExchange_cancelOrder_210101
-        );
+        if (_orderId > latestOrderId())
+            revert IbetError(ErrorCode.ERR_IbetExchange_cancelOrder_210101);
 
-        Order memory order;
-        (
-            order.owner,
-            order.token,
-            order.amount,
-            order.price,
-            order.isBuy,
-            order.agent,
-            order.canceled
-        ) = getOrder(_orderId);
+        ExchangeStorageModel.Order memory order = ExchangeStorageV2(
+            storageAddress
+        ).getOrder(_orderId);
 
         // チェック：元注文の残注文が存在すること
-        require(
-            order.amount > 0,
-            ErrorCode.ERR_IbetExchange_cancelOrder_210102
-        );
+        if (order.amount == 0)
+            revert IbetError(ErrorCode.ERR_IbetExchange_cancelOrder_210102);
 
         // チェック：キャンセル対象の注文が未キャンセルであること
-        require(
-            order.canceled == false,
-            ErrorCode.ERR_IbetExchange_cancelOrder_210103
-        );
+        if (order.canceled)
+            revert IbetError(ErrorCode.ERR_IbetExchange_cancelOrder_210103);
 
         // チェック：msg.senderが発注者（owner）であること
-        require(
-            msg.sender == order.owner,
-            ErrorCode.ERR_IbetExchange_cancelOrder_210104
-        );
+        if (msg.sender != order.owner)
+            revert IbetError(ErrorCode.ERR_IbetExchange_cancelOrder_210104);
 
         // 更新処理：売り注文の場合、注文で拘束している預かりを解放 => 残高を発注者のアカウントに戻す
         if (!order.isBuy) {
@@ -531,16 +660,8 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
         }
 
         // 更新処理：キャンセル済みフラグをキャンセル済み（True）に更新
-        setOrder(
-            _orderId,
-            order.owner,
-            order.token,
-            order.amount,
-            order.price,
-            order.isBuy,
-            order.agent,
-            true
-        );
+        order.canceled = true;
+        setOrder(_orderId, order);
 
         // イベント登録：注文キャンセル
         emit CancelOrder(
@@ -561,39 +682,32 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
     /// @return 処理結果
     function forceCancelOrder(uint256 _orderId) public returns (bool) {
         // チェック：指定した注文番号は直近の注文ID以下であること
-        require(
-            _orderId <= latestOrderId(),
-            ErrorCode.ERR_IbetExchange_forceCancelOrder_210201
-        );
+        if (_orderId > latestOrderId())
+            revert IbetError(
+                ErrorCode.ERR_IbetExchange_forceCancelOrder_210201
+            );
 
-        Order memory order;
-        (
-            order.owner,
-            order.token,
-            order.amount,
-            order.price,
-            order.isBuy,
-            order.agent,
-            order.canceled
-        ) = getOrder(_orderId);
+        ExchangeStorageModel.Order memory order = ExchangeStorageV2(
+            storageAddress
+        ).getOrder(_orderId);
 
         // チェック：元注文の残注文が存在すること
-        require(
-            order.amount > 0,
-            ErrorCode.ERR_IbetExchange_forceCancelOrder_210202
-        );
+        if (order.amount == 0)
+            revert IbetError(
+                ErrorCode.ERR_IbetExchange_forceCancelOrder_210202
+            );
 
         // チェック：キャンセル対象の注文が未キャンセルであること
-        require(
-            order.canceled == false,
-            ErrorCode.ERR_IbetExchange_forceCancelOrder_210203
-        );
+        if (order.canceled)
+            revert IbetError(
+                ErrorCode.ERR_IbetExchange_forceCancelOrder_210203
+            );
 
         // チェック：msg.senderが決済代行（agent）
-        require(
-            msg.sender == order.agent,
-            ErrorCode.ERR_IbetExchange_forceCancelOrder_210204
-        );
+        if (msg.sender != order.agent)
+            revert IbetError(
+                ErrorCode.ERR_IbetExchange_forceCancelOrder_210204
+            );
 
         // 更新処理：売り注文の場合、注文で拘束している預かりを解放 => 残高を発注者（msg.sender）のアカウントに戻す
         if (!order.isBuy) {
@@ -609,16 +723,8 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
         }
 
         // 更新処理：キャンセル済みフラグをキャンセル済み（True）に更新
-        setOrder(
-            _orderId,
-            order.owner,
-            order.token,
-            order.amount,
-            order.price,
-            order.isBuy,
-            order.agent,
-            true
-        );
+        order.canceled = true;
+        setOrder(_orderId, order);
 
         // イベント登録：注文キャンセル
         emit ForceCancelOrder(
@@ -646,21 +752,12 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
     ) public returns (bool) {
         // <CHK>
         //  指定した注文IDが直近の注文IDを超えている場合
-        require(
-            _orderId <= latestOrderId(),
-            ErrorCode.ERR_IbetExchange_executeOrder_210301
-        );
+        if (_orderId > latestOrderId())
+            revert IbetError(ErrorCode.ERR_IbetExchange_executeOrder_210301);
 
-        Order memory order;
-        (
-            order.owner,
-            order.token,
-            order.amount,
-            order.price,
-            order.isBuy,
-            order.agent,
-            order.canceled
-        ) = getOrder(_orderId);
+        ExchangeStorageModel.Order memory order = ExchangeStorageV2(
+            storageAddress
+        ).getOrder(_orderId);
 
         if (_isBuy == true) {
             // 買注文の場合
@@ -682,7 +779,9 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
                 IbetStandardTokenInterface(order.token).status() == false ||
                 order.amount < _amount
             ) {
-                revert(ErrorCode.ERR_IbetExchange_executeOrder_210302);
+                revert IbetError(
+                    ErrorCode.ERR_IbetExchange_executeOrder_210302
+                );
             }
         }
 
@@ -716,30 +815,22 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
         }
 
         // 更新処理：約定IDをカウントアップ => 約定情報を挿入する
-        uint256 agreementId = latestAgreementId(_orderId) + 1;
-        setLatestAgreementId(_orderId, agreementId);
-        uint256 expiry = block.timestamp + lockingPeriod;
-        setAgreement(
+        //          元注文の数量を減らす
+        order.latestAgreementId += 1;
+        uint256 agreementId = order.latestAgreementId;
+        order.amount = order.amount.sub(_amount);
+        setOrderAndAgreement(
             _orderId,
+            order,
             agreementId,
-            msg.sender,
-            _amount,
-            order.price,
-            false,
-            false,
-            expiry
-        );
-
-        // 更新処理：元注文の数量を減らす
-        setOrder(
-            _orderId,
-            order.owner,
-            order.token,
-            order.amount.sub(_amount),
-            order.price,
-            order.isBuy,
-            order.agent,
-            order.canceled
+            ExchangeStorageModel.Agreement({
+                counterpart: msg.sender,
+                canceled: false,
+                paid: false,
+                expiry: SafeCast.toUint64(block.timestamp + lockingPeriod),
+                amount: _amount,
+                price: order.price
+            })
         );
 
         if (order.isBuy) {
@@ -795,35 +886,19 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
         //  1) 指定した注文番号が、直近の注文ID以上の場合
         //  2) 指定した約定IDが、直近の約定ID以上の場合
         //   -> REVERT
-        require(
-            _orderId <= latestOrderId(),
-            ErrorCode.ERR_IbetExchange_confirmAgreement_210401
-        );
-        require(
-            _agreementId <= latestAgreementId(_orderId),
-            ErrorCode.ERR_IbetExchange_confirmAgreement_210402
-        );
-
-        Order memory order;
-        (
-            order.owner,
-            order.token,
-            order.amount,
-            order.price,
-            order.isBuy,
-            order.agent,
-            order.canceled
-        ) = getOrder(_orderId);
+        if (_orderId > latestOrderId())
+            revert IbetError(
+                ErrorCode.ERR_IbetExchange_confirmAgreement_210401
+            );
 
-        Agreement memory agreement;
         (
-            agreement.counterpart,
-            agreement.amount,
-            agreement.price,
-            agreement.canceled,
-            agreement.paid,
-            agreement.expiry
-        ) = getAgreement(_orderId, _agreementId);
+            ExchangeStorageModel.Order memory order,
+            ExchangeStorageModel.Agreement memory agreement
+        ) = getOrderAndAgreement(_orderId, _agreementId);
+        if (_agreementId > order.latestAgreementId)
+            revert IbetError(
+                ErrorCode.ERR_IbetExchange_confirmAgreement_210402
+            );
 
         // <CHK>
         //  1) すでに決済承認済み（支払い済み）の場合
@@ -831,7 +906,9 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
         //  3) 元注文で指定した決済業者ではない場合
         //   -> REVERT
         if (agreement.paid || agreement.canceled || msg.sender != order.agent) {
-            revert(ErrorCode.ERR_IbetExchange_confirmAgreement_210403);
+            revert IbetError(
+                ErrorCode.ERR_IbetExchange_confirmAgreement_210403
+            );
         }
 
         // 更新処理：資産移転
@@ -896,16 +973,8 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
         }
 
         // 更新処理：支払い済みフラグを支払い済み（True）に更新する
-        setAgreement(
-            _orderId,
-            _agreementId,
-            agreement.counterpart,
-            agreement.amount,
-            agreement.price,
-            agreement.canceled,
-            true,
-            agreement.expiry
-        );
+        agreement.paid = true;
+        setAgreement(_orderId, _agreementId, agreement);
 
         // 更新処理：現在値を更新する
         setLastPrice(order.token, order.price);
@@ -915,46 +984,42 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
 
     /// @notice 決済非承認
     /// @dev 注文時に指定された決済業者から実行が可能、有効期限後はMake注文者も実行が可能
+    /// @dev 注文が板に戻る際の価格帯の挿入位置が最良気配から遠い場合はREVERTするため、
+    ///      cancelAgreementWithHintを利用する
     /// @param _orderId 注文ID
     /// @param _agreementId 約定ID
     /// @return 処理結果
     function cancelAgreement(
         uint256 _orderId,
         uint256 _agreementId
+    ) public returns (bool) {
+        return cancelAgreementWithHint(_orderId, _agreementId, 0);
+    }
+
+    /// @notice 決済非承認（価格帯の挿入位置のヒント指定）
+    /// @dev 注文が板に戻る際に新しい価格帯を作成する場合、ヒントから挿入位置を探索する
+    /// @param _orderId 注文ID
+    /// @param _agreementId 約定ID
+    /// @param _hintPrice 価格帯の挿入位置のヒント（getPriceLevelHint）
+    /// @return 処理結果
+    function cancelAgreementWithHint(
+        uint256 _orderId,
+        uint256 _agreementId,
+        uint256 _hintPrice
     ) public returns (bool) {
         // <CHK>
         //  1) 指定した注文番号が、直近の注文ID以上の場合
         //  2) 指定した約定IDが、直近の約定ID以上の場合
         //   -> REVERT
-        require(
-            _orderId <= latestOrderId(),
-            ErrorCode.ERR_IbetExchange_cancelAgreement_210501
-        );
-        require(
-            _agreementId <= latestAgreementId(_orderId),
-            ErrorCode.ERR_IbetExchange_cancelAgreement_210502
-        );
-
-        Order memory order;
-        (
-            order.owner,
-            order.token,
-            order.amount,
-            order.price,
-            order.isBuy,
-            order.agent,
-            order.canceled
-        ) = getOrder(_orderId);
+        if (_orderId > latestOrderId())
+            revert IbetError(ErrorCode.ERR_IbetExchange_cancelAgreement_210501);
 
-        Agreement memory agreement;
         (
-            agreement.counterpart,
-            agreement.amount,
-            agreement.price,
-            agreement.canceled,
-            agreement.paid,
-            agreement.expiry
-        ) = getAgreement(_orderId, _agreementId);
+            ExchangeStorageModel.Order memory order,
+            ExchangeStorageModel.Agreement memory agreement
+        ) = getOrderAndAgreement(_orderId, _agreementId);
+        if (_agreementId > order.latestAgreementId)
+            revert IbetError(ErrorCode.ERR_IbetExchange_cancelAgreement_210502);
 
         if (agreement.expiry <= block.timestamp) {
             // 約定明細の有効期限を超過している場合
@@ -970,7 +1035,9 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
                     msg.sender != order.owner &&
                     msg.sender != agreement.counterpart)
             ) {
-                revert(ErrorCode.ERR_IbetExchange_cancelAgreement_210503);
+                revert IbetError(
+                    ErrorCode.ERR_IbetExchange_cancelAgreement_210503
+                );
             }
         } else {
             // 約定明細の有効期限を超過していない場合
@@ -984,32 +1051,22 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
                 agreement.canceled ||
                 msg.sender != order.agent
             ) {
-                revert(ErrorCode.ERR_IbetExchange_cancelAgreement_210504);
+                revert IbetError(
+                    ErrorCode.ERR_IbetExchange_cancelAgreement_210504
+                );
             }
         }
 
         // 更新処理：注文明細の数量を戻す
-        setOrder(
-            _orderId,
-            order.owner,
-            order.token,
-            order.amount.add(agreement.amount),
-            order.price,
-            order.isBuy,
-            order.agent,
-            order.canceled
-        );
-
-        // 更新処理：約定明細をキャンセル（True）に更新する
-        setAgreement(
+        //          約定明細をキャンセル（True）に更新する
+        order.amount = order.amount.add(agreement.amount);
+        agreement.canceled = true;
+        setOrderAndAgreementWithHint(
             _orderId,
+            order,
             _agreementId,
-            agreement.counterpart,
-            agreement.amount,
-            agreement.price,
-            true,
-            agreement.paid,
-            agreement.expiry
+            agreement,
+            _hintPrice
         );
 
         if (order.isBuy) {
@@ -1053,6 +1110,402 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
         return true;
     }
 
+    /// @notice 決済承認（一括）
+    /// @dev 注文時に指定された決済業者のみ実行が可能
+    /// @dev 処理できない明細はREVERTせずにスキップし、処理結果をfalseとする
+    /// @dev 同一注文の明細が連続する場合、注文情報の参照と現在値の更新はまとめて行う
+    /// @param _orderIdList 注文IDのリスト
+    /// @param _agreementIdList 約定IDのリスト
+    /// @return results 明細ごとの処理結果
+    function bulkConfirmAgreement(
+        uint256[] calldata _orderIdList,
+        uint256[] calldata _agreementIdList
+    ) public returns (bool[] memory results) {
+        // <CHK>
+        //  リスト長が等しくない場合
+        //   -> REVERT
+        if (_orderIdList.length != _agreementIdList.length)
+            revert IbetError(
+                ErrorCode.ERR_IbetExchange_bulkConfirmAgreement_210701
+            );
+
+        results = new bool[](_orderIdList.length);
+        uint256 _latestOrderId = latestOrderId();
+        uint256 _start = 0;
+        while (_start < _orderIdList.length) {
+            uint256 _end = nextOrderRange(_orderIdList, _start);
+            if (_orderIdList[_start] <= _latestOrderId) {
+                confirmAgreementRange(
+                    _orderIdList[_start],
+                    _agreementIdList,
+                    _start,
+                    _end,
+                    results
+                );
+            }
+            _start = _end;
+        }
+    }
+
+    /// @notice 決済非承認（一括）
+    /// @dev 注文時に指定された決済業者から実行が可能、有効期限後はMake注文者も実行が可能
+    /// @dev 処理できない明細はREVERTせずにスキップし、処理結果をfalseとする
+    /// @dev 同一注文の明細が連続する場合、注文情報の参照・更新はまとめて行う
+    /// @dev 注文が板に戻る際の価格帯の挿入位置が最良気配から遠い場合はREVERTするため、
+    ///      bulkCancelAgreementWithHintを利用する
+    /// @param _orderIdList 注文IDのリスト
+    /// @param _agreementIdList 約定IDのリスト
+    /// @return results 明細ごとの処理結果
+    function bulkCancelAgreement(
+        uint256[] calldata _orderIdList,
+        uint256[] calldata _agreementIdList
+    ) public returns (bool[] memory results) {
+        return
+            bulkCancelAgreementWithHintList(
+                _orderIdList,
+                _agreementIdList,
+                new uint256[](_orderIdList.length)
+            );
+    }
+
+    /// @notice 決済非承認（一括、価格帯の挿入位置のヒント指定）
+    /// @dev 注文時に指定された決済業者から実行が可能、有効期限後はMake注文者も実行が可能
+    /// @dev 処理できない明細はREVERTせずにスキップし、処理結果をfalseとする
+    /// @dev 同一注文の明細が連続する場合、先頭の明細のヒントを使用する
+    /// @param _orderIdList 注文IDのリスト
+    /// @param _agreementIdList 約定IDのリスト
+    /// @param _hintPriceList 価格帯の挿入位置のヒント（getPriceLevelHint）のリスト
+    /// @return results 明細ごとの処理結果
+    function bulkCancelAgreementWithHint(
+        uint256[] calldata _orderIdList,
+        uint256[] calldata _agreementIdList,
+        uint256[] calldata _hintPriceList
+    ) public returns (bool[] memory results) {
+        return
+            bulkCancelAgreementWithHintList(
+                _orderIdList,
+                _agreementIdList,
+                _hintPriceList
+            );
+    }
+
+    /// @notice 決済非承認（一括）の共通処理
+    /// @param _orderIdList 注文IDのリスト
+    /// @param _agreementIdList 約定IDのリスト
+    /// @param _hintPriceList 価格帯の挿入位置のヒントのリスト
+    /// @return results 明細ごとの処理結果
+    function bulkCancelAgreementWithHintList(
+        uint256[] calldata _orderIdList,
+        uint256[] calldata _agreementIdList,
+        uint256[] memory _hintPriceList
+    ) private returns (bool[] memory results) {
+        // <CHK>
+        //  リスト長が等しくない場合
+        //   -> REVERT
+        if (
+            _orderIdList.length != _agreementIdList.length ||
+            _orderIdList.length != _hintPriceList.length
+        )
+            revert IbetError(
+                ErrorCode.ERR_IbetExchange_bulkCancelAgreement_210801
+            );
+
+        results = new bool[](_orderIdList.length);
+        uint256 _latestOrderId = latestOrderId();
+        uint256 _start = 0;
+        while (_start < _orderIdList.length) {
+            uint256 _end = nextOrderRange(_orderIdList, _start);
+            if (_orderIdList[_start] <= _latestOrderId) {
+                cancelAgreementRange(
+                    _orderIdList[_start],
+                    _agreementIdList,
+                    _start,
+                    _end,
+                    _hintPriceList[_start],
+                    results
+                );
+            }
+            _start = _end;
+        }
+    }
+
+    /// @notice 同一注文IDが連続する範囲の終端を取得
+    /// @param _orderIdList 注文IDのリスト
+    /// @param _start 範囲の開始位置
+    /// @return _end 範囲の終端（この位置を含まない）
+    function nextOrderRange(
+        uint256[] calldata _orderIdList,
+        uint256 _start
+    ) private pure returns (uint256 _end) {
+        _end = _start + 1;
+        while (
+            _end < _orderIdList.length &&
+            _orderIdList[_end] == _orderIdList[_start]
+        ) {
+            _end++;
+        }
+    }
+
+    /// @notice 同一注文に対する決済承認（一括）
+    /// @param _orderId 注文ID
+    /// @param _agreementIdList 約定IDのリスト
+    /// @param _start 処理対象の開始位置
+    /// @param _end 処理対象の終端（この位置を含まない）
+    /// @param _results 明細ごとの処理結果
+    function confirmAgreementRange(
+        uint256 _orderId,
+        uint256[] calldata _agreementIdList,
+        uint256 _start,
+        uint256 _end,
+        bool[] memory _results
+    ) private {
+        ExchangeStorageModel.Order memory order = ExchangeStorageV2(
+            storageAddress
+        ).getOrder(_orderId);
+
+        // 元注文で指定した決済業者ではない場合、全ての明細をスキップする
+        if (msg.sender != order.agent) {
+            return;
+        }
+
+        // 決済数量の合計
+        // 売注文の場合、注文者の拘束数量はこの数量でまとめて解放する
+        uint256 _settledAmount = 0;
+        for (uint256 i = _start; i < _end; i++) {
+            uint256 _amount = confirmAgreementItem(
+                _orderId,
+                order,
+                _agreementIdList[i]
+            );
+            if (_amount > 0) {
+                _results[i] = true;
+                _settledAmount = _settledAmount.add(_amount);
+            }
+        }
+
+        if (_settledAmount > 0) {
+            if (order.isBuy == false) {
+                setCommitment(
+                    order.owner,
+                    order.token,
+                    commitmentOf(order.owner, order.token).sub(_settledAmount)
+                );
+            }
+            // 更新処理：現在値を更新する
+            setLastPrice(order.token, order.price);
+        }
+    }
+
+    /// @notice 約定明細単位の決済承認
+    /// @dev 売注文の場合、注文者の拘束数量の解放は呼び出し元で行う
+    /// @param _orderId 注文ID
+    /// @param order 注文情報
+    /// @param _agreementId 約定ID
+    /// @return 決済数量（処理できない場合は0）
+    function confirmAgreementItem(
+        uint256 _orderId,
+        ExchangeStorageModel.Order memory order,
+        uint256 _agreementId
+    ) private returns (uint256) {
+        if (_agreementId > order.latestAgreementId) {
+            return 0;
+        }
+        ExchangeStorageModel.Agreement memory agreement = ExchangeStorageV2(
+            storageAddress
+        ).getAgreement(_orderId, _agreementId);
+
+        // すでに決済承認済み（支払い済み）または決済非承認済み（キャンセル済み）の場合
+        if (agreement.paid || agreement.canceled) {
+            return 0;
+        }
+
+        if (order.isBuy) {
+            // 買注文の場合、突合相手（売り手）から注文者（買い手）へと資産移転を行う
+            if (!tryTransfer(order.token, order.owner, agreement.amount)) {
+                return 0;
+            }
+            setCommitment(
+                agreement.counterpart,
+                order.token,
+                commitmentOf(agreement.counterpart, order.token).sub(
+                    agreement.amount
+                )
+            );
+            emit SettlementOK(
+                order.token,
+                _orderId,
+                _agreementId,
+                order.owner,
+                agreement.counterpart,
+                order.price,
+                agreement.amount,
+                order.agent
+            );
+            emit HolderChanged(
+                order.token,
+                agreement.counterpart,
+                order.owner,
+                agreement.amount
+            );
+        } else {
+            // 売注文の場合、注文者（売り手）から突合相手（買い手）へと資産移転を行う
+            if (
+                !tryTransfer(
+                    order.token,
+                    agreement.counterpart,
+                    agreement.amount
+                )
+            ) {
+                return 0;
+            }
+            emit SettlementOK(
+                order.token,
+                _orderId,
+                _agreementId,
+                agreement.counterpart,
+                order.owner,
+                order.price,
+                agreement.amount,
+                order.agent
+            );
+            emit HolderChanged(
+                order.token,
+                order.owner,
+                agreement.counterpart,
+                agreement.amount
+            );
+        }
+
+        // 更新処理：支払い済みフラグを支払い済み（True）に更新する
+        agreement.paid = true;
+        setAgreement(_orderId, _agreementId, agreement);
+
+        return agreement.amount;
+    }
+
+    /// @notice 同一注文に対する決済非承認（一括）
+    /// @param _orderId 注文ID
+    /// @param _agreementIdList 約定IDのリスト
+    /// @param _start 処理対象の開始位置
+    /// @param _end 処理対象の終端（この位置を含まない）
+    /// @param _hintPrice 価格帯の挿入位置のヒント
+    /// @param _results 明細ごとの処理結果
+    function cancelAgreementRange(
+        uint256 _orderId,
+        uint256[] calldata _agreementIdList,
+        uint256 _start,
+        uint256 _end,
+        uint256 _hintPrice,
+        bool[] memory _results
+    ) private {
+        ExchangeStorageModel.Order memory order = ExchangeStorageV2(
+            storageAddress
+        ).getOrder(_orderId);
+
+        bool _canceled = false;
+        for (uint256 i = _start; i < _end; i++) {
+            if (cancelAgreementItem(_orderId, order, _agreementIdList[i])) {
+                _results[i] = true;
+                _canceled = true;
+            }
+        }
+
+        // 更新処理：注文明細の数量をまとめて戻す
+        if (_canceled) {
+            setOrderWithHint(_orderId, order, _hintPrice);
+        }
+    }
+
+    /// @notice 約定明細単位の決済非承認
+    /// @dev 注文明細の数量はメモリ上で戻し、保存は呼び出し元で行う
+    /// @param _orderId 注文ID
+    /// @param order 注文情報
+    /// @param _agreementId 約定ID
+    /// @return 処理結果
+    function cancelAgreementItem(
+        uint256 _orderId,
+        ExchangeStorageModel.Order memory order,
+        uint256 _agreementId
+    ) private returns (bool) {
+        if (_agreementId > order.latestAgreementId) {
+            return false;
+        }
+        ExchangeStorageModel.Agreement memory agreement = ExchangeStorageV2(
+            storageAddress
+        ).getAgreement(_orderId, _agreementId);
+
+        // すでに決済承認済み（支払い済み）または決済非承認済み（キャンセル済み）の場合
+        if (agreement.paid || agreement.canceled) {
+            return false;
+        }
+        if (agreement.expiry <= block.timestamp) {
+            // 約定明細の有効期限を超過している場合
+            // msg.senderが、決済代行（agent）、発注者（owner）、約定相手（counterpart）以外の場合
+            if (
+                msg.sender != order.agent &&
+                msg.sender != order.owner &&
+                msg.sender != agreement.counterpart
+            ) {
+                return false;
+            }
+        } else {
+            // 約定明細の有効期限を超過していない場合
+            // msg.senderが、決済代行（agent）以外の場合
+            if (msg.sender != order.agent) {
+                return false;
+            }
+        }
+
+        if (order.isBuy) {
+            // 更新処理：買い注文の場合、突合相手（売り手）の預かりを解放 -> 預かりの引き出し
+            if (
+                !tryTransfer(
+                    order.token,
+                    agreement.counterpart,
+                    agreement.amount
+                )
+            ) {
+                return false;
+            }
+            setCommitment(
+                agreement.counterpart,
+                order.token,
+                commitmentOf(agreement.counterpart, order.token).sub(
+                    agreement.amount
+                )
+            );
+            emit SettlementNG(
+                order.token,
+                _orderId,
+                _agreementId,
+                order.owner,
+                agreement.counterpart,
+                order.price,
+                agreement.amount,
+                order.agent
+            );
+        } else {
+            emit SettlementNG(
+                order.token,
+                _orderId,
+                _agreementId,
+                agreement.counterpart,
+                order.owner,
+                order.price,
+                agreement.amount,
+                order.agent
+            );
+        }
+
+        // 更新処理：注文明細の数量を戻す
+        //          約定明細をキャンセル（True）に更新する
+        order.amount = order.amount.add(agreement.amount);
+        agreement.canceled = true;
+        setAgreement(_orderId, _agreementId, agreement);
+
+        return true;
+    }
+
     /// @notice 全ての残高を引き出しする
     /// @dev 未売却の預かりに対してのみ引き出しをおこなう。約定済、注文中の預かり（commitments）の引き出しはおこなわない。
     /// @param _token トークンアドレス
@@ -1060,7 +1513,8 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
     function withdraw(address _token) public override returns (bool) {
         uint256 balance = balanceOf(msg.sender, _token);
 
-        require(balance > 0, ErrorCode.ERR_IbetExchange_withdraw_210601);
+        if (balance == 0)
+            revert IbetError(ErrorCode.ERR_IbetExchange_withdraw_210601);
 
         // 更新処理：トークン引き出し（送信）
         IbetStandardTokenInterface(_token).transfer(msg.sender, balance);
@@ -1103,4 +1557,23 @@ contract IbetExchange is Ownable, IbetExchangeInterface {
     function validateAgent(address _addr) private view returns (bool) {
         return PaymentGateway(paymentGatewayAddress).getAgent(_addr);
     }
+
+    /// @notice トークンの移転（失敗時はREVERTせずにfalseを返す）
+    /// @param _token トークンアドレス
+    /// @param _to 移転先アドレス
+    /// @param _value 移転数量
+    /// @return 処理結果
+    function tryTransfer(
+        address _token,
+        address _to,
+        uint256 _value
+    ) private returns (bool) {
+        try IbetStandardTokenInterface(_token).transfer(_to, _value) returns (
+            bool _result
+        ) {
+            return _result;
+        } catch {
+            return false;
+        }
+    }
 }
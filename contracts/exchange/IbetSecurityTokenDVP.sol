@@ -164,6 +164,87 @@ contract IbetSecurityTokenDVP is Ownable, IbetExchangeInterface {
         return DVPStorage(storageAddress).getCommitment(_account, _token);
     }
 
+    /// @notice 決済エージェント別の未完了の決済数の参照
+    /// @param _agent 決済エージェント
+    /// @return 未完了の決済数
+    function getOpenDeliveryCountByAgent(
+        address _agent
+    ) public view returns (uint256) {
+        return DVPStorage(storageAddress).getOpenDeliveryCountByAgent(_agent);
+    }
+
+    /// @notice 決済エージェント別の未完了の決済IDの範囲参照
+    /// @param _agent 決済エージェント
+    /// @param _offset 開始位置
+    /// @param _limit 最大取得件数
+    /// @return 決済IDのリスト
+    function getOpenDeliveriesByAgent(
+        address _agent,
+        uint256 _offset,
+        uint256 _limit
+    ) public view returns (uint256[] memory) {
+        return
+            DVPStorage(storageAddress).getOpenDeliveriesByAgent(
+                _agent,
+                _offset,
+                _limit
+            );
+    }
+
+    /// @notice 売り方別の未完了の決済数の参照
+    /// @param _seller 売り方
+    /// @return 未完了の決済数
+    function getOpenDeliveryCountBySeller(
+        address _seller
+    ) public view returns (uint256) {
+        return DVPStorage(storageAddress).getOpenDeliveryCountBySeller(_seller);
+    }
+
+    /// @notice 売り方別の未完了の決済IDの範囲参照
+    /// @param _seller 売り方
+    /// @param _offset 開始位置
+    /// @param _limit 最大取得件数
+    /// @return 決済IDのリスト
+    function getOpenDeliveriesBySeller(
+        address _seller,
+        uint256 _offset,
+        uint256 _limit
+    ) public view returns (uint256[] memory) {
+        return
+            DVPStorage(storageAddress).getOpenDeliveriesBySeller(
+                _seller,
+                _offset,
+                _limit
+            );
+    }
+
+    /// @notice 買い方別の未完了の決済数の参照
+    /// @param _buyer 買い方
+    /// @return 未完了の決済数
+    function getOpenDeliveryCountByBuyer(
+        address _buyer
+    ) public view returns (uint256) {
+        return DVPStorage(storageAddress).getOpenDeliveryCountByBuyer(_buyer);
+    }
+
+    /// @notice 買い方別の未完了の決済IDの範囲参照
+    /// @param _buyer 買い方
+    /// @param _offset 開始位置
+    /// @param _limit 最大取得件数
+    /// @return 決済IDのリスト
+    function getOpenDeliveriesByBuyer(
+        address _buyer,
+        uint256 _offset,
+        uint256 _limit
+    ) public view returns (uint256[] memory) {
+        return
+            DVPStorage(storageAddress).getOpenDeliveriesByBuyer(
+                _buyer,
+                _offset,
+                _limit
+            );
+    }
+
     // ---------------------------------------------------------------
     // Function: Logic
     // ---------------------------------------------------------------
@@ -182,29 +263,28 @@ contract IbetSecurityTokenDVP is Ownable, IbetExchangeInterface {
         string memory _data
     ) public returns (uint256) {
         // チェック：数量がゼロより大きいこと
-        require(
-            _amount > 0,
-            ErrorCode.ERR_IbetSecurityTokenDVP_createDelivery_260001
-        );
+        if (_amount == 0)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_createDelivery_260001
+            );
 
         // チェック：数量が残高以下であること
-        require(
-            balanceOf(msg.sender, _token) >= _amount,
-            ErrorCode.ERR_IbetSecurityTokenDVP_createDelivery_260002
-        );
+        if (balanceOf(msg.sender, _token) < _amount)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_createDelivery_260002
+            );
 
         // チェック：トークンのステータスが有効であること
-        require(
-            IbetSecurityTokenInterface(_token).status() == true,
-            ErrorCode.ERR_IbetSecurityTokenDVP_createDelivery_260003
-        );
+        if (!IbetSecurityTokenInterface(_token).status())
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_createDelivery_260003
+            );
 
         // チェック：トークンの移転承諾要否フラグが無効であること
-        require(
-            IbetSecurityTokenInterface(_token).transferApprovalRequired() ==
-                false,
-            ErrorCode.ERR_IbetSecurityTokenDVP_createDelivery_260004
-        );
+        if (IbetSecurityTokenInterface(_token).transferApprovalRequired())
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_createDelivery_260004
+            );
 
         // 更新：決済IDをカウントアップ
         uint256 _deliveryId =
@@ -255,10 +335,10 @@ contract IbetSecurityTokenDVP is Ownable, IbetExchangeInterface {
     /// @param _deliveryId 決済ID
     function cancelDelivery(uint256 _deliveryId) public returns (bool) {
         // チェック：決済IDが直近ID以下であること
-        require(
-            _deliveryId <= DVPStorage(storageAddress).getLatestDeliveryId(),
-            ErrorCode.ERR_IbetSecurityTokenDVP_cancelDelivery_260101
-        );
+        if (_deliveryId > DVPStorage(storageAddress).getLatestDeliveryId())
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_cancelDelivery_260101
+            );
 
         Delivery memory delivery;
         (
@@ -272,22 +352,22 @@ contract IbetSecurityTokenDVP is Ownable, IbetExchangeInterface {
         ) = DVPStorage(storageAddress).getDelivery(_deliveryId);
 
         // チェック：決済が有効であること
-        require(
-            delivery.valid == true,
-            ErrorCode.ERR_IbetSecurityTokenDVP_cancelDelivery_260102
-        );
+        if (!delivery.valid)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_cancelDelivery_260102
+            );
 
         // チェック：決済が確認済ではないこと
-        require(
-            delivery.confirmed == false,
-            ErrorCode.ERR_IbetSecurityTokenDVP_cancelDelivery_260103
-        );
+        if (delivery.confirmed)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_cancelDelivery_260103
+            );
 
         // チェック：msg.senderがDVP決済のsender、またはbuyerであること
-        require(
-            msg.sender == delivery.seller || msg.sender == delivery.buyer,
-            ErrorCode.ERR_IbetSecurityTokenDVP_cancelDelivery_260104
-        );
+        if (msg.sender != delivery.seller && msg.sender != delivery.buyer)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_cancelDelivery_260104
+            );
 
         // 更新：残高
         DVPStorage(storageAddress).setBalance(
@@ -332,10 +412,10 @@ contract IbetSecurityTokenDVP is Ownable, IbetExchangeInterface {
     /// @param _deliveryId 決済ID
     function confirmDelivery(uint256 _deliveryId) public returns (bool) {
         // チェック：決済IDが直近ID以下であること
-        require(
-            _deliveryId <= DVPStorage(storageAddress).getLatestDeliveryId(),
-            ErrorCode.ERR_IbetSecurityTokenDVP_confirmDelivery_260201
-        );
+        if (_deliveryId > DVPStorage(storageAddress).getLatestDeliveryId())
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_confirmDelivery_260201
+            );
 
         Delivery memory delivery;
         (
@@ -349,33 +429,34 @@ contract IbetSecurityTokenDVP is Ownable, IbetExchangeInterface {
         ) = DVPStorage(storageAddress).getDelivery(_deliveryId);
 
         // チェック：決済が有効であること
-        require(
-            delivery.valid == true,
-            ErrorCode.ERR_IbetSecurityTokenDVP_confirmDelivery_260202
-        );
+        if (!delivery.valid)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_confirmDelivery_260202
+            );
 
         // チェック：決済が確認済ではないこと
-        require(
-            delivery.confirmed == false,
-            ErrorCode.ERR_IbetSecurityTokenDVP_confirmDelivery_260203
-        );
+        if (delivery.confirmed)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_confirmDelivery_260203
+            );
 
         // チェック：msg.senderがbuyerであること
-        require(
-            msg.sender == delivery.buyer,
-            ErrorCode.ERR_IbetSecurityTokenDVP_confirmDelivery_260204
-        );
+        if (msg.sender != delivery.buyer)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_confirmDelivery_260204
+            );
 
         // チェック：トークンのステータスが有効であること
-        require(
-            IbetSecurityTokenInterface(delivery.token).status() == true,
-            ErrorCode.ERR_IbetSecurityTokenDVP_confirmDelivery_260205
-        );
+        if (!IbetSecurityTokenInterface(delivery.token).status())
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_confirmDelivery_260205
+            );
 
         // チェック：トークンの移転承諾要否フラグが無効であること
-        require(
+        if (
             IbetSecurityTokenInterface(delivery.token)
-                .transferApprovalRequired() == false,
+                .transferApprovalRequired()
+        ) revert IbetError(
             ErrorCode.ERR_IbetSecurityTokenDVP_confirmDelivery_260206
         );
 
@@ -408,10 +489,10 @@ contract IbetSecurityTokenDVP is Ownable, IbetExchangeInterface {
     /// @param _deliveryId 決済ID
     function finishDelivery(uint256 _deliveryId) public returns (bool) {
         // チェック：決済IDが直近ID以下であること
-        require(
-            _deliveryId <= DVPStorage(storageAddress).getLatestDeliveryId(),
-            ErrorCode.ERR_IbetSecurityTokenDVP_finishDelivery_260301
-        );
+        if (_deliveryId > DVPStorage(storageAddress).getLatestDeliveryId())
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_finishDelivery_260301
+            );
 
         Delivery memory delivery;
         (
@@ -425,33 +506,34 @@ contract IbetSecurityTokenDVP is Ownable, IbetExchangeInterface {
         ) = DVPStorage(storageAddress).getDelivery(_deliveryId);
 
         // チェック：決済が取消済みではないこと
-        require(
-            delivery.valid == true,
-            ErrorCode.ERR_IbetSecurityTokenDVP_finishDelivery_260302
-        );
+        if (!delivery.valid)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_finishDelivery_260302
+            );
 
         // チェック：決済が確認済みであること
-        require(
-            delivery.confirmed == true,
-            ErrorCode.ERR_IbetSecurityTokenDVP_finishDelivery_260303
-        );
+        if (!delivery.confirmed)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_finishDelivery_260303
+            );
 
         // チェック：msg.senderがDVP決済のagentであること
-        require(
-            delivery.agent == msg.sender,
-            ErrorCode.ERR_IbetSecurityTokenDVP_finishDelivery_260304
-        );
+        if (delivery.agent != msg.sender)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_finishDelivery_260304
+            );
 
         // チェック：トークンのステータスが有効であること
-        require(
-            IbetSecurityTokenInterface(delivery.token).status() == true,
-            ErrorCode.ERR_IbetSecurityTokenDVP_finishDelivery_260305
-        );
+        if (!IbetSecurityTokenInterface(delivery.token).status())
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_finishDelivery_260305
+            );
 
         // チェック：トークンの移転承諾要否フラグが無効であること
-        require(
+        if (
             IbetSecurityTokenInterface(delivery.token)
-                .transferApprovalRequired() == false,
+                .transferApprovalRequired()
+        ) revert IbetError(
             ErrorCode.ERR_IbetSecurityTokenDVP_finishDelivery_260306
         );
 
@@ -504,10 +586,10 @@ contract IbetSecurityTokenDVP is Ownable, IbetExchangeInterface {
     /// @param _deliveryId 決済ID
     function abortDelivery(uint256 _deliveryId) public returns (bool) {
         // チェック：決済IDが直近ID以下であること
-        require(
-            _deliveryId <= DVPStorage(storageAddress).getLatestDeliveryId(),
-            ErrorCode.ERR_IbetSecurityTokenDVP_abortDelivery_260401
-        );
+        if (_deliveryId > DVPStorage(storageAddress).getLatestDeliveryId())
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_abortDelivery_260401
+            );
 
         Delivery memory delivery;
         (
@@ -521,22 +603,22 @@ contract IbetSecurityTokenDVP is Ownable, IbetExchangeInterface {
         ) = DVPStorage(storageAddress).getDelivery(_deliveryId);
 
         // チェック：決済が有効であること
-        require(
-            delivery.valid == true,
-            ErrorCode.ERR_IbetSecurityTokenDVP_abortDelivery_260402
-        );
+        if (!delivery.valid)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_abortDelivery_260402
+            );
 
         // チェック：決済が確認済であること
-        require(
-            delivery.confirmed == true,
-            ErrorCode.ERR_IbetSecurityTokenDVP_abortDelivery_260403
-        );
+        if (!delivery.confirmed)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_abortDelivery_260403
+            );
 
         // チェック：msg.senderがDVP決済のagentであること
-        require(
-            msg.sender == delivery.agent,
-            ErrorCode.ERR_IbetSecurityTokenDVP_abortDelivery_260404
-        );
+        if (msg.sender != delivery.agent)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_abortDelivery_260404
+            );
 
         // 更新：残高
         DVPStorage(storageAddress).setBalance(
@@ -588,6 +670,44 @@ contract IbetSecurityTokenDVP is Ownable, IbetExchangeInterface {
         return success;
     }
 
+    /// @notice DVP決済一括新規作成
+    /// @param _tokenList トークンアドレスのリスト
+    /// @param _buyerList トークン受領者のリスト
+    /// @param _amountList 数量のリスト
+    /// @param _agentList 決済エージェントのリスト
+    /// @param _dataList イベント出力用の任意のデータのリスト
+    /// @return deliveryIdList 決済IDのリスト
+    function bulkCreateDelivery(
+        address[] calldata _tokenList,
+        address[] calldata _buyerList,
+        uint256[] calldata _amountList,
+        address[] calldata _agentList,
+        string[] calldata _dataList
+    ) public returns (uint256[] memory deliveryIdList) {
+        // チェック：リストの要素数が一致すること
+        if (
+            _tokenList.length != _buyerList.length ||
+            _tokenList.length != _amountList.length ||
+            _tokenList.length != _agentList.length ||
+            _tokenList.length != _dataList.length
+        )
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_bulkCreateDelivery_260701
+            );
+
+        deliveryIdList = new uint256[](_tokenList.length);
+        for (uint i = 0; i < _tokenList.length; i++) {
+            deliveryIdList[i] = createDelivery(
+                _tokenList[i],
+                _buyerList[i],
+                _amountList[i],
+                _agentList[i],
+                _dataList[i]
+            );
+        }
+        return deliveryIdList;
+    }
+
     /// @notice 部分的に残高を引き出しする
     /// @dev 決済で拘束されているものは引き出しされない
     /// @param _token トークンアドレス
@@ -599,10 +719,10 @@ contract IbetSecurityTokenDVP is Ownable, IbetExchangeInterface {
     ) public returns (bool) {
         uint256 balance = balanceOf(msg.sender, _token);
 
-        require(
-            balance >= _value,
-            ErrorCode.ERR_IbetSecurityTokenDVP_withdrawPartial_260601
-        );
+        if (balance < _value)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_withdrawPartial_260601
+            );
 
         // 更新処理：トークン引き出し（送信）
         IbetSecurityTokenInterface(_token).transfer(msg.sender, _value);
@@ -625,10 +745,10 @@ contract IbetSecurityTokenDVP is Ownable, IbetExchangeInterface {
     function withdraw(address _token) public override returns (bool) {
         uint256 balance = balanceOf(msg.sender, _token);
 
-        require(
-            balance > 0,
-            ErrorCode.ERR_IbetSecurityTokenDVP_withdraw_260501
-        );
+        if (balance == 0)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenDVP_withdraw_260501
+            );
 
         // 更新処理：トークン引き出し（送信）
         IbetSecurityTokenInterface(_token).transfer(msg.sender, balance);
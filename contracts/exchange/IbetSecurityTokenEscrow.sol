@@ -90,6 +90,9 @@ contract IbetSecurityTokenEscrow is Ownable, IbetExchangeInterface {
         string data
     );
 
+    /// Event: 移転一括承認のスキップ
+    event ApproveTransferSkipped(uint256 indexed escrowId, uint256 errorCode);
+
     // ---------------------------------------------------------------
     // Constructor
     // ---------------------------------------------------------------
@@ -202,6 +205,34 @@ contract IbetSecurityTokenEscrow is Ownable, IbetExchangeInterface {
         return EscrowStorage(storageAddress).getCommitment(_account, _token);
     }
 
+    /// @notice 承認待ちの移転申請数の参照
+    /// @param _token トークンアドレス
+    /// @return 承認待ちの移転申請数
+    function getPendingApplicationCount(
+        address _token
+    ) public view returns (uint256) {
+        return EscrowStorage(storageAddress).getPendingApplicationCount(_token);
+    }
+
+    /// @notice 承認待ちの移転申請の範囲参照
+    /// @dev エスクロー完了済で未承認の移転申請のみを返す
+    /// @param _token トークンアドレス
+    /// @param _offset 開始位置
+    /// @param _limit 最大取得件数
+    /// @return エスクローIDのリスト
+    function getPendingApplications(
+        address _token,
+        uint256 _offset,
+        uint256 _limit
+    ) public view returns (uint256[] memory) {
+        return
+            EscrowStorage(storageAddress).getPendingApplications(
+                _token,
+                _offset,
+                _limit
+            );
+    }
+
     // ---------------------------------------------------------------
     // Function: Logic
     // ---------------------------------------------------------------
@@ -222,23 +253,24 @@ contract IbetSecurityTokenEscrow is Ownable, IbetExchangeInterface {
         string memory _data
     ) public returns (bool) {
         // チェック：数量がゼロより大きいこと
-        require(
-            _amount > 0,
-            ErrorCode.ERR_IbetSecurityTokenEscrow_createEscrow_240001
-        );
+        if (_amount == 0)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenEscrow_createEscrow_240001
+            );
 
         // チェック：数量が残高以下であること
-        require(
-            EscrowStorage(storageAddress).getBalance(msg.sender, _token) >=
-                _amount,
+        if (
+            EscrowStorage(storageAddress).getBalance(msg.sender, _token) <
+                _amount
+        ) revert IbetError(
             ErrorCode.ERR_IbetSecurityTokenEscrow_createEscrow_240002
         );
 
         // チェック：トークンのステータスが有効であること
-        require(
-            IbetSecurityTokenInterface(_token).status() == true,
-            ErrorCode.ERR_IbetSecurityTokenEscrow_createEscrow_240003
-        );
+        if (!IbetSecurityTokenInterface(_token).status())
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenEscrow_createEscrow_240003
+            );
 
         // 更新：エスクローIDをカウントアップ
         uint256 _escrowId =
@@ -313,10 +345,10 @@ contract IbetSecurityTokenEscrow is Ownable, IbetExchangeInterface {
     /// @param _escrowId エスクローID
     function cancelEscrow(uint256 _escrowId) public returns (bool) {
         // チェック：エスクローIDが直近ID以下であること
-        require(
-            _escrowId <= EscrowStorage(storageAddress).getLatestEscrowId(),
-            ErrorCode.ERR_IbetSecurityTokenEscrow_cancelEscrow_240101
-        );
+        if (_escrowId > EscrowStorage(storageAddress).getLatestEscrowId())
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenEscrow_cancelEscrow_240101
+            );
 
         Escrow memory escrow;
         (
@@ -329,22 +361,22 @@ contract IbetSecurityTokenEscrow is Ownable, IbetExchangeInterface {
         ) = EscrowStorage(storageAddress).getEscrow(_escrowId);
 
         // チェック：エスクローが有効であること
-        require(
-            escrow.valid == true,
-            ErrorCode.ERR_IbetSecurityTokenEscrow_cancelEscrow_240102
-        );
+        if (!escrow.valid)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenEscrow_cancelEscrow_240102
+            );
 
         // チェック：msg.senderがエスクローのsender、またはagentであること
-        require(
-            msg.sender == escrow.sender || msg.sender == escrow.agent,
-            ErrorCode.ERR_IbetSecurityTokenEscrow_cancelEscrow_240103
-        );
+        if (msg.sender != escrow.sender && msg.sender != escrow.agent)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenEscrow_cancelEscrow_240103
+            );
 
         // チェック：トークンのステータスが有効であること
-        require(
-            IbetSecurityTokenInterface(escrow.token).status() == true,
-            ErrorCode.ERR_IbetSecurityTokenEscrow_cancelEscrow_240104
-        );
+        if (!IbetSecurityTokenInterface(escrow.token).status())
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenEscrow_cancelEscrow_240104
+            );
 
         // 更新：残高
         EscrowStorage(storageAddress).setBalance(
@@ -429,6 +461,52 @@ contract IbetSecurityTokenEscrow is Ownable, IbetExchangeInterface {
         uint256 _escrowId,
         string memory _transferApprovalData
     ) public returns (bool) {
+        uint256 _errorCode = tryApproveTransfer(
+            _escrowId,
+            _transferApprovalData
+        );
+        if (_errorCode != 0) revert IbetError(_errorCode);
+        return true;
+    }
+
+    /// @notice 移転一括承認
+    /// @dev 承認できなかった移転申請はスキップし、エラーコードを返す
+    /// @param _escrowIdList エスクローIDのリスト
+    /// @param _transferApprovalDataList 移転承認データのリスト
+    /// @return errorCodeList エラーコードのリスト（承認成功の場合は0）
+    function bulkApproveTransfer(
+        uint256[] calldata _escrowIdList,
+        string[] calldata _transferApprovalDataList
+    ) public returns (uint256[] memory errorCodeList) {
+        // チェック：リストの要素数が一致すること
+        if (_escrowIdList.length != _transferApprovalDataList.length)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenEscrow_bulkApproveTransfer_240501
+            );
+
+        errorCodeList = new uint256[](_escrowIdList.length);
+        for (uint i = 0; i < _escrowIdList.length; i++) {
+            errorCodeList[i] = tryApproveTransfer(
+                _escrowIdList[i],
+                _transferApprovalDataList[i]
+            );
+            if (errorCodeList[i] != 0) {
+                // イベント登録
+                emit ApproveTransferSkipped(_escrowIdList[i], errorCodeList[i]);
+            }
+        }
+        return errorCodeList;
+    }
+
+    /// @dev 移転承認
+    /// @dev チェックエラーの場合は状態を更新せずにエラーコードを返す
+    /// @param _escrowId エスクローID
+    /// @param _transferApprovalData 移転承認データ
+    /// @return エラーコード（承認成功の場合は0）
+    function tryApproveTransfer(
+        uint256 _escrowId,
+        string memory _transferApprovalData
+    ) private returns (uint256) {
         ApplicationForTransfer memory application;
         (
             application.token,
@@ -450,34 +528,28 @@ contract IbetSecurityTokenEscrow is Ownable, IbetExchangeInterface {
         ) = EscrowStorage(storageAddress).getEscrow(_escrowId);
 
         // チェック：移転申請が存在すること
-        require(
-            application.token != address(0),
-            ErrorCode.ERR_IbetSecurityTokenEscrow_approveTransfer_240201
-        );
+        if (application.token == address(0))
+            return ErrorCode.ERR_IbetSecurityTokenEscrow_approveTransfer_240201;
 
         // チェック：承認者がトークンのオーナーであること
-        require(
-            msg.sender == Ownable(application.token).owner(),
-            ErrorCode.ERR_IbetSecurityTokenEscrow_approveTransfer_240202
-        );
+        if (msg.sender != Ownable(application.token).owner())
+            return ErrorCode.ERR_IbetSecurityTokenEscrow_approveTransfer_240202;
 
         // チェック：移転申請が有効状態であること
-        require(
-            application.valid == true,
-            ErrorCode.ERR_IbetSecurityTokenEscrow_approveTransfer_240203
-        );
+        if (!application.valid)
+            return ErrorCode.ERR_IbetSecurityTokenEscrow_approveTransfer_240203;
 
         // チェック：移転申請のエスクロー状態が完了状態であること
-        require(
-            application.escrowFinished == true,
-            ErrorCode.ERR_IbetSecurityTokenEscrow_approveTransfer_240204
-        );
+        if (!application.escrowFinished)
+            return ErrorCode.ERR_IbetSecurityTokenEscrow_approveTransfer_240204;
+
+        // チェック：移転申請が承認済みではないこと
+        if (application.approved)
+            return ErrorCode.ERR_IbetSecurityTokenEscrow_approveTransfer_240206;
 
         // チェック：トークンのステータスが有効であること
-        require(
-            IbetSecurityTokenInterface(escrow.token).status() == true,
-            ErrorCode.ERR_IbetSecurityTokenEscrow_approveTransfer_240205
-        );
+        if (!IbetSecurityTokenInterface(escrow.token).status())
+            return ErrorCode.ERR_IbetSecurityTokenEscrow_approveTransfer_240205;
 
         // 更新：移転承諾
         EscrowStorage(storageAddress).setApplicationForTransfer(
@@ -518,17 +590,17 @@ contract IbetSecurityTokenEscrow is Ownable, IbetExchangeInterface {
             escrow.amount
         );
 
-        return true;
+        return 0;
     }
 
     /// @notice エスクロー完了
     /// @param _escrowId エスクローID
     function finishEscrow(uint256 _escrowId) public returns (bool) {
         // チェック：エスクローIDが直近ID以下であること
-        require(
-            _escrowId <= EscrowStorage(storageAddress).getLatestEscrowId(),
-            ErrorCode.ERR_IbetSecurityTokenEscrow_finishEscrow_240301
-        );
+        if (_escrowId > EscrowStorage(storageAddress).getLatestEscrowId())
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenEscrow_finishEscrow_240301
+            );
 
         Escrow memory escrow;
         (
@@ -541,22 +613,22 @@ contract IbetSecurityTokenEscrow is Ownable, IbetExchangeInterface {
         ) = EscrowStorage(storageAddress).getEscrow(_escrowId);
 
         // チェック：エスクローが取消済みではないこと
-        require(
-            escrow.valid == true,
-            ErrorCode.ERR_IbetSecurityTokenEscrow_finishEscrow_240302
-        );
+        if (!escrow.valid)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenEscrow_finishEscrow_240302
+            );
 
         // チェック：msg.senderがエスクローのagentであること
-        require(
-            escrow.agent == msg.sender,
-            ErrorCode.ERR_IbetSecurityTokenEscrow_finishEscrow_240303
-        );
+        if (escrow.agent != msg.sender)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenEscrow_finishEscrow_240303
+            );
 
         // チェック：トークンのステータスが有効であること
-        require(
-            IbetSecurityTokenInterface(escrow.token).status() == true,
-            ErrorCode.ERR_IbetSecurityTokenEscrow_finishEscrow_240304
-        );
+        if (!IbetSecurityTokenInterface(escrow.token).status())
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenEscrow_finishEscrow_240304
+            );
 
         if (
             IbetSecurityTokenInterface(escrow.token)
@@ -672,10 +744,10 @@ contract IbetSecurityTokenEscrow is Ownable, IbetExchangeInterface {
     function withdraw(address _token) public override returns (bool) {
         uint256 balance = balanceOf(msg.sender, _token);
 
-        require(
-            balance > 0,
-            ErrorCode.ERR_IbetSecurityTokenEscrow_withdraw_240401
-        );
+        if (balance == 0)
+            revert IbetError(
+                ErrorCode.ERR_IbetSecurityTokenEscrow_withdraw_240401
+            );
 
         // 更新処理：トークン引き出し（送信）
         IbetSecurityTokenInterface(_token).transfer(msg.sender, balance);
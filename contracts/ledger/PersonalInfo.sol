@@ -77,14 +77,10 @@ contract PersonalInfo {
         Info storage info = personal_info[_account_address][msg.sender];
 
         // 登録済みか確認
-        require(
-            info.account_address == _account_address,
-            ErrorCode.ERR_PersonalInfo_modify_400001
-        );
-        require(
-            info.link_address == msg.sender,
-            ErrorCode.ERR_PersonalInfo_modify_400002
-        );
+        if (info.account_address != _account_address)
+            revert IbetError(ErrorCode.ERR_PersonalInfo_modify_400001);
+        if (info.link_address != msg.sender)
+            revert IbetError(ErrorCode.ERR_PersonalInfo_modify_400002);
 
         info.encrypted_info = _encrypted_info;
 
@@ -110,6 +106,27 @@ contract PersonalInfo {
         return true;
     }
 
+    /// @notice 個人情報登録（一括強制登録）
+    /// @param _account_address_list アカウントアドレスのリスト
+    /// @param _encrypted_info_list 暗号化済個人情報のリスト
+    /// @return 処理結果
+    function bulkForceRegister(
+        address[] calldata _account_address_list,
+        string[] calldata _encrypted_info_list
+    ) public returns (bool) {
+        // <CHK>
+        // リスト長が等しくない場合、エラーを返す
+        if (_account_address_list.length != _encrypted_info_list.length)
+            revert IbetError(
+                ErrorCode.ERR_PersonalInfo_bulkForceRegister_400101
+            );
+
+        for (uint256 i = 0; i < _account_address_list.length; i++) {
+            forceRegister(_account_address_list[i], _encrypted_info_list[i]);
+        }
+        return true;
+    }
+
     /// @notice 登録状況の確認
     /// @param _account_address アカウントアドレス
     /// @param _link_address 通知先アドレス
@@ -125,4 +142,22 @@ contract PersonalInfo {
             return true;
         }
     }
+
+    /// @notice 登録状況の確認（一括）
+    /// @param _account_address_list アカウントアドレスのリスト
+    /// @param _link_address 通知先アドレス
+    /// @return 登録状況のリスト
+    function isRegisteredBatch(
+        address[] calldata _account_address_list,
+        address _link_address
+    ) public view returns (bool[] memory) {
+        bool[] memory registered = new bool[](_account_address_list.length);
+        for (uint256 i = 0; i < _account_address_list.length; i++) {
+            registered[i] = isRegistered(
+                _account_address_list[i],
+                _link_address
+            );
+        }
+        return registered;
+    }
 }
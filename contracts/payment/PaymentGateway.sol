@@ -115,10 +115,8 @@ contract PaymentGateway is Ownable {
         PaymentAccount storage payment_account = payment_accounts[msg.sender][
             _agent_address
         ];
-        require(
-            payment_account.approval_status != 4,
-            ErrorCode.ERR_PaymentGateway_register_300001
-        );
+        if (payment_account.approval_status == 4)
+            revert IbetError(ErrorCode.ERR_PaymentGateway_register_300001);
 
         // 口座情報の登録
         payment_account.account_address = msg.sender;
@@ -137,10 +135,8 @@ contract PaymentGateway is Ownable {
         PaymentAccount storage payment_account = payment_accounts[
             _account_address
         ][msg.sender];
-        require(
-            payment_account.account_address != address(0),
-            ErrorCode.ERR_PaymentGateway_approve_300101
-        );
+        if (payment_account.account_address == address(0))
+            revert IbetError(ErrorCode.ERR_PaymentGateway_approve_300101);
 
         payment_account.approval_status = 2;
 
@@ -155,10 +151,8 @@ contract PaymentGateway is Ownable {
         PaymentAccount storage payment_account = payment_accounts[
             _account_address
         ][msg.sender];
-        require(
-            payment_account.account_address != address(0),
-            ErrorCode.ERR_PaymentGateway_warn_300201
-        );
+        if (payment_account.account_address == address(0))
+            revert IbetError(ErrorCode.ERR_PaymentGateway_warn_300201);
 
         payment_account.approval_status = 3;
 
@@ -173,10 +167,8 @@ contract PaymentGateway is Ownable {
         PaymentAccount storage payment_account = payment_accounts[
             _account_address
         ][msg.sender];
-        require(
-            payment_account.account_address != address(0),
-            ErrorCode.ERR_PaymentGateway_disapprove_300301
-        );
+        if (payment_account.account_address == address(0))
+            revert IbetError(ErrorCode.ERR_PaymentGateway_disapprove_300301);
 
         payment_account.approval_status = 1;
 
@@ -191,10 +183,8 @@ contract PaymentGateway is Ownable {
         PaymentAccount storage payment_account = payment_accounts[
             _account_address
         ][msg.sender];
-        require(
-            payment_account.account_address != address(0),
-            ErrorCode.ERR_PaymentGateway_ban_300401
-        );
+        if (payment_account.account_address == address(0))
+            revert IbetError(ErrorCode.ERR_PaymentGateway_ban_300401);
 
         payment_account.approval_status = 4;
 
@@ -202,6 +192,46 @@ contract PaymentGateway is Ownable {
         return true;
     }
 
+    /// @notice 支払用口座情報の承認（一括）
+    /// @dev 未登録のアカウントはスキップする
+    /// @param _account_address_list アカウントアドレスのリスト
+    /// @return 処理結果のリスト（未登録の場合はfalse）
+    function bulkApprove(
+        address[] calldata _account_address_list
+    ) public returns (bool[] memory) {
+        return _bulkUpdateApprovalStatus(_account_address_list, 2);
+    }
+
+    /// @notice 支払用口座情報を警告状態にする（一括）
+    /// @dev 未登録のアカウントはスキップする
+    /// @param _account_address_list アカウントアドレスのリスト
+    /// @return 処理結果のリスト（未登録の場合はfalse）
+    function bulkWarn(
+        address[] calldata _account_address_list
+    ) public returns (bool[] memory) {
+        return _bulkUpdateApprovalStatus(_account_address_list, 3);
+    }
+
+    /// @notice 支払用口座情報を非承認状態にする（一括）
+    /// @dev 未登録のアカウントはスキップする
+    /// @param _account_address_list アカウントアドレスのリスト
+    /// @return 処理結果のリスト（未登録の場合はfalse）
+    function bulkDisapprove(
+        address[] calldata _account_address_list
+    ) public returns (bool[] memory) {
+        return _bulkUpdateApprovalStatus(_account_address_list, 1);
+    }
+
+    /// @notice 支払用口座情報を停止状態にする（一括）
+    /// @dev 未登録のアカウントはスキップする
+    /// @param _account_address_list アカウントアドレスのリスト
+    /// @return 処理結果のリスト（未登録の場合はfalse）
+    function bulkBan(
+        address[] calldata _account_address_list
+    ) public returns (bool[] memory) {
+        return _bulkUpdateApprovalStatus(_account_address_list, 4);
+    }
+
     /// @notice アカウントの承認状態を返却する
     /// @param _account_address アカウントアドレス
     /// @param _agent_address 収納代行業者のアドレス
@@ -224,6 +254,24 @@ contract PaymentGateway is Ownable {
         }
     }
 
+    /// @notice アカウントの承認状態を返却する（一括）
+    /// @param _account_address_list アカウントアドレスのリスト
+    /// @param _agent_address 収納代行業者のアドレス
+    /// @return 承認状態のリスト
+    function accountApprovedBatch(
+        address[] calldata _account_address_list,
+        address _agent_address
+    ) public view returns (bool[] memory) {
+        bool[] memory approved = new bool[](_account_address_list.length);
+        for (uint256 i = 0; i < _account_address_list.length; i++) {
+            approved[i] = accountApproved(
+                _account_address_list[i],
+                _agent_address
+            );
+        }
+        return approved;
+    }
+
     /// @notice 支払用口座情報の修正
     /// @dev 収納代行業者による修正。口座登録アカウントによる修正はregister()を使う。この関数では認可状況の更新は行わない。
     /// @param _account_address 銀行口座情報登録アカウントアドレス
@@ -238,14 +286,45 @@ contract PaymentGateway is Ownable {
         ][msg.sender];
 
         // 登録済みか確認
-        require(
-            payment_account.account_address != address(0),
-            ErrorCode.ERR_PaymentGateway_modify_300501
-        );
+        if (payment_account.account_address == address(0))
+            revert IbetError(ErrorCode.ERR_PaymentGateway_modify_300501);
 
         payment_account.encrypted_info = _encrypted_info;
 
         emit Modify(_account_address, msg.sender);
         return true;
     }
+
+    /// @dev 認可状況の一括更新
+    /// @param _account_address_list アカウントアドレスのリスト
+    /// @param _approval_status 認可状況（NG(1)/OK(2)/WARN(3)/BAN(4)）
+    /// @return results 処理結果のリスト（未登録の場合はfalse）
+    function _bulkUpdateApprovalStatus(
+        address[] calldata _account_address_list,
+        uint8 _approval_status
+    ) private returns (bool[] memory results) {
+        results = new bool[](_account_address_list.length);
+        for (uint256 i = 0; i < _account_address_list.length; i++) {
+            address _account_address = _account_address_list[i];
+            PaymentAccount storage payment_account = payment_accounts[
+                _account_address
+            ][msg.sender];
+            if (payment_account.account_address == address(0)) {
+                continue;
+            }
+
+            payment_account.approval_status = _approval_status;
+            results[i] = true;
+
+            if (_approval_status == 1) {
+                emit Disapprove(_account_address, msg.sender);
+            } else if (_approval_status == 2) {
+                emit Approve(_account_address, msg.sender);
+            } else if (_approval_status == 3) {
+                emit Warn(_account_address, msg.sender);
+            } else {
+                emit Ban(_account_address, msg.sender);
+            }
+        }
+    }
 }
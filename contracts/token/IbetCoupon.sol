@@ -137,10 +137,10 @@ contract IbetCoupon is Ownable, IbetStandardTokenInterface {
         uint _value,
         bytes memory _data
     ) private returns (bool success) {
-        require(
-            _to == tradableExchange,
-            ErrorCode.ERR_IbetCoupon_transferToContract_130001
-        );
+        if (_to != tradableExchange)
+            revert IbetError(
+                ErrorCode.ERR_IbetCoupon_transferToContract_130001
+            );
         balances[msg.sender] = balanceOf(msg.sender).sub(_value);
         balances[_to] = balanceOf(_to).add(_value);
         ContractReceiver receiver = ContractReceiver(_to);
@@ -159,13 +159,11 @@ contract IbetCoupon is Ownable, IbetStandardTokenInterface {
     ) public override returns (bool success) {
         // 譲渡しようとしている数量が残高を超えている場合、エラーを返す
         if (balanceOf(msg.sender) < _value)
-            revert(ErrorCode.ERR_IbetCoupon_transfer_130101);
+            revert IbetError(ErrorCode.ERR_IbetCoupon_transfer_130101);
         if (msg.sender != tradableExchange) {
             // 譲渡可能なクーポンではない場合、エラーを返す
-            require(
-                transferable == true,
-                ErrorCode.ERR_IbetCoupon_transfer_130102
-            );
+            if (!transferable)
+                revert IbetError(ErrorCode.ERR_IbetCoupon_transfer_130102);
         }
         bytes memory empty;
         if (isContract(_to)) {
@@ -186,7 +184,7 @@ contract IbetCoupon is Ownable, IbetStandardTokenInterface {
         // <CHK>
         // リスト長が等しくない場合、エラーを返す
         if (_toList.length != _valueList.length)
-            revert(ErrorCode.ERR_IbetCoupon_bulkTransfer_130201);
+            revert IbetError(ErrorCode.ERR_IbetCoupon_bulkTransfer_130201);
 
         // <CHK>
         // 数量が残高を超えている場合、エラーを返す
@@ -195,15 +193,13 @@ contract IbetCoupon is Ownable, IbetStandardTokenInterface {
             totalValue += _valueList[i];
         }
         if (balanceOf(msg.sender) < totalValue)
-            revert(ErrorCode.ERR_IbetCoupon_bulkTransfer_130202);
+            revert IbetError(ErrorCode.ERR_IbetCoupon_bulkTransfer_130202);
 
         // <CHK>
         // 譲渡可能ではない場合、エラーを返す
         if (msg.sender != tradableExchange) {
-            require(
-                transferable == true,
-                ErrorCode.ERR_IbetCoupon_bulkTransfer_130203
-            );
+            if (!transferable)
+                revert IbetError(ErrorCode.ERR_IbetCoupon_bulkTransfer_130203);
         }
 
         bytes memory empty;
@@ -235,7 +231,7 @@ contract IbetCoupon is Ownable, IbetStandardTokenInterface {
     ) public override onlyOwner returns (bool success) {
         //  数量が送信元アドレス（from）の残高を超えている場合、エラーを返す
         if (balanceOf(_from) < _value)
-            revert(ErrorCode.ERR_IbetCoupon_transferFrom_130301);
+            revert IbetError(ErrorCode.ERR_IbetCoupon_transferFrom_130301);
 
         bytes memory empty;
         if (isContract(_to)) {
@@ -272,7 +268,7 @@ contract IbetCoupon is Ownable, IbetStandardTokenInterface {
         if (
             _fromList.length != _toList.length ||
             _fromList.length != _valueList.length
-        ) revert(ErrorCode.ERR_IbetCoupon_bulkTransferFrom_130601);
+        ) revert IbetError(ErrorCode.ERR_IbetCoupon_bulkTransferFrom_130601);
         // 強制移転（一括）
         for (uint256 i = 0; i < _fromList.length; i++) {
             transferFrom(_fromList[i], _toList[i], _valueList[i]);
@@ -285,7 +281,7 @@ contract IbetCoupon is Ownable, IbetStandardTokenInterface {
     function consume(uint _value) public {
         // 消費しようとしている数量が残高を超えている場合、エラーを返す
         if (balanceOf(msg.sender) < _value)
-            revert(ErrorCode.ERR_IbetCoupon_consume_130401);
+            revert IbetError(ErrorCode.ERR_IbetCoupon_consume_130401);
 
         // 残高数量を更新する
         balances[msg.sender] = balanceOf(msg.sender).sub(_value);
@@ -419,10 +415,8 @@ contract IbetCoupon is Ownable, IbetStandardTokenInterface {
     /// @param _data 申込付与情報
     function applyForOffering(string memory _data) public {
         // 申込ステータスが停止中の場合、エラーを返す
-        require(
-            initialOfferingStatus == true,
-            ErrorCode.ERR_IbetCoupon_applyForOffering_130501
-        );
+        if (!initialOfferingStatus)
+            revert IbetError(ErrorCode.ERR_IbetCoupon_applyForOffering_130501);
         applications[msg.sender] = _data;
         emit ApplyFor(msg.sender);
     }
@@ -128,10 +128,10 @@ contract IbetMembership is Ownable, IbetStandardTokenInterface {
         uint _value,
         bytes memory _data
     ) private returns (bool success) {
-        require(
-            _to == tradableExchange,
-            ErrorCode.ERR_IbetMembership_transferToContract_140001
-        );
+        if (_to != tradableExchange)
+            revert IbetError(
+                ErrorCode.ERR_IbetMembership_transferToContract_140001
+            );
         balances[msg.sender] = balanceOf(msg.sender).sub(_value);
         balances[_to] = balanceOf(_to).add(_value);
 
@@ -151,13 +151,11 @@ contract IbetMembership is Ownable, IbetStandardTokenInterface {
     function transfer(address _to, uint _value) public override returns (bool) {
         //  数量が残高を超えている場合、エラーを返す
         if (balanceOf(msg.sender) < _value)
-            revert(ErrorCode.ERR_IbetMembership_transfer_140101);
+            revert IbetError(ErrorCode.ERR_IbetMembership_transfer_140101);
         if (msg.sender != tradableExchange) {
             // 譲渡可能ではない場合、エラーを返す
-            require(
-                transferable == true,
-                ErrorCode.ERR_IbetMembership_transfer_140102
-            );
+            if (!transferable)
+                revert IbetError(ErrorCode.ERR_IbetMembership_transfer_140102);
         }
 
         bytes memory empty;
@@ -179,7 +177,7 @@ contract IbetMembership is Ownable, IbetStandardTokenInterface {
         // <CHK>
         // リスト長が等しくない場合、エラーを返す
         if (_toList.length != _valueList.length)
-            revert(ErrorCode.ERR_IbetMembership_bulkTransfer_140201);
+            revert IbetError(ErrorCode.ERR_IbetMembership_bulkTransfer_140201);
 
         // <CHK>
         // 数量が残高を超えている場合、エラーを返す
@@ -188,15 +186,15 @@ contract IbetMembership is Ownable, IbetStandardTokenInterface {
             totalValue += _valueList[i];
         }
         if (balanceOf(msg.sender) < totalValue)
-            revert(ErrorCode.ERR_IbetMembership_bulkTransfer_140202);
+            revert IbetError(ErrorCode.ERR_IbetMembership_bulkTransfer_140202);
 
         // <CHK>
         // 譲渡可能ではない場合、エラーを返す
         if (msg.sender != tradableExchange) {
-            require(
-                transferable == true,
-                ErrorCode.ERR_IbetMembership_bulkTransfer_140203
-            );
+            if (!transferable)
+                revert IbetError(
+                    ErrorCode.ERR_IbetMembership_bulkTransfer_140203
+                );
         }
 
         bytes memory empty;
@@ -228,7 +226,7 @@ contract IbetMembership is Ownable, IbetStandardTokenInterface {
     ) public override onlyOwner returns (bool success) {
         //  数量が送信元アドレス（from）の残高を超えている場合、エラーを返す
         if (balanceOf(_from) < _value)
-            revert(ErrorCode.ERR_IbetMembership_transferFrom_140301);
+            revert IbetError(ErrorCode.ERR_IbetMembership_transferFrom_140301);
 
         bytes memory empty;
         if (isContract(_to)) {
@@ -265,7 +263,9 @@ contract IbetMembership is Ownable, IbetStandardTokenInterface {
         if (
             _fromList.length != _toList.length ||
             _fromList.length != _valueList.length
-        ) revert(ErrorCode.ERR_IbetMembership_bulkTransferFrom_140501);
+        ) revert IbetError(
+            ErrorCode.ERR_IbetMembership_bulkTransferFrom_140501
+        );
         // 強制移転（一括）
         for (uint256 i = 0; i < _fromList.length; i++) {
             transferFrom(_fromList[i], _toList[i], _valueList[i]);
@@ -385,10 +385,10 @@ contract IbetMembership is Ownable, IbetStandardTokenInterface {
     /// @param _data 申込付与情報
     function applyForOffering(string memory _data) public {
         // 申込ステータスが停止中の場合、エラーを返す
-        require(
-            initialOfferingStatus == true,
-            ErrorCode.ERR_IbetMembership_applyForOffering_140401
-        );
+        if (!initialOfferingStatus)
+            revert IbetError(
+                ErrorCode.ERR_IbetMembership_applyForOffering_140401
+            );
         applications[msg.sender] = _data;
         emit ApplyFor(msg.sender);
     }
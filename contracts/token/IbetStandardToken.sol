@@ -91,10 +91,10 @@ contract IbetStandardToken is Ownable, IbetStandardTokenInterface {
         uint _value,
         bytes memory _data
     ) private returns (bool success) {
-        require(
-            _to == tradableExchange,
-            ErrorCode.ERR_IbetStandardToken_transferToContract_150001
-        );
+        if (_to != tradableExchange)
+            revert IbetError(
+                ErrorCode.ERR_IbetStandardToken_transferToContract_150001
+            );
         balances[msg.sender] = balanceOf(msg.sender).sub(_value);
         balances[_to] = balanceOf(_to).add(_value);
         ContractReceiver receiver = ContractReceiver(_to);
@@ -113,7 +113,7 @@ contract IbetStandardToken is Ownable, IbetStandardTokenInterface {
     ) public override returns (bool success) {
         // 譲渡しようとしている数量が残高を超えている場合、エラーを返す
         if (balanceOf(msg.sender) < _value)
-            revert(ErrorCode.ERR_IbetStandardToken_transfer_150101);
+            revert IbetError(ErrorCode.ERR_IbetStandardToken_transfer_150101);
 
         bytes memory empty;
         if (isContract(_to)) {
@@ -134,7 +134,9 @@ contract IbetStandardToken is Ownable, IbetStandardTokenInterface {
         // <CHK>
         // リスト長が等しくない場合、エラーを返す
         if (_toList.length != _valueList.length)
-            revert(ErrorCode.ERR_IbetStandardToken_bulkTransfer_150201);
+            revert IbetError(
+                ErrorCode.ERR_IbetStandardToken_bulkTransfer_150201
+            );
 
         // <CHK>
         // 数量が残高を超えている場合、エラーを返す
@@ -143,7 +145,9 @@ contract IbetStandardToken is Ownable, IbetStandardTokenInterface {
             totalValue += _valueList[i];
         }
         if (balanceOf(msg.sender) < totalValue)
-            revert(ErrorCode.ERR_IbetStandardToken_bulkTransfer_150202);
+            revert IbetError(
+                ErrorCode.ERR_IbetStandardToken_bulkTransfer_150202
+            );
 
         bytes memory empty;
         bool result;
@@ -174,7 +178,9 @@ contract IbetStandardToken is Ownable, IbetStandardTokenInterface {
     ) public override onlyOwner returns (bool success) {
         //  数量が送信元アドレス（from）の残高を超えている場合、エラーを返す
         if (balanceOf(_from) < _value)
-            revert(ErrorCode.ERR_IbetStandardToken_transferFrom_150301);
+            revert IbetError(
+                ErrorCode.ERR_IbetStandardToken_transferFrom_150301
+            );
 
         bytes memory empty;
         if (isContract(_to)) {
@@ -211,7 +217,9 @@ contract IbetStandardToken is Ownable, IbetStandardTokenInterface {
         if (
             _fromList.length != _toList.length ||
             _fromList.length != _valueList.length
-        ) revert(ErrorCode.ERR_IbetStandardToken_bulkTransferFrom_150401);
+        ) revert IbetError(
+            ErrorCode.ERR_IbetStandardToken_bulkTransferFrom_150401
+        );
         // 強制移転（一括）
         for (uint256 i = 0; i < _fromList.length; i++) {
             transferFrom(_fromList[i], _toList[i], _valueList[i]);
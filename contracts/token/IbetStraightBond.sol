@@ -21,6 +21,7 @@ pragma solidity ^0.8.23;
 import "OpenZeppelin/openzeppelin-contracts@4.9.3/contracts/utils/math/SafeMath.sol";
 import "../access/Ownable.sol";
 import "../ledger/PersonalInfo.sol";
+import "../utils/AddressList.sol";
 import "../utils/Errors.sol";
 import "../../interfaces/ContractReceiver.sol";
 import "../../interfaces/IbetSecurityTokenInterface.sol";
@@ -28,6 +29,7 @@ import "../../interfaces/IbetSecurityTokenInterface.sol";
 /// @title ibet Straight Bond Token
 contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
     using SafeMath for uint256;
+    using AddressList for AddressList.List;
 
     uint256 public faceValue; // 額面金額
     uint256 public interestRate; // 年利
@@ -119,7 +121,9 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
         if (
             msg.sender != tradableExchange && transferApprovalRequired == true
         ) {
-            revert(ErrorCode.ERR_IbetStraightBond_transferToAddress_120201);
+            revert IbetError(
+                ErrorCode.ERR_IbetStraightBond_transferToAddress_120201
+            );
         }
 
         // <CHK>
@@ -128,15 +132,16 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
         // - 発行体への移転の場合
         // - 移転時個人情報登録が不要の場合
         if (_to != owner && requirePersonalInfoRegistered == true) {
-            require(
-                PersonalInfo(personalInfoAddress).isRegistered(_to, owner) ==
-                    true,
-                ErrorCode.ERR_IbetStraightBond_transferToAddress_120202
-            );
+            if (!PersonalInfo(personalInfoAddress).isRegistered(_to, owner))
+                revert IbetError(
+                    ErrorCode.ERR_IbetStraightBond_transferToAddress_120202
+                );
         }
 
         balances[msg.sender] = balanceOf(msg.sender).sub(_value);
         balances[_to] = balanceOf(_to).add(_value);
+        updateHolderIndex(msg.sender);
+        updateHolderIndex(_to);
 
         // イベント登録
         emit Transfer(msg.sender, _to, _value);
@@ -155,13 +160,15 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
         bytes memory _data
     ) private returns (bool success) {
         // 宛先はtradableExchangeのみ可能
-        require(
-            _to == tradableExchange,
-            ErrorCode.ERR_IbetStraightBond_transferToContract_120301
-        );
+        if (_to != tradableExchange)
+            revert IbetError(
+                ErrorCode.ERR_IbetStraightBond_transferToContract_120301
+            );
 
         balances[msg.sender] = balanceOf(msg.sender).sub(_value);
         balances[_to] = balanceOf(_to).add(_value);
+        updateHolderIndex(msg.sender);
+        updateHolderIndex(_to);
 
         ContractReceiver receiver = ContractReceiver(_to);
         receiver.tokenFallback(msg.sender, _value, _data);
@@ -180,15 +187,11 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
         address _to,
         uint _value
     ) public override returns (bool success) {
-        require(
-            balanceOf(msg.sender) >= _value,
-            ErrorCode.ERR_IbetStraightBond_transfer_120401
-        );
+        if (balanceOf(msg.sender) < _value)
+            revert IbetError(ErrorCode.ERR_IbetStraightBond_transfer_120401);
 
-        require(
-            transferable == true,
-            ErrorCode.ERR_IbetStraightBond_transfer_120402
-        );
+        if (!transferable)
+            revert IbetError(ErrorCode.ERR_IbetStraightBond_transfer_120402);
 
         bytes memory empty;
         if (isContract(_to)) {
@@ -209,7 +212,9 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
         // <CHK>
         // リスト長が等しくない場合、エラーを返す
         if (_toList.length != _valueList.length)
-            revert(ErrorCode.ERR_IbetStraightBond_bulkTransfer_120501);
+            revert IbetError(
+                ErrorCode.ERR_IbetStraightBond_bulkTransfer_120501
+            );
 
         // <CHK>
         // 数量が残高を超えている場合、エラーを返す
@@ -218,15 +223,17 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
             totalValue += _valueList[i];
         }
         if (balanceOf(msg.sender) < totalValue)
-            revert(ErrorCode.ERR_IbetStraightBond_bulkTransfer_120502);
+            revert IbetError(
+                ErrorCode.ERR_IbetStraightBond_bulkTransfer_120502
+            );
 
         // <CHK>
         // 譲渡可能ではない場合、エラーを返す
         if (msg.sender != tradableExchange) {
-            require(
-                transferable == true,
-                ErrorCode.ERR_IbetStraightBond_bulkTransfer_120503
-            );
+            if (!transferable)
+                revert IbetError(
+                    ErrorCode.ERR_IbetStraightBond_bulkTransfer_120503
+                );
         }
 
         bytes memory empty;
@@ -259,7 +266,9 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
         // <CHK>
         //  数量が送信元アドレス（from）の残高を超えている場合、エラーを返す
         if (balanceOf(_from) < _value)
-            revert(ErrorCode.ERR_IbetStraightBond_transferFrom_120601);
+            revert IbetError(
+                ErrorCode.ERR_IbetStraightBond_transferFrom_120601
+            );
 
         bytes memory empty;
 
@@ -267,12 +276,16 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
             // 送信先アドレスがコントラクトアドレスの場合
             balances[_from] = balanceOf(_from).sub(_value);
             balances[_to] = balanceOf(_to).add(_value);
+            updateHolderIndex(_from);
+            updateHolderIndex(_to);
             ContractReceiver receiver = ContractReceiver(_to);
             receiver.tokenFallback(msg.sender, _value, empty);
         } else {
             // 送信先アドレスがアカウントアドレスの場合
             balances[_from] = balanceOf(_from).sub(_value);
             balances[_to] = balanceOf(_to).add(_value);
+            updateHolderIndex(_from);
+            updateHolderIndex(_to);
         }
 
         // イベント登録
@@ -297,7 +310,9 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
         if (
             _fromList.length != _toList.length ||
             _fromList.length != _valueList.length
-        ) revert(ErrorCode.ERR_IbetStraightBond_bulkTransferFrom_121501);
+        ) revert IbetError(
+            ErrorCode.ERR_IbetStraightBond_bulkTransferFrom_121501
+        );
         // 強制移転（一括）
         for (uint256 i = 0; i < _fromList.length; i++) {
             transferFrom(_fromList[i], _toList[i], _valueList[i]);
@@ -493,18 +508,19 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
         string memory _data
     ) public override {
         // 申込ステータスが停止中の場合、エラーを返す
-        require(
-            isOffering == true,
-            ErrorCode.ERR_IbetStraightBond_applyForOffering_121001
-        );
+        if (!isOffering)
+            revert IbetError(
+                ErrorCode.ERR_IbetStraightBond_applyForOffering_121001
+            );
 
         if (requirePersonalInfoRegistered == true) {
             // 個人情報未登録の場合、エラーを返す
-            require(
-                PersonalInfo(personalInfoAddress).isRegistered(
+            if (
+                !PersonalInfo(personalInfoAddress).isRegistered(
                     msg.sender,
                     owner
-                ) == true,
+                )
+            ) revert IbetError(
                 ErrorCode.ERR_IbetStraightBond_applyForOffering_121002
             );
         }
@@ -541,6 +557,228 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
         return locked[_lockAddress][_accountAddress];
     }
 
+    /// @notice 残高の一括参照
+    /// @param _accountAddressList アカウントアドレスのリスト
+    /// @return balanceList 残高のリスト
+    function balancesOf(
+        address[] calldata _accountAddressList
+    ) public view override returns (uint256[] memory balanceList) {
+        balanceList = new uint256[](_accountAddressList.length);
+        for (uint256 i = 0; i < _accountAddressList.length; i++) {
+            balanceList[i] = balances[_accountAddressList[i]];
+        }
+    }
+
+    /// @notice ロック中資産の一括参照
+    /// @dev ロック先アドレスとロック対象アカウントは同じ位置の要素を組として参照する
+    /// @param _lockAddressList ロック先アドレスのリスト
+    /// @param _accountAddressList ロック対象アカウントのリスト
+    /// @return lockedList ロック中の数量のリスト
+    function lockedOfBatch(
+        address[] calldata _lockAddressList,
+        address[] calldata _accountAddressList
+    ) public view override returns (uint256[] memory lockedList) {
+        // <CHK>
+        // リスト長が等しくない場合、エラーを返す
+        if (_lockAddressList.length != _accountAddressList.length)
+            revert IbetError(
+                ErrorCode.ERR_IbetStraightBond_lockedOfBatch_121801
+            );
+
+        lockedList = new uint256[](_accountAddressList.length);
+        for (uint256 i = 0; i < _accountAddressList.length; i++) {
+            lockedList[i] = locked[_lockAddressList[i]][_accountAddressList[i]];
+        }
+    }
+
+    /// @notice 移転待ち数量の一括参照
+    /// @param _accountAddressList アカウントアドレスのリスト
+    /// @return pendingList 移転待ち数量のリスト
+    function pendingTransfersOf(
+        address[] calldata _accountAddressList
+    ) public view override returns (uint256[] memory pendingList) {
+        pendingList = new uint256[](_accountAddressList.length);
+        for (uint256 i = 0; i < _accountAddressList.length; i++) {
+            pendingList[i] = pendingTransfer[_accountAddressList[i]];
+        }
+    }
+
+    // 保有者リスト
+    AddressList.List private holders;
+
+    /// @notice 保有者インデックス有効化状態の更新
+    /// @dev 発行体のみ実行可能
+    /// @dev 有効化前の保有者はsyncHolderIndexで登録する
+    /// @param _enabled 有効化状態
+    function setHolderIndexEnabled(bool _enabled) public override onlyOwner {
+        holderIndexEnabled = _enabled;
+
+        // イベント登録
+        emit ChangeHolderIndexEnabled(_enabled);
+    }
+
+    /// @notice 保有者インデックスの同期
+    /// @dev 発行体のみ実行可能
+    /// @param _accountAddressList 同期対象のアカウントアドレスのリスト
+    function syncHolderIndex(
+        address[] calldata _accountAddressList
+    ) public override onlyOwner {
+        for (uint256 i = 0; i < _accountAddressList.length; i++) {
+            syncHolder(_accountAddressList[i]);
+        }
+    }
+
+    /// @notice 保有者数の参照
+    /// @return 保有者数
+    function holderCount() public view override returns (uint256) {
+        return holders.length();
+    }
+
+    /// @notice 保有者リストの範囲取得
+    /// @dev 保有者が外れた場合、末尾の要素がその位置に移動する
+    /// @param _offset 開始位置
+    /// @param _limit 最大取得件数
+    /// @return holderList 保有者アドレスのリスト
+    function getHolders(
+        uint256 _offset,
+        uint256 _limit
+    ) public view override returns (address[] memory holderList) {
+        return holders.slice(_offset, _limit);
+    }
+
+    /// @notice 保有者インデックスの更新
+    /// @dev 保有者インデックスが無効の場合は何もしない
+    /// @param _accountAddress アカウントアドレス
+    function updateHolderIndex(address _accountAddress) private {
+        if (holderIndexEnabled == true) {
+            syncHolder(_accountAddress);
+        }
+    }
+
+    /// @notice 保有状況に応じた保有者リストへの追加・削除
+    /// @dev 残高、移転待ち数量、またはロック中数量を持つアカウントを保有者とする
+    /// @param _accountAddress アカウントアドレス
+    function syncHolder(address _accountAddress) private {
+        bool _holding = balances[_accountAddress] > 0 ||
+            pendingTransfer[_accountAddress] > 0 ||
+            lockAddresses[_accountAddress].length() > 0;
+
+        if (_holding == true) {
+            holders.add(_accountAddress);
+        } else {
+            holders.remove(_accountAddress);
+        }
+    }
+
+    // ロック先アドレス別のロック対象アカウントリスト
+    // lock address => account address list
+    mapping(address => AddressList.List) private lockedAccounts;
+
+    // アカウント別のロック先アドレスリスト
+    // account address => lock address list
+    mapping(address => AddressList.List) private lockAddresses;
+
+    /// @notice ロック先アドレス別のロック件数の参照
+    /// @param _lockAddress ロック先アドレス
+    /// @return ロック中数量を持つアカウントの数
+    function getLockCountByLockAddress(
+        address _lockAddress
+    ) public view override returns (uint256) {
+        return lockedAccounts[_lockAddress].length();
+    }
+
+    /// @notice ロック先アドレス別のロック一覧の範囲取得
+    /// @dev ロックが解消された場合、末尾の要素がその位置に移動する
+    /// @param _lockAddress ロック先アドレス
+    /// @param _offset 開始位置
+    /// @param _limit 最大取得件数
+    /// @return accountAddressList ロック対象アカウントのリスト
+    /// @return valueList ロック中の数量のリスト
+    function getLocksByLockAddress(
+        address _lockAddress,
+        uint256 _offset,
+        uint256 _limit
+    )
+        public
+        view
+        override
+        returns (
+            address[] memory accountAddressList,
+            uint256[] memory valueList
+        )
+    {
+        accountAddressList = lockedAccounts[_lockAddress].slice(
+            _offset,
+            _limit
+        );
+        valueList = new uint256[](accountAddressList.length);
+        for (uint256 i = 0; i < accountAddressList.length; i++) {
+            valueList[i] = locked[_lockAddress][accountAddressList[i]];
+        }
+    }
+
+    /// @notice アカウント別のロック件数の参照
+    /// @param _accountAddress ロック対象アカウント
+    /// @return ロック中数量を持つロック先アドレスの数
+    function getLockCountByAccount(
+        address _accountAddress
+    ) public view override returns (uint256) {
+        return lockAddresses[_accountAddress].length();
+    }
+
+    /// @notice アカウント別のロック一覧の範囲取得
+    /// @dev ロックが解消された場合、末尾の要素がその位置に移動する
+    /// @param _accountAddress ロック対象アカウント
+    /// @param _offset 開始位置
+    /// @param _limit 最大取得件数
+    /// @return lockAddressList ロック先アドレスのリスト
+    /// @return valueList ロック中の数量のリスト
+    function getLocksByAccount(
+        address _accountAddress,
+        uint256 _offset,
+        uint256 _limit
+    )
+        public
+        view
+        override
+        returns (
+            address[] memory lockAddressList,
+            uint256[] memory valueList
+        )
+    {
+        lockAddressList = lockAddresses[_accountAddress].slice(
+            _offset,
+            _limit
+        );
+        valueList = new uint256[](lockAddressList.length);
+        for (uint256 i = 0; i < lockAddressList.length; i++) {
+            valueList[i] = locked[lockAddressList[i]][_accountAddress];
+        }
+    }
+
+    /// @notice ロック一覧の更新
+    /// @dev ロック中数量の有無に応じてロック一覧への追加・削除を行う
+    /// @dev ロック一覧が変わった場合、ロック対象アカウントの保有者インデックスも更新する
+    /// @param _lockAddress ロック先アドレス
+    /// @param _accountAddress ロック対象アカウント
+    function updateLockIndex(
+        address _lockAddress,
+        address _accountAddress
+    ) private {
+        bool _locking = locked[_lockAddress][_accountAddress] > 0;
+        bool _indexed = lockedAccounts[_lockAddress].contains(_accountAddress);
+        if (_locking == _indexed) return;
+
+        if (_locking == true) {
+            lockedAccounts[_lockAddress].add(_accountAddress);
+            lockAddresses[_accountAddress].add(_lockAddress);
+        } else {
+            lockedAccounts[_lockAddress].remove(_accountAddress);
+            lockAddresses[_accountAddress].remove(_lockAddress);
+        }
+        updateHolderIndex(_accountAddress);
+    }
+
     /// @notice 資産をロックする
     /// @param _lockAddress 資産ロック先アドレス
     /// @param _value ロックする数量
@@ -552,12 +790,14 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
     ) public override {
         // ロック数量が保有数量を上回っている場合、エラーを返す
         if (balanceOf(msg.sender) < _value)
-            revert(ErrorCode.ERR_IbetStraightBond_lock_120002);
+            revert IbetError(ErrorCode.ERR_IbetStraightBond_lock_120002);
 
         // データ更新
         balances[msg.sender] = balanceOf(msg.sender).sub(_value);
         locked[_lockAddress][msg.sender] = lockedOf(_lockAddress, msg.sender)
             .add(_value);
+        updateLockIndex(_lockAddress, msg.sender);
+        updateHolderIndex(msg.sender);
 
         // イベント登録
         emit Lock(msg.sender, _lockAddress, _value, _data);
@@ -577,7 +817,7 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
     ) public override onlyOwner {
         // ロック数量が保有数量を上回っている場合、エラーを返す
         if (balanceOf(_accountAddress) < _value)
-            revert(ErrorCode.ERR_IbetStraightBond_forceLock_121601);
+            revert IbetError(ErrorCode.ERR_IbetStraightBond_forceLock_121601);
 
         // データ更新
         balances[_accountAddress] = balanceOf(_accountAddress).sub(_value);
@@ -585,6 +825,8 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
             _lockAddress,
             _accountAddress
         ).add(_value);
+        updateLockIndex(_lockAddress, _accountAddress);
+        updateHolderIndex(_accountAddress);
 
         // イベント登録
         emit ForceLock(_accountAddress, _lockAddress, _value, _data);
@@ -602,14 +844,16 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
     ) public override {
         // アンロック数量がロック数量を上回ってる場合、エラーを返す
         if (lockedOf(msg.sender, _accountAddress) < _value)
-            revert(ErrorCode.ERR_IbetStraightBond_unlock_120102);
+            revert IbetError(ErrorCode.ERR_IbetStraightBond_unlock_120102);
 
         // データ更新
         locked[msg.sender][_accountAddress] = lockedOf(
             msg.sender,
             _accountAddress
         ).sub(_value);
+        updateLockIndex(msg.sender, _accountAddress);
         balances[_recipientAddress] = balanceOf(_recipientAddress).add(_value);
+        updateHolderIndex(_recipientAddress);
 
         // イベント登録
         emit Unlock(
@@ -636,14 +880,16 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
     ) public override onlyOwner {
         // アンロック数量がロック数量を上回ってる場合、エラーを返す
         if (lockedOf(_lockAddress, _accountAddress) < _value)
-            revert(ErrorCode.ERR_IbetStraightBond_forceUnlock_121201);
+            revert IbetError(ErrorCode.ERR_IbetStraightBond_forceUnlock_121201);
 
         // データ更新
         locked[_lockAddress][_accountAddress] = lockedOf(
             _lockAddress,
             _accountAddress
         ).sub(_value);
+        updateLockIndex(_lockAddress, _accountAddress);
         balances[_recipientAddress] = balanceOf(_recipientAddress).add(_value);
+        updateHolderIndex(_recipientAddress);
 
         // イベント登録
         emit ForceUnlock(
@@ -671,7 +917,7 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
     ) public override onlyOwner {
         // 変更数量がもともとのロック数量を上回ってる場合、エラーを返す
         if (lockedOf(_lockAddress, _beforeAccountAddress) < _value)
-            revert(
+            revert IbetError(
                 ErrorCode.ERR_IbetStraightBond_forceChangeLockedAccount_121701
             );
 
@@ -680,10 +926,12 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
             _lockAddress,
             _beforeAccountAddress
         ).sub(_value);
+        updateLockIndex(_lockAddress, _beforeAccountAddress);
         locked[_lockAddress][_afterAccountAddress] = lockedOf(
             _lockAddress,
             _afterAccountAddress
         ).add(_value);
+        updateLockIndex(_lockAddress, _afterAccountAddress);
 
         // イベント登録
         emit ForceChangeLockedAccount(
@@ -714,7 +962,9 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
             transferable == false ||
             balanceOf(msg.sender) < _value
         ) {
-            revert(ErrorCode.ERR_IbetStraightBond_applyForTransfer_120701);
+            revert IbetError(
+                ErrorCode.ERR_IbetStraightBond_applyForTransfer_120701
+            );
         }
 
         // <CHK>
@@ -723,11 +973,10 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
         // - 発行体への移転の場合
         // - 移転時個人情報登録が不要の場合
         if (_to != owner && requirePersonalInfoRegistered == true) {
-            require(
-                PersonalInfo(personalInfoAddress).isRegistered(_to, owner) ==
-                    true,
-                ErrorCode.ERR_IbetStraightBond_applyForTransfer_120702
-            );
+            if (!PersonalInfo(personalInfoAddress).isRegistered(_to, owner))
+                revert IbetError(
+                    ErrorCode.ERR_IbetStraightBond_applyForTransfer_120702
+                );
         }
 
         balances[msg.sender] -= _value;
@@ -763,14 +1012,18 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
             applicationsForTransfer[_index].from != msg.sender &&
             msg.sender != owner
         ) {
-            revert(ErrorCode.ERR_IbetStraightBond_cancelTransfer_120801);
+            revert IbetError(
+                ErrorCode.ERR_IbetStraightBond_cancelTransfer_120801
+            );
         }
 
         // <CHK>
         // すでに無効な申請に対する取消の場合
         // -> REVERT
         if (applicationsForTransfer[_index].valid == false)
-            revert(ErrorCode.ERR_IbetStraightBond_cancelTransfer_120802);
+            revert IbetError(
+                ErrorCode.ERR_IbetStraightBond_cancelTransfer_120802
+            );
 
         balances[
             applicationsForTransfer[_index].from
@@ -802,13 +1055,17 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
         // 移転不可の場合
         // -> REVERT
         if (transferable == false)
-            revert(ErrorCode.ERR_IbetStraightBond_approveTransfer_120901);
+            revert IbetError(
+                ErrorCode.ERR_IbetStraightBond_approveTransfer_120901
+            );
 
         // <CHK>
         // すでに無効な申請に対する取消の場合
         // -> REVERT
         if (applicationsForTransfer[_index].valid == false)
-            revert(ErrorCode.ERR_IbetStraightBond_approveTransfer_120902);
+            revert IbetError(
+                ErrorCode.ERR_IbetStraightBond_approveTransfer_120902
+            );
 
         balances[applicationsForTransfer[_index].to] += applicationsForTransfer[
             _index
@@ -816,6 +1073,8 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
         pendingTransfer[
             applicationsForTransfer[_index].from
         ] -= applicationsForTransfer[_index].amount;
+        updateHolderIndex(applicationsForTransfer[_index].to);
+        updateHolderIndex(applicationsForTransfer[_index].from);
 
         applicationsForTransfer[_index].valid = false;
 
@@ -851,11 +1110,13 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
                 _lockAddress,
                 _targetAddress
             ).add(_amount);
+            updateLockIndex(_lockAddress, _targetAddress);
             // 総発行数量の更新
             totalSupply = totalSupply.add(_amount);
         } else {
             // アカウント残高の更新
             balances[_targetAddress] = balanceOf(_targetAddress).add(_amount);
+            updateHolderIndex(_targetAddress);
             // 総発行数量の更新
             totalSupply = totalSupply.add(_amount);
         }
@@ -880,7 +1141,7 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
         if (
             _targetAddressList.length != _lockAddressList.length ||
             _targetAddressList.length != _amounts.length
-        ) revert(ErrorCode.ERR_IbetStraightBond_bulkIssueFrom_121301);
+        ) revert IbetError(ErrorCode.ERR_IbetStraightBond_bulkIssueFrom_121301);
 
         // 追加発行（一括）
         for (uint256 i = 0; i < _targetAddressList.length; i++) {
@@ -904,20 +1165,26 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
         if (_lockAddress != address(0)) {
             // 減資数量が対象アドレスのロック数量を上回っている場合はエラー
             if (lockedOf(_lockAddress, _targetAddress) < _amount)
-                revert(ErrorCode.ERR_IbetStraightBond_redeemFrom_121101);
+                revert IbetError(
+                    ErrorCode.ERR_IbetStraightBond_redeemFrom_121101
+                );
             // ロック資産の更新
             locked[_lockAddress][_targetAddress] = lockedOf(
                 _lockAddress,
                 _targetAddress
             ).sub(_amount);
+            updateLockIndex(_lockAddress, _targetAddress);
             // 総発行数量の更新
             totalSupply = totalSupply.sub(_amount);
         } else {
             // 減資数量が対象アドレスの残高数量を上回っている場合はエラーを返す
             if (balances[_targetAddress] < _amount)
-                revert(ErrorCode.ERR_IbetStraightBond_redeemFrom_121102);
+                revert IbetError(
+                    ErrorCode.ERR_IbetStraightBond_redeemFrom_121102
+                );
             // アカウント残高の更新
             balances[_targetAddress] = balanceOf(_targetAddress).sub(_amount);
+            updateHolderIndex(_targetAddress);
             // 総発行数量の更新
             totalSupply = totalSupply.sub(_amount);
         }
@@ -942,7 +1209,9 @@ contract IbetStraightBond is Ownable, IbetSecurityTokenInterface {
         if (
             _targetAddressList.length != _lockAddressList.length ||
             _targetAddressList.length != _amounts.length
-        ) revert(ErrorCode.ERR_IbetStraightBond_bulkRedeemFrom_121401);
+        ) revert IbetError(
+            ErrorCode.ERR_IbetStraightBond_bulkRedeemFrom_121401
+        );
 
         // 償却（一括）
         for (uint256 i = 0; i < _targetAddressList.length; i++) {
@@ -38,6 +38,22 @@ contract TokenList {
     // トークンリスト
     Token[] public token_list;
 
+    // トークンリストのインデックス（+1した値を保持する。0は未登録）
+    // token address => index + 1
+    mapping(address => uint256) private tokenListIndex;
+
+    // トークン仕様別のインデックス
+    // keccak256(token template) => token_list index[]
+    mapping(bytes32 => uint256[]) private templateIndex;
+
+    // オーナー別のインデックス
+    // owner address => token_list index[]
+    mapping(address => uint256[]) private ownerIndex;
+
+    // オーナー別インデックス内の位置
+    // token_list index => position in ownerIndex[owner]
+    mapping(uint256 => uint256) private ownerIndexPosition;
+
     // イベント：登録
     event Register(
         address indexed token_address,
@@ -52,14 +68,10 @@ contract TokenList {
         address _token_address,
         string memory _token_template
     ) public {
-        require(
-            tokens[_token_address].token_address == address(0),
-            ErrorCode.ERR_TokenList_register_100001
-        );
-        require(
-            Ownable(_token_address).owner() == msg.sender,
-            ErrorCode.ERR_TokenList_register_100002
-        );
+        if (tokens[_token_address].token_address != address(0))
+            revert IbetError(ErrorCode.ERR_TokenList_register_100001);
+        if (Ownable(_token_address).owner() != msg.sender)
+            revert IbetError(ErrorCode.ERR_TokenList_register_100002);
         tokens[_token_address].token_address = _token_address;
         tokens[_token_address].token_template = _token_template;
         tokens[_token_address].owner_address = msg.sender;
@@ -70,6 +82,13 @@ contract TokenList {
                 owner_address: msg.sender
             })
         );
+
+        // インデックス更新
+        uint256 _index = token_list.length - 1;
+        tokenListIndex[_token_address] = _index + 1;
+        templateIndex[keccak256(bytes(_token_template))].push(_index);
+        addOwnerIndex(msg.sender, _index);
+
         emit Register(_token_address, _token_template, msg.sender);
     }
 
@@ -80,20 +99,18 @@ contract TokenList {
         address _token_address,
         address _new_owner_address
     ) public {
-        require(
-            tokens[_token_address].token_address != address(0),
-            ErrorCode.ERR_TokenList_changeOwner_100101
-        );
-        require(
-            tokens[_token_address].owner_address == msg.sender,
-            ErrorCode.ERR_TokenList_changeOwner_100102
-        );
+        if (tokens[_token_address].token_address == address(0))
+            revert IbetError(ErrorCode.ERR_TokenList_changeOwner_100101);
+        if (tokens[_token_address].owner_address != msg.sender)
+            revert IbetError(ErrorCode.ERR_TokenList_changeOwner_100102);
         tokens[_token_address].owner_address = _new_owner_address;
-        for (uint i = 0; i < token_list.length; i++) {
-            if (token_list[i].token_address == _token_address) {
-                token_list[i].owner_address = _new_owner_address;
-            }
-        }
+
+        uint256 _index = tokenListIndex[_token_address] - 1;
+        token_list[_index].owner_address = _new_owner_address;
+
+        // インデックス更新
+        removeOwnerIndex(msg.sender, _index);
+        addOwnerIndex(_new_owner_address, _index);
     }
 
     /// @notice オーナーアドレスの参照
@@ -150,4 +167,134 @@ contract TokenList {
         token_template = tokens[_token_address].token_template;
         owner_address = tokens[_token_address].owner_address;
     }
+
+    /// @notice トークンリストの範囲取得
+    /// @dev 範囲外の場合は取得可能な件数のみを返す
+    /// @param _offset 開始位置
+    /// @param _limit 最大取得件数
+    /// @return tokenList トークン情報のリスト
+    function getTokens(
+        uint256 _offset,
+        uint256 _limit
+    ) public view returns (Token[] memory tokenList) {
+        uint256 _length = token_list.length;
+        uint256 _count = pageSize(_length, _offset, _limit);
+        tokenList = new Token[](_count);
+        for (uint256 i = 0; i < _count; i++) {
+            tokenList[i] = token_list[_offset + i];
+        }
+    }
+
+    /// @notice トークン仕様別のリスト長取得
+    /// @param _token_template トークン仕様
+    /// @return length リスト長
+    function getListLengthByTemplate(
+        string memory _token_template
+    ) public view returns (uint256 length) {
+        length = templateIndex[keccak256(bytes(_token_template))].length;
+    }
+
+    /// @notice トークン仕様を指定してトークンリストの範囲取得
+    /// @dev 登録順に返す
+    /// @param _token_template トークン仕様
+    /// @param _offset 開始位置
+    /// @param _limit 最大取得件数
+    /// @return tokenList トークン情報のリスト
+    function getTokensByTemplate(
+        string memory _token_template,
+        uint256 _offset,
+        uint256 _limit
+    ) public view returns (Token[] memory tokenList) {
+        tokenList = getTokensByIndex(
+            templateIndex[keccak256(bytes(_token_template))],
+            _offset,
+            _limit
+        );
+    }
+
+    /// @notice オーナー別のリスト長取得
+    /// @param _owner_address オーナーアドレス
+    /// @return length リスト長
+    function getListLengthByOwner(
+        address _owner_address
+    ) public view returns (uint256 length) {
+        length = ownerIndex[_owner_address].length;
+    }
+
+    /// @notice オーナーを指定してトークンリストの範囲取得
+    /// @dev オーナー変更があった場合、並び順は登録順とはならない
+    /// @param _owner_address オーナーアドレス
+    /// @param _offset 開始位置
+    /// @param _limit 最大取得件数
+    /// @return tokenList トークン情報のリスト
+    function getTokensByOwner(
+        address _owner_address,
+        uint256 _offset,
+        uint256 _limit
+    ) public view returns (Token[] memory tokenList) {
+        tokenList = getTokensByIndex(
+            ownerIndex[_owner_address],
+            _offset,
+            _limit
+        );
+    }
+
+    /// @notice インデックスからトークンリストの範囲取得
+    /// @param _indexList トークンリストのインデックス
+    /// @param _offset 開始位置
+    /// @param _limit 最大取得件数
+    /// @return tokenList トークン情報のリスト
+    function getTokensByIndex(
+        uint256[] storage _indexList,
+        uint256 _offset,
+        uint256 _limit
+    ) private view returns (Token[] memory tokenList) {
+        uint256 _count = pageSize(_indexList.length, _offset, _limit);
+        tokenList = new Token[](_count);
+        for (uint256 i = 0; i < _count; i++) {
+            tokenList[i] = token_list[_indexList[_offset + i]];
+        }
+    }
+
+    /// @notice 取得件数の算出
+    /// @param _length リスト長
+    /// @param _offset 開始位置
+    /// @param _limit 最大取得件数
+    /// @return 取得件数
+    function pageSize(
+        uint256 _length,
+        uint256 _offset,
+        uint256 _limit
+    ) private pure returns (uint256) {
+        if (_offset >= _length) {
+            return 0;
+        }
+        if (_limit > _length - _offset) {
+            return _length - _offset;
+        }
+        return _limit;
+    }
+
+    /// @notice オーナー別インデックスへの追加
+    /// @param _owner_address オーナーアドレス
+    /// @param _index トークンリストのインデックス
+    function addOwnerIndex(address _owner_address, uint256 _index) private {
+        ownerIndexPosition[_index] = ownerIndex[_owner_address].length;
+        ownerIndex[_owner_address].push(_index);
+    }
+
+    /// @notice オーナー別インデックスからの削除
+    /// @dev 末尾の要素を削除位置に移動する
+    /// @param _owner_address オーナーアドレス
+    /// @param _index トークンリストのインデックス
+    function removeOwnerIndex(address _owner_address, uint256 _index) private {
+        uint256[] storage _indexList = ownerIndex[_owner_address];
+        uint256 _position = ownerIndexPosition[_index];
+        uint256 _lastIndex = _indexList[_indexList.length - 1];
+
+        _indexList[_position] = _lastIndex;
+        ownerIndexPosition[_lastIndex] = _position;
+        _indexList.pop();
+        delete ownerIndexPosition[_index];
+    }
 }
@@ -18,11 +18,14 @@
  */
 pragma solidity ^0.8.23;
 
+import "OpenZeppelin/openzeppelin-contracts@4.9.3/contracts/utils/structs/EnumerableSet.sol";
 import "../access/Ownable.sol";
 import "../utils/Errors.sol";
 
 /// @title Contract Registry
 contract ContractRegistry is Ownable {
+    using EnumerableSet for EnumerableSet.AddressSet;
+
     // レジストリ
     struct Registry {
         string contractType;
@@ -32,6 +35,13 @@ contract ContractRegistry is Ownable {
     // contract address => Registry
     mapping(address => Registry) private registry;
 
+    // 登録済みのコントラクトアドレス
+    EnumerableSet.AddressSet private contracts;
+    // contract type => contract address set
+    mapping(string => EnumerableSet.AddressSet) private contractsByType;
+    // contract owner => contract address set
+    mapping(address => EnumerableSet.AddressSet) private contractsByOwner;
+
     // イベント：レジストリ登録
     event Registered(
         address indexed contractAddress,
@@ -51,16 +61,21 @@ contract ContractRegistry is Ownable {
         assembly {
             extCodeLength := extcodesize(_contractAddress)
         }
-        require(
-            extCodeLength > 0,
-            ErrorCode.ERR_ContractRegistry_register_600001
-        );
+        if (extCodeLength == 0)
+            revert IbetError(ErrorCode.ERR_ContractRegistry_register_600001);
 
         // チェック：msg.senderがコントラクトのオーナーであること
-        require(
-            msg.sender == Ownable(_contractAddress).owner(),
-            ErrorCode.ERR_ContractRegistry_register_600002
-        );
+        if (msg.sender != Ownable(_contractAddress).owner())
+            revert IbetError(ErrorCode.ERR_ContractRegistry_register_600002);
+
+        // 再登録の場合は登録済みのコントラクト型・オーナーの一覧から削除する
+        if (!contracts.add(_contractAddress)) {
+            Registry storage _registry = registry[_contractAddress];
+            contractsByType[_registry.contractType].remove(_contractAddress);
+            contractsByOwner[_registry.contractOwner].remove(_contractAddress);
+        }
+        contractsByType[_contractType].add(_contractAddress);
+        contractsByOwner[msg.sender].add(_contractAddress);
 
         registry[_contractAddress].contractType = _contractType;
         registry[_contractAddress].contractOwner = msg.sender;
@@ -80,4 +95,109 @@ contract ContractRegistry is Ownable {
         contractType = registry[_contractAddress].contractType;
         contractOwner = registry[_contractAddress].contractOwner;
     }
+
+    /// @notice レジストリ情報を取得（一括）
+    /// @param _contractAddressList コントラクトアドレスのリスト
+    /// @return contractTypes コントラクト型のリスト
+    /// @return contractOwners コントラクトオーナーのリスト
+    function getRegistries(
+        address[] calldata _contractAddressList
+    )
+        public
+        view
+        returns (string[] memory contractTypes, address[] memory contractOwners)
+    {
+        contractTypes = new string[](_contractAddressList.length);
+        contractOwners = new address[](_contractAddressList.length);
+        for (uint256 i = 0; i < _contractAddressList.length; i++) {
+            Registry storage _registry = registry[_contractAddressList[i]];
+            contractTypes[i] = _registry.contractType;
+            contractOwners[i] = _registry.contractOwner;
+        }
+    }
+
+    /// @notice 登録済みのコントラクト数を取得
+    /// @return 登録済みのコントラクト数
+    function getContractCount() public view returns (uint256) {
+        return contracts.length();
+    }
+
+    /// @notice 登録済みのコントラクトアドレスを取得
+    /// @param _offset 取得開始位置
+    /// @param _limit 最大取得件数
+    /// @return コントラクトアドレスのリスト
+    function getContracts(
+        uint256 _offset,
+        uint256 _limit
+    ) public view returns (address[] memory) {
+        return _paginate(contracts, _offset, _limit);
+    }
+
+    /// @notice コントラクト型ごとの登録済みのコントラクト数を取得
+    /// @param _contractType コントラクト型
+    /// @return 登録済みのコントラクト数
+    function getContractCountByType(
+        string memory _contractType
+    ) public view returns (uint256) {
+        return contractsByType[_contractType].length();
+    }
+
+    /// @notice コントラクト型ごとの登録済みのコントラクトアドレスを取得
+    /// @param _contractType コントラクト型
+    /// @param _offset 取得開始位置
+    /// @param _limit 最大取得件数
+    /// @return コントラクトアドレスのリスト
+    function getContractsByType(
+        string memory _contractType,
+        uint256 _offset,
+        uint256 _limit
+    ) public view returns (address[] memory) {
+        return _paginate(contractsByType[_contractType], _offset, _limit);
+    }
+
+    /// @notice オーナーごとの登録済みのコントラクト数を取得
+    /// @param _contractOwner コントラクトオーナー
+    /// @return 登録済みのコントラクト数
+    function getContractCountByOwner(
+        address _contractOwner
+    ) public view returns (uint256) {
+        return contractsByOwner[_contractOwner].length();
+    }
+
+    /// @notice オーナーごとの登録済みのコントラクトアドレスを取得
+    /// @param _contractOwner コントラクトオーナー
+    /// @param _offset 取得開始位置
+    /// @param _limit 最大取得件数
+    /// @return コントラクトアドレスのリスト
+    function getContractsByOwner(
+        address _contractOwner,
+        uint256 _offset,
+        uint256 _limit
+    ) public view returns (address[] memory) {
+        return _paginate(contractsByOwner[_contractOwner], _offset, _limit);
+    }
+
+    /// @dev 一覧の一部を取得する。
+    /// 再登録によって一覧から削除された位置には末尾の要素が移動するため、一覧の順序は登録順と一致しない場合がある。
+    /// @param _set コントラクトアドレスの一覧
+    /// @param _offset 取得開始位置
+    /// @param _limit 最大取得件数
+    /// @return page コントラクトアドレスのリスト
+    function _paginate(
+        EnumerableSet.AddressSet storage _set,
+        uint256 _offset,
+        uint256 _limit
+    ) private view returns (address[] memory page) {
+        uint256 _length = _set.length();
+        if (_offset >= _length) {
+            return new address[](0);
+        }
+        uint256 _count = _length - _offset < _limit
+            ? _length - _offset
+            : _limit;
+        page = new address[](_count);
+        for (uint256 i = 0; i < _count; i++) {
+            page[i] = _set.at(_offset + i);
+        }
+    }
 }
@@ -80,10 +80,8 @@ contract E2EMessaging {
     function getLastMessage(
         address _who
     ) public view returns (address _from, string memory _text, uint256 _time) {
-        require(
-            last_msg_index[_who] > 0,
-            ErrorCode.ERR_E2EMessaging_getLastMessage_610001
-        );
+        if (last_msg_index[_who] == 0)
+            revert IbetError(ErrorCode.ERR_E2EMessaging_getLastMessage_610001);
         return (
             messages[_who][last_msg_index[_who] - 1].from,
             messages[_who][last_msg_index[_who] - 1].text,
@@ -108,15 +106,52 @@ contract E2EMessaging {
         );
     }
 
+    /// @notice Get messages in the index range
+    /// @dev `_toIndex` is exclusive and is capped at the last index.
+    /// @param _who Message receiver address
+    /// @param _fromIndex First message index
+    /// @param _toIndex Message index after the last message
+    /// @return _from Message sender addresses
+    /// @return _text Message texts
+    /// @return _time Message block timestamps
+    function getMessages(
+        address _who,
+        uint256 _fromIndex,
+        uint256 _toIndex
+    )
+        public
+        view
+        returns (
+            address[] memory _from,
+            string[] memory _text,
+            uint256[] memory _time
+        )
+    {
+        if (_fromIndex > _toIndex)
+            revert IbetError(ErrorCode.ERR_E2EMessaging_getMessages_610201);
+        if (_toIndex > last_msg_index[_who]) {
+            _toIndex = last_msg_index[_who];
+        }
+        uint256 _count = _fromIndex < _toIndex ? _toIndex - _fromIndex : 0;
+
+        _from = new address[](_count);
+        _text = new string[](_count);
+        _time = new uint256[](_count);
+        for (uint256 i = 0; i < _count; i++) {
+            message storage _message = messages[_who][_fromIndex + i];
+            _from[i] = _message.from;
+            _text[i] = _message.text;
+            _time[i] = _message.time;
+        }
+    }
+
     /// @notice Clear message
     /// @param _to Message receiver address
     /// @param _index Message index
     function clearMessage(address _to, uint256 _index) public {
         message storage _message = messages[_to][_index];
-        require(
-            _message.from == msg.sender,
-            ErrorCode.ERR_E2EMessaging_clearMessage_610101
-        );
+        if (_message.from != msg.sender)
+            revert IbetError(ErrorCode.ERR_E2EMessaging_clearMessage_610101);
 
         messages[_to][_index].from = msg.sender;
         messages[_to][_index].text = "";
@@ -133,6 +168,25 @@ contract E2EMessaging {
         return (keys[_who].key, keys[_who].key_type);
     }
 
+    /// @notice Get public keys
+    /// @param _who Account addresses
+    /// @return _key Public keys
+    /// @return _key_type Key types
+    function getPublicKeys(
+        address[] memory _who
+    )
+        public
+        view
+        returns (string[] memory _key, string[] memory _key_type)
+    {
+        _key = new string[](_who.length);
+        _key_type = new string[](_who.length);
+        for (uint256 i = 0; i < _who.length; i++) {
+            _key[i] = keys[_who[i]].key;
+            _key_type[i] = keys[_who[i]].key_type;
+        }
+    }
+
     /// @notice Set public key
     /// @param _key Public key
     /// @param _key_type Key type
@@ -0,0 +1,255 @@
+/**
+ * Copyright BOOSTRY Co., Ltd.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ *
+ * You may obtain a copy of the License at
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing,
+ * software distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ */
+
+pragma solidity ^0.8.23;
+
+import "./Errors.sol";
+
+/// @title E2E Messaging (event storage)
+/// @notice Stores only the hash and metadata of each message.
+/// The message text is carried in the Message event.
+contract E2EMessagingLite {
+    event Message(
+        address indexed sender,
+        address indexed receiver,
+        uint256 index,
+        uint256 time,
+        bytes32 textHash,
+        string text
+    );
+    event MessageCleared(
+        address indexed sender,
+        address indexed receiver,
+        uint256 index
+    );
+    event PublicKeyUpdated(address indexed who, string key, string key_type);
+
+    struct message {
+        address from; // Message sender
+        uint48 time; // Timestamp of the message in UNIX seconds
+        uint48 blockNumber; // Block number of the Message event
+        bytes32 textHash; // keccak256 of the message text
+    }
+
+    struct public_key_struct {
+        string key; // Public key
+        string key_type; // Key type
+    }
+
+    mapping(address => uint256) public last_msg_index;
+    mapping(address => mapping(uint256 => message)) public messages;
+    mapping(address => public_key_struct) public keys;
+
+    // [CONSTRUCTOR]
+    constructor() {}
+
+    /// @notice Send message
+    /// @param _to Message receiver address
+    /// @param _text Message text
+    function sendMessage(address _to, string memory _text) public {
+        uint256 _index = last_msg_index[_to];
+        bytes32 _textHash = keccak256(bytes(_text));
+        messages[_to][_index] = message({
+            from: msg.sender,
+            time: uint48(block.timestamp),
+            blockNumber: uint48(block.number),
+            textHash: _textHash
+        });
+        last_msg_index[_to]++;
+        emit Message(
+            msg.sender,
+            _to,
+            _index,
+            block.timestamp,
+            _textHash,
+            _text
+        );
+    }
+
+    /// @notice Get last index
+    /// @param _who Message receiver address
+    /// @return _index Last index
+    function lastIndex(address _who) public view returns (uint256 _index) {
+        return last_msg_index[_who];
+    }
+
+    /// @notice Get last message
+    /// @param _who Message receiver address
+    /// @return _from Message sender address
+    /// @return _textHash Message text hash
+    /// @return _time Message block timestamp
+    /// @return _blockNumber Block number of the Message event
+    function getLastMessage(
+        address _who
+    )
+        public
+        view
+        returns (
+            address _from,
+            bytes32 _textHash,
+            uint256 _time,
+            uint256 _blockNumber
+        )
+    {
+        if (last_msg_index[_who] == 0)
+            revert IbetError(
+                ErrorCode.ERR_E2EMessagingLite_getLastMessage_650001
+            );
+        return getMessageByIndex(_who, last_msg_index[_who] - 1);
+    }
+
+    /// @notice Get message by index
+    /// @param _who Message receiver address
+    /// @param _index Message index
+    /// @return _from Message sender address
+    /// @return _textHash Message text hash
+    /// @return _time Message block timestamp
+    /// @return _blockNumber Block number of the Message event
+    function getMessageByIndex(
+        address _who,
+        uint256 _index
+    )
+        public
+        view
+        returns (
+            address _from,
+            bytes32 _textHash,
+            uint256 _time,
+            uint256 _blockNumber
+        )
+    {
+        message storage _message = messages[_who][_index];
+        return (
+            _message.from,
+            _message.textHash,
+            _message.time,
+            _message.blockNumber
+        );
+    }
+
+    /// @notice Get messages in the index range
+    /// @dev `_toIndex` is exclusive and is capped at the last index.
+    /// @param _who Message receiver address
+    /// @param _fromIndex First message index
+    /// @param _toIndex Message index after the last message
+    /// @return _from Message sender addresses
+    /// @return _textHash Message text hashes
+    /// @return _time Message block timestamps
+    /// @return _blockNumber Block numbers of the Message events
+    function getMessages(
+        address _who,
+        uint256 _fromIndex,
+        uint256 _toIndex
+    )
+        public
+        view
+        returns (
+            address[] memory _from,
+            bytes32[] memory _textHash,
+            uint256[] memory _time,
+            uint256[] memory _blockNumber
+        )
+    {
+        if (_fromIndex > _toIndex)
+            revert IbetError(ErrorCode.ERR_E2EMessagingLite_getMessages_650201);
+        if (_toIndex > last_msg_index[_who]) {
+            _toIndex = last_msg_index[_who];
+        }
+        uint256 _count = _fromIndex < _toIndex ? _toIndex - _fromIndex : 0;
+
+        _from = new address[](_count);
+        _textHash = new bytes32[](_count);
+        _time = new uint256[](_count);
+        _blockNumber = new uint256[](_count);
+        for (uint256 i = 0; i < _count; i++) {
+            message storage _message = messages[_who][_fromIndex + i];
+            _from[i] = _message.from;
+            _textHash[i] = _message.textHash;
+            _time[i] = _message.time;
+            _blockNumber[i] = _message.blockNumber;
+        }
+    }
+
+    /// @notice Verify message text
+    /// @param _who Message receiver address
+    /// @param _index Message index
+    /// @param _text Message text (e.g. read from the Message event)
+    /// @return _valid True if the text matches the stored hash
+    function verifyMessage(
+        address _who,
+        uint256 _index,
+        string memory _text
+    ) public view returns (bool _valid) {
+        bytes32 _textHash = messages[_who][_index].textHash;
+        return _textHash != bytes32(0) && _textHash == keccak256(bytes(_text));
+    }
+
+    /// @notice Clear message
+    /// @dev The text hash is removed. The Message event remains in the logs.
+    /// @param _to Message receiver address
+    /// @param _index Message index
+    function clearMessage(address _to, uint256 _index) public {
+        message storage _message = messages[_to][_index];
+        if (_message.from != msg.sender)
+            revert IbetError(
+                ErrorCode.ERR_E2EMessagingLite_clearMessage_650101
+            );
+
+        _message.textHash = bytes32(0);
+        emit MessageCleared(msg.sender, _to, _index);
+    }
+
+    /// @notice Get public key
+    /// @param _who Message receiver address
+    /// @return _key Public key
+    /// @return _key_type Key type
+    function getPublicKey(
+        address _who
+    ) public view returns (string memory _key, string memory _key_type) {
+        return (keys[_who].key, keys[_who].key_type);
+    }
+
+    /// @notice Get public keys
+    /// @param _who Account addresses
+    /// @return _key Public keys
+    /// @return _key_type Key types
+    function getPublicKeys(
+        address[] memory _who
+    )
+        public
+        view
+        returns (string[] memory _key, string[] memory _key_type)
+    {
+        _key = new string[](_who.length);
+        _key_type = new string[](_who.length);
+        for (uint256 i = 0; i < _who.length; i++) {
+            _key[i] = keys[_who[i]].key;
+            _key_type[i] = keys[_who[i]].key_type;
+        }
+    }
+
+    /// @notice Set public key
+    /// @param _key Public key
+    /// @param _key_type Key type
+    function setPublicKey(string memory _key, string memory _key_type) public {
+        keys[msg.sender].key = _key;
+        keys[msg.sender].key_type = _key_type;
+        emit PublicKeyUpdated(msg.sender, _key, _key_type);
+    }
+}
@@ -85,12 +85,10 @@ contract FreezeLog {
     function updateLog(uint256 _index, string memory _log) public {
         Log storage storageLog = logs[msg.sender][_index];
 
-        require(
-            storageLog.createdBlockNumber +
-                storageLog.freezingGraceBlockCount >=
-                block.number,
-            ErrorCode.ERR_FreezeLog_updateLog_620001
-        );
+        if (
+            storageLog.createdBlockNumber + storageLog.freezingGraceBlockCount <
+                block.number
+        ) revert IbetError(ErrorCode.ERR_FreezeLog_updateLog_620001);
 
         storageLog.log = _log;
 
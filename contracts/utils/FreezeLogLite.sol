@@ -0,0 +1,159 @@
+/**
+ * Copyright BOOSTRY Co., Ltd.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ *
+ * You may obtain a copy of the License at
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing,
+ * software distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ */
+
+pragma solidity ^0.8.23;
+
+import "./Errors.sol";
+
+/// @title Freeze Log (event storage)
+/// @notice Stores only the hash and metadata of each log.
+/// The log text is carried in the Recorded and Updated events.
+contract FreezeLogLite {
+    // Event: log recorded
+    event Recorded(
+        address indexed recorder,
+        uint256 index,
+        uint256 _freezingGraceBlockCount,
+        bytes32 logHash,
+        string log
+    );
+
+    // Event: log updated
+    event Updated(
+        address indexed recorder,
+        uint256 index,
+        bytes32 logHash,
+        string log
+    );
+
+    struct Log {
+        uint64 createdBlockNumber; // Created block number
+        uint64 updatedBlockNumber; // Block number of the latest log event
+        uint256 freezingGraceBlockCount; // Freezing grace block count
+        bytes32 logHash; // keccak256 of the log text
+    }
+
+    /// Recorder -> Index
+    mapping(address => uint256) public last_log_index;
+    /// Recorder -> Index -> Log
+    mapping(address => mapping(uint256 => Log)) public logs;
+
+    // [CONSTRUCTOR]
+    constructor() {}
+
+    /// @notice Get last index
+    /// @param _recorder Recorder
+    /// @return _index Last index
+    function lastLogIndex(
+        address _recorder
+    ) public view returns (uint256 _index) {
+        return last_log_index[_recorder];
+    }
+
+    /// @notice Record new logs
+    /// @param _log Log text
+    /// @param _freezingGraceBlockCount Freezing grace block count
+    function recordLog(
+        string memory _log,
+        uint256 _freezingGraceBlockCount
+    ) public {
+        uint256 _index = last_log_index[msg.sender];
+        bytes32 _logHash = keccak256(bytes(_log));
+        logs[msg.sender][_index] = Log({
+            createdBlockNumber: uint64(block.number),
+            updatedBlockNumber: uint64(block.number),
+            freezingGraceBlockCount: _freezingGraceBlockCount,
+            logHash: _logHash
+        });
+        last_log_index[msg.sender]++;
+
+        emit Recorded(
+            msg.sender,
+            _index,
+            _freezingGraceBlockCount,
+            _logHash,
+            _log
+        );
+    }
+
+    /// @notice Update recorded logs
+    /// @param _index Index
+    /// @param _log Log to be updated
+    function updateLog(uint256 _index, string memory _log) public {
+        Log storage storageLog = logs[msg.sender][_index];
+
+        if (
+            storageLog.createdBlockNumber + storageLog.freezingGraceBlockCount <
+                block.number
+        ) revert IbetError(ErrorCode.ERR_FreezeLogLite_updateLog_660001);
+
+        bytes32 _logHash = keccak256(bytes(_log));
+        storageLog.logHash = _logHash;
+        storageLog.updatedBlockNumber = uint64(block.number);
+
+        emit Updated(msg.sender, _index, _logHash, _log);
+    }
+
+    /// @notice Get log
+    /// @param _recorder Recorder
+    /// @param _index Index
+    /// @return _createdBlockNumber Created block number
+    /// @return _freezingGraceBlockCount Freezing grace block count
+    /// @return _logHash Log text hash
+    /// @return _updatedBlockNumber Block number of the latest log event
+    function getLog(
+        address _recorder,
+        uint256 _index
+    )
+        public
+        view
+        returns (
+            uint256 _createdBlockNumber,
+            uint256 _freezingGraceBlockCount,
+            bytes32 _logHash,
+            uint256 _updatedBlockNumber
+        )
+    {
+        Log storage log = logs[_recorder][_index];
+        return (
+            log.createdBlockNumber,
+            log.freezingGraceBlockCount,
+            log.logHash,
+            log.updatedBlockNumber
+        );
+    }
+
+    /// @notice Verify log text
+    /// @dev The hash can only be replaced within the freezing grace period,
+    /// so a log text that matches a frozen log cannot be altered.
+    /// @param _recorder Recorder
+    /// @param _index Index
+    /// @param _log Log text (e.g. read from the Recorded/Updated event)
+    /// @return _valid True if the text matches the stored hash
+    function verifyLog(
+        address _recorder,
+        uint256 _index,
+        string memory _log
+    ) public view returns (bool _valid) {
+        Log storage log = logs[_recorder][_index];
+        return
+            log.createdBlockNumber > 0 &&
+            log.logHash == keccak256(bytes(_log));
+    }
+}
@@ -0,0 +1,94 @@
+/**
+ * Copyright BOOSTRY Co., Ltd.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ *
+ * You may obtain a copy of the License at
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing,
+ * software distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ */
+pragma solidity ^0.8.23;
+
+import "./Errors.sol";
+
+/// @title Multicall
+/// @notice 複数のコントラクトの参照系関数を1回の呼び出しで実行する
+contract Multicall {
+    // 呼び出し内容
+    struct Call {
+        address target; // 呼び出し先のコントラクトアドレス
+        bytes callData; // ABIエンコードされた呼び出しデータ
+        uint256 gasLimit; // 呼び出しに割り当てるガス量（0の場合は残りのガスを全て割り当てる）
+    }
+
+    // 呼び出し結果
+    struct Result {
+        bool success; // 呼び出しの成否
+        bytes returnData; // 戻り値（失敗時はリバートデータ）
+    }
+
+    /// @notice 一括呼び出し
+    /// @dev いずれかの呼び出しが失敗した場合はリバートする
+    /// @param _calls 呼び出し内容のリスト
+    /// @return blockNumber ブロック番号
+    /// @return returnData 戻り値のリスト
+    function aggregate(
+        Call[] memory _calls
+    ) public view returns (uint256 blockNumber, bytes[] memory returnData) {
+        blockNumber = block.number;
+        returnData = new bytes[](_calls.length);
+        for (uint256 i = 0; i < _calls.length; i++) {
+            (bool success, bytes memory data) = staticcallWithGas(_calls[i]);
+            if (!success)
+                revert IbetError(ErrorCode.ERR_Multicall_aggregate_640001);
+            returnData[i] = data;
+        }
+    }
+
+    /// @notice 一括呼び出し（失敗を許容）
+    /// @dev 失敗した呼び出しは結果に記録し、後続の呼び出しを継続する
+    /// @dev gasLimitを指定した呼び出しがガス不足で失敗しても、後続の呼び出しのガスは残る
+    /// @param _requireSuccess trueの場合、いずれかの呼び出しが失敗するとリバートする
+    /// @param _calls 呼び出し内容のリスト
+    /// @return blockNumber ブロック番号
+    /// @return results 呼び出し結果のリスト
+    function tryAggregate(
+        bool _requireSuccess,
+        Call[] memory _calls
+    ) public view returns (uint256 blockNumber, Result[] memory results) {
+        blockNumber = block.number;
+        results = new Result[](_calls.length);
+        for (uint256 i = 0; i < _calls.length; i++) {
+            (bool success, bytes memory data) = staticcallWithGas(_calls[i]);
+            if (_requireSuccess) {
+                if (!success)
+                    revert IbetError(
+                        ErrorCode.ERR_Multicall_tryAggregate_640101
+                    );
+            }
+            results[i] = Result(success, data);
+        }
+    }
+
+    /// @dev 呼び出し内容のガス量を割り当てて呼び出す
+    /// @param _call 呼び出し内容
+    /// @return success 呼び出しの成否
+    /// @return data 戻り値（失敗時はリバートデータ）
+    function staticcallWithGas(
+        Call memory _call
+    ) private view returns (bool success, bytes memory data) {
+        if (_call.gasLimit == 0) {
+            return _call.target.staticcall(_call.callData);
+        }
+        return _call.target.staticcall{gas: _call.gasLimit}(_call.callData);
+    }
+}
@@ -0,0 +1,343 @@
+/**
+ * Copyright BOOSTRY Co., Ltd.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ *
+ * You may obtain a copy of the License at
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing,
+ * software distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ */
+pragma solidity ^0.8.23;
+
+/// @title P256 Verifier
+/// @notice Pure Solidity secp256r1(P-256) ECDSA verification, used when the
+///         EIP-7951 precompile is not available.
+/// @dev u1 * G + u2 * Q is computed with Shamir's trick over a joint window:
+///      each step doubles the accumulator `window` times and adds one
+///      precomputed point d1 * G + d2 * Q (0 <= d1, d2 < 2^window).
+///      Points are accumulated in Jacobian coordinates and the table is kept
+///      in affine coordinates, so that each step uses a mixed addition.
+///
+///      The table depends on the public key. It can be built for each
+///      verification (`verify`), or built once and stored as contract code
+///      (`deployTable` / `verifyWithTable`), which allows a wider window.
+library P256Verifier {
+    // Curve parameters
+    uint256 internal constant P =
+        0xFFFFFFFF00000001000000000000000000000000FFFFFFFFFFFFFFFFFFFFFFFF;
+    uint256 internal constant A = P - 3;
+    uint256 internal constant B =
+        0x5AC635D8AA3A93E7B3EBBD55769886BC651D06B0CC53B0F63BCE3C3E27D2604B;
+    uint256 internal constant N =
+        0xFFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551;
+    uint256 internal constant GX =
+        0x6B17D1F2E12C4247F8BCE6E563A440F277037D812DEB33A0F4A13945D898C296;
+    uint256 internal constant GY =
+        0x4FE342E2FE1A7F9B8EE7EB4A7C0F9E162BCE33576B315ECECBB6406837BF51F5;
+
+    /// Window width of the table built for each verification (16 points)
+    uint256 internal constant WINDOW = 2;
+
+    /// Window width of the stored table (64 points, 4 KiB of code)
+    uint256 internal constant TABLE_WINDOW = 3;
+
+    address private constant MODEXP_PRECOMPILE =
+        0x0000000000000000000000000000000000000005;
+
+    /// @notice Verify a signature, building the table on the fly.
+    /// @param hash Signed message hash.
+    /// @param r ECDSA signature r.
+    /// @param s ECDSA signature s.
+    /// @param x Public key x.
+    /// @param y Public key y.
+    /// @return True if the signature is valid.
+    function verify(
+        bytes32 hash,
+        uint256 r,
+        uint256 s,
+        uint256 x,
+        uint256 y
+    ) internal view returns (bool) {
+        if (!isValidSignature(r, s)) return false;
+
+        (uint256[] memory table, bool ok) = buildTable(x, y, WINDOW);
+        if (!ok) return false;
+
+        return _verify(hash, r, s, table, WINDOW);
+    }
+
+    /// @notice Verify a signature with a table stored by `deployTable`.
+    /// @param hash Signed message hash.
+    /// @param r ECDSA signature r.
+    /// @param s ECDSA signature s.
+    /// @param table Address of the table contract.
+    /// @return True if the signature is valid.
+    function verifyWithTable(
+        bytes32 hash,
+        uint256 r,
+        uint256 s,
+        address table
+    ) internal view returns (bool) {
+        if (!isValidSignature(r, s)) return false;
+
+        return _verify(hash, r, s, loadTable(table), TABLE_WINDOW);
+    }
+
+    /// @notice Store the table of a public key as contract code.
+    /// @dev The code is prefixed with STOP so that it can not be executed.
+    /// @param x Public key x.
+    /// @param y Public key y.
+    /// @return table Table contract address (zero if the key is invalid).
+    function deployTable(
+        uint256 x,
+        uint256 y
+    ) internal returns (address table) {
+        (uint256[] memory points, bool ok) = buildTable(x, y, TABLE_WINDOW);
+        if (!ok) return address(0);
+
+        bytes memory code = abi.encodePacked(hex"00", points);
+        // PUSH4 <size> DUP1 PUSH1 0x0E PUSH1 0x00 CODECOPY PUSH1 0x00 RETURN
+        bytes memory creationCode = abi.encodePacked(
+            hex"63",
+            uint32(code.length),
+            hex"80600E6000396000F3",
+            code
+        );
+        assembly {
+            table := create(0, add(creationCode, 32), mload(creationCode))
+        }
+    }
+
+    /// @notice Load a table stored by `deployTable`.
+    /// @param table Address of the table contract.
+    /// @return points Affine coordinates of the table points.
+    function loadTable(
+        address table
+    ) internal view returns (uint256[] memory points) {
+        points = new uint256[](2 << (2 * TABLE_WINDOW));
+        assembly {
+            extcodecopy(table, add(points, 32), 1, mul(mload(points), 32))
+        }
+    }
+
+    /// @notice Build the table of d1 * G + d2 * Q (index: d1 + d2 << window).
+    /// @dev Returns false if the public key is not on the curve, or if any
+    ///      table point is the point at infinity (d1 * G == -d2 * Q).
+    /// @param x Public key x.
+    /// @param y Public key y.
+    /// @param window Window width.
+    /// @return table Affine coordinates of the points ([x0, y0, x1, ...]).
+    /// @return ok False if the public key can not be used.
+    function buildTable(
+        uint256 x,
+        uint256 y,
+        uint256 window
+    ) internal view returns (uint256[] memory table, bool ok) {
+        if (!isOnCurve(x, y)) return (table, false);
+
+        // Jacobian coordinates ([X0, Y0, Z0, X1, ...])
+        // Each point is the previous point in the row + G, and the first
+        // point in the row is the first point in the previous row + Q.
+        uint256 size = 1 << (2 * window);
+        uint256[] memory points = new uint256[](3 * size);
+        for (uint256 i = 1; i < size; i++) {
+            uint256 prev;
+            uint256 addX;
+            uint256 addY;
+            if ((i & ((1 << window) - 1)) == 0) {
+                (prev, addX, addY) = (i - (1 << window), x, y);
+            } else {
+                (prev, addX, addY) = (i - 1, GX, GY);
+            }
+            (points[3 * i], points[3 * i + 1], points[3 * i + 2]) = _addAffine(
+                points[3 * prev],
+                points[3 * prev + 1],
+                points[3 * prev + 2],
+                addX,
+                addY
+            );
+        }
+
+        // Convert to affine coordinates with a single inversion
+        // (Montgomery's trick)
+        uint256[] memory prefix = new uint256[](size);
+        uint256 product = 1;
+        for (uint256 i = 1; i < size; i++) {
+            if (points[3 * i + 2] == 0) return (table, false);
+            prefix[i] = product;
+            product = mulmod(product, points[3 * i + 2], P);
+        }
+        uint256 inverse = _invMod(product, P);
+
+        table = new uint256[](2 * size);
+        for (uint256 i = size - 1; i > 0; i--) {
+            uint256 zInv = mulmod(inverse, prefix[i], P);
+            inverse = mulmod(inverse, points[3 * i + 2], P);
+            uint256 zz = mulmod(zInv, zInv, P);
+            table[2 * i] = mulmod(points[3 * i], zz, P);
+            table[2 * i + 1] = mulmod(
+                points[3 * i + 1],
+                mulmod(zz, zInv, P),
+                P
+            );
+        }
+        return (table, true);
+    }
+
+    /// @notice Check the range of the signature values.
+    function isValidSignature(
+        uint256 r,
+        uint256 s
+    ) internal pure returns (bool) {
+        return r != 0 && r < N && s != 0 && s < N;
+    }
+
+    /// @notice Check that the point is on the curve (y^2 = x^3 + ax + b).
+    function isOnCurve(uint256 x, uint256 y) internal pure returns (bool) {
+        if (x >= P || y >= P) return false;
+
+        uint256 lhs = mulmod(y, y, P);
+        uint256 rhs = addmod(
+            mulmod(mulmod(x, x, P), x, P),
+            addmod(mulmod(A, x, P), B, P),
+            P
+        );
+        return lhs == rhs;
+    }
+
+    /// @dev Check x(u1 * G + u2 * Q) mod n == r without converting to affine.
+    function _verify(
+        bytes32 hash,
+        uint256 r,
+        uint256 s,
+        uint256[] memory table,
+        uint256 window
+    ) private view returns (bool) {
+        uint256 w = _invMod(s, N);
+        (uint256 X, , uint256 Z) = _shamir(
+            mulmod(uint256(hash), w, N),
+            mulmod(r, w, N),
+            table,
+            window
+        );
+        if (Z == 0) return false;
+
+        // x = X / Z^2 (mod p), and x (< p) can be r or r + n
+        uint256 zz = mulmod(Z, Z, P);
+        if (X == mulmod(r, zz, P)) return true;
+        return r < P - N && X == mulmod(r + N, zz, P);
+    }
+
+    /// @dev Compute u1 * G + u2 * Q in Jacobian coordinates.
+    function _shamir(
+        uint256 u1,
+        uint256 u2,
+        uint256[] memory table,
+        uint256 window
+    ) private pure returns (uint256 X, uint256 Y, uint256 Z) {
+        uint256 mask = (1 << window) - 1;
+        for (uint256 i = ((255 + window) / window) * window; i > 0; ) {
+            i -= window;
+
+            // The point at infinity does not need to be doubled
+            if (Z != 0) {
+                for (uint256 j = 0; j < window; j++) {
+                    (X, Y, Z) = _double(X, Y, Z);
+                }
+            }
+
+            uint256 index = (((u2 >> i) & mask) << window) |
+                ((u1 >> i) & mask);
+            if (index != 0) {
+                (X, Y, Z) = _addAffine(
+                    X,
+                    Y,
+                    Z,
+                    table[2 * index],
+                    table[2 * index + 1]
+                );
+            }
+        }
+    }
+
+    /// @dev Point doubling in Jacobian coordinates (a = -3, dbl-2001-b).
+    function _double(
+        uint256 X,
+        uint256 Y,
+        uint256 Z
+    ) private pure returns (uint256 X3, uint256 Y3, uint256 Z3) {
+        uint256 delta = mulmod(Z, Z, P);
+        uint256 gamma = mulmod(Y, Y, P);
+        uint256 beta = mulmod(X, gamma, P);
+        uint256 alpha = mulmod(
+            3,
+            mulmod(addmod(X, P - delta, P), addmod(X, delta, P), P),
+            P
+        );
+
+        X3 = addmod(mulmod(alpha, alpha, P), P - mulmod(8, beta, P), P);
+        Z3 = addmod(Y, Z, P);
+        Z3 = addmod(mulmod(Z3, Z3, P), P - addmod(gamma, delta, P), P);
+        Y3 = addmod(
+            mulmod(alpha, addmod(mulmod(4, beta, P), P - X3, P), P),
+            P - mulmod(8, mulmod(gamma, gamma, P), P),
+            P
+        );
+    }
+
+    /// @dev Addition of a Jacobian point and an affine point (mixed addition).
+    function _addAffine(
+        uint256 X1,
+        uint256 Y1,
+        uint256 Z1,
+        uint256 x2,
+        uint256 y2
+    ) private pure returns (uint256 X3, uint256 Y3, uint256 Z3) {
+        if (Z1 == 0) return (x2, y2, 1);
+
+        // H = U2 - X1, r = S2 - Y1
+        uint256 zz = mulmod(Z1, Z1, P);
+        uint256 h = addmod(mulmod(x2, zz, P), P - X1, P);
+        uint256 r = addmod(mulmod(y2, mulmod(Z1, zz, P), P), P - Y1, P);
+
+        if (h == 0) {
+            // Same point: doubling, opposite point: infinity
+            if (r == 0) return _double(X1, Y1, Z1);
+            return (0, 0, 0);
+        }
+
+        Z3 = mulmod(Z1, h, P);
+        zz = mulmod(h, h, P); // H^2
+        h = mulmod(h, zz, P); // H^3
+        zz = mulmod(X1, zz, P); // V = X1 * H^2
+        X3 = addmod(
+            addmod(mulmod(r, r, P), P - h, P),
+            P - mulmod(2, zz, P),
+            P
+        );
+        Y3 = addmod(
+            mulmod(r, addmod(zz, P - X3, P), P),
+            P - mulmod(Y1, h, P),
+            P
+        );
+    }
+
+    /// @dev Modular inverse by Fermat's little theorem (modexp precompile).
+    function _invMod(uint256 a, uint256 m) private view returns (uint256) {
+        (bool success, bytes memory output) = MODEXP_PRECOMPILE.staticcall(
+            abi.encode(uint256(32), uint256(32), uint256(32), a, m - 2, m)
+        );
+        if (!success || output.length < 32) return 0;
+
+        return abi.decode(output, (uint256));
+    }
+}
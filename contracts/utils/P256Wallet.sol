@@ -19,10 +19,13 @@
 pragma solidity ^0.8.23;
 
 import "./Errors.sol";
+import "./P256Verifier.sol";
 
 /// @title P256 Wallet (EIP-7951 precompile based)
 /// @notice A minimal contract wallet that verifies secp256r1(P-256) signatures
 ///         through the EIP-7951-compatible precompile and executes transactions.
+///         On networks without the precompile, signatures are verified by
+///         the P256Verifier library.
 contract P256Wallet {
     // NOTE:
     // The precompile address follows the expected EIP-7951 deployment on ibet quorum.
@@ -30,9 +33,26 @@ contract P256Wallet {
     address internal constant P256_VERIFY_PRECOMPILE =
         0x0000000000000000000000000000000000000100;
 
+    // NOTE:
+    // A valid signature used to check whether the precompile is available.
+    bytes32 internal constant PRECOMPILE_TEST_HASH =
+        0x0d839c4ad3f85615845efcab9c4d06fd256bdf70016992b180aa485ef37e2a8a;
+    uint256 internal constant PRECOMPILE_TEST_R =
+        0xaf76e01b25489cb71550ba003ccaba8a880b926d16fa5ba7dbd9a6e4e763b241;
+    uint256 internal constant PRECOMPILE_TEST_S =
+        0xee84b25420e7c6ae9db53f06b8bbf3e436664f9590068d19728563aee6679fcf;
+    uint256 internal constant PRECOMPILE_TEST_X =
+        0x07b09cf4bd98a0595fc776eea5df8f882311debd0acb2393e137c65bbf75fe62;
+    uint256 internal constant PRECOMPILE_TEST_Y =
+        0xe0f9e6cdad811031bb1d05b6ca89000a008c34812d68cf9b5b069ac5e429e2a9;
+
     uint256 public immutable pubKeyX;
     uint256 public immutable pubKeyY;
 
+    /// @notice Precomputed table of the public key for P256Verifier.
+    /// @dev Stored at creation only when the precompile is not available.
+    address public immutable verifierTable;
+
     uint256 public nonce;
 
     event Executed(
@@ -45,10 +65,21 @@ contract P256Wallet {
 
     constructor(uint256 _pubKeyX, uint256 _pubKeyY) {
         if (_pubKeyX == 0 || _pubKeyY == 0) {
-            revert(ErrorCode.ERR_P256Wallet_constructor_630001);
+            revert IbetError(ErrorCode.ERR_P256Wallet_constructor_630001);
         }
         pubKeyX = _pubKeyX;
         pubKeyY = _pubKeyY;
+
+        bool precompileAvailable = _verifyWithPrecompile(
+            PRECOMPILE_TEST_HASH,
+            PRECOMPILE_TEST_R,
+            PRECOMPILE_TEST_S,
+            PRECOMPILE_TEST_X,
+            PRECOMPILE_TEST_Y
+        );
+        verifierTable = precompileAvailable
+            ? address(0)
+            : P256Verifier.deployTable(_pubKeyX, _pubKeyY);
     }
 
     receive() external payable {}
@@ -70,7 +101,7 @@ contract P256Wallet {
         bytes32 txHash = getTransactionHash(target, value, data, nonce);
 
         if (!_verify(txHash, sigR, sigS)) {
-            revert(ErrorCode.ERR_P256Wallet_execute_630101);
+            revert IbetError(ErrorCode.ERR_P256Wallet_execute_630101);
         }
 
         uint256 currentNonce = nonce;
@@ -78,13 +109,56 @@ contract P256Wallet {
 
         (bool success, bytes memory result) = target.call{value: value}(data);
         if (!success) {
-            revert(ErrorCode.ERR_P256Wallet_execute_630102);
+            revert IbetError(ErrorCode.ERR_P256Wallet_execute_630102);
         }
 
         emit Executed(target, value, data, result, currentNonce);
         return result;
     }
 
+    /// @notice Execute ordered calls authorized by a single P-256 signature.
+    /// @dev All calls share the current nonce, which is incremented once.
+    ///      If any call fails, the whole batch is reverted.
+    /// @param targets Destination contracts/accounts.
+    /// @param values Native token amounts to transfer.
+    /// @param data Calldata for each call.
+    /// @param sigR ECDSA signature r.
+    /// @param sigS ECDSA signature s.
+    /// @return returnData Raw return data from each target call.
+    function executeBatch(
+        address[] calldata targets,
+        uint256[] calldata values,
+        bytes[] calldata data,
+        uint256 sigR,
+        uint256 sigS
+    ) external payable returns (bytes[] memory returnData) {
+        if (targets.length != values.length || targets.length != data.length)
+            revert IbetError(ErrorCode.ERR_P256Wallet_executeBatch_630201);
+
+        bytes32 txHash = getBatchTransactionHash(targets, values, data, nonce);
+
+        if (!_verify(txHash, sigR, sigS)) {
+            revert IbetError(ErrorCode.ERR_P256Wallet_executeBatch_630202);
+        }
+
+        uint256 currentNonce = nonce;
+        nonce = currentNonce + 1;
+
+        returnData = new bytes[](targets.length);
+        for (uint256 i = 0; i < targets.length; i++) {
+            (bool success, bytes memory result) = targets[i].call{
+                value: values[i]
+            }(data[i]);
+            if (!success) {
+                revert IbetError(ErrorCode.ERR_P256Wallet_executeBatch_630203);
+            }
+
+            emit Executed(targets[i], values[i], data[i], result, currentNonce);
+            returnData[i] = result;
+        }
+        return returnData;
+    }
+
     /// @notice Build the signed hash for execution authorization.
     function getTransactionHash(
         address target,
@@ -107,14 +181,59 @@ contract P256Wallet {
             );
     }
 
-    /// @dev Calls EIP-7951-compatible precompile with input (hash, r, s, x, y).
-    ///      The precompile is expected to return 32-byte boolean-style value.
+    /// @notice Build the signed hash for batch execution authorization.
+    /// @dev The calls are bound in order by hashing the lists of
+    ///      (target, value, keccak256(data)). The version byte (0x02)
+    ///      separates batch hashes from single call hashes.
+    function getBatchTransactionHash(
+        address[] calldata targets,
+        uint256[] calldata values,
+        bytes[] calldata data,
+        uint256 _nonce
+    ) public view returns (bytes32) {
+        bytes32[] memory dataHashes = new bytes32[](data.length);
+        for (uint256 i = 0; i < data.length; i++) {
+            dataHashes[i] = keccak256(data[i]);
+        }
+
+        return
+            keccak256(
+                abi.encodePacked(
+                    bytes1(0x19),
+                    bytes1(0x02),
+                    block.chainid,
+                    address(this),
+                    keccak256(abi.encode(targets, values, dataHashes)),
+                    _nonce
+                )
+            );
+    }
+
+    /// @dev Verifies with the stored table if the precompile was not available
+    ///      at creation. Otherwise the precompile result is returned as is,
+    ///      so an invalid signature is not verified a second time in Solidity.
     function _verify(
         bytes32 hash,
         uint256 sigR,
         uint256 sigS
     ) internal view returns (bool) {
-        bytes memory input = abi.encode(hash, sigR, sigS, pubKeyX, pubKeyY);
+        if (verifierTable != address(0)) {
+            return
+                P256Verifier.verifyWithTable(hash, sigR, sigS, verifierTable);
+        }
+        return _verifyWithPrecompile(hash, sigR, sigS, pubKeyX, pubKeyY);
+    }
+
+    /// @dev Calls EIP-7951-compatible precompile with input (hash, r, s, x, y).
+    ///      The precompile is expected to return 32-byte boolean-style value.
+    function _verifyWithPrecompile(
+        bytes32 hash,
+        uint256 sigR,
+        uint256 sigS,
+        uint256 x,
+        uint256 y
+    ) internal view returns (bool) {
+        bytes memory input = abi.encode(hash, sigR, sigS, x, y);
         (bool success, bytes memory output) = P256_VERIFY_PRECOMPILE.staticcall(
             input
         );
@@ -0,0 +1,99 @@
+/**
+ * Copyright BOOSTRY Co., Ltd.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ *
+ * You may obtain a copy of the License at
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing,
+ * software distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ */
+pragma solidity ^0.8.23;
+
+/// @title 整数リスト
+/// @notice 追加・削除・範囲取得が可能な整数（uint256）のリスト
+/// @dev 削除時は末尾の要素を削除位置に移動するため、要素の順序は保持されない
+library UintList {
+    struct List {
+        uint256[] items;
+        // 値の位置（+1した値を保持する。0は未登録）
+        // value => index + 1
+        mapping(uint256 => uint256) position;
+    }
+
+    /// @notice 登録状態の参照
+    /// @param _list 整数リスト
+    /// @param _value 値
+    /// @return 登録済みの場合True
+    function contains(
+        List storage _list,
+        uint256 _value
+    ) internal view returns (bool) {
+        return _list.position[_value] != 0;
+    }
+
+    /// @notice 登録数の参照
+    /// @param _list 整数リスト
+    /// @return 登録数
+    function length(List storage _list) internal view returns (uint256) {
+        return _list.items.length;
+    }
+
+    /// @notice 値を末尾に追加する
+    /// @dev 登録済みの場合は何もしない
+    /// @param _list 整数リスト
+    /// @param _value 値
+    function add(List storage _list, uint256 _value) internal {
+        if (_list.position[_value] != 0) {
+            return;
+        }
+        _list.items.push(_value);
+        _list.position[_value] = _list.items.length;
+    }
+
+    /// @notice 値を削除する
+    /// @dev 未登録の場合は何もしない
+    /// @param _list 整数リスト
+    /// @param _value 値
+    function remove(List storage _list, uint256 _value) internal {
+        uint256 _position = _list.position[_value];
+        if (_position == 0) {
+            return;
+        }
+        uint256 _last = _list.items[_list.items.length - 1];
+        _list.items[_position - 1] = _last;
+        _list.position[_last] = _position;
+        _list.items.pop();
+        delete _list.position[_value];
+    }
+
+    /// @notice 範囲取得
+    /// @dev 範囲外の場合は取得可能な件数のみを返す
+    /// @param _list 整数リスト
+    /// @param _offset 開始位置
+    /// @param _limit 最大取得件数
+    /// @return valueList 値のリスト
+    function slice(
+        List storage _list,
+        uint256 _offset,
+        uint256 _limit
+    ) internal view returns (uint256[] memory valueList) {
+        uint256 _count = 0;
+        if (_offset < _list.items.length) {
+            _count = _list.items.length - _offset;
+            if (_count > _limit) _count = _limit;
+        }
+        valueList = new uint256[](_count);
+        for (uint256 i = 0; i < _count; i++) {
+            valueList[i] = _list.items[_offset + i];
+        }
+    }
+}
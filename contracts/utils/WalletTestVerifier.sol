@@ -0,0 +1,69 @@
+/**
+ * Copyright BOOSTRY Co., Ltd.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ *
+ * You may obtain a copy of the License at
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing,
+ * software distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ */
+pragma solidity ^0.8.23;
+
+import "./P256Verifier.sol";
+
+contract WalletTestVerifier {
+    address internal constant P256_VERIFY_PRECOMPILE =
+        0x0000000000000000000000000000000000000100;
+
+    event TableDeployed(address table);
+
+    function verify(
+        bytes32 hash,
+        uint256 r,
+        uint256 s,
+        uint256 x,
+        uint256 y
+    ) external view returns (bool) {
+        return P256Verifier.verify(hash, r, s, x, y);
+    }
+
+    function verifyWithTable(
+        bytes32 hash,
+        uint256 r,
+        uint256 s,
+        address table
+    ) external view returns (bool) {
+        return P256Verifier.verifyWithTable(hash, r, s, table);
+    }
+
+    function verifyWithPrecompile(
+        bytes32 hash,
+        uint256 r,
+        uint256 s,
+        uint256 x,
+        uint256 y
+    ) external view returns (bool) {
+        (bool success, bytes memory output) = P256_VERIFY_PRECOMPILE.staticcall(
+            abi.encode(hash, r, s, x, y)
+        );
+        return
+            success &&
+            output.length >= 32 &&
+            abi.decode(output, (uint256)) == 1;
+    }
+
+    function deployTable(uint256 x, uint256 y) external returns (address) {
+        address table = P256Verifier.deployTable(x, y);
+        emit TableDeployed(table);
+        return table;
+    }
+}
@@ -0,0 +1,97 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import argparse
+import time
+
+from web3 import HTTPProvider, Web3
+from web3.middleware import geth_poa_middleware
+
+from .abi import EventRegistry
+from .indexer import EventIndexer
+from .store import EventStore
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m indexer", description="Index ibet contract events"
+    )
+    parser.add_argument("--rpc-url", default="http://localhost:8545")
+    parser.add_argument("--db", default="build/index.db", help="SQLite file path")
+    parser.add_argument(
+        "--abi-dir", default="output", help="ABI directory (tools/json_filter.py)"
+    )
+    parser.add_argument(
+        "--abi-bundle",
+        default=None,
+        help="ABI bundle (tools/json_filter.py --bundle), used instead of --abi-dir",
+    )
+    parser.add_argument(
+        "--address",
+        action="append",
+        default=None,
+        help="Contract address to index (repeatable, default: all)",
+    )
+    parser.add_argument("--from-block", type=int, default=0)
+    parser.add_argument("--to-block", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--confirmations", type=int, default=0)
+    parser.add_argument(
+        "--follow", action="store_true", help="Keep indexing new blocks"
+    )
+    parser.add_argument("--interval", type=float, default=5.0)
+    args = parser.parse_args()
+
+    web3 = Web3(HTTPProvider(args.rpc_url))
+    web3.middleware_onion.inject(geth_poa_middleware, layer=0)
+
+    store = EventStore(args.db)
+    indexer = EventIndexer(
+        web3=web3,
+        store=store,
+        registry=(
+            EventRegistry.from_bundle(args.abi_bundle)
+            if args.abi_bundle is not None
+            else EventRegistry.from_directory(args.abi_dir)
+        ),
+        addresses=args.address,
+        batch_size=args.batch_size,
+        confirmations=args.confirmations,
+    )
+
+    try:
+        while True:
+            stats = indexer.sync(start_block=args.from_block, end_block=args.to_block)
+            if stats.blocks > 0 or stats.reorgs > 0:
+                print(
+                    f"blocks {stats.from_block}-{stats.to_block}: "
+                    f"{stats.events} events, {stats.reorgs} reorgs, "
+                    f"{stats.elapsed:.2f}s ({stats.blocks_per_second:.1f} blocks/s)"
+                )
+            if not args.follow:
+                break
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
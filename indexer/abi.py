@@ -0,0 +1,177 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+import os
+from dataclasses import dataclass
+
+from eth_abi import decode
+from eth_utils import event_abi_to_log_topic, to_checksum_address, to_hex
+from eth_utils.abi import collapse_if_tuple
+from hexbytes import HexBytes
+
+
+@dataclass(frozen=True)
+class DecodedEvent:
+    """デコード済みのイベント"""
+
+    event: str
+    args: dict
+
+
+@dataclass(frozen=True)
+class EventDefinition:
+    """イベント定義（ABI）"""
+
+    name: str
+    abi: dict
+    topic: bytes
+
+    @property
+    def indexed_count(self) -> int:
+        return len([i for i in self.abi["inputs"] if i.get("indexed")])
+
+    def decode(self, topics: list[bytes], data: bytes) -> DecodedEvent:
+        """ログのトピックとデータから引数をデコードする
+
+        文字列・配列等の動的な型のindexed引数はハッシュ値のみが記録されるため、
+        トピックの値をそのまま返す。
+        """
+        inputs = self.abi["inputs"]
+        indexed = [i for i in inputs if i.get("indexed")]
+        non_indexed = [i for i in inputs if not i.get("indexed")]
+
+        values = {}
+        for _input, topic in zip(indexed, topics):
+            _type = collapse_if_tuple(_input)
+            if is_dynamic_type(_type):
+                values[_input["name"]] = to_hex(topic)
+            else:
+                values[_input["name"]] = normalize(_type, decode([_type], topic)[0])
+
+        types = [collapse_if_tuple(i) for i in non_indexed]
+        for _input, _type, value in zip(non_indexed, types, decode(types, data)):
+            values[_input["name"]] = normalize(_type, value)
+
+        # ABIの引数順に並べ替える
+        args = {i["name"]: values[i["name"]] for i in inputs}
+        return DecodedEvent(event=self.name, args=args)
+
+
+class EventRegistry:
+    """コントラクトABIに定義されたイベントの一覧
+
+    同じシグネチャのイベントは複数のコントラクトで共有されるため、
+    トピック（シグネチャハッシュ）とindexed引数の数でイベント定義を特定する。
+    """
+
+    def __init__(self):
+        self._events: dict[bytes, list[EventDefinition]] = {}
+
+    @classmethod
+    def from_abis(cls, abis: dict[str, list]) -> "EventRegistry":
+        """コントラクト名とABIの組からイベント一覧を作成する"""
+        registry = cls()
+        for abi in abis.values():
+            for item in abi:
+                if item.get("type") == "event" and not item.get("anonymous"):
+                    registry.add(item)
+        return registry
+
+    @classmethod
+    def from_directory(cls, path: str = "output") -> "EventRegistry":
+        """tools/json_filter.py が出力したABIファイルからイベント一覧を作成する"""
+        abis = {}
+        for file in sorted(os.listdir(path)):
+            if file.startswith(".") or not file.endswith(".json"):
+                continue
+            with open(os.path.join(path, file), "r") as f:
+                artifact = json.load(f)
+            if "abi" in artifact:
+                abis[file[: -len(".json")]] = artifact["abi"]
+        return cls.from_abis(abis)
+
+    @classmethod
+    def from_bundle(cls, path: str) -> "EventRegistry":
+        """tools/json_filter.py --bundle が出力したABIバンドルからイベント一覧を作成する"""
+        with open(path, "r") as f:
+            return cls.from_abis(json.load(f)["contracts"])
+
+    def add(self, event_abi: dict):
+        topic = bytes(event_abi_to_log_topic(event_abi))
+        definitions = self._events.setdefault(topic, [])
+        definition = EventDefinition(name=event_abi["name"], abi=event_abi, topic=topic)
+        if all(d.indexed_count != definition.indexed_count for d in definitions):
+            definitions.append(definition)
+
+    @property
+    def topics(self) -> list[str]:
+        """登録済みのイベントのトピック一覧"""
+        return sorted(to_hex(topic) for topic in self._events)
+
+    def decode_log(self, log: dict) -> DecodedEvent | None:
+        """ログをデコードする（未知のイベントの場合はNoneを返す）"""
+        topics = [bytes(HexBytes(t)) for t in log["topics"]]
+        if len(topics) == 0:
+            return None
+        for definition in self._events.get(topics[0], []):
+            if definition.indexed_count == len(topics) - 1:
+                return definition.decode(topics[1:], bytes(HexBytes(log["data"])))
+        return None
+
+
+def is_dynamic_type(abi_type: str) -> bool:
+    return (
+        abi_type in ("string", "bytes")
+        or abi_type.endswith("]")
+        or abi_type.startswith("(")
+    )
+
+
+def normalize(abi_type: str, value):
+    """デコードした値をJSONで保存可能な形式に変換する"""
+    if abi_type.endswith("]"):
+        item_type = abi_type[: abi_type.rindex("[")]
+        return [normalize(item_type, v) for v in value]
+    if abi_type.startswith("("):
+        item_types = split_tuple_type(abi_type)
+        return [normalize(t, v) for t, v in zip(item_types, value)]
+    if abi_type == "address":
+        return to_checksum_address(value)
+    if isinstance(value, bytes):
+        return to_hex(value)
+    return value
+
+
+def split_tuple_type(abi_type: str) -> list[str]:
+    """タプル型（例："(address,uint256[])"）を要素の型に分割する"""
+    types, depth, current = [], 0, ""
+    for char in abi_type[1:-1]:
+        if char == "," and depth == 0:
+            types.append(current)
+            current = ""
+            continue
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        current += char
+    if current:
+        types.append(current)
+    return types
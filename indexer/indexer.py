@@ -0,0 +1,173 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import time
+from dataclasses import dataclass
+
+from eth_utils import to_checksum_address
+from web3 import Web3
+
+from .abi import EventRegistry
+from .store import EventRecord, EventStore
+
+
+class ReorgTooDeepError(Exception):
+    """記録済みのどのブロックとも一致しないチェーン再編成"""
+
+
+@dataclass
+class IndexStats:
+    """インデックス処理の実行結果"""
+
+    from_block: int
+    to_block: int
+    events: int = 0
+    reorgs: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def blocks(self) -> int:
+        return max(self.to_block - self.from_block + 1, 0)
+
+    @property
+    def blocks_per_second(self) -> float:
+        return self.blocks / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class EventIndexer:
+    """ブロック範囲単位でイベントを取得・デコードしてEventStoreに保存する
+
+    - チェックポイント（インデックス済みの最終ブロック）から処理を再開する
+    - 直近のブロックのハッシュを記録し、処理開始時にチェーン上のハッシュと比較して
+      チェーン再編成を検知する
+    - 再編成を検知した場合は共通の祖先ブロックより後のデータを削除して再取得する
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        store: EventStore,
+        registry: EventRegistry,
+        addresses: list[str] | None = None,
+        batch_size: int = 1000,
+        confirmations: int = 0,
+        max_reorg_depth: int = 64,
+    ):
+        self.web3 = web3
+        self.store = store
+        self.registry = registry
+        self.addresses = (
+            [to_checksum_address(a) for a in addresses] if addresses else None
+        )
+        self.batch_size = batch_size
+        self.confirmations = confirmations
+        self.max_reorg_depth = max_reorg_depth
+
+    def sync(self, start_block: int = 0, end_block: int | None = None) -> IndexStats:
+        """最新ブロック（またはend_block）までインデックスする
+
+        :param start_block: 初回実行時の開始ブロック（チェックポイントがある場合は無視される）
+        :param end_block: 終了ブロック（Noneの場合は確定済みの最新ブロック）
+        :return: 実行結果
+        """
+        started = time.perf_counter()
+        reorgs = self.handle_reorg()
+
+        head = self.web3.eth.block_number - self.confirmations
+        to_block = head if end_block is None else min(end_block, head)
+        checkpoint = self.store.get_checkpoint()
+        from_block = start_block if checkpoint is None else checkpoint + 1
+
+        stats = IndexStats(from_block=from_block, to_block=to_block, reorgs=reorgs)
+        for batch_start in range(from_block, to_block + 1, self.batch_size):
+            batch_end = min(batch_start + self.batch_size - 1, to_block)
+            stats.events += self.index_range(batch_start, batch_end, head)
+
+        stats.elapsed = time.perf_counter() - started
+        return stats
+
+    def index_range(self, from_block: int, to_block: int, head: int) -> int:
+        """ブロック範囲のイベントを保存する
+
+        再編成が起こり得る直近max_reorg_depth分のブロックはハッシュを全て記録し、
+        それより古いブロックはバッチの最終ブロックのハッシュのみを記録する。
+
+        :return: 保存したイベント数
+        """
+        log_filter = {
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "topics": [self.registry.topics],
+        }
+        if self.addresses is not None:
+            log_filter["address"] = self.addresses
+
+        events, blocks = [], {}
+        for log in self.web3.eth.get_logs(log_filter):
+            decoded = self.registry.decode_log(log)
+            if decoded is None:
+                continue
+            block_hash = Web3.to_hex(log["blockHash"])
+            blocks[log["blockNumber"]] = block_hash
+            events.append(
+                EventRecord(
+                    block_number=log["blockNumber"],
+                    log_index=log["logIndex"],
+                    block_hash=block_hash,
+                    transaction_hash=Web3.to_hex(log["transactionHash"]),
+                    address=to_checksum_address(log["address"]),
+                    event=decoded.event,
+                    args=decoded.args,
+                )
+            )
+        tip_start = max(from_block, head - self.max_reorg_depth + 1)
+        for number in range(min(tip_start, to_block), to_block + 1):
+            blocks[number] = Web3.to_hex(self.web3.eth.get_block(number)["hash"])
+
+        self.store.save_batch(events, blocks, checkpoint=to_block)
+        self.store.prune_blocks(to_block - self.max_reorg_depth)
+        return len(events)
+
+    def handle_reorg(self) -> int:
+        """チェーン再編成を検知し、共通の祖先ブロックまで巻き戻す
+
+        :return: 巻き戻しを行った場合は1、それ以外は0
+        """
+        checkpoint = self.store.get_checkpoint()
+        if checkpoint is None:
+            return 0
+
+        head = self.web3.eth.block_number
+        for number, block_hash in self.store.get_recent_blocks():
+            if number > head:
+                continue
+            if Web3.to_hex(self.web3.eth.get_block(number)["hash"]) == block_hash:
+                if number == checkpoint:
+                    return 0
+                self.store.rollback(number)
+                return 1
+
+        if checkpoint - self.max_reorg_depth < 0:
+            # チェーンの先頭まで再編成された場合は全て削除して再取得する
+            self.store.rollback(None)
+            return 1
+        raise ReorgTooDeepError(
+            f"No common ancestor within {self.max_reorg_depth} blocks "
+            f"of checkpoint {checkpoint}"
+        )
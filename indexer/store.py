@@ -0,0 +1,183 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+import sqlite3
+from dataclasses import dataclass
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    block_hash TEXT NOT NULL,
+    transaction_hash TEXT NOT NULL,
+    address TEXT NOT NULL,
+    event TEXT NOT NULL,
+    args TEXT NOT NULL,
+    PRIMARY KEY (block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS ix_events_address_event
+    ON events (address, event, block_number);
+CREATE INDEX IF NOT EXISTS ix_events_event
+    ON events (event, block_number);
+CREATE INDEX IF NOT EXISTS ix_events_transaction_hash
+    ON events (transaction_hash);
+CREATE TABLE IF NOT EXISTS blocks (
+    number INTEGER PRIMARY KEY,
+    hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS checkpoint (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    block_number INTEGER NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class EventRecord:
+    """保存されたイベント"""
+
+    block_number: int
+    log_index: int
+    block_hash: str
+    transaction_hash: str
+    address: str
+    event: str
+    args: dict
+
+
+class EventStore:
+    """イベントを保存するSQLiteストア
+
+    - events: デコード済みのイベント
+    - blocks: チェーン再編成（reorg）検知のためのブロックハッシュ
+    - checkpoint: インデックス済みの最終ブロック番号
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def get_checkpoint(self) -> int | None:
+        """インデックス済みの最終ブロック番号（未実行の場合はNone）"""
+        row = self.conn.execute(
+            "SELECT block_number FROM checkpoint WHERE id = 1"
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def get_recent_blocks(self) -> list[tuple[int, str]]:
+        """記録済みのブロック番号とハッシュ（新しい順）"""
+        return self.conn.execute(
+            "SELECT number, hash FROM blocks ORDER BY number DESC"
+        ).fetchall()
+
+    def save_batch(
+        self,
+        events: list[EventRecord],
+        blocks: dict[int, str],
+        checkpoint: int,
+    ):
+        """イベント・ブロックハッシュ・チェックポイントを1トランザクションで保存する"""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        e.block_number,
+                        e.log_index,
+                        e.block_hash,
+                        e.transaction_hash,
+                        e.address,
+                        e.event,
+                        json.dumps(e.args),
+                    )
+                    for e in events
+                ],
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO blocks VALUES (?, ?)", blocks.items()
+            )
+            self.set_checkpoint(checkpoint)
+
+    def rollback(self, block_number: int | None):
+        """指定したブロックより後のデータを削除する（Noneの場合は全て削除する）"""
+        with self.conn:
+            if block_number is None:
+                self.conn.execute("DELETE FROM events")
+                self.conn.execute("DELETE FROM blocks")
+                self.conn.execute("DELETE FROM checkpoint")
+                return
+            self.conn.execute(
+                "DELETE FROM events WHERE block_number > ?", (block_number,)
+            )
+            self.conn.execute("DELETE FROM blocks WHERE number > ?", (block_number,))
+            self.set_checkpoint(block_number)
+
+    def prune_blocks(self, block_number: int):
+        """指定したブロックより前のブロックハッシュを削除する"""
+        with self.conn:
+            self.conn.execute("DELETE FROM blocks WHERE number < ?", (block_number,))
+
+    def set_checkpoint(self, block_number: int):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO checkpoint (id, block_number) VALUES (1, ?)",
+            (block_number,),
+        )
+
+    def get_events(
+        self,
+        event: str | None = None,
+        address: str | None = None,
+        from_block: int | None = None,
+        to_block: int | None = None,
+        limit: int | None = None,
+    ) -> list[EventRecord]:
+        """条件に一致するイベントをブロック順に取得する"""
+        conditions, params = [], []
+        if event is not None:
+            conditions.append("event = ?")
+            params.append(event)
+        if address is not None:
+            conditions.append("address = ?")
+            params.append(address)
+        if from_block is not None:
+            conditions.append("block_number >= ?")
+            params.append(from_block)
+        if to_block is not None:
+            conditions.append("block_number <= ?")
+            params.append(to_block)
+
+        query = "SELECT * FROM events"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY block_number, log_index"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        return [
+            EventRecord(*row[:-1], args=json.loads(row[-1]))
+            for row in self.conn.execute(query, params)
+        ]
+
+    def count_events(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
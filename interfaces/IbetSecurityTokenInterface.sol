@@ -22,6 +22,47 @@ import "./IbetStandardTokenInterface.sol";
 
 /// @title ibet Security Token Interface
 abstract contract IbetSecurityTokenInterface is IbetStandardTokenInterface {
+    // -------------------------------------------------------------------
+    // 移転制御フラグ
+    // -------------------------------------------------------------------
+
+    // NOTE:
+    // 移転時に参照するフラグは最初に宣言し、IbetStandardTokenInterfaceの
+    // tradableExchange・statusと同じスロットに配置する。
+    // 移転（transfer, bulkTransfer等）のチェックは1スロットの読み込みで行われる。
+    //
+    // | Byte    | 変数                          |
+    // |---------|-------------------------------|
+    // | 0 - 19  | tradableExchange              |
+    // | 20      | status                        |
+    // | 21      | requirePersonalInfoRegistered |
+    // | 22      | transferable                  |
+    // | 23      | transferApprovalRequired      |
+    // | 24      | holderIndexEnabled            |
+    // | 25      | isOffering                    |
+    //
+    // 宣言順を変更するとストレージレイアウトが変わるため注意すること。
+    //
+    // personalInfoAddressは別スロットに配置する。
+    // 移転時に参照するアドレス（owner, tradableExchange, personalInfoAddress）
+    // とフラグの合計は66バイトとなり、2スロットには収まらないため。
+    // personalInfoAddressは移転時個人情報登録要否がtrueの場合のみ読み込まれる。
+
+    /// 移転時個人情報登録要否
+    bool public requirePersonalInfoRegistered;
+
+    /// 譲渡可否
+    bool public transferable;
+
+    /// 移転承諾要否フラグ
+    bool public transferApprovalRequired;
+
+    /// 保有者インデックス有効化状態
+    bool public holderIndexEnabled;
+
+    /// 募集ステータス
+    bool public isOffering;
+
     // -------------------------------------------------------------------
     // 投資家名簿関連機能
     // -------------------------------------------------------------------
@@ -33,9 +74,6 @@ abstract contract IbetSecurityTokenInterface is IbetStandardTokenInterface {
     /// @param _address 個人情報記帳コントラクトアドレス
     function setPersonalInfoAddress(address _address) public virtual;
 
-    /// 移転時個人情報登録要否
-    bool public requirePersonalInfoRegistered;
-
     /// @notice 移転時個人情報登録要否の更新
     /// @param _requireRegistered 移転時個人情報登録要否（true:必要）
     function setRequirePersonalInfoRegistered(
@@ -46,9 +84,6 @@ abstract contract IbetSecurityTokenInterface is IbetStandardTokenInterface {
     // 譲渡制限関連機能
     // -------------------------------------------------------------------
 
-    /// 譲渡可否
-    bool public transferable;
-
     /// @notice 譲渡可否を更新
     /// @param _transferable 譲渡可否
     function setTransferable(bool _transferable) public virtual;
@@ -57,9 +92,6 @@ abstract contract IbetSecurityTokenInterface is IbetStandardTokenInterface {
     // 募集関連機能
     // -------------------------------------------------------------------
 
-    /// 募集ステータス
-    bool public isOffering;
-
     /// 募集申込
     struct ApplicationForOffering {
         uint256 applicationAmount; // 申込数量
@@ -98,9 +130,6 @@ abstract contract IbetSecurityTokenInterface is IbetStandardTokenInterface {
     // 移転承諾関連機能
     // -------------------------------------------------------------------
 
-    /// 移転承諾要否フラグ
-    bool public transferApprovalRequired;
-
     /// @notice 移転承諾要否フラグの更新
     /// @param _required 移転承諾要否
     function setTransferApprovalRequired(bool _required) public virtual;
@@ -349,4 +378,104 @@ abstract contract IbetSecurityTokenInterface is IbetStandardTokenInterface {
         address indexed lockAddress,
         uint256 amount
     );
+
+    // -------------------------------------------------------------------
+    // 残高一括参照
+    // -------------------------------------------------------------------
+
+    /// @notice 残高の一括参照
+    /// @param _accountAddressList アカウントアドレスのリスト
+    /// @return 残高のリスト
+    function balancesOf(
+        address[] calldata _accountAddressList
+    ) public view virtual returns (uint256[] memory);
+
+    /// @notice ロック中資産の一括参照
+    /// @param _lockAddressList ロック先アドレスのリスト
+    /// @param _accountAddressList ロック対象アカウントのリスト
+    /// @return ロック中の数量のリスト
+    function lockedOfBatch(
+        address[] calldata _lockAddressList,
+        address[] calldata _accountAddressList
+    ) public view virtual returns (uint256[] memory);
+
+    /// @notice 移転待ち数量の一括参照
+    /// @param _accountAddressList アカウントアドレスのリスト
+    /// @return 移転待ち数量のリスト
+    function pendingTransfersOf(
+        address[] calldata _accountAddressList
+    ) public view virtual returns (uint256[] memory);
+
+    // -------------------------------------------------------------------
+    // 保有者インデックス
+    // -------------------------------------------------------------------
+
+    /// @notice 保有者インデックス有効化状態の更新
+    /// @dev 有効化前の保有者はsyncHolderIndexで登録する
+    /// @param _enabled 有効化状態
+    function setHolderIndexEnabled(bool _enabled) public virtual;
+
+    /// @notice 保有者インデックスの同期
+    /// @param _accountAddressList 同期対象のアカウントアドレスのリスト
+    function syncHolderIndex(
+        address[] calldata _accountAddressList
+    ) public virtual;
+
+    /// @notice 保有者数の参照
+    /// @return 保有者数
+    function holderCount() public view virtual returns (uint256);
+
+    /// @notice 保有者リストの範囲取得
+    /// @param _offset 開始位置
+    /// @param _limit 最大取得件数
+    /// @return 保有者アドレスのリスト
+    function getHolders(
+        uint256 _offset,
+        uint256 _limit
+    ) public view virtual returns (address[] memory);
+
+    /// Event: 保有者インデックス有効化状態変更
+    event ChangeHolderIndexEnabled(bool enabled);
+
+    // -------------------------------------------------------------------
+    // ロック一覧
+    // -------------------------------------------------------------------
+
+    /// @notice ロック先アドレス別のロック件数の参照
+    /// @param _lockAddress ロック先アドレス
+    /// @return ロック中数量を持つアカウントの数
+    function getLockCountByLockAddress(
+        address _lockAddress
+    ) public view virtual returns (uint256);
+
+    /// @notice ロック先アドレス別のロック一覧の範囲取得
+    /// @param _lockAddress ロック先アドレス
+    /// @param _offset 開始位置
+    /// @param _limit 最大取得件数
+    /// @return ロック対象アカウントのリスト
+    /// @return ロック中の数量のリスト
+    function getLocksByLockAddress(
+        address _lockAddress,
+        uint256 _offset,
+        uint256 _limit
+    ) public view virtual returns (address[] memory, uint256[] memory);
+
+    /// @notice アカウント別のロック件数の参照
+    /// @param _accountAddress ロック対象アカウント
+    /// @return ロック中数量を持つロック先アドレスの数
+    function getLockCountByAccount(
+        address _accountAddress
+    ) public view virtual returns (uint256);
+
+    /// @notice アカウント別のロック一覧の範囲取得
+    /// @param _accountAddress ロック対象アカウント
+    /// @param _offset 開始位置
+    /// @param _limit 最大取得件数
+    /// @return ロック先アドレスのリスト
+    /// @return ロック中の数量のリスト
+    function getLocksByAccount(
+        address _accountAddress,
+        uint256 _offset,
+        uint256 _limit
+    ) public view virtual returns (address[] memory, uint256[] memory);
 }
@@ -23,10 +23,21 @@ abstract contract IbetStandardTokenInterface {
     string public name; // 名称
     string public symbol; //略称
     uint256 public totalSupply; // 総発行量
-    address public tradableExchange; // 取引可能Exchangeアドレス
     string public contactInformation; // 発行体の問い合わせ先情報
     string public privacyPolicy; // 発行体のプライバシーポリシー
 
+    /// 残高数量
+    /// account_address => balance
+    mapping(address => uint256) public balances;
+
+    // NOTE:
+    // tradableExchange と status は最後に宣言する。
+    // 派生コントラクトの移転制御フラグ（IbetSecurityTokenInterface）が同じスロットに
+    // 詰めて配置され、移転時のチェックに必要な値を1スロットから参照できる。
+    // 宣言順を変更するとストレージレイアウトが変わるため注意すること。
+
+    address public tradableExchange; // 取引可能Exchangeアドレス
+
     /// トークンの状態
     /// tradableExchangeとして指定したコントラクトにて、トークンの利用可否を制御する際に利用する
     /// True：有効、False：無効
@@ -57,10 +68,6 @@ abstract contract IbetStandardTokenInterface {
      * 残高関連機能
      */
 
-    /// 残高数量
-    /// account_address => balance
-    mapping(address => uint256) public balances;
-
     /// @notice 残高の参照
     /// @param _owner 保有者のアドレス
     /// @return 残高数量
@@ -30,13 +30,16 @@ p.load_config()
 from brownie.project.ibet_smart_contract import (
     DVPStorage,
     E2EMessaging,
+    E2EMessagingLite,
     EscrowStorage,
-    ExchangeStorage,
+    ExchangeStorageV2,
     FreezeLog,
+    FreezeLogLite,
     IbetEscrow,
     IbetExchange,
     IbetSecurityTokenDVP,
     IbetSecurityTokenEscrow,
+    Multicall,
     PaymentGateway,
     PersonalInfo,
     SnapMessaging,
@@ -66,7 +69,7 @@ def main():
     elif contract_type == "IbetExchange":
         payment_gateway_address = args.get("payment_gateway")
         # Exchange Storage
-        exchange_storage = deployer.deploy(ExchangeStorage)
+        exchange_storage = deployer.deploy(ExchangeStorageV2)
         # IbetExchange
         deploy_args = [payment_gateway_address, exchange_storage.address]
         exchange = deployer.deploy(IbetExchange, *deploy_args)
@@ -98,6 +101,12 @@ def main():
         dvp_storage.upgradeVersion(dvp.address, {"from": deployer})
     elif contract_type == "FreezeLog":
         deployer.deploy(FreezeLog)
+    elif contract_type == "Multicall":
+        deployer.deploy(Multicall)
+    elif contract_type == "E2EMessagingLite":
+        deployer.deploy(E2EMessagingLite)
+    elif contract_type == "FreezeLogLite":
+        deployer.deploy(FreezeLogLite)
 
 
 def set_up_deployer():
@@ -153,6 +162,9 @@ def parse_args():
         "IbetSecurityTokenEscrow",
         "IbetSecurityTokenDVP",
         "FreezeLog",
+        "Multicall",
+        "E2EMessagingLite",
+        "FreezeLogLite",
     ]
     if _args.arg1 not in deployable_contracts:
         parser.error(f"This is a contract that cannot be deployed. : {_args.arg1}")
@@ -0,0 +1,150 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import argparse
+import os
+import sys
+
+from brownie import ZERO_ADDRESS, accounts, network, project, web3
+
+p = project.load(".", name="ibet_smart_contract")
+p.load_config()
+from brownie.project.ibet_smart_contract import (
+    ExchangeStorage,
+    ExchangeStorageV2,
+    IbetExchange,
+)
+
+# 1トランザクションで移行する件数
+ORDER_CHUNK_SIZE = 50
+BALANCE_CHUNK_SIZE = 100
+
+
+def main():
+    # Settings
+    deployer = set_up_deployer()
+
+    # Parse args
+    parser = argparse.ArgumentParser()
+    parser.add_argument("arg1", help="Target Exchange contract address to be migrated")
+    if len(sys.argv) <= 1:
+        parser.error("No arguments")
+        return
+    args = parser.parse_args()
+
+    # Deploy & Migrate & Upgrade
+    old_exchange = args.arg1
+    migrate_exchange_storage(old_address=old_exchange, deployer=deployer)
+
+
+def set_up_deployer():
+    """Deployerの設定"""
+
+    # 環境設定の読み込み
+    APP_ENV = os.environ.get("APP_ENV") or "local"
+    ETH_ACCOUNT_PASSWORD = os.environ.get("ETH_ACCOUNT_PASSWORD") or "password"
+    REFER_ACCOUNT = os.environ.get("REFER_ACCOUNT") or "GETH"
+
+    if APP_ENV == "local":
+        network_id = "local_network"
+    else:
+        network_id = "main_network"
+    network.connect(network_id)
+
+    # アカウント設定
+    if REFER_ACCOUNT == "GETH":
+        deployer = accounts[0]
+        web3.geth.personal.unlock_account(deployer.address, ETH_ACCOUNT_PASSWORD, 1000)
+    else:
+        # NOTE: パスワード入力待ちあり
+        deployer = accounts.load("deploy_user")
+
+    return deployer
+
+
+def migrate_exchange_storage(old_address, deployer):
+    """ExchangeStorageからExchangeStorageV2への移行
+
+    旧Storageを凍結した上で全データを新Storageへコピーし、
+    新しいIbetExchangeを新Storageに接続する。
+    """
+    old_exchange = IbetExchange.at(old_address)
+
+    # Old Storage
+    old_storage_address = old_exchange.storageAddress({"from": deployer})
+    old_storage = ExchangeStorage.at(old_storage_address)
+
+    # Freeze Old Storage
+    # NOTE: 移行中に旧Exchangeから更新されないよう、書き込み可能なバージョンを外す
+    old_storage.upgradeVersion(ZERO_ADDRESS, {"from": deployer})
+
+    # Deploy ExchangeStorageV2
+    new_storage = deployer.deploy(ExchangeStorageV2)
+
+    # Migrate Orders & Agreements
+    latest_order_id = old_storage.getLatestOrderId()
+    for from_id in range(1, latest_order_id + 1, ORDER_CHUNK_SIZE):
+        to_id = min(from_id + ORDER_CHUNK_SIZE - 1, latest_order_id)
+        new_storage.migrateOrders(
+            old_storage_address, from_id, to_id, {"from": deployer}
+        )
+
+    # Migrate Balances & Commitments
+    # NOTE: 残高を保持するアカウントとトークンの組は入庫イベントから収集する
+    pairs = sorted(
+        {
+            (event["args"]["account"], event["args"]["token"])
+            for event in old_exchange.events.get_sequence(
+                from_block=0, event_type="Deposited"
+            )
+        }
+    )
+    for i in range(0, len(pairs), BALANCE_CHUNK_SIZE):
+        chunk = pairs[i : i + BALANCE_CHUNK_SIZE]
+        new_storage.migrateBalances(
+            old_storage_address,
+            [account for account, _ in chunk],
+            [token for _, token in chunk],
+            {"from": deployer},
+        )
+
+    # Migrate Last Prices
+    tokens = sorted({token for _, token in pairs})
+    for i in range(0, len(tokens), BALANCE_CHUNK_SIZE):
+        new_storage.migrateLastPrices(
+            old_storage_address,
+            tokens[i : i + BALANCE_CHUNK_SIZE],
+            {"from": deployer},
+        )
+
+    # Deploy new IbetExchange
+    deploy_args = [
+        old_exchange.paymentGatewayAddress({"from": deployer}),
+        new_storage.address,
+    ]
+    exchange = deployer.deploy(IbetExchange, *deploy_args)
+
+    # Upgrade Version
+    new_storage.upgradeVersion(exchange.address, {"from": deployer})
+
+    return exchange
+
+
+if __name__ == "__main__":
+    main()
@@ -25,7 +25,7 @@ from brownie import accounts, network, project, web3
 
 p = project.load(".", name="ibet_smart_contract")
 p.load_config()
-from brownie.project.ibet_smart_contract import ExchangeStorage, IbetExchange
+from brownie.project.ibet_smart_contract import ExchangeStorageV2, IbetExchange
 
 
 def main():
@@ -75,7 +75,7 @@ def upgrade_exchange(old_address, deployer):
 
     # Storage
     exchange_storage_address = old_exchange.storageAddress({"from": deployer})
-    exchange_storage = ExchangeStorage.at(exchange_storage_address)
+    exchange_storage = ExchangeStorageV2.at(exchange_storage_address)
 
     # Deploy new IbetExchange
     deploy_args = [
@@ -0,0 +1,152 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+import os
+
+import pytest
+
+# 計測結果（"Contract.function" -> gasUsed）
+GAS_RESULTS: dict[str, int] = {}
+
+# ベースラインとの比較結果（name, baseline, current）
+GAS_REGRESSIONS: list[tuple[str, int, int]] = []
+
+# ベースラインに計測値が存在しない計測対象
+GAS_UNMEASURED: list[str] = []
+
+# 指定されたベースラインが存在しない場合のファイルパス
+GAS_BASELINE_MISSING: list[str] = []
+
+
+@pytest.fixture()
+def gas_report():
+    """ガス使用量の記録
+
+    >>> tx = token.transfer(to, value, {"from": issuer})
+    >>> gas_report("IbetShare.transfer", tx)
+    """
+
+    def record(name: str, tx):
+        GAS_RESULTS[name] = tx.gas_used
+        return tx
+
+    return record
+
+
+def load_gas_report(path: str) -> dict[str, int | None]:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def compare_gas_report(
+    baseline: dict[str, int | None], current: dict[str, int], threshold: float
+) -> list[tuple[str, int, int]]:
+    """ベースラインに対して閾値を超えて増加した計測対象を返す"""
+    regressions = []
+    for name, gas_used in sorted(current.items()):
+        base = baseline.get(name)
+        if base is None or base == 0:
+            continue
+        if (gas_used - base) / base > threshold:
+            regressions.append((name, base, gas_used))
+    return regressions
+
+
+def find_unmeasured(
+    baseline: dict[str, int | None], current: dict[str, int]
+) -> list[str]:
+    """ベースラインに計測値（null以外）が存在しない計測対象を返す"""
+    return [name for name in sorted(current) if not baseline.get(name)]
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+
+    # ベースラインの存在確認
+    # 指定したベースラインが存在しない場合は比較できないため失敗とする
+    baseline_path = config.getoption("--gas-baseline")
+    if baseline_path is not None and not os.path.exists(baseline_path):
+        GAS_BASELINE_MISSING.append(baseline_path)
+        session.exitstatus = pytest.ExitCode.USAGE_ERROR
+
+    if len(GAS_RESULTS) == 0:
+        return
+
+    current = dict(sorted(GAS_RESULTS.items()))
+
+    # レポート出力
+    report_path = config.getoption("--gas-report")
+    if report_path is not None:
+        report_dir = os.path.dirname(report_path)
+        if report_dir != "":
+            os.makedirs(report_dir, exist_ok=True)
+        with open(report_path, "w") as f:
+            json.dump(current, f, indent=2)
+            f.write("\n")
+
+    # ベースラインとの比較
+    if baseline_path is None or len(GAS_BASELINE_MISSING) > 0:
+        return
+    baseline = load_gas_report(baseline_path)
+    # ベースラインに計測値が無い場合は比較できないため失敗とする
+    GAS_UNMEASURED.extend(find_unmeasured(baseline=baseline, current=current))
+    GAS_REGRESSIONS.extend(
+        compare_gas_report(
+            baseline=baseline,
+            current=current,
+            threshold=config.getoption("--gas-threshold"),
+        )
+    )
+    if len(GAS_UNMEASURED) > 0 or len(GAS_REGRESSIONS) > 0:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if len(GAS_BASELINE_MISSING) > 0:
+        terminalreporter.section("gas baseline", red=True)
+        for path in GAS_BASELINE_MISSING:
+            terminalreporter.write_line(
+                f"baseline not found: {path} (run 'make benchmark-baseline')",
+                red=True,
+            )
+
+    if len(GAS_RESULTS) == 0:
+        return
+
+    terminalreporter.section("gas report")
+    for name, gas_used in sorted(GAS_RESULTS.items()):
+        terminalreporter.write_line(f"{name:<50} {gas_used:>12,}")
+
+    if len(GAS_UNMEASURED) > 0:
+        terminalreporter.section("gas baseline not recorded", red=True)
+        for name in GAS_UNMEASURED:
+            terminalreporter.write_line(
+                f"{name} (run 'make benchmark-baseline')", red=True
+            )
+
+    if len(GAS_REGRESSIONS) > 0:
+        threshold = config.getoption("--gas-threshold")
+        terminalreporter.section("gas regressions", red=True)
+        for name, base, gas_used in GAS_REGRESSIONS:
+            terminalreporter.write_line(
+                f"{name:<50} {base:>12,} -> {gas_used:>12,} "
+                f"(+{(gas_used - base) / base:.2%} > {threshold:.2%})",
+                red=True,
+            )
@@ -0,0 +1,297 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import pytest
+from brownie import IbetShare, IbetStandardToken
+
+# 計測用の固定ワークロード
+TOTAL_SUPPLY = 1000000
+DEPOSIT_AMOUNT = 1000
+TRADE_AMOUNT = 100
+PRICE = 1000
+BULK_COUNT = 3
+
+
+def deploy_standard_token(issuer, tradable_exchange):
+    deploy_args = [
+        "test_token",
+        "STD",
+        TOTAL_SUPPLY,
+        tradable_exchange,
+        "some_contact_information",
+        "some_privacy_policy",
+    ]
+    return issuer.deploy(IbetStandardToken, *deploy_args)
+
+
+def deploy_share(issuer, tradable_exchange, transfer_approval_required=False):
+    deploy_args = [
+        "test_share",
+        "SHR",
+        10000,
+        TOTAL_SUPPLY,
+        1000,
+        "20200829",
+        "20200831",
+        "20191231",
+        10000,
+    ]
+    token = issuer.deploy(IbetShare, *deploy_args)
+    token.setTradableExchange(tradable_exchange, {"from": issuer})
+    token.setTransferable(True, {"from": issuer})
+    if transfer_approval_required:
+        token.setTransferApprovalRequired(True, {"from": issuer})
+    return token
+
+
+# BENCHMARK_IbetExchange
+class TestIbetExchange:
+    @pytest.fixture()
+    def token(self, users, exchange):
+        issuer = users["issuer"]
+        token = deploy_standard_token(issuer, exchange.address)
+        token.transfer(exchange.address, DEPOSIT_AMOUNT, {"from": issuer})
+        return token
+
+    def test_createOrder_cancelOrder(self, users, exchange, token, gas_report):
+        issuer = users["issuer"]
+
+        tx = exchange.createOrder(
+            token.address, TRADE_AMOUNT, PRICE, False, users["agent"], {"from": issuer}
+        )
+        gas_report("IbetExchange.createOrder", tx)
+
+        tx = exchange.cancelOrder(exchange.latestOrderId(), {"from": issuer})
+        gas_report("IbetExchange.cancelOrder", tx)
+
+    def test_executeOrder_confirmAgreement(self, users, exchange, token, gas_report):
+        agent = users["agent"]
+        exchange.createOrder(
+            token.address, TRADE_AMOUNT, PRICE, False, agent, {"from": users["issuer"]}
+        )
+        order_id = exchange.latestOrderId()
+
+        tx = exchange.executeOrder(
+            order_id, TRADE_AMOUNT, True, {"from": users["trader"]}
+        )
+        gas_report("IbetExchange.executeOrder", tx)
+
+        agreement_id = exchange.latestAgreementId(order_id)
+        tx = exchange.confirmAgreement(order_id, agreement_id, {"from": agent})
+        gas_report("IbetExchange.confirmAgreement", tx)
+
+    def test_cancelAgreement(self, users, exchange, token, gas_report):
+        agent = users["agent"]
+        exchange.createOrder(
+            token.address, TRADE_AMOUNT, PRICE, False, agent, {"from": users["issuer"]}
+        )
+        order_id = exchange.latestOrderId()
+        exchange.executeOrder(order_id, TRADE_AMOUNT, True, {"from": users["trader"]})
+
+        agreement_id = exchange.latestAgreementId(order_id)
+        tx = exchange.cancelAgreement(order_id, agreement_id, {"from": agent})
+        gas_report("IbetExchange.cancelAgreement", tx)
+
+    def test_bulkConfirmAgreement(self, users, exchange, token, gas_report):
+        agent = users["agent"]
+        exchange.createOrder(
+            token.address, TRADE_AMOUNT, PRICE, False, agent, {"from": users["issuer"]}
+        )
+        order_id = exchange.latestOrderId()
+        for _ in range(BULK_COUNT):
+            exchange.executeOrder(
+                order_id, TRADE_AMOUNT // BULK_COUNT, True, {"from": users["trader"]}
+            )
+
+        tx = exchange.bulkConfirmAgreement(
+            [order_id] * BULK_COUNT,
+            list(range(1, BULK_COUNT + 1)),
+            {"from": agent},
+        )
+        gas_report("IbetExchange.bulkConfirmAgreement", tx)
+
+    def test_bulkCancelAgreement(self, users, exchange, token, gas_report):
+        agent = users["agent"]
+        exchange.createOrder(
+            token.address, TRADE_AMOUNT, PRICE, False, agent, {"from": users["issuer"]}
+        )
+        order_id = exchange.latestOrderId()
+        for _ in range(BULK_COUNT):
+            exchange.executeOrder(
+                order_id, TRADE_AMOUNT // BULK_COUNT, True, {"from": users["trader"]}
+            )
+
+        tx = exchange.bulkCancelAgreement(
+            [order_id] * BULK_COUNT,
+            list(range(1, BULK_COUNT + 1)),
+            {"from": agent},
+        )
+        gas_report("IbetExchange.bulkCancelAgreement", tx)
+
+    def test_withdraw(self, users, exchange, token, gas_report):
+        tx = exchange.withdraw(token.address, {"from": users["issuer"]})
+        gas_report("IbetExchange.withdraw", tx)
+
+
+# BENCHMARK_IbetEscrow
+class TestIbetEscrow:
+    @pytest.fixture()
+    def token(self, users, escrow):
+        issuer = users["issuer"]
+        token = deploy_standard_token(issuer, escrow.address)
+        token.transfer(escrow.address, DEPOSIT_AMOUNT, {"from": issuer})
+        return token
+
+    def test_createEscrow_finishEscrow(self, users, escrow, token, gas_report):
+        tx = escrow.createEscrow(
+            token.address,
+            users["user1"],
+            TRADE_AMOUNT,
+            users["agent"],
+            "",
+            {"from": users["issuer"]},
+        )
+        gas_report("IbetEscrow.createEscrow", tx)
+
+        tx = escrow.finishEscrow(escrow.latestEscrowId(), {"from": users["agent"]})
+        gas_report("IbetEscrow.finishEscrow", tx)
+
+    def test_cancelEscrow(self, users, escrow, token, gas_report):
+        escrow.createEscrow(
+            token.address,
+            users["user1"],
+            TRADE_AMOUNT,
+            users["agent"],
+            "",
+            {"from": users["issuer"]},
+        )
+
+        tx = escrow.cancelEscrow(escrow.latestEscrowId(), {"from": users["issuer"]})
+        gas_report("IbetEscrow.cancelEscrow", tx)
+
+    def test_withdraw(self, users, escrow, token, gas_report):
+        tx = escrow.withdraw(token.address, {"from": users["issuer"]})
+        gas_report("IbetEscrow.withdraw", tx)
+
+
+# BENCHMARK_IbetSecurityTokenEscrow
+class TestIbetSecurityTokenEscrow:
+    @pytest.fixture()
+    def token(self, users, st_escrow):
+        issuer = users["issuer"]
+        token = deploy_share(issuer, st_escrow.address, transfer_approval_required=True)
+        token.transfer(st_escrow.address, DEPOSIT_AMOUNT, {"from": issuer})
+        return token
+
+    def test_createEscrow_finishEscrow_approveTransfer(
+        self, users, st_escrow, token, gas_report
+    ):
+        tx = st_escrow.createEscrow(
+            token.address,
+            users["user1"],
+            TRADE_AMOUNT,
+            users["agent"],
+            "",
+            "",
+            {"from": users["issuer"]},
+        )
+        gas_report("IbetSecurityTokenEscrow.createEscrow", tx)
+
+        escrow_id = st_escrow.latestEscrowId()
+        tx = st_escrow.finishEscrow(escrow_id, {"from": users["agent"]})
+        gas_report("IbetSecurityTokenEscrow.finishEscrow", tx)
+
+        tx = st_escrow.approveTransfer(escrow_id, "", {"from": users["issuer"]})
+        gas_report("IbetSecurityTokenEscrow.approveTransfer", tx)
+
+    def test_cancelEscrow(self, users, st_escrow, token, gas_report):
+        st_escrow.createEscrow(
+            token.address,
+            users["user1"],
+            TRADE_AMOUNT,
+            users["agent"],
+            "",
+            "",
+            {"from": users["issuer"]},
+        )
+
+        tx = st_escrow.cancelEscrow(
+            st_escrow.latestEscrowId(), {"from": users["issuer"]}
+        )
+        gas_report("IbetSecurityTokenEscrow.cancelEscrow", tx)
+
+
+# BENCHMARK_IbetSecurityTokenDVP
+class TestIbetSecurityTokenDVP:
+    @pytest.fixture()
+    def token(self, users, st_dvp):
+        issuer = users["issuer"]
+        token = deploy_share(issuer, st_dvp.address)
+        token.transfer(st_dvp.address, DEPOSIT_AMOUNT, {"from": issuer})
+        return token
+
+    def test_createDelivery_finishDelivery(self, users, st_dvp, token, gas_report):
+        tx = st_dvp.createDelivery(
+            token.address,
+            users["user1"],
+            TRADE_AMOUNT,
+            users["agent"],
+            "",
+            {"from": users["issuer"]},
+        )
+        gas_report("IbetSecurityTokenDVP.createDelivery", tx)
+
+        delivery_id = st_dvp.latestDeliveryId()
+        tx = st_dvp.confirmDelivery(delivery_id, {"from": users["user1"]})
+        gas_report("IbetSecurityTokenDVP.confirmDelivery", tx)
+
+        tx = st_dvp.finishDelivery(delivery_id, {"from": users["agent"]})
+        gas_report("IbetSecurityTokenDVP.finishDelivery", tx)
+
+    def test_cancelDelivery(self, users, st_dvp, token, gas_report):
+        st_dvp.createDelivery(
+            token.address,
+            users["user1"],
+            TRADE_AMOUNT,
+            users["agent"],
+            "",
+            {"from": users["issuer"]},
+        )
+
+        tx = st_dvp.cancelDelivery(st_dvp.latestDeliveryId(), {"from": users["issuer"]})
+        gas_report("IbetSecurityTokenDVP.cancelDelivery", tx)
+
+    def test_abortDelivery(self, users, st_dvp, token, gas_report):
+        st_dvp.createDelivery(
+            token.address,
+            users["user1"],
+            TRADE_AMOUNT,
+            users["agent"],
+            "",
+            {"from": users["issuer"]},
+        )
+        delivery_id = st_dvp.latestDeliveryId()
+        st_dvp.confirmDelivery(delivery_id, {"from": users["user1"]})
+
+        tx = st_dvp.abortDelivery(delivery_id, {"from": users["agent"]})
+        gas_report("IbetSecurityTokenDVP.abortDelivery", tx)
+
+    def test_withdraw(self, users, st_dvp, token, gas_report):
+        tx = st_dvp.withdraw(token.address, {"from": users["issuer"]})
+        gas_report("IbetSecurityTokenDVP.withdraw", tx)
@@ -0,0 +1,279 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import brownie
+import brownie_utils
+import pytest
+from brownie import (
+    IbetCoupon,
+    IbetMembership,
+    IbetShare,
+    IbetStandardToken,
+    IbetStraightBond,
+)
+
+# 計測用の固定ワークロード
+TOTAL_SUPPLY = 1000000
+TRANSFER_AMOUNT = 100
+BULK_TRANSFER_COUNT = 3
+
+
+def deploy_share(issuer):
+    deploy_args = [
+        "test_share",
+        "SHR",
+        10000,
+        TOTAL_SUPPLY,
+        1000,
+        "20200829",
+        "20200831",
+        "20191231",
+        10000,
+    ]
+    return issuer.deploy(IbetShare, *deploy_args)
+
+
+def deploy_bond(issuer):
+    deploy_args = [
+        "test_bond",
+        "BND",
+        TOTAL_SUPPLY,
+        10000,
+        "JPY",
+        "20191231",
+        100,
+        "JPY",
+        "20191231",
+        "some_return",
+        "some_purpose",
+    ]
+    return brownie_utils.force_deploy(issuer, IbetStraightBond, *deploy_args)
+
+
+@pytest.fixture(params=["IbetShare", "IbetStraightBond"])
+def security_token(request, users, personal_info):
+    """移転可能な状態のセキュリティトークン（保有者は個人情報登録済み）"""
+    issuer = users["issuer"]
+
+    if request.param == "IbetShare":
+        token = deploy_share(issuer)
+    else:
+        token = deploy_bond(issuer)
+    token.setPersonalInfoAddress(personal_info.address, {"from": issuer})
+    token.setTransferable(True, {"from": issuer})
+
+    for holder in [users["trader"], users["user1"], users["user2"]]:
+        personal_info.register(issuer, "encrypted_message", {"from": holder})
+
+    return request.param, token
+
+
+# BENCHMARK_SecurityToken (IbetShare, IbetStraightBond)
+class TestSecurityToken:
+    def test_transfer(self, users, security_token, gas_report):
+        name, token = security_token
+        tx = token.transfer(users["trader"], TRANSFER_AMOUNT, {"from": users["issuer"]})
+        gas_report(f"{name}.transfer", tx)
+
+    def test_bulkTransfer(self, users, security_token, gas_report):
+        name, token = security_token
+        to_list = [users["trader"], users["user1"], users["user2"]]
+        tx = token.bulkTransfer(
+            to_list,
+            [TRANSFER_AMOUNT] * BULK_TRANSFER_COUNT,
+            {"from": users["issuer"]},
+        )
+        gas_report(f"{name}.bulkTransfer", tx)
+
+    def test_transferFrom(self, users, security_token, gas_report):
+        name, token = security_token
+        token.transfer(users["trader"], TRANSFER_AMOUNT, {"from": users["issuer"]})
+        tx = token.transferFrom(
+            users["trader"], users["user1"], TRANSFER_AMOUNT, {"from": users["issuer"]}
+        )
+        gas_report(f"{name}.transferFrom", tx)
+
+    def test_lock_unlock(self, users, security_token, gas_report):
+        name, token = security_token
+        issuer = users["issuer"]
+        lock_address = users["agent"]
+        token.transfer(users["trader"], TRANSFER_AMOUNT, {"from": issuer})
+
+        tx = token.lock(lock_address, TRANSFER_AMOUNT, "", {"from": users["trader"]})
+        gas_report(f"{name}.lock", tx)
+
+        tx = token.unlock(
+            users["trader"],
+            users["user1"],
+            TRANSFER_AMOUNT,
+            "",
+            {"from": lock_address},
+        )
+        gas_report(f"{name}.unlock", tx)
+
+    def test_forceLock_forceUnlock(self, users, security_token, gas_report):
+        name, token = security_token
+        issuer = users["issuer"]
+        lock_address = users["agent"]
+        token.transfer(users["trader"], TRANSFER_AMOUNT, {"from": issuer})
+
+        tx = token.forceLock(
+            lock_address, users["trader"], TRANSFER_AMOUNT, "", {"from": issuer}
+        )
+        gas_report(f"{name}.forceLock", tx)
+
+        tx = token.forceUnlock(
+            lock_address,
+            users["trader"],
+            users["user1"],
+            TRANSFER_AMOUNT,
+            "",
+            {"from": issuer},
+        )
+        gas_report(f"{name}.forceUnlock", tx)
+
+    def test_issueFrom_redeemFrom(self, users, security_token, gas_report):
+        name, token = security_token
+        issuer = users["issuer"]
+        tx = token.issueFrom(
+            users["trader"], brownie.ZERO_ADDRESS, TRANSFER_AMOUNT, {"from": issuer}
+        )
+        gas_report(f"{name}.issueFrom", tx)
+
+        tx = token.redeemFrom(
+            users["trader"], brownie.ZERO_ADDRESS, TRANSFER_AMOUNT, {"from": issuer}
+        )
+        gas_report(f"{name}.redeemFrom", tx)
+
+    def test_applyForTransfer_approveTransfer(self, users, security_token, gas_report):
+        name, token = security_token
+        issuer = users["issuer"]
+        token.transfer(users["trader"], TRANSFER_AMOUNT * 2, {"from": issuer})
+        token.setTransferApprovalRequired(True, {"from": issuer})
+
+        tx = token.applyForTransfer(
+            users["user1"], TRANSFER_AMOUNT, "", {"from": users["trader"]}
+        )
+        gas_report(f"{name}.applyForTransfer", tx)
+
+        tx = token.approveTransfer(0, "", {"from": issuer})
+        gas_report(f"{name}.approveTransfer", tx)
+
+        token.applyForTransfer(
+            users["user1"], TRANSFER_AMOUNT, "", {"from": users["trader"]}
+        )
+        tx = token.cancelTransfer(1, "", {"from": users["trader"]})
+        gas_report(f"{name}.cancelTransfer", tx)
+
+
+# BENCHMARK_SecurityToken transfer path
+# 移転時の個人情報登録チェックの有無で比較する
+# チェック無しの場合、移転時に読み込むスロットは owner と移転制御フラグのスロットのみとなる
+class TestSecurityTokenTransferPath:
+    @pytest.fixture()
+    def unchecked_token(self, users, security_token):
+        name, token = security_token
+        token.setRequirePersonalInfoRegistered(False, {"from": users["issuer"]})
+        return name, token
+
+    def test_transfer(self, users, unchecked_token, gas_report):
+        name, token = unchecked_token
+        tx = token.transfer(users["trader"], TRANSFER_AMOUNT, {"from": users["issuer"]})
+        gas_report(f"{name}.transfer.withoutPersonalInfo", tx)
+
+    def test_bulkTransfer(self, users, unchecked_token, gas_report):
+        name, token = unchecked_token
+        to_list = [users["trader"], users["user1"], users["user2"]]
+        tx = token.bulkTransfer(
+            to_list,
+            [TRANSFER_AMOUNT] * BULK_TRANSFER_COUNT,
+            {"from": users["issuer"]},
+        )
+        gas_report(f"{name}.bulkTransfer.withoutPersonalInfo", tx)
+
+    def test_transferFrom(self, users, unchecked_token, gas_report):
+        name, token = unchecked_token
+        token.transfer(users["trader"], TRANSFER_AMOUNT, {"from": users["issuer"]})
+        tx = token.transferFrom(
+            users["trader"], users["user1"], TRANSFER_AMOUNT, {"from": users["issuer"]}
+        )
+        gas_report(f"{name}.transferFrom.withoutPersonalInfo", tx)
+
+
+# BENCHMARK_UtilityToken (IbetStandardToken, IbetCoupon, IbetMembership)
+class TestUtilityToken:
+    @pytest.fixture(params=["IbetStandardToken", "IbetCoupon", "IbetMembership"])
+    def utility_token(self, request, users, exchange):
+        issuer = users["issuer"]
+        if request.param == "IbetStandardToken":
+            token = issuer.deploy(
+                IbetStandardToken,
+                "test_token",
+                "STD",
+                TOTAL_SUPPLY,
+                exchange.address,
+                "some_contact_information",
+                "some_privacy_policy",
+            )
+        elif request.param == "IbetCoupon":
+            token = issuer.deploy(
+                IbetCoupon,
+                "test_coupon",
+                "CPN",
+                TOTAL_SUPPLY,
+                exchange.address,
+                "some_details",
+                "some_return_details",
+                "some_memo",
+                "20201231",
+                True,
+                "some_contact_information",
+                "some_privacy_policy",
+            )
+        else:
+            token = issuer.deploy(
+                IbetMembership,
+                "test_membership",
+                "MEM",
+                TOTAL_SUPPLY,
+                exchange.address,
+                "some_details",
+                "some_return",
+                "20191231",
+                "some_memo",
+                True,
+                "some_contact_information",
+                "some_privacy_policy",
+            )
+        return request.param, token
+
+    def test_transfer(self, users, utility_token, gas_report):
+        name, token = utility_token
+        tx = token.transfer(users["trader"], TRANSFER_AMOUNT, {"from": users["issuer"]})
+        gas_report(f"{name}.transfer", tx)
+
+    def test_bulkTransfer(self, users, utility_token, gas_report):
+        name, token = utility_token
+        to_list = [users["trader"], users["user1"], users["user2"]]
+        tx = token.bulkTransfer(
+            to_list,
+            [TRANSFER_AMOUNT] * BULK_TRANSFER_COUNT,
+            {"from": users["issuer"]},
+        )
+        gas_report(f"{name}.bulkTransfer", tx)
@@ -0,0 +1,138 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import brownie
+from brownie import (
+    ContractRegistry,
+    E2EMessaging,
+    FreezeLog,
+    IbetStandardToken,
+    TokenList,
+)
+
+# 計測用の固定ワークロード
+REGISTERED_TOKEN_COUNT = 5
+ENCRYPTED_INFO = "encrypted_message"
+
+
+def deploy_standard_token(issuer):
+    deploy_args = [
+        "test_token",
+        "STD",
+        1000000,
+        brownie.ZERO_ADDRESS,
+        "some_contact_information",
+        "some_privacy_policy",
+    ]
+    return issuer.deploy(IbetStandardToken, *deploy_args)
+
+
+# BENCHMARK_TokenList
+class TestTokenList:
+    def test_register_changeOwner(self, users, gas_report):
+        issuer = users["issuer"]
+        token_list = users["admin"].deploy(TokenList)
+
+        # 複数のトークンが登録済みの状態で計測する
+        tokens = [deploy_standard_token(issuer) for _ in range(REGISTERED_TOKEN_COUNT)]
+        for token in tokens[:-1]:
+            token_list.register(token.address, "IbetStandardToken", {"from": issuer})
+
+        tx = token_list.register(
+            tokens[-1].address, "IbetStandardToken", {"from": issuer}
+        )
+        gas_report("TokenList.register", tx)
+
+        tx = token_list.changeOwner(
+            tokens[-1].address, users["user1"], {"from": issuer}
+        )
+        gas_report("TokenList.changeOwner", tx)
+
+
+# BENCHMARK_PersonalInfo
+class TestPersonalInfo:
+    def test_register_modify(self, users, personal_info, gas_report):
+        tx = personal_info.register(
+            users["issuer"], ENCRYPTED_INFO, {"from": users["trader"]}
+        )
+        gas_report("PersonalInfo.register", tx)
+
+        tx = personal_info.modify(
+            users["trader"], ENCRYPTED_INFO, {"from": users["issuer"]}
+        )
+        gas_report("PersonalInfo.modify", tx)
+
+    def test_forceRegister(self, users, personal_info, gas_report):
+        tx = personal_info.forceRegister(
+            users["trader"], ENCRYPTED_INFO, {"from": users["issuer"]}
+        )
+        gas_report("PersonalInfo.forceRegister", tx)
+
+
+# BENCHMARK_PaymentGateway
+class TestPaymentGateway:
+    def test_register_approve(self, users, payment_gateway, gas_report):
+        agent = users["agent"]
+
+        tx = payment_gateway.register(agent, ENCRYPTED_INFO, {"from": users["trader"]})
+        gas_report("PaymentGateway.register", tx)
+
+        tx = payment_gateway.approve(users["trader"], {"from": agent})
+        gas_report("PaymentGateway.approve", tx)
+
+
+# BENCHMARK_ContractRegistry
+class TestContractRegistry:
+    def test_register(self, users, gas_report):
+        issuer = users["issuer"]
+        contract_registry = users["admin"].deploy(ContractRegistry)
+        token = deploy_standard_token(issuer)
+
+        tx = contract_registry.register(
+            token.address, "IbetStandardToken", {"from": issuer}
+        )
+        gas_report("ContractRegistry.register", tx)
+
+
+# BENCHMARK_E2EMessaging
+class TestE2EMessaging:
+    def test_sendMessage_setPublicKey(self, users, gas_report):
+        e2e_messaging = users["admin"].deploy(E2EMessaging)
+
+        tx = e2e_messaging.sendMessage(
+            users["user2"], "test_message", {"from": users["user1"]}
+        )
+        gas_report("E2EMessaging.sendMessage", tx)
+
+        tx = e2e_messaging.setPublicKey(
+            "test_public_key", "RSA4098", {"from": users["user1"]}
+        )
+        gas_report("E2EMessaging.setPublicKey", tx)
+
+
+# BENCHMARK_FreezeLog
+class TestFreezeLog:
+    def test_recordLog_updateLog(self, users, gas_report):
+        freeze_log = users["admin"].deploy(FreezeLog)
+
+        tx = freeze_log.recordLog("test_message", 5, {"from": users["user1"]})
+        gas_report("FreezeLog.recordLog", tx)
+
+        tx = freeze_log.updateLog(0, "test_message_after", {"from": users["user1"]})
+        gas_report("FreezeLog.updateLog", tx)
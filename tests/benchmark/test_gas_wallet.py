@@ -0,0 +1,132 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import pytest
+from brownie import P256Wallet, WalletTestReceiver, WalletTestVerifier
+from Crypto.Hash import SHA256
+from Crypto.PublicKey import ECC
+from Crypto.Signature import DSS
+from eth_utils import keccak
+
+# 計測用の固定鍵（secp256r1の位数未満の値。RFC6979により署名も固定となる）
+PRIVATE_KEY = int.from_bytes(keccak(text="benchmark"), "big") % (2**255)
+MESSAGE_HASH = keccak(text="benchmark_message")
+BATCH_CALL_COUNT = 3
+
+
+class _RawHash:
+    block_size = 64
+    digest_size = 32
+    oid = SHA256.new(b"").oid
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    @classmethod
+    def new(cls, data=b""):
+        return cls(data)
+
+    def update(self, data: bytes):
+        self._data += data
+
+    def copy(self):
+        return self.__class__(self._data)
+
+    def digest(self):
+        return self._data
+
+
+def sign(private_key, message_hash) -> tuple[int, int]:
+    signer = DSS.new(private_key, "deterministic-rfc6979", encoding="binary")
+    signature = signer.sign(_RawHash(bytes(message_hash)))
+    return (
+        int.from_bytes(signature[:32], byteorder="big"),
+        int.from_bytes(signature[32:], byteorder="big"),
+    )
+
+
+@pytest.fixture()
+def private_key():
+    return ECC.construct(curve="P-256", d=PRIVATE_KEY)
+
+
+# BENCHMARK_P256Verifier
+# プリコンパイルとP256Verifier（Solidity実装）の検証コストの比較
+class TestP256Verifier:
+    def test_verify(self, users, private_key, gas_report):
+        admin = users["admin"]
+        verifier = admin.deploy(WalletTestVerifier)
+        pubkey_x, pubkey_y = int(private_key.pointQ.x), int(private_key.pointQ.y)
+        sig_r, sig_s = sign(private_key, MESSAGE_HASH)
+        signature = (MESSAGE_HASH, sig_r, sig_s)
+
+        # プリコンパイルが無いネットワークでは計測値が意味を持たないため、検証結果を確認する
+        assert verifier.verifyWithPrecompile(*signature, pubkey_x, pubkey_y) is True
+        assert verifier.verify(*signature, pubkey_x, pubkey_y) is True
+
+        tx = verifier.verifyWithPrecompile.transact(
+            *signature, pubkey_x, pubkey_y, {"from": admin}
+        )
+        gas_report("P256Verifier.precompile", tx)
+
+        tx = verifier.verify.transact(*signature, pubkey_x, pubkey_y, {"from": admin})
+        gas_report("P256Verifier.verify", tx)
+
+        tx = verifier.deployTable(pubkey_x, pubkey_y, {"from": admin})
+        gas_report("P256Verifier.deployTable", tx)
+
+        table = tx.events["TableDeployed"]["table"]
+        assert verifier.verifyWithTable(*signature, table) is True
+        tx = verifier.verifyWithTable.transact(*signature, table, {"from": admin})
+        gas_report("P256Verifier.verifyWithTable", tx)
+
+
+# BENCHMARK_P256Wallet
+class TestP256Wallet:
+    def test_execute_executeBatch(self, users, private_key, gas_report):
+        admin = users["admin"]
+        receiver = admin.deploy(WalletTestReceiver)
+        wallet = admin.deploy(
+            P256Wallet, int(private_key.pointQ.x), int(private_key.pointQ.y)
+        )
+        gas_report("P256Wallet.deploy", wallet.tx)
+
+        call_data = receiver.setValue.encode_input(1)
+        tx_hash = wallet.getTransactionHash(receiver.address, 0, call_data, 0)
+        tx = wallet.execute(
+            receiver.address,
+            0,
+            call_data,
+            *sign(private_key, tx_hash),
+            {"from": users["user1"]},
+        )
+        gas_report("P256Wallet.execute", tx)
+
+        targets = [receiver.address] * BATCH_CALL_COUNT
+        values = [0] * BATCH_CALL_COUNT
+        data = [receiver.setValue.encode_input(i) for i in range(BATCH_CALL_COUNT)]
+        tx_hash = wallet.getBatchTransactionHash(targets, values, data, 1)
+        tx = wallet.executeBatch(
+            targets,
+            values,
+            data,
+            *sign(private_key, tx_hash),
+            {"from": users["user1"]},
+        )
+        gas_report("P256Wallet.executeBatch", tx)
@@ -130,3 +130,18 @@ def _is_constant(abi):
         return abi["constant"]
     else:
         return abi["stateMutability"] in ("view", "pure")
+
+
+def assert_holders(token, expected_holders):
+    """
+    保有者インデックスの内容を検証する。
+
+    holderCount と getHolders の結果が期待する保有者と一致することを確認する。
+    保有者が外れると末尾の要素が移動するため、順序は比較しない。
+
+    :param token: 保有者インデックスを持つトークンのContractオブジェクト
+    :param expected_holders: 期待する保有者アカウントのリスト
+    """
+    holder_count = token.holderCount()
+    assert holder_count == len(expected_holders)
+    assert sorted(token.getHolders(0, holder_count)) == sorted(expected_holders)
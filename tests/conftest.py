@@ -17,6 +17,8 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 
+import json
+import os
 from typing import TypedDict
 
 import pytest
@@ -25,6 +27,57 @@ from web3.middleware import geth_poa_middleware
 
 web3.middleware_onion.inject(geth_poa_middleware, layer=0)
 
+# テスト実行時間の集計（フェーズ -> 秒）
+TIMINGS: dict[str, float] = {"setup": 0.0, "call": 0.0, "teardown": 0.0}
+
+
+def pytest_addoption(parser):
+    # フィクスチャのデプロイ方式
+    parser.addoption(
+        "--redeploy-fixtures",
+        action="store_true",
+        default=False,
+        help="Redeploy contract fixtures for every test instead of reverting "
+        "to a snapshot of the session-wide deployment",
+    )
+
+    # テスト実行時間の計測用のオプション
+    group = parser.getgroup("timing", "test timing report")
+    group.addoption(
+        "--timing-report",
+        action="store",
+        default=None,
+        help="Path to write the test timing report (JSON)",
+    )
+    group.addoption(
+        "--timing-baseline",
+        action="store",
+        default=None,
+        help="Path to the timing report to compare with",
+    )
+
+    # ガス計測（tests/benchmark）用のオプション
+    group = parser.getgroup("gas", "gas benchmark")
+    group.addoption(
+        "--gas-report",
+        action="store",
+        default=None,
+        help="Path to write the gas report (JSON)",
+    )
+    group.addoption(
+        "--gas-baseline",
+        action="store",
+        default=None,
+        help="Path to the baseline gas report to compare with",
+    )
+    group.addoption(
+        "--gas-threshold",
+        action="store",
+        type=float,
+        default=0.05,
+        help="Allowed gas increase ratio against the baseline (default: 0.05)",
+    )
+
 
 class Users(TypedDict):
     admin: str
@@ -35,8 +88,89 @@ class Users(TypedDict):
     user2: str
 
 
-@pytest.fixture()
-def users(web3, accounts) -> Users:
+def pytest_runtest_logreport(report):
+    TIMINGS[report.when] += report.duration
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    report_path = config.getoption("--timing-report")
+    baseline_path = config.getoption("--timing-baseline")
+    if report_path is None and baseline_path is None:
+        return
+
+    current = {name: round(value, 3) for name, value in TIMINGS.items()}
+    current["total"] = round(sum(TIMINGS.values()), 3)
+
+    # レポート出力
+    if report_path is not None:
+        report_dir = os.path.dirname(report_path)
+        if report_dir != "":
+            os.makedirs(report_dir, exist_ok=True)
+        with open(report_path, "w") as f:
+            json.dump(current, f, indent=2)
+            f.write("\n")
+
+    # ベースラインとの比較
+    baseline = {}
+    if baseline_path is not None and os.path.exists(baseline_path):
+        with open(baseline_path, "r") as f:
+            baseline = json.load(f)
+
+    terminalreporter.section("timing report")
+    terminalreporter.write_line(f"{'phase':<10} {'before':>10} {'after':>10}")
+    for name, value in current.items():
+        base = baseline.get(name)
+        if base is None:
+            terminalreporter.write_line(f"{name:<10} {'-':>10} {value:>9.1f}s")
+            continue
+        ratio = f"({(value - base) / base:+.1%})" if base > 0 else ""
+        terminalreporter.write_line(f"{name:<10} {base:>9.1f}s {value:>9.1f}s {ratio}")
+
+
+def fixture_scope(fixture_name, config) -> str:
+    """コントラクトのフィクスチャのスコープ
+
+    通常はセッション内で一度だけデプロイし、テストごとにデプロイ直後のスナップショットへ巻き戻す。
+    --redeploy-fixtures を指定した場合はテストごとに再デプロイする。
+    """
+    if config.getoption("--redeploy-fixtures"):
+        return "function"
+    return "session"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def module_isolation():
+    """xdist実行時のテストの分離
+
+    Brownieはxdist実行時、module_isolationを利用しないテストを収集対象から除外する。
+    tests/ 配下の各テストは isolation フィクスチャでスナップショットから巻き戻されるため、
+    ここではチェーンのリセットを行わない（リセットするとセッション単位でデプロイしたコントラクトが失われる）。
+    tests/ 以外のテストはBrownie標準の module_isolation でリセットされる。
+    """
+    yield
+
+
+@pytest.fixture(autouse=True)
+def isolation(request, chain):
+    """テストごとのチェーン状態の分離
+
+    テスト開始前にスナップショットを取得し、終了後に巻き戻す。
+    セッションスコープのフィクスチャはテスト開始前にデプロイされるため、
+    後続のテストでもデプロイ直後の状態から利用できる。
+
+    NOTE: テスト内で chain.snapshot() を実行するとこのスナップショットが上書きされる
+    """
+    if request.config.getoption("--redeploy-fixtures"):
+        yield
+        return
+
+    chain.snapshot()
+    yield
+    chain.revert()
+
+
+@pytest.fixture(scope="session")
+def users(accounts) -> Users:
     admin = accounts[0]
     trader = accounts[1]
     issuer = accounts[2]
@@ -55,26 +189,26 @@ def users(web3, accounts) -> Users:
     yield users
 
 
-@pytest.fixture()
+@pytest.fixture(scope=fixture_scope)
 def personal_info(PersonalInfo, users):
     personal_info = users["admin"].deploy(PersonalInfo)
     return personal_info
 
 
-@pytest.fixture()
+@pytest.fixture(scope=fixture_scope)
 def payment_gateway(PaymentGateway, users):
     payment_gateway = users["admin"].deploy(PaymentGateway)
     payment_gateway.addAgent.transact(users["agent"], {"from": users["admin"]})
     return payment_gateway
 
 
-@pytest.fixture()
-def exchange_storage(ExchangeStorage, users):
-    exchange_storage = users["admin"].deploy(ExchangeStorage)
+@pytest.fixture(scope=fixture_scope)
+def exchange_storage(ExchangeStorageV2, users):
+    exchange_storage = users["admin"].deploy(ExchangeStorageV2)
     return exchange_storage
 
 
-@pytest.fixture()
+@pytest.fixture(scope=fixture_scope)
 def exchange(IbetExchange, users, payment_gateway, exchange_storage):
     deploy_args = [payment_gateway.address, exchange_storage.address]
     exchange = users["admin"].deploy(IbetExchange, *deploy_args)
@@ -82,13 +216,13 @@ def exchange(IbetExchange, users, payment_gateway, exchange_storage):
     return exchange
 
 
-@pytest.fixture()
+@pytest.fixture(scope=fixture_scope)
 def escrow_storage(EscrowStorage, users):
     escrow_storage = users["admin"].deploy(EscrowStorage)
     return escrow_storage
 
 
-@pytest.fixture()
+@pytest.fixture(scope=fixture_scope)
 def escrow(IbetEscrow, users, escrow_storage):
     deploy_args = [escrow_storage.address]
     escrow = users["admin"].deploy(IbetEscrow, *deploy_args)
@@ -96,13 +230,13 @@ def escrow(IbetEscrow, users, escrow_storage):
     return escrow
 
 
-@pytest.fixture()
+@pytest.fixture(scope=fixture_scope)
 def st_escrow_storage(EscrowStorage, users):
     escrow_storage = users["admin"].deploy(EscrowStorage)
     return escrow_storage
 
 
-@pytest.fixture()
+@pytest.fixture(scope=fixture_scope)
 def st_escrow(IbetSecurityTokenEscrow, users, st_escrow_storage):
     deploy_args = [st_escrow_storage.address]
     st_escrow = users["admin"].deploy(IbetSecurityTokenEscrow, *deploy_args)
@@ -112,13 +246,13 @@ def st_escrow(IbetSecurityTokenEscrow, users, st_escrow_storage):
     return st_escrow
 
 
-@pytest.fixture()
+@pytest.fixture(scope=fixture_scope)
 def st_dvp_storage(DVPStorage, users):
     dvp_storage = users["admin"].deploy(DVPStorage)
     return dvp_storage
 
 
-@pytest.fixture()
+@pytest.fixture(scope=fixture_scope)
 def st_dvp(IbetSecurityTokenDVP, users, st_dvp_storage):
     deploy_args = [st_dvp_storage.address]
     st_dvp = users["admin"].deploy(IbetSecurityTokenDVP, *deploy_args)
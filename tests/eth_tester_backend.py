@@ -0,0 +1,271 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import sys
+import time
+
+import psutil
+from brownie.exceptions import RPCRequestError
+from brownie.network.rpc import LAUNCH_BACKENDS
+from brownie.network.web3 import web3
+from eth.vm.forks import BerlinVM
+from eth.vm.spoof import SpoofTransaction
+from eth_tester import EthereumTester, PyEVMBackend
+from web3 import EthereumTesterProvider
+
+# Brownie用のインプロセスEVM（eth-tester / py-evm）バックエンド
+#
+# Hardhatノードを起動せず、テストプロセス内のEVMでトランザクションを実行する。
+# JSON-RPC（HTTP）の通信が発生しないため、単体テストの実行時間を短縮できる。
+# pytestの --evm-backend=eth-tester オプションで有効になる（conftest.py）。
+
+LAUNCH_COMMAND = "eth-tester"
+
+# Hardhat Network と同じアカウントを生成する
+HARDHAT_MNEMONIC = "test test test test test test test test test test test junk"
+HARDHAT_HD_PATH = "m/44'/60'/0'/0"
+ACCOUNT_COUNT = 20
+
+# hardhat.config.js の blockGasLimit
+BLOCK_GAS_LIMIT = 16777216
+
+# 存在しないJSON-RPCメソッドのエラーコード
+METHOD_NOT_FOUND = -32601
+
+# トランザクションを返すJSON-RPCメソッド
+TRANSACTION_METHODS = (
+    "eth_getTransactionByHash",
+    "eth_getTransactionByBlockHashAndIndex",
+    "eth_getTransactionByBlockNumberAndIndex",
+)
+
+
+class Reverted(Exception):
+    """revertしたコールの戻り値（revertデータ）"""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.data = data
+
+
+class InProcessEVMBackend(PyEVMBackend):
+    """revertデータを保持したまま例外を送出するPyEVMBackend
+
+    PyEVMBackendはrevert理由を文字列に変換して送出するため、
+    カスタムエラーやPanicのrevertデータが失われる。
+    eth-testerの内部関数には依存せず、py-evmの公開API（VM / State）でコールを実行する。
+    """
+
+    def call(self, transaction, block_number="latest"):
+        # 指定ブロックの状態でトランザクションを実行し、実行後に状態を戻す
+        block = self.get_block_by_number(block_number)
+        vm = self.chain.get_vm(self.chain.get_block_header_by_hash(block["hash"]))
+        # Berlin以前のEVMではEIP-1559のトランザクションを実行できないため、
+        # 常にレガシートランザクションとして実行する
+        unsigned_tx = vm.create_unsigned_transaction(
+            nonce=self.get_nonce(transaction["from"], block_number),
+            gas_price=transaction.get("gas_price", 0),
+            gas=transaction.get("gas", block["gas_limit"]),
+            to=transaction.get("to", b""),
+            value=transaction.get("value", 0),
+            data=transaction.get("data", b""),
+        )
+        state = vm.state
+        snapshot = state.snapshot()
+        try:
+            computation = state.apply_transaction(
+                SpoofTransaction(unsigned_tx, from_=transaction["from"])
+            )
+        finally:
+            state.revert(snapshot)
+        if computation.is_error:
+            raise Reverted(revert_data(computation.error))
+        return computation.output
+
+    def estimate_gas(self, transaction, block_number="latest"):
+        if "gas_price" not in transaction and "max_fee_per_gas" not in transaction:
+            transaction = dict(transaction, gas_price=0)
+        # revertする場合はcallと同じ例外を送出する
+        self.call(transaction, block_number)
+        return super().estimate_gas(transaction, block_number)
+
+
+class InProcessEVMProvider(EthereumTesterProvider):
+    """Hardhat（JSON-RPC）と同じ形式でエラーを返すEthereumTesterProvider
+
+    - eth_call / eth_estimateGas がrevertした場合はrevertデータをエラーとして返す
+    - eth_sendTransaction がrevertした場合はトランザクションIDとrevertデータをエラーとして返す
+    - 未対応のメソッドは METHOD_NOT_FOUND を返す（Brownieはトレース機能が無いものとして扱う）
+    - トランザクションの入力データを input として返す（eth-testerは data として返す）
+    """
+
+    endpoint_uri = LAUNCH_COMMAND
+
+    def make_request(self, method, params):
+        namespace, _, endpoint = method.partition("_")
+        if endpoint not in self.api_endpoints.get(namespace, {}):
+            return error_response(METHOD_NOT_FOUND, f"Unknown RPC Endpoint: {method}")
+
+        try:
+            response = super().make_request(method, params)
+        except Reverted as exc:
+            return error_response(3, "execution reverted", "0x" + exc.data.hex())
+
+        if method == "eth_sendTransaction" and "result" in response:
+            return self.check_transaction(params[0], response)
+        if method in TRANSACTION_METHODS and response.get("result") is not None:
+            response["result"].setdefault("input", response["result"]["data"])
+        return response
+
+    def check_transaction(self, transaction: dict, response: dict) -> dict:
+        """revertしたトランザクションのrevertデータを取得する
+
+        ブロックは1トランザクションごとに生成されるため、
+        直前のブロックで同じトランザクションを実行するとrevertデータを再現できる。
+        """
+        tx_hash = response["result"]
+        receipt = self.ethereum_tester.get_transaction_receipt(tx_hash)
+        if receipt["status"] == 1:
+            return response
+
+        call = {k: v for k, v in transaction.items() if k != "nonce"}
+        try:
+            self.ethereum_tester.call(call, receipt["block_number"] - 1)
+            data = b""
+        except Reverted as exc:
+            data = exc.data
+        return error_response(
+            -32000,
+            "VM Exception while processing transaction: revert",
+            {
+                tx_hash: {
+                    "error": "revert",
+                    "reason": "0x" + data.hex() if len(data) > 0 else None,
+                    "program_counter": None,
+                }
+            },
+        )
+
+
+class InProcessEVM:
+    """インプロセスEVMをBrownieのRPCプロセスとして扱うためのオブジェクト
+
+    Brownieは起動したRPCクライアントのプロセスを psutil.Process として扱う。
+    """
+
+    def __init__(self):
+        self.running = True
+
+    def is_running(self) -> bool:
+        return self.running
+
+    def parent(self) -> psutil.Process:
+        return psutil.Process()
+
+    def children(self, recursive: bool = False) -> list:
+        return []
+
+    def kill(self):
+        self.running = False
+
+    def wait(self):
+        pass
+
+
+def revert_data(error: Exception) -> bytes:
+    """VMErrorからrevertデータを取得する（REVERT以外の場合は空）"""
+    if len(error.args) > 0 and isinstance(error.args[0], bytes):
+        return error.args[0]
+    return b""
+
+
+def error_response(code: int, message: str, data=None) -> dict:
+    error = {"code": code, "message": message}
+    if data is not None:
+        error["data"] = data
+    return {"jsonrpc": "2.0", "id": 0, "error": error}
+
+
+def create_tester() -> EthereumTester:
+    backend = InProcessEVMBackend.from_mnemonic(
+        HARDHAT_MNEMONIC,
+        num_accounts=ACCOUNT_COUNT,
+        genesis_parameters=PyEVMBackend.generate_genesis_params(
+            overrides={"gas_limit": BLOCK_GAS_LIMIT}
+        ),
+        # コンパイル時のEVMバージョン（brownie-config.yaml）と合わせる
+        vm_configuration=((0, BerlinVM),),
+        hd_path=HARDHAT_HD_PATH,
+    )
+    return EthereumTester(backend)
+
+
+def register():
+    """BrownieのRPCバックエンドとして登録する"""
+    LAUNCH_BACKENDS[LAUNCH_COMMAND] = sys.modules[__name__]
+
+
+#######################################
+# Brownie RPC backend
+#######################################
+
+
+def launch(cmd: str, **kwargs) -> InProcessEVM:
+    web3.provider = InProcessEVMProvider(create_tester())
+    return InProcessEVM()
+
+
+def on_connection():
+    pass
+
+
+def tester() -> EthereumTester:
+    return web3.provider.ethereum_tester
+
+
+def sleep(seconds: int) -> int:
+    """次のブロックの時刻を進める
+
+    NOTE: Hardhatと異なり、eth-testerでは時刻を進める際に空のブロックが生成される
+
+    :return: 現在時刻との差（Hardhatの evm_increaseTime と同様）
+    """
+    timestamp = tester().get_block_by_number("pending")["timestamp"] + seconds
+    tester().time_travel(timestamp)
+    return timestamp - int(time.time())
+
+
+def mine(timestamp: int | None = None):
+    if timestamp is None:
+        tester().mine_blocks(1)
+    else:
+        # time_travelは指定した時刻のブロックを生成する
+        tester().time_travel(timestamp)
+
+
+def snapshot() -> int:
+    return tester().take_snapshot()
+
+
+def revert(snapshot_id: int):
+    tester().revert_to_snapshot(snapshot_id)
+
+
+def unlock_account(address: str):
+    raise RPCRequestError("eth-tester does not support account impersonation")
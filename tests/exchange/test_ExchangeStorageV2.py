@@ -0,0 +1,257 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import brownie
+import pytest
+from brownie import ExchangeStorage, ExchangeStorageV2
+
+
+@pytest.fixture()
+def old_storage(users):
+    """移行元のExchangeStorage（adminを書き込み可能なバージョンとして設定）"""
+    admin = users["admin"]
+    storage = admin.deploy(ExchangeStorage)
+    storage.upgradeVersion(admin, {"from": admin})
+    return storage
+
+
+@pytest.fixture()
+def new_storage(users):
+    return users["admin"].deploy(ExchangeStorageV2)
+
+
+# TEST_migrateOrders
+class TestMigrateOrders:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # Orders and agreements are copied into the packed layout
+    def test_normal_1(self, users, old_storage, new_storage):
+        admin = users["admin"]
+        trader = users["trader"]
+        issuer = users["issuer"]
+        agent = users["agent"]
+        token = brownie.accounts[6]
+
+        # prepare old storage data
+        old_storage.setLatestOrderId(2, {"from": admin})
+        old_storage.setOrder(
+            1,
+            issuer,
+            token,
+            2**256 - 1,
+            2**256 - 1,
+            False,
+            agent,
+            False,
+            {"from": admin},
+        )
+        old_storage.setOrder(
+            2, trader, token, 100, 200, True, agent, True, {"from": admin}
+        )
+        old_storage.setLatestAgreementId(1, 2, {"from": admin})
+        old_storage.setAgreement(
+            1, 1, trader, 10, 2**256 - 1, False, True, 1000, {"from": admin}
+        )
+        old_storage.setAgreement(
+            1, 2, trader, 20, 2**256 - 1, True, False, 2000, {"from": admin}
+        )
+
+        # migrate
+        new_storage.migrateOrders(old_storage, 1, 2, {"from": admin})
+
+        # assertion
+        assert new_storage.getLatestOrderId() == 2
+        assert new_storage.getOrder(1) == (
+            issuer.address,
+            False,
+            False,
+            2,
+            token.address,
+            agent.address,
+            2**256 - 1,
+            2**256 - 1,
+        )
+        assert new_storage.getOrder(2) == (
+            trader.address,
+            True,
+            True,
+            0,
+            token.address,
+            agent.address,
+            100,
+            200,
+        )
+        assert new_storage.getLatestAgreementId(1) == 2
+        assert new_storage.getAgreement(1, 1) == (
+            trader.address,
+            False,
+            True,
+            1000,
+            10,
+            2**256 - 1,
+        )
+        assert new_storage.getAgreement(1, 2) == (
+            trader.address,
+            True,
+            False,
+            2000,
+            20,
+            2**256 - 1,
+        )
+
+    # Normal_2
+    # Open orders are added to the order book index
+    def test_normal_2(self, users, old_storage, new_storage):
+        admin = users["admin"]
+        trader = users["trader"]
+        issuer = users["issuer"]
+        agent = users["agent"]
+        token = brownie.accounts[6]
+
+        # prepare old storage data
+        old_storage.setLatestOrderId(3, {"from": admin})
+        old_storage.setOrder(
+            1, issuer, token, 100, 2**256 - 1, False, agent, False, {"from": admin}
+        )
+        old_storage.setOrder(
+            2, trader, token, 100, 200, True, agent, True, {"from": admin}
+        )
+        old_storage.setOrder(
+            3, trader, token, 0, 300, True, agent, False, {"from": admin}
+        )
+
+        # migrate
+        new_storage.migrateOrders(old_storage, 1, 3, {"from": admin})
+
+        # assertion
+        assert new_storage.getBestOrder(token, False) == (2**256 - 1, 1)
+        assert new_storage.getBestOrder(token, True) == (0, 0)
+        assert new_storage.getOpenOrderCount(token, False) == 1
+        assert new_storage.getOpenOrderCount(token, True) == 0
+        assert new_storage.getOpenOrders(token, False, 0, 10) == [1]
+
+    #######################################
+    # Error
+    #######################################
+
+    # Error_1
+    # Order ID range is invalid
+    def test_error_1(self, users, old_storage, new_storage):
+        admin = users["admin"]
+        old_storage.setLatestOrderId(1, {"from": admin})
+
+        with brownie.reverts(revert_msg="270201"):
+            new_storage.migrateOrders(old_storage, 1, 2, {"from": admin})
+
+    # Error_2
+    # The storage has already been linked to an exchange contract
+    def test_error_2(self, users, old_storage, new_storage):
+        admin = users["admin"]
+        old_storage.setLatestOrderId(1, {"from": admin})
+        new_storage.upgradeVersion(admin, {"from": admin})
+
+        with brownie.reverts(revert_msg="270101"):
+            new_storage.migrateOrders(old_storage, 1, 1, {"from": admin})
+
+    # Error_3
+    # Message sender must be the owner
+    def test_error_3(self, users, old_storage, new_storage):
+        admin = users["admin"]
+        old_storage.setLatestOrderId(1, {"from": admin})
+
+        with brownie.reverts(revert_msg="500001"):
+            new_storage.migrateOrders(old_storage, 1, 1, {"from": users["user1"]})
+
+
+# TEST_migrateBalances
+class TestMigrateBalances:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    def test_normal_1(self, users, old_storage, new_storage):
+        admin = users["admin"]
+        user1 = users["user1"]
+        user2 = users["user2"]
+        token = brownie.accounts[6]
+
+        old_storage.setBalance(user1, token, 100, {"from": admin})
+        old_storage.setCommitment(user1, token, 10, {"from": admin})
+        old_storage.setBalance(user2, token, 200, {"from": admin})
+
+        new_storage.migrateBalances(
+            old_storage, [user1, user2], [token, token], {"from": admin}
+        )
+
+        assert new_storage.getBalance(user1, token) == 100
+        assert new_storage.getCommitment(user1, token) == 10
+        assert new_storage.getBalance(user2, token) == 200
+        assert new_storage.getCommitment(user2, token) == 0
+
+    #######################################
+    # Error
+    #######################################
+
+    # Error_1
+    # The accounts and tokens lengths don't match
+    def test_error_1(self, users, old_storage, new_storage):
+        admin = users["admin"]
+        token = brownie.accounts[6]
+
+        with brownie.reverts(revert_msg="270301"):
+            new_storage.migrateBalances(
+                old_storage, [users["user1"], users["user2"]], [token], {"from": admin}
+            )
+
+
+# TEST_migrateLastPrices
+class TestMigrateLastPrices:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    def test_normal_1(self, users, old_storage, new_storage):
+        admin = users["admin"]
+        token = brownie.accounts[6]
+
+        old_storage.setLastPrice(token, 1000, {"from": admin})
+
+        new_storage.migrateLastPrices(old_storage, [token], {"from": admin})
+
+        assert new_storage.getLastPrice(token) == 1000
+
+
+# TEST_onlyLatestVersion
+class TestOnlyLatestVersion:
+    #######################################
+    # Error
+    #######################################
+
+    # Error_1
+    # Message sender must be the latest version of exchange
+    def test_error_1(self, users, new_storage):
+        admin = users["admin"]
+
+        with brownie.reverts(revert_msg="270001"):
+            new_storage.setLatestOrderId(1, {"from": admin})
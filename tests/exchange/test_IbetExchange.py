@@ -18,6 +18,7 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 import brownie
+import pytest
 from brownie import IbetStandardToken
 from eth_utils import to_checksum_address
 
@@ -2918,6 +2919,779 @@ class TestCancelAgreement:
         assert exchange.commitmentOf(trader, token.address) == 0
 
 
+# TEST_bulkConfirmAgreement
+class TestBulkConfirmAgreement:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # Take order: BUY
+    # Invalid and duplicated agreements are skipped
+    def test_normal_1(self, users, exchange):
+        issuer = users["issuer"]
+        trader = users["trader"]
+        agent = users["agent"]
+
+        # issue token
+        deploy_args = init_args(exchange.address)
+        token = deploy(users, deploy_args)
+
+        # make SELL order by issuer
+        _make_amount = 100
+        _price = 1000
+        token.transfer.transact(exchange.address, _make_amount, {"from": issuer})
+        exchange.createOrder.transact(
+            token.address, _make_amount, _price, False, agent, {"from": issuer}
+        )
+        order_id = exchange.latestOrderId()
+
+        # take BUY order by trader (twice)
+        exchange.executeOrder.transact(order_id, 10, True, {"from": trader})
+        exchange.executeOrder.transact(order_id, 20, True, {"from": trader})
+
+        # bulk confirm agreement
+        order_id_list = [order_id, order_id, order_id, order_id + 1]
+        agreement_id_list = [1, 2, 2, 1]
+        results = exchange.bulkConfirmAgreement.call(
+            order_id_list, agreement_id_list, {"from": agent}
+        )
+        tx = exchange.bulkConfirmAgreement.transact(
+            order_id_list, agreement_id_list, {"from": agent}
+        )
+
+        # assertion
+        assert results == [True, True, False, False]
+        assert token.balanceOf(trader) == 30
+        assert exchange.commitmentOf(issuer, token.address) == 0
+        assert exchange.lastPrice(token.address) == _price
+        assert exchange.getAgreement(order_id, 1)[4] is True
+        assert exchange.getAgreement(order_id, 2)[4] is True
+
+        assert len(tx.events["SettlementOK"]) == 2
+        assert tx.events["SettlementOK"][0]["orderId"] == order_id
+        assert tx.events["SettlementOK"][0]["agreementId"] == 1
+        assert tx.events["SettlementOK"][0]["buyAddress"] == trader
+        assert tx.events["SettlementOK"][0]["sellAddress"] == issuer
+        assert tx.events["SettlementOK"][0]["amount"] == 10
+        assert tx.events["SettlementOK"][1]["agreementId"] == 2
+        assert tx.events["SettlementOK"][1]["amount"] == 20
+
+    # Normal_2
+    # Take order: SELL
+    def test_normal_2(self, users, exchange):
+        issuer = users["issuer"]
+        trader = users["trader"]
+        agent = users["agent"]
+
+        # issue token
+        deploy_args = init_args(exchange.address)
+        token = deploy(users, deploy_args)
+
+        # make BUY order by trader
+        _make_amount = 100
+        _price = 1000
+        exchange.createOrder.transact(
+            token.address, _make_amount, _price, True, agent, {"from": trader}
+        )
+        order_id = exchange.latestOrderId()
+
+        # take SELL order by issuer
+        token.transfer.transact(exchange.address, 30, {"from": issuer})
+        exchange.executeOrder.transact(order_id, 30, False, {"from": issuer})
+
+        # bulk confirm agreement
+        results = exchange.bulkConfirmAgreement.call([order_id], [1], {"from": agent})
+        exchange.bulkConfirmAgreement.transact([order_id], [1], {"from": agent})
+
+        # assertion
+        assert results == [True]
+        assert token.balanceOf(trader) == 30
+        assert exchange.commitmentOf(issuer, token.address) == 0
+        assert exchange.lastPrice(token.address) == _price
+
+    # Normal_3
+    # Message sender is not the agent of order
+    def test_normal_3(self, users, exchange):
+        issuer = users["issuer"]
+        trader = users["trader"]
+        agent = users["agent"]
+
+        # issue token
+        deploy_args = init_args(exchange.address)
+        token = deploy(users, deploy_args)
+
+        # make SELL order by issuer -> take BUY order by trader
+        token.transfer.transact(exchange.address, 100, {"from": issuer})
+        exchange.createOrder.transact(
+            token.address, 100, 1000, False, agent, {"from": issuer}
+        )
+        order_id = exchange.latestOrderId()
+        exchange.executeOrder.transact(order_id, 10, True, {"from": trader})
+
+        # bulk confirm agreement
+        results = exchange.bulkConfirmAgreement.call([order_id], [1], {"from": trader})
+        exchange.bulkConfirmAgreement.transact([order_id], [1], {"from": trader})
+
+        # assertion
+        assert results == [False]
+        assert token.balanceOf(trader) == 0
+        assert exchange.commitmentOf(issuer, token.address) == 10
+        assert exchange.getAgreement(order_id, 1)[4] is False
+
+    #######################################
+    # Error
+    #######################################
+
+    # Error_1
+    # The lengths of the lists don't match
+    def test_error_1(self, users, exchange):
+        with brownie.reverts(revert_msg="210701"):
+            exchange.bulkConfirmAgreement.transact(
+                [1, 1], [1], {"from": users["agent"]}
+            )
+
+
+# TEST_bulkCancelAgreement
+class TestBulkCancelAgreement:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # Take order: BUY
+    # Invalid and duplicated agreements are skipped
+    def test_normal_1(self, users, exchange):
+        issuer = users["issuer"]
+        trader = users["trader"]
+        agent = users["agent"]
+
+        # issue token
+        deploy_args = init_args(exchange.address)
+        token = deploy(users, deploy_args)
+
+        # make SELL order by issuer
+        _make_amount = 100
+        _price = 1000
+        token.transfer.transact(exchange.address, _make_amount, {"from": issuer})
+        exchange.createOrder.transact(
+            token.address, _make_amount, _price, False, agent, {"from": issuer}
+        )
+        order_id = exchange.latestOrderId()
+
+        # take BUY order by trader (twice)
+        exchange.executeOrder.transact(order_id, 10, True, {"from": trader})
+        exchange.executeOrder.transact(order_id, 20, True, {"from": trader})
+
+        # bulk cancel agreement
+        order_id_list = [order_id, order_id, order_id]
+        agreement_id_list = [1, 1, 2]
+        results = exchange.bulkCancelAgreement.call(
+            order_id_list, agreement_id_list, {"from": agent}
+        )
+        tx = exchange.bulkCancelAgreement.transact(
+            order_id_list, agreement_id_list, {"from": agent}
+        )
+
+        # assertion
+        assert results == [True, False, True]
+        assert exchange.getOrder(order_id) == [
+            issuer.address,
+            token.address,
+            _make_amount,
+            _price,
+            False,
+            agent.address,
+            False,
+        ]
+        assert token.balanceOf(trader) == 0
+        assert exchange.commitmentOf(issuer, token.address) == _make_amount
+        assert exchange.getAgreement(order_id, 1)[3] is True
+        assert exchange.getAgreement(order_id, 2)[3] is True
+
+        assert len(tx.events["SettlementNG"]) == 2
+        assert tx.events["SettlementNG"][0]["agreementId"] == 1
+        assert tx.events["SettlementNG"][0]["buyAddress"] == trader
+        assert tx.events["SettlementNG"][0]["sellAddress"] == issuer
+        assert tx.events["SettlementNG"][1]["agreementId"] == 2
+
+    # Normal_2
+    # Take order: SELL
+    def test_normal_2(self, users, exchange):
+        issuer = users["issuer"]
+        trader = users["trader"]
+        agent = users["agent"]
+
+        # issue token
+        deploy_args = init_args(exchange.address)
+        token = deploy(users, deploy_args)
+
+        # make BUY order by trader
+        _make_amount = 100
+        _price = 1000
+        exchange.createOrder.transact(
+            token.address, _make_amount, _price, True, agent, {"from": trader}
+        )
+        order_id = exchange.latestOrderId()
+
+        # take SELL order by issuer
+        token.transfer.transact(exchange.address, 30, {"from": issuer})
+        exchange.executeOrder.transact(order_id, 30, False, {"from": issuer})
+
+        # bulk cancel agreement
+        results = exchange.bulkCancelAgreement.call([order_id], [1], {"from": agent})
+        exchange.bulkCancelAgreement.transact([order_id], [1], {"from": agent})
+
+        # assertion
+        assert results == [True]
+        assert exchange.getOrder(order_id)[2] == _make_amount
+        assert token.balanceOf(issuer) == deploy_args[2]
+        assert exchange.commitmentOf(issuer, token.address) == 0
+
+    # Normal_3
+    # Message sender is not the agent of order (before expiry)
+    def test_normal_3(self, users, exchange):
+        issuer = users["issuer"]
+        trader = users["trader"]
+        agent = users["agent"]
+
+        # issue token
+        deploy_args = init_args(exchange.address)
+        token = deploy(users, deploy_args)
+
+        # make SELL order by issuer -> take BUY order by trader
+        token.transfer.transact(exchange.address, 100, {"from": issuer})
+        exchange.createOrder.transact(
+            token.address, 100, 1000, False, agent, {"from": issuer}
+        )
+        order_id = exchange.latestOrderId()
+        exchange.executeOrder.transact(order_id, 10, True, {"from": trader})
+
+        # bulk cancel agreement
+        results = exchange.bulkCancelAgreement.call([order_id], [1], {"from": trader})
+        exchange.bulkCancelAgreement.transact([order_id], [1], {"from": trader})
+
+        # assertion
+        assert results == [False]
+        assert exchange.getOrder(order_id)[2] == 90
+        assert exchange.getAgreement(order_id, 1)[3] is False
+
+    #######################################
+    # Error
+    #######################################
+
+    # Error_1
+    # The lengths of the lists don't match
+    def test_error_1(self, users, exchange):
+        with brownie.reverts(revert_msg="210801"):
+            exchange.bulkCancelAgreement.transact([1, 1], [1], {"from": users["agent"]})
+
+
+# TEST_getBestBid
+class TestGetBestBid:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # No orders
+    def test_normal_1(self, users, exchange):
+        deploy_args = init_args(exchange.address)
+        token = deploy(users, deploy_args)
+
+        assert exchange.getBestBid(token.address) == (0, 0)
+
+    # Normal_2
+    # Highest price first, then the earliest order at the same price
+    def test_normal_2(self, users, exchange):
+        trader = users["trader"]
+        agent = users["agent"]
+
+        # issue token
+        deploy_args = init_args(exchange.address)
+        token = deploy(users, deploy_args)
+
+        # make BUY orders
+        for _price in [1000, 1200, 1100, 1200]:
+            exchange.createOrder.transact(
+                token.address, 100, _price, True, agent, {"from": trader}
+            )
+
+        # assertion
+        assert exchange.getBestBid(token.address) == (1200, 2)
+        assert exchange.getBestAsk(token.address) == (0, 0)
+
+        # cancel the best orders
+        exchange.cancelOrder.transact(2, {"from": trader})
+        assert exchange.getBestBid(token.address) == (1200, 4)
+
+        exchange.cancelOrder.transact(4, {"from": trader})
+        assert exchange.getBestBid(token.address) == (1100, 3)
+
+
+# TEST_getBestAsk
+class TestGetBestAsk:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # Lowest price first, then the earliest order at the same price
+    def test_normal_1(self, users, exchange):
+        issuer = users["issuer"]
+        agent = users["agent"]
+
+        # issue token
+        deploy_args = init_args(exchange.address)
+        token = deploy(users, deploy_args)
+
+        # make SELL orders
+        for _price in [1000, 900, 900]:
+            token.transfer.transact(exchange.address, 100, {"from": issuer})
+            exchange.createOrder.transact(
+                token.address, 100, _price, False, agent, {"from": issuer}
+            )
+
+        # assertion
+        assert exchange.getBestAsk(token.address) == (900, 2)
+        assert exchange.getBestBid(token.address) == (0, 0)
+
+    # Normal_2
+    # Fully executed orders are removed and re-queued when the agreement is canceled
+    def test_normal_2(self, users, exchange):
+        issuer = users["issuer"]
+        trader = users["trader"]
+        agent = users["agent"]
+
+        # issue token
+        deploy_args = init_args(exchange.address)
+        token = deploy(users, deploy_args)
+
+        # make SELL orders
+        for _price in [1000, 900, 900]:
+            token.transfer.transact(exchange.address, 100, {"from": issuer})
+            exchange.createOrder.transact(
+                token.address, 100, _price, False, agent, {"from": issuer}
+            )
+
+        # take the whole amount of the best order
+        exchange.executeOrder.transact(2, 100, True, {"from": trader})
+        assert exchange.getBestAsk(token.address) == (900, 3)
+        assert exchange.getOpenOrders(token.address, False, 0, 10) == [3, 1]
+
+        # cancel agreement
+        exchange.cancelAgreement.transact(2, 1, {"from": agent})
+        assert exchange.getBestAsk(token.address) == (900, 3)
+        assert exchange.getOpenOrders(token.address, False, 0, 10) == [3, 2, 1]
+
+
+# TEST_getOpenOrders
+class TestGetOpenOrders:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # Price-time priority and pagination
+    def test_normal_1(self, users, exchange):
+        trader = users["trader"]
+        agent = users["agent"]
+
+        # issue token
+        deploy_args = init_args(exchange.address)
+        token = deploy(users, deploy_args)
+
+        # make BUY orders
+        for _price in [1000, 1200, 1100, 1200, 0]:
+            exchange.createOrder.transact(
+                token.address, 100, _price, True, agent, {"from": trader}
+            )
+
+        # assertion
+        assert exchange.getOpenOrderCount(token.address, True) == 5
+        assert exchange.getOpenOrderCount(token.address, False) == 0
+        assert exchange.getOpenOrders(token.address, True, 0, 10) == [2, 4, 3, 1, 5]
+        assert exchange.getOpenOrders(token.address, True, 0, 2) == [2, 4]
+        assert exchange.getOpenOrders(token.address, True, 4, 2) == [3, 1]
+        assert exchange.getOpenOrders(token.address, True, 1, 2) == [5]
+        assert exchange.getOpenOrders(token.address, True, 5, 10) == []
+        assert exchange.getOpenOrders(token.address, True, 0, 0) == []
+        assert exchange.getOpenOrders(token.address, False, 0, 10) == []
+
+    # Normal_2
+    # Canceled and fully executed orders are excluded
+    def test_normal_2(self, users, exchange):
+        issuer = users["issuer"]
+        trader = users["trader"]
+        agent = users["agent"]
+
+        # issue token
+        deploy_args = init_args(exchange.address)
+        token = deploy(users, deploy_args)
+
+        # make BUY orders
+        for _price in [1000, 1100, 1200]:
+            exchange.createOrder.transact(
+                token.address, 100, _price, True, agent, {"from": trader}
+            )
+
+        # cancel order
+        exchange.cancelOrder.transact(2, {"from": trader})
+
+        # take the whole amount of the best order
+        token.transfer.transact(exchange.address, 100, {"from": issuer})
+        exchange.executeOrder.transact(3, 100, False, {"from": issuer})
+
+        # take a part of the remaining order
+        token.transfer.transact(exchange.address, 40, {"from": issuer})
+        exchange.executeOrder.transact(1, 40, False, {"from": issuer})
+
+        # assertion
+        assert exchange.getOpenOrderCount(token.address, True) == 1
+        assert exchange.getOpenOrders(token.address, True, 0, 10) == [1]
+        assert exchange.getBestBid(token.address) == (1000, 1)
+
+        # force cancel the last order
+        exchange.forceCancelOrder.transact(1, {"from": agent})
+        assert exchange.getOpenOrderCount(token.address, True) == 0
+        assert exchange.getOpenOrders(token.address, True, 0, 10) == []
+        assert exchange.getBestBid(token.address) == (0, 0)
+
+    #######################################
+    # Error
+    #######################################
+
+    # Error_1
+    # The cursor order must be an open order of the specified side.
+    # 270401
+    def test_error_1(self, users, exchange):
+        issuer = users["issuer"]
+        trader = users["trader"]
+        agent = users["agent"]
+
+        # issue token
+        deploy_args = init_args(exchange.address)
+        token = deploy(users, deploy_args)
+
+        # make BUY orders
+        for _price in [1000, 1100]:
+            exchange.createOrder.transact(
+                token.address, 100, _price, True, agent, {"from": trader}
+            )
+
+        # cancel order
+        exchange.cancelOrder.transact(2, {"from": trader})
+
+        # assertion
+        with brownie.reverts(revert_msg="270401"):
+            exchange.getOpenOrders(token.address, True, 2, 10)  # canceled
+        with brownie.reverts(revert_msg="270401"):
+            exchange.getOpenOrders(token.address, True, 3, 10)  # not exist
+        with brownie.reverts(revert_msg="270401"):
+            exchange.getOpenOrders(token.address, False, 1, 10)  # other side
+        with brownie.reverts(revert_msg="270401"):
+            exchange.getOpenOrders(issuer.address, True, 1, 10)  # other token
+
+
+# TEST_getPriceLevelHint
+class TestGetPriceLevelHint:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    def test_normal_1(self, users, exchange):
+        trader = users["trader"]
+        agent = users["agent"]
+
+        # issue token
+        deploy_args = init_args(exchange.address)
+        token = deploy(users, deploy_args)
+
+        # assertion: no orders
+        assert exchange.getPriceLevelHint(token.address, True, 1000) == 0
+
+        # make BUY orders
+        for _price in [1000, 1200, 1100]:
+            exchange.createOrder.transact(
+                token.address, 100, _price, True, agent, {"from": trader}
+            )
+
+        # assertion
+        assert exchange.getPriceLevelHint(token.address, True, 1300) == 0
+        assert exchange.getPriceLevelHint(token.address, True, 1200) == 0
+        assert exchange.getPriceLevelHint(token.address, True, 1150) == 1200
+        assert exchange.getPriceLevelHint(token.address, True, 1100) == 1200
+        assert exchange.getPriceLevelHint(token.address, True, 1050) == 1100
+        assert exchange.getPriceLevelHint(token.address, True, 900) == 1000
+
+
+# TEST_createOrderWithHint
+class TestCreateOrderWithHint:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # The price level is inserted at the correct position with any hint
+    @pytest.mark.parametrize(
+        "hint_price",
+        [
+            1100,  # exact
+            1200,  # better than the exact one
+            1000,  # worse than the new price
+            5000,  # not exist
+            0,  # no hint
+        ],
+    )
+    def test_normal_1(self, users, exchange, hint_price):
+        trader = users["trader"]
+        agent = users["agent"]
+
+        # issue token
+        deploy_args = init_args(exchange.address)
+        token = deploy(users, deploy_args)
+
+        # make BUY orders
+        for _price in [1000, 1200, 1100, 900]:
+            exchange.createOrder.transact(
+                token.address, 100, _price, True, agent, {"from": trader}
+            )
+
+        # make BUY order with hint
+        exchange.createOrderWithHint.transact(
+            token.address, 100, 1050, True, agent, hint_price, {"from": trader}
+        )
+
+        # assertion
+        assert exchange.getOpenOrders(token.address, True, 0, 10) == [2, 3, 5, 1, 4]
+        assert exchange.getOrder(5) == (
+            trader,
+            token.address,
+            100,
+            1050,
+            True,
+            agent,
+            False,
+        )
+
+    # Normal_2
+    # Searching for the insert position costs less gas with the exact hint
+    def test_normal_2(self, users, exchange):
+        trader = users["trader"]
+        agent = users["agent"]
+
+        # issue token
+        deploy_args = init_args(exchange.address)
+        token = deploy(users, deploy_args)
+
+        # make BUY orders: 20 price levels
+        for _price in range(2000, 1000, -50):
+            exchange.createOrder.transact(
+                token.address, 100, _price, True, agent, {"from": trader}
+            )
+
+        # make BUY orders at the worst position
+        hint_price = exchange.getPriceLevelHint(token.address, True, 900)
+        tx_with_hint = exchange.createOrderWithHint.transact(
+            token.address, 100, 900, True, agent, hint_price, {"from": trader}
+        )
+        tx_without_hint = exchange.createOrder.transact(
+            token.address, 100, 800, True, agent, {"from": trader}
+        )
+
+        # assertion
+        assert hint_price == 1050
+        assert tx_with_hint.gas_used < tx_without_hint.gas_used
+        assert exchange.getOpenOrders(token.address, True, 20, 10) == [21, 22]
+
+    #######################################
+    # Error
+    #######################################
+
+    # Error_1
+    # The insert position is too far from the best price without a hint
+    def test_error_1(self, users, exchange, exchange_storage):
+        trader = users["trader"]
+        agent = users["agent"]
+
+        # issue token
+        deploy_args = init_args(exchange.address)
+        token = deploy(users, deploy_args)
+
+        # make BUY orders: more price levels than the search limit
+        max_search = exchange_storage.MAX_PRICE_LEVEL_SEARCH()
+        for i in range(max_search + 2):
+            exchange.createOrder.transact(
+                token.address, 100, 10000 - i, True, agent, {"from": trader}
+            )
+        latest_order_id = exchange.latestOrderId()
+
+        # make BUY order at the worst position without a hint
+        with brownie.reverts(revert_msg="270501"):
+            exchange.createOrder.transact(
+                token.address, 100, 100, True, agent, {"from": trader}
+            )
+
+        # make BUY order at the worst position with a hint
+        hint_price = exchange.getPriceLevelHint(token.address, True, 100)
+        exchange.createOrderWithHint.transact(
+            token.address, 100, 100, True, agent, hint_price, {"from": trader}
+        )
+
+        # assertion
+        assert exchange.latestOrderId() == latest_order_id + 1
+        assert exchange.getOpenOrderCount(token.address, True) == max_search + 3
+
+
+# TEST_cancelAgreementWithHint
+class TestCancelAgreementWithHint:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # The order is re-queued at the correct position
+    def test_normal_1(self, users, exchange):
+        issuer = users["issuer"]
+        trader = users["trader"]
+        agent = users["agent"]
+
+        # issue token
+        deploy_args = init_args(exchange.address)
+        token = deploy(users, deploy_args)
+
+        # make SELL orders
+        for _price in [1000, 900, 800]:
+            token.transfer.transact(exchange.address, 100, {"from": issuer})
+            exchange.createOrder.transact(
+                token.address, 100, _price, False, agent, {"from": issuer}
+            )
+
+        # take the whole amount of the order
+        exchange.executeOrder.transact(2, 100, True, {"from": trader})
+        assert exchange.getOpenOrders(token.address, False, 0, 10) == [3, 1]
+
+        # cancel agreement
+        hint_price = exchange.getPriceLevelHint(token.address, False, 900)
+        exchange.cancelAgreementWithHint.transact(2, 1, hint_price, {"from": agent})
+
+        # assertion
+        assert hint_price == 800
+        assert exchange.getOpenOrders(token.address, False, 0, 10) == [3, 2, 1]
+        assert exchange.getAgreement(2, 1)[3] is True
+
+    #######################################
+    # Error
+    #######################################
+
+    # Error_1
+    # The re-insert position is too far from the best price without a hint
+    def test_error_1(self, users, exchange, exchange_storage):
+        issuer = users["issuer"]
+        trader = users["trader"]
+        agent = users["agent"]
+
+        # issue token
+        deploy_args = init_args(exchange.address)
+        token = deploy(users, deploy_args)
+
+        # make BUY order -> take the whole amount of the order
+        exchange.createOrder.transact(
+            token.address, 100, 100, True, agent, {"from": trader}
+        )
+        token.transfer.transact(exchange.address, 100, {"from": issuer})
+        exchange.executeOrder.transact(1, 100, False, {"from": issuer})
+
+        # make BUY orders: more price levels than the search limit
+        max_search = exchange_storage.MAX_PRICE_LEVEL_SEARCH()
+        for i in range(max_search + 2):
+            exchange.createOrder.transact(
+                token.address, 100, 10000 - i, True, agent, {"from": trader}
+            )
+
+        # cancel agreement without a hint
+        with brownie.reverts(revert_msg="270501"):
+            exchange.cancelAgreement.transact(1, 1, {"from": agent})
+
+        # cancel agreement with a hint
+        hint_price = exchange.getPriceLevelHint(token.address, True, 100)
+        exchange.cancelAgreementWithHint.transact(1, 1, hint_price, {"from": agent})
+
+        # assertion
+        assert exchange.getAgreement(1, 1)[3] is True
+        assert exchange.getOpenOrderCount(token.address, True) == max_search + 3
+
+
+# TEST_bulkCancelAgreementWithHint
+class TestBulkCancelAgreementWithHint:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # The orders are re-queued at the correct position
+    def test_normal_1(self, users, exchange, exchange_storage):
+        issuer = users["issuer"]
+        trader = users["trader"]
+        agent = users["agent"]
+
+        # issue token
+        deploy_args = init_args(exchange.address)
+        token = deploy(users, deploy_args)
+
+        # make BUY orders -> take the whole amount of the orders
+        for _price in [100, 200]:
+            exchange.createOrder.transact(
+                token.address, 100, _price, True, agent, {"from": trader}
+            )
+        token.transfer.transact(exchange.address, 200, {"from": issuer})
+        exchange.executeOrder.transact(1, 100, False, {"from": issuer})
+        exchange.executeOrder.transact(2, 100, False, {"from": issuer})
+
+        # make BUY orders: more price levels than the search limit
+        max_search = exchange_storage.MAX_PRICE_LEVEL_SEARCH()
+        for i in range(max_search + 2):
+            exchange.createOrder.transact(
+                token.address, 100, 10000 - i, True, agent, {"from": trader}
+            )
+
+        # bulk cancel agreement without hints
+        with brownie.reverts(revert_msg="270501"):
+            exchange.bulkCancelAgreement.transact([1, 2], [1, 1], {"from": agent})
+
+        # bulk cancel agreement with hints
+        hint_price = exchange.getPriceLevelHint(token.address, True, 200)
+        results = exchange.bulkCancelAgreementWithHint.call(
+            [2, 1], [1, 1], [hint_price, 200], {"from": agent}
+        )
+        exchange.bulkCancelAgreementWithHint.transact(
+            [2, 1], [1, 1], [hint_price, 200], {"from": agent}
+        )
+
+        # assertion
+        assert results == [True, True]
+        assert exchange.getOpenOrderCount(token.address, True) == max_search + 4
+        assert exchange.getOpenOrders(token.address, True, max_search + 4, 10) == [
+            2,
+            1,
+        ]
+
+    #######################################
+    # Error
+    #######################################
+
+    # Error_1
+    # The list lengths don't match
+    def test_error_1(self, users, exchange):
+        agent = users["agent"]
+
+        with brownie.reverts(revert_msg="210801"):
+            exchange.bulkCancelAgreementWithHint.transact(
+                [1, 2], [1, 1], [0], {"from": agent}
+            )
+
+
 # update exchange
 class TestUpdateExchange:
     #######################################
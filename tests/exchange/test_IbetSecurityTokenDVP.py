@@ -297,6 +297,233 @@ class TestCommitmentOf:
         ) == st_dvp_storage.getCommitment(_buyer, token.address)
 
 
+# TEST_getOpenDeliveriesByAgent
+class TestGetOpenDeliveriesByAgent:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # No data
+    def test_normal_1(self, users, st_dvp):
+        _agent = users["agent"]
+
+        # assertion
+        assert st_dvp.getOpenDeliveryCountByAgent(_agent) == 0
+        assert st_dvp.getOpenDeliveriesByAgent(_agent, 0, 10) == ()
+
+    # Normal_2
+    # Deliveries are removed from the index when they are finished, aborted or cancelled
+    def test_normal_2(self, users, st_dvp):
+        _issuer = users["issuer"]
+        _buyer = users["user1"]
+        _agent = users["agent"]
+        _data = "test_data"
+        _deposit_amount = 1000
+        _delivery_amount = 100
+
+        # issue token
+        deploy_args = init_args()
+        token = deploy(users, deploy_args=deploy_args, tradable_exchange=st_dvp.address)
+
+        # transfer to DVP contract
+        token.transfer(st_dvp.address, _deposit_amount, {"from": _issuer})
+
+        # create delivery: id=1~5
+        for _ in range(5):
+            st_dvp.createDelivery(
+                token.address,
+                _buyer,
+                _delivery_amount,
+                _agent,
+                _data,
+                {"from": _issuer},
+            )
+        assert st_dvp.getOpenDeliveryCountByAgent(_agent) == 5
+        assert st_dvp.getOpenDeliveriesByAgent(_agent, 0, 10) == (1, 2, 3, 4, 5)
+
+        # confirm delivery: id=1,2
+        st_dvp.confirmDelivery(1, {"from": _buyer})
+        st_dvp.confirmDelivery(2, {"from": _buyer})
+        assert st_dvp.getOpenDeliveriesByAgent(_agent, 0, 10) == (1, 2, 3, 4, 5)
+
+        # finish delivery: id=1
+        st_dvp.finishDelivery(1, {"from": _agent})
+        assert st_dvp.getOpenDeliveriesByAgent(_agent, 0, 10) == (5, 2, 3, 4)
+
+        # abort delivery: id=2
+        st_dvp.abortDelivery(2, {"from": _agent})
+        assert st_dvp.getOpenDeliveriesByAgent(_agent, 0, 10) == (5, 4, 3)
+
+        # cancel delivery: id=4
+        st_dvp.cancelDelivery(4, {"from": _issuer})
+        assert st_dvp.getOpenDeliveriesByAgent(_agent, 0, 10) == (5, 3)
+
+        # assertion
+        assert st_dvp.getOpenDeliveryCountByAgent(_agent) == 2
+
+    # Normal_3
+    # Pagination
+    def test_normal_3(self, users, st_dvp):
+        _issuer = users["issuer"]
+        _buyer = users["user1"]
+        _agent = users["agent"]
+        _data = "test_data"
+        _deposit_amount = 1000
+        _delivery_amount = 100
+
+        # issue token
+        deploy_args = init_args()
+        token = deploy(users, deploy_args=deploy_args, tradable_exchange=st_dvp.address)
+
+        # transfer to DVP contract
+        token.transfer(st_dvp.address, _deposit_amount, {"from": _issuer})
+
+        # create delivery: id=1~5
+        for _ in range(5):
+            st_dvp.createDelivery(
+                token.address,
+                _buyer,
+                _delivery_amount,
+                _agent,
+                _data,
+                {"from": _issuer},
+            )
+
+        # assertion
+        assert st_dvp.getOpenDeliveriesByAgent(_agent, 0, 2) == (1, 2)
+        assert st_dvp.getOpenDeliveriesByAgent(_agent, 2, 2) == (3, 4)
+        assert st_dvp.getOpenDeliveriesByAgent(_agent, 4, 2) == (5,)
+        assert st_dvp.getOpenDeliveriesByAgent(_agent, 5, 2) == ()
+        assert st_dvp.getOpenDeliveriesByAgent(_agent, 0, 0) == ()
+
+    # Normal_4
+    # Deliveries of other agents are not included
+    def test_normal_4(self, users, st_dvp):
+        _issuer = users["issuer"]
+        _buyer = users["user1"]
+        _agent_1 = users["agent"]
+        _agent_2 = users["user2"]
+        _data = "test_data"
+        _deposit_amount = 1000
+        _delivery_amount = 100
+
+        # issue token
+        deploy_args = init_args()
+        token = deploy(users, deploy_args=deploy_args, tradable_exchange=st_dvp.address)
+
+        # transfer to DVP contract
+        token.transfer(st_dvp.address, _deposit_amount, {"from": _issuer})
+
+        # create delivery
+        st_dvp.createDelivery(
+            token.address, _buyer, _delivery_amount, _agent_1, _data, {"from": _issuer}
+        )
+        st_dvp.createDelivery(
+            token.address, _buyer, _delivery_amount, _agent_2, _data, {"from": _issuer}
+        )
+        st_dvp.createDelivery(
+            token.address, _buyer, _delivery_amount, _agent_1, _data, {"from": _issuer}
+        )
+
+        # assertion
+        assert st_dvp.getOpenDeliveryCountByAgent(_agent_1) == 2
+        assert st_dvp.getOpenDeliveriesByAgent(_agent_1, 0, 10) == (1, 3)
+        assert st_dvp.getOpenDeliveryCountByAgent(_agent_2) == 1
+        assert st_dvp.getOpenDeliveriesByAgent(_agent_2, 0, 10) == (2,)
+
+
+# TEST_getOpenDeliveriesBySeller
+class TestGetOpenDeliveriesBySeller:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    def test_normal_1(self, users, st_dvp):
+        _issuer = users["issuer"]
+        _seller = users["user2"]
+        _buyer = users["user1"]
+        _agent = users["agent"]
+        _data = "test_data"
+        _deposit_amount = 1000
+        _delivery_amount = 100
+
+        # issue token
+        deploy_args = init_args()
+        token = deploy(users, deploy_args=deploy_args, tradable_exchange=st_dvp.address)
+
+        # transfer to DVP contract
+        token.transfer(_seller, _deposit_amount, {"from": _issuer})
+        token.transfer(st_dvp.address, _deposit_amount, {"from": _issuer})
+        token.transfer(st_dvp.address, _deposit_amount, {"from": _seller})
+
+        # create delivery
+        st_dvp.createDelivery(
+            token.address, _buyer, _delivery_amount, _agent, _data, {"from": _issuer}
+        )
+        st_dvp.createDelivery(
+            token.address, _buyer, _delivery_amount, _agent, _data, {"from": _seller}
+        )
+        st_dvp.createDelivery(
+            token.address, _buyer, _delivery_amount, _agent, _data, {"from": _seller}
+        )
+
+        # cancel delivery
+        st_dvp.cancelDelivery(2, {"from": _seller})
+
+        # assertion
+        assert st_dvp.getOpenDeliveryCountBySeller(_issuer) == 1
+        assert st_dvp.getOpenDeliveriesBySeller(_issuer, 0, 10) == (1,)
+        assert st_dvp.getOpenDeliveryCountBySeller(_seller) == 1
+        assert st_dvp.getOpenDeliveriesBySeller(_seller, 0, 10) == (3,)
+
+
+# TEST_getOpenDeliveriesByBuyer
+class TestGetOpenDeliveriesByBuyer:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    def test_normal_1(self, users, st_dvp):
+        _issuer = users["issuer"]
+        _buyer_1 = users["user1"]
+        _buyer_2 = users["user2"]
+        _agent = users["agent"]
+        _data = "test_data"
+        _deposit_amount = 1000
+        _delivery_amount = 100
+
+        # issue token
+        deploy_args = init_args()
+        token = deploy(users, deploy_args=deploy_args, tradable_exchange=st_dvp.address)
+
+        # transfer to DVP contract
+        token.transfer(st_dvp.address, _deposit_amount, {"from": _issuer})
+
+        # create delivery
+        st_dvp.createDelivery(
+            token.address, _buyer_1, _delivery_amount, _agent, _data, {"from": _issuer}
+        )
+        st_dvp.createDelivery(
+            token.address, _buyer_2, _delivery_amount, _agent, _data, {"from": _issuer}
+        )
+        st_dvp.createDelivery(
+            token.address, _buyer_1, _delivery_amount, _agent, _data, {"from": _issuer}
+        )
+
+        # confirm & finish delivery
+        st_dvp.confirmDelivery(1, {"from": _buyer_1})
+        st_dvp.finishDelivery(1, {"from": _agent})
+
+        # assertion
+        assert st_dvp.getOpenDeliveryCountByBuyer(_buyer_1) == 1
+        assert st_dvp.getOpenDeliveriesByBuyer(_buyer_1, 0, 10) == (3,)
+        assert st_dvp.getOpenDeliveryCountByBuyer(_buyer_2) == 1
+        assert st_dvp.getOpenDeliveriesByBuyer(_buyer_2, 0, 10) == (2,)
+
+
 # TEST_createDelivery
 class TestCreateDelivery:
     #######################################
@@ -2563,6 +2790,140 @@ class TestBulkFinishDelivery:
         assert st_dvp.commitmentOf(_issuer, token.address) == _delivery_amount
 
 
+# TEST_bulkCreateDelivery
+class TestBulkCreateDelivery:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    def test_normal_1(self, users, st_dvp):
+        _issuer = users["issuer"]
+        _buyer_1 = users["user1"]
+        _buyer_2 = users["user2"]
+        _agent = users["agent"]
+        _deposit_amount = 1000
+
+        # issue token
+        deploy_args = init_args()
+        token = deploy(users, deploy_args=deploy_args, tradable_exchange=st_dvp.address)
+
+        # transfer to DVP contract
+        token.transfer(st_dvp.address, _deposit_amount, {"from": _issuer})
+
+        # bulk create delivery
+        tx = st_dvp.bulkCreateDelivery(
+            [token.address, token.address],
+            [_buyer_1, _buyer_2],
+            [100, 200],
+            [_agent, _agent],
+            ["test_data_1", "test_data_2"],
+            {"from": _issuer},
+        )
+
+        # assertion
+        assert tx.return_value == (1, 2)
+        assert st_dvp.latestDeliveryId() == 2
+        assert st_dvp.balanceOf(_issuer, token.address) == _deposit_amount - 300
+        assert st_dvp.commitmentOf(_issuer, token.address) == 300
+        assert st_dvp.getDelivery(1) == (
+            token.address,
+            _issuer,
+            _buyer_1,
+            100,
+            _agent,
+            False,
+            True,
+        )
+        assert st_dvp.getDelivery(2) == (
+            token.address,
+            _issuer,
+            _buyer_2,
+            200,
+            _agent,
+            False,
+            True,
+        )
+        assert st_dvp.getOpenDeliveriesByAgent(_agent, 0, 10) == (1, 2)
+
+        assert len(tx.events["DeliveryCreated"]) == 2
+        assert tx.events["DeliveryCreated"][0]["deliveryId"] == 1
+        assert tx.events["DeliveryCreated"][0]["buyer"] == _buyer_1
+        assert tx.events["DeliveryCreated"][0]["amount"] == 100
+        assert tx.events["DeliveryCreated"][0]["data"] == "test_data_1"
+        assert tx.events["DeliveryCreated"][1]["deliveryId"] == 2
+        assert tx.events["DeliveryCreated"][1]["buyer"] == _buyer_2
+        assert tx.events["DeliveryCreated"][1]["amount"] == 200
+        assert tx.events["DeliveryCreated"][1]["data"] == "test_data_2"
+
+    #######################################
+    # Error
+    #######################################
+
+    # Error_1
+    # The lengths of the input lists must match.
+    # 260701
+    def test_error_1(self, users, st_dvp):
+        _issuer = users["issuer"]
+        _buyer = users["user1"]
+        _agent = users["agent"]
+        _deposit_amount = 1000
+
+        # issue token
+        deploy_args = init_args()
+        token = deploy(users, deploy_args=deploy_args, tradable_exchange=st_dvp.address)
+
+        # transfer to DVP contract
+        token.transfer(st_dvp.address, _deposit_amount, {"from": _issuer})
+
+        # bulk create delivery
+        with brownie.reverts(revert_msg="260701"):
+            st_dvp.bulkCreateDelivery(
+                [token.address, token.address],
+                [_buyer],
+                [100, 200],
+                [_agent, _agent],
+                ["test_data_1", "test_data_2"],
+                {"from": _issuer},
+            )
+
+        # assertion
+        assert st_dvp.latestDeliveryId() == 0
+        assert st_dvp.balanceOf(_issuer, token.address) == _deposit_amount
+
+    # Error_2
+    # All deliveries are reverted when one of them fails.
+    # 260002
+    def test_error_2(self, users, st_dvp):
+        _issuer = users["issuer"]
+        _buyer = users["user1"]
+        _agent = users["agent"]
+        _deposit_amount = 1000
+
+        # issue token
+        deploy_args = init_args()
+        token = deploy(users, deploy_args=deploy_args, tradable_exchange=st_dvp.address)
+
+        # transfer to DVP contract
+        token.transfer(st_dvp.address, _deposit_amount, {"from": _issuer})
+
+        # bulk create delivery
+        with brownie.reverts(revert_msg="260002"):
+            st_dvp.bulkCreateDelivery(
+                [token.address, token.address],
+                [_buyer, _buyer],
+                [600, 600],
+                [_agent, _agent],
+                ["test_data_1", "test_data_2"],
+                {"from": _issuer},
+            )
+
+        # assertion
+        assert st_dvp.latestDeliveryId() == 0
+        assert st_dvp.balanceOf(_issuer, token.address) == _deposit_amount
+        assert st_dvp.getOpenDeliveryCountByAgent(_agent) == 0
+
+
 # TEST_abortDelivery
 class TestAbortDelivery:
     #######################################
@@ -293,6 +293,129 @@ class TestCommitmentOf:
         ) == st_escrow_storage.getCommitment(_issuer, token.address)
 
 
+# TEST_getPendingApplications
+class TestGetPendingApplications:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # No data
+    def test_normal_1(self, users, st_escrow):
+        _issuer = users["issuer"]
+
+        # issue token
+        deploy_args = init_args()
+        token = deploy(
+            users,
+            deploy_args=deploy_args,
+            tradable_exchange=st_escrow.address,
+            transfer_approval_required=True,
+        )
+
+        # assertion
+        assert st_escrow.getPendingApplicationCount(token.address) == 0
+        assert st_escrow.getPendingApplications(token.address, 0, 10) == ()
+
+    # Normal_2
+    # Applications are added when the escrow is finished and removed when approved
+    def test_normal_2(self, users, st_escrow):
+        _issuer = users["issuer"]
+        _recipient = users["user1"]
+        _agent = users["agent"]
+        _transfer_application_data = "transfer_application_data"
+        _transfer_approval_data = "transfer_approval_data"
+        _data = "test_data"
+        _deposit_amount = 1000
+        _escrow_amount = 100
+
+        # issue token
+        deploy_args = init_args()
+        token = deploy(
+            users,
+            deploy_args=deploy_args,
+            tradable_exchange=st_escrow.address,
+            transfer_approval_required=True,
+        )
+
+        # transfer to escrow contract
+        token.transfer(st_escrow.address, _deposit_amount, {"from": _issuer})
+
+        # create escrow: id=1~5
+        for _ in range(5):
+            st_escrow.createEscrow(
+                token.address,
+                _recipient,
+                _escrow_amount,
+                _agent,
+                _transfer_application_data,
+                _data,
+                {"from": _issuer},
+            )
+        assert st_escrow.getPendingApplicationCount(token.address) == 0
+
+        # cancel escrow: id=5
+        st_escrow.cancelEscrow(5, {"from": _issuer})
+        assert st_escrow.getPendingApplicationCount(token.address) == 0
+
+        # finish escrow: id=1~4
+        for escrow_id in range(1, 5):
+            st_escrow.finishEscrow(escrow_id, {"from": _agent})
+        assert st_escrow.getPendingApplications(token.address, 0, 10) == (1, 2, 3, 4)
+
+        # approve transfer: id=1
+        st_escrow.approveTransfer(1, _transfer_approval_data, {"from": _issuer})
+        assert st_escrow.getPendingApplications(token.address, 0, 10) == (4, 2, 3)
+
+        # approve transfer: id=2
+        st_escrow.approveTransfer(2, _transfer_approval_data, {"from": _issuer})
+        assert st_escrow.getPendingApplications(token.address, 0, 10) == (4, 3)
+
+        # assertion
+        assert st_escrow.getPendingApplicationCount(token.address) == 2
+        assert st_escrow.getPendingApplications(token.address, 0, 1) == (4,)
+        assert st_escrow.getPendingApplications(token.address, 1, 1) == (3,)
+        assert st_escrow.getPendingApplications(token.address, 2, 1) == ()
+
+    # Normal_3
+    # Escrows of tokens that do not require transfer approval are not included
+    def test_normal_3(self, users, st_escrow):
+        _issuer = users["issuer"]
+        _recipient = users["user1"]
+        _agent = users["agent"]
+        _transfer_application_data = "transfer_application_data"
+        _data = "test_data"
+        _deposit_amount = 1000
+        _escrow_amount = 100
+
+        # issue token
+        deploy_args = init_args()
+        token = deploy(
+            users,
+            deploy_args=deploy_args,
+            tradable_exchange=st_escrow.address,
+            transfer_approval_required=False,
+        )
+
+        # transfer to escrow contract
+        token.transfer(st_escrow.address, _deposit_amount, {"from": _issuer})
+
+        # create escrow
+        st_escrow.createEscrow(
+            token.address,
+            _recipient,
+            _escrow_amount,
+            _agent,
+            _transfer_application_data,
+            _data,
+            {"from": _issuer},
+        )
+
+        # assertion
+        assert st_escrow.getPendingApplicationCount(token.address) == 0
+        assert st_escrow.getPendingApplications(token.address, 0, 10) == ()
+
+
 # TEST_createEscrow
 class TestCreateEscrow:
     #######################################
@@ -1396,6 +1519,270 @@ class TestApproveTransfer:
                 latest_escrow_id, _transfer_approval_data, {"from": _issuer}
             )
 
+    # Error_6
+    # The application must not have been approved.
+    def test_error_6(self, users, st_escrow):
+        _issuer = users["issuer"]
+        _recipient = users["user1"]
+        _agent = users["agent"]
+        _transfer_application_data = "transfer_application_data"
+        _transfer_approval_data = "transfer_approval_data"
+        _data = "test_data"
+        _deposit_amount = 1000
+        _escrow_amount = 100
+
+        # issue token
+        deploy_args = init_args()
+        token = deploy(
+            users,
+            deploy_args=deploy_args,
+            tradable_exchange=st_escrow.address,
+            transfer_approval_required=True,
+        )
+
+        # transfer to escrow contract
+        token.transfer(st_escrow.address, _deposit_amount, {"from": _issuer})
+
+        # create escrow
+        st_escrow.createEscrow(
+            token.address,
+            _recipient,
+            _escrow_amount,
+            _agent,
+            _transfer_application_data,
+            _data,
+            {"from": _issuer},
+        )
+
+        # finish escrow
+        latest_escrow_id = st_escrow.latestEscrowId()
+        st_escrow.finishEscrow(latest_escrow_id, {"from": _agent})
+
+        # approve transfer
+        st_escrow.approveTransfer(
+            latest_escrow_id, _transfer_approval_data, {"from": _issuer}
+        )
+
+        # approve transfer again
+        with brownie.reverts(revert_msg="240206"):
+            st_escrow.approveTransfer(
+                latest_escrow_id, _transfer_approval_data, {"from": _issuer}
+            )
+
+        # assertion
+        assert st_escrow.balanceOf(_recipient, token.address) == _escrow_amount
+        assert st_escrow.commitmentOf(_issuer, token.address) == 0
+
+
+# TEST_bulkApproveTransfer
+class TestBulkApproveTransfer:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # All applications are approved
+    def test_normal_1(self, users, st_escrow):
+        _issuer = users["issuer"]
+        _recipient = users["user1"]
+        _agent = users["agent"]
+        _transfer_application_data = "transfer_application_data"
+        _data = "test_data"
+        _deposit_amount = 1000
+        _escrow_amount = 100
+
+        # issue token
+        deploy_args = init_args()
+        token = deploy(
+            users,
+            deploy_args=deploy_args,
+            tradable_exchange=st_escrow.address,
+            transfer_approval_required=True,
+        )
+
+        # transfer to escrow contract
+        token.transfer(st_escrow.address, _deposit_amount, {"from": _issuer})
+
+        # create & finish escrow: id=1,2
+        for escrow_id in [1, 2]:
+            st_escrow.createEscrow(
+                token.address,
+                _recipient,
+                _escrow_amount,
+                _agent,
+                _transfer_application_data,
+                _data,
+                {"from": _issuer},
+            )
+            st_escrow.finishEscrow(escrow_id, {"from": _agent})
+
+        # bulk approve transfer
+        tx = st_escrow.bulkApproveTransfer(
+            [1, 2], ["approval_data_1", "approval_data_2"], {"from": _issuer}
+        )
+
+        # assertion
+        assert tx.return_value == (0, 0)
+        assert st_escrow.getApplicationForTransfer(1) == (
+            token.address,
+            _transfer_application_data,
+            "approval_data_1",
+            True,
+            True,
+            True,
+        )
+        assert st_escrow.getApplicationForTransfer(2) == (
+            token.address,
+            _transfer_application_data,
+            "approval_data_2",
+            True,
+            True,
+            True,
+        )
+        assert (
+            st_escrow.balanceOf(_issuer, token.address)
+            == _deposit_amount - _escrow_amount * 2
+        )
+        assert st_escrow.balanceOf(_recipient, token.address) == _escrow_amount * 2
+        assert st_escrow.commitmentOf(_issuer, token.address) == 0
+        assert st_escrow.getPendingApplicationCount(token.address) == 0
+
+        assert len(tx.events["ApproveTransfer"]) == 2
+        assert tx.events["ApproveTransfer"][0]["escrowId"] == 1
+        assert tx.events["ApproveTransfer"][0]["data"] == "approval_data_1"
+        assert tx.events["ApproveTransfer"][1]["escrowId"] == 2
+        assert tx.events["ApproveTransfer"][1]["data"] == "approval_data_2"
+        assert "ApproveTransferSkipped" not in tx.events
+
+    # Normal_2
+    # Applications that cannot be approved are skipped
+    def test_normal_2(self, users, st_escrow):
+        _issuer = users["issuer"]
+        _recipient = users["user1"]
+        _agent = users["agent"]
+        _transfer_application_data = "transfer_application_data"
+        _transfer_approval_data = "transfer_approval_data"
+        _data = "test_data"
+        _deposit_amount = 1000
+        _escrow_amount = 100
+
+        # issue token
+        deploy_args = init_args()
+        token = deploy(
+            users,
+            deploy_args=deploy_args,
+            tradable_exchange=st_escrow.address,
+            transfer_approval_required=True,
+        )
+
+        # transfer to escrow contract
+        token.transfer(st_escrow.address, _deposit_amount, {"from": _issuer})
+
+        # create escrow: id=1,2
+        for _ in range(2):
+            st_escrow.createEscrow(
+                token.address,
+                _recipient,
+                _escrow_amount,
+                _agent,
+                _transfer_application_data,
+                _data,
+                {"from": _issuer},
+            )
+
+        # finish escrow: id=1
+        st_escrow.finishEscrow(1, {"from": _agent})
+
+        # bulk approve transfer
+        #   id=1: approved
+        #   id=2: escrow has not been finished
+        #   id=3: application does not exist
+        tx = st_escrow.bulkApproveTransfer(
+            [1, 2, 3], [_transfer_approval_data] * 3, {"from": _issuer}
+        )
+
+        # assertion
+        assert tx.return_value == (0, 240204, 240201)
+        assert st_escrow.getApplicationForTransfer(1)[5] is True
+        assert st_escrow.getApplicationForTransfer(2)[5] is False
+        assert st_escrow.balanceOf(_recipient, token.address) == _escrow_amount
+        assert st_escrow.commitmentOf(_issuer, token.address) == _escrow_amount
+        assert st_escrow.getPendingApplicationCount(token.address) == 0
+
+        assert tx.events["ApproveTransfer"]["escrowId"] == 1
+        assert len(tx.events["ApproveTransferSkipped"]) == 2
+        assert tx.events["ApproveTransferSkipped"][0]["escrowId"] == 2
+        assert tx.events["ApproveTransferSkipped"][0]["errorCode"] == 240204
+        assert tx.events["ApproveTransferSkipped"][1]["escrowId"] == 3
+        assert tx.events["ApproveTransferSkipped"][1]["errorCode"] == 240201
+
+    # Normal_3
+    # Duplicate escrow IDs are approved only once
+    def test_normal_3(self, users, st_escrow):
+        _issuer = users["issuer"]
+        _recipient = users["user1"]
+        _agent = users["agent"]
+        _transfer_application_data = "transfer_application_data"
+        _transfer_approval_data = "transfer_approval_data"
+        _data = "test_data"
+        _deposit_amount = 1000
+        _escrow_amount = 100
+
+        # issue token
+        deploy_args = init_args()
+        token = deploy(
+            users,
+            deploy_args=deploy_args,
+            tradable_exchange=st_escrow.address,
+            transfer_approval_required=True,
+        )
+
+        # transfer to escrow contract
+        token.transfer(st_escrow.address, _deposit_amount, {"from": _issuer})
+
+        # create escrow: id=1,2
+        for _ in range(2):
+            st_escrow.createEscrow(
+                token.address,
+                _recipient,
+                _escrow_amount,
+                _agent,
+                _transfer_application_data,
+                _data,
+                {"from": _issuer},
+            )
+
+        # finish escrow: id=1
+        st_escrow.finishEscrow(1, {"from": _agent})
+
+        # bulk approve transfer
+        tx = st_escrow.bulkApproveTransfer(
+            [1, 1], [_transfer_approval_data] * 2, {"from": _issuer}
+        )
+
+        # assertion
+        assert tx.return_value == (0, 240206)
+        assert st_escrow.balanceOf(_recipient, token.address) == _escrow_amount
+        assert st_escrow.commitmentOf(_issuer, token.address) == _escrow_amount
+        assert tx.events["ApproveTransferSkipped"]["escrowId"] == 1
+        assert tx.events["ApproveTransferSkipped"]["errorCode"] == 240206
+
+    #######################################
+    # Error
+    #######################################
+
+    # Error_1
+    # The lengths of the input lists must match.
+    # 240501
+    def test_error_1(self, users, st_escrow):
+        _issuer = users["issuer"]
+
+        # bulk approve transfer
+        with brownie.reverts(revert_msg="240501"):
+            st_escrow.bulkApproveTransfer(
+                [1, 2], ["transfer_approval_data"], {"from": _issuer}
+            )
+
 
 # TEST_finishEscrow
 class TestFinishEscrow:
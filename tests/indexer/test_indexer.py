@@ -0,0 +1,174 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import pytest
+from brownie import IbetShare, PersonalInfo
+
+from indexer import EventIndexer, EventRegistry, EventStore
+
+
+def init_args():
+    name = "test_share"
+    symbol = "IBS"
+    issue_price = 2**256 - 1
+    total_supply = 2**256 - 1
+    dividends = 2**256 - 1
+    dividend_record_date = "20200829"
+    dividend_payment_date = "20200831"
+    cancellation_date = "20191231"
+    principal_value = 2**256 - 1
+
+    deploy_args = [
+        name,
+        symbol,
+        issue_price,
+        total_supply,
+        dividends,
+        dividend_record_date,
+        dividend_payment_date,
+        cancellation_date,
+        principal_value,
+    ]
+    return deploy_args
+
+
+@pytest.fixture()
+def store(tmp_path):
+    store = EventStore(str(tmp_path / "index.db"))
+    yield store
+    store.close()
+
+
+@pytest.fixture()
+def registry():
+    return EventRegistry.from_abis(
+        {"IbetShare": IbetShare.abi, "PersonalInfo": PersonalInfo.abi}
+    )
+
+
+# TEST_sync
+class TestSync:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # Events of multiple contracts are decoded and stored
+    def test_normal_1(self, web3, users, personal_info, store, registry):
+        issuer = users["issuer"]
+        user1 = users["user1"]
+        lock_eoa = users["agent"]
+
+        # issue token
+        share_token = issuer.deploy(IbetShare, *init_args())
+
+        # transfer & lock & register
+        share_token.transferFrom.transact(issuer, user1, 30, {"from": issuer})
+        share_token.lock.transact(lock_eoa, 10, "lock_message", {"from": user1})
+        personal_info.register.transact(issuer, "encrypted", {"from": user1})
+
+        # index
+        indexer = EventIndexer(
+            web3,
+            store,
+            registry,
+            addresses=[share_token.address, personal_info.address],
+        )
+        stats = indexer.sync()
+
+        # assertion
+        assert stats.to_block == web3.eth.block_number
+        assert stats.events == 3
+        assert store.get_checkpoint() == web3.eth.block_number
+
+        transfer = store.get_events(event="Transfer")
+        assert len(transfer) == 1
+        assert transfer[0].address == share_token.address
+        assert transfer[0].args == {
+            "from": issuer.address,
+            "to": user1.address,
+            "value": 30,
+        }
+
+        lock = store.get_events(event="Lock", address=share_token.address)
+        assert lock[0].args == {
+            "accountAddress": user1.address,
+            "lockAddress": lock_eoa.address,
+            "value": 10,
+            "data": "lock_message",
+        }
+
+        register = store.get_events(event="Register")
+        assert register[0].address == personal_info.address
+        assert register[0].args == {
+            "account_address": user1.address,
+            "link_address": issuer.address,
+        }
+
+    # Normal_2
+    # Indexing resumes from the checkpoint
+    def test_normal_2(self, web3, users, store, registry):
+        issuer = users["issuer"]
+        user1 = users["user1"]
+
+        # issue token
+        share_token = issuer.deploy(IbetShare, *init_args())
+        share_token.transferFrom.transact(issuer, user1, 10, {"from": issuer})
+
+        # index
+        indexer = EventIndexer(
+            web3, store, registry, addresses=[share_token.address], batch_size=2
+        )
+        first = indexer.sync()
+
+        # transfer & index again
+        share_token.transferFrom.transact(issuer, user1, 20, {"from": issuer})
+        second = indexer.sync()
+
+        # assertion
+        assert second.from_block == first.to_block + 1
+        assert second.events == 1
+        assert [e.args["value"] for e in store.get_events(event="Transfer")] == [
+            10,
+            20,
+        ]
+
+    # Normal_3
+    # Events of orphaned blocks are removed after a chain reorganization
+    def test_normal_3(self, web3, chain, users, store, registry):
+        issuer = users["issuer"]
+        user1 = users["user1"]
+
+        # issue token
+        share_token = issuer.deploy(IbetShare, *init_args())
+        indexer = EventIndexer(web3, store, registry, addresses=[share_token.address])
+
+        # transfer & index
+        share_token.transferFrom.transact(issuer, user1, 10, {"from": issuer})
+        indexer.sync()
+
+        # reorg & transfer & index
+        chain.undo()
+        share_token.transferFrom.transact(issuer, user1, 20, {"from": issuer})
+        stats = indexer.sync()
+
+        # assertion
+        assert stats.reorgs == 1
+        assert [e.args["value"] for e in store.get_events(event="Transfer")] == [20]
+        assert store.get_checkpoint() == web3.eth.block_number
@@ -232,3 +232,105 @@ class TestForceRegister:
 
         is_registered = personal_info.isRegistered(account, link)
         assert is_registered is True
+
+
+# TEST_bulkForceRegister
+class TestBulkForceRegister:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    def test_normal_1(self, users, personal_info):
+        account_1 = users["trader"]
+        account_2 = users["user1"]
+        link = users["issuer"]
+
+        # register
+        tx = personal_info.bulkForceRegister.transact(
+            [account_1.address, account_2.address],
+            [encrypted_message, encrypted_message_after],
+            {"from": link},
+        )
+
+        # assertion
+        registered_personal_info = personal_info.personal_info(account_1, link)
+        assert registered_personal_info[0] == account_1
+        assert registered_personal_info[1] == link
+        assert registered_personal_info[2] == encrypted_message
+
+        registered_personal_info = personal_info.personal_info(account_2, link)
+        assert registered_personal_info[0] == account_2
+        assert registered_personal_info[1] == link
+        assert registered_personal_info[2] == encrypted_message_after
+
+        assert len(tx.events["Register"]) == 2
+        assert tx.events["Register"][0]["account_address"] == account_1.address
+        assert tx.events["Register"][1]["account_address"] == account_2.address
+
+    # Normal_2
+    # Empty list
+    def test_normal_2(self, users, personal_info):
+        link = users["issuer"]
+
+        # register
+        tx = personal_info.bulkForceRegister.transact([], [], {"from": link})
+
+        # assertion
+        assert "Register" not in tx.events
+
+    #######################################
+    # Error
+    #######################################
+
+    # Error_1
+    # The length of the lists don't match
+    def test_error_1(self, users, personal_info):
+        account = users["trader"]
+        link = users["issuer"]
+
+        # register
+        with brownie.reverts(revert_msg="400101"):
+            personal_info.bulkForceRegister.transact(
+                [account.address],
+                [encrypted_message, encrypted_message_after],
+                {"from": link},
+            )
+
+        # assertion
+        is_registered = personal_info.isRegistered(account, link)
+        assert is_registered is False
+
+
+# TEST_isRegisteredBatch
+class TestIsRegisteredBatch:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    def test_normal_1(self, users, personal_info):
+        account_1 = users["trader"]
+        account_2 = users["user1"]
+        account_3 = users["user2"]
+        link = users["issuer"]
+
+        # register
+        personal_info.register.transact(link, encrypted_message, {"from": account_1})
+        personal_info.forceRegister.transact(
+            account_3.address, encrypted_message, {"from": link}
+        )
+
+        # assertion
+        is_registered = personal_info.isRegisteredBatch(
+            [account_1, account_2, account_3], link
+        )
+        assert is_registered == [True, False, True]
+
+    # Normal_2
+    # Empty list
+    def test_normal_2(self, users, personal_info):
+        link = users["issuer"]
+
+        # assertion
+        assert personal_info.isRegisteredBatch([], link) == []
@@ -489,6 +489,215 @@ class TestBan:
         assert payment_account[0] == brownie.ZERO_ADDRESS
 
 
+# TEST_bulkApprove
+class TestBulkApprove:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # Unregistered accounts are skipped
+    def test_normal_1(self, PaymentGateway, users):
+        admin = users["admin"]
+        trader = users["trader"]
+        user1 = users["user1"]
+        user2 = users["user2"]
+        agent = users["agent"]
+
+        # deploy
+        pg_contract = admin.deploy(PaymentGateway)
+
+        # register
+        pg_contract.register.transact(agent, encrypted_message, {"from": trader})
+        pg_contract.register.transact(agent, encrypted_message, {"from": user2})
+
+        # approve
+        account_list = [trader, user1, user2]
+        results = pg_contract.bulkApprove.call(account_list, {"from": agent})
+        tx = pg_contract.bulkApprove.transact(account_list, {"from": agent})
+
+        # assertion
+        assert results == [True, False, True]
+
+        assert pg_contract.payment_accounts(trader, agent)[3] == 2
+        assert pg_contract.payment_accounts(user1, agent)[3] == 0
+        assert pg_contract.payment_accounts(user2, agent)[3] == 2
+
+        assert len(tx.events["Approve"]) == 2
+        assert tx.events["Approve"][0]["account_address"] == trader.address
+        assert tx.events["Approve"][0]["agent_address"] == agent.address
+        assert tx.events["Approve"][1]["account_address"] == user2.address
+        assert tx.events["Approve"][1]["agent_address"] == agent.address
+
+
+# TEST_bulkWarn
+class TestBulkWarn:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # Unregistered accounts are skipped
+    def test_normal_1(self, PaymentGateway, users):
+        admin = users["admin"]
+        trader = users["trader"]
+        user1 = users["user1"]
+        user2 = users["user2"]
+        agent = users["agent"]
+
+        # deploy
+        pg_contract = admin.deploy(PaymentGateway)
+
+        # register
+        pg_contract.register.transact(agent, encrypted_message, {"from": trader})
+        pg_contract.register.transact(agent, encrypted_message, {"from": user2})
+
+        # warn
+        account_list = [trader, user1, user2]
+        results = pg_contract.bulkWarn.call(account_list, {"from": agent})
+        tx = pg_contract.bulkWarn.transact(account_list, {"from": agent})
+
+        # assertion
+        assert results == [True, False, True]
+
+        assert pg_contract.payment_accounts(trader, agent)[3] == 3
+        assert pg_contract.payment_accounts(user1, agent)[3] == 0
+        assert pg_contract.payment_accounts(user2, agent)[3] == 3
+
+        assert len(tx.events["Warn"]) == 2
+        assert tx.events["Warn"][0]["account_address"] == trader.address
+        assert tx.events["Warn"][0]["agent_address"] == agent.address
+        assert tx.events["Warn"][1]["account_address"] == user2.address
+        assert tx.events["Warn"][1]["agent_address"] == agent.address
+
+
+# TEST_bulkDisapprove
+class TestBulkDisapprove:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # Unregistered accounts are skipped
+    def test_normal_1(self, PaymentGateway, users):
+        admin = users["admin"]
+        trader = users["trader"]
+        user1 = users["user1"]
+        user2 = users["user2"]
+        agent = users["agent"]
+
+        # deploy
+        pg_contract = admin.deploy(PaymentGateway)
+
+        # register
+        pg_contract.register.transact(agent, encrypted_message, {"from": trader})
+        pg_contract.register.transact(agent, encrypted_message, {"from": user2})
+
+        # disapprove
+        account_list = [trader, user1, user2]
+        results = pg_contract.bulkDisapprove.call(account_list, {"from": agent})
+        tx = pg_contract.bulkDisapprove.transact(account_list, {"from": agent})
+
+        # assertion
+        assert results == [True, False, True]
+
+        assert pg_contract.payment_accounts(trader, agent)[3] == 1
+        assert pg_contract.payment_accounts(user1, agent)[3] == 0
+        assert pg_contract.payment_accounts(user2, agent)[3] == 1
+
+        assert len(tx.events["Disapprove"]) == 2
+        assert tx.events["Disapprove"][0]["account_address"] == trader.address
+        assert tx.events["Disapprove"][0]["agent_address"] == agent.address
+        assert tx.events["Disapprove"][1]["account_address"] == user2.address
+        assert tx.events["Disapprove"][1]["agent_address"] == agent.address
+
+
+# TEST_bulkBan
+class TestBulkBan:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # Unregistered accounts are skipped
+    def test_normal_1(self, PaymentGateway, users):
+        admin = users["admin"]
+        trader = users["trader"]
+        user1 = users["user1"]
+        user2 = users["user2"]
+        agent = users["agent"]
+
+        # deploy
+        pg_contract = admin.deploy(PaymentGateway)
+
+        # register
+        pg_contract.register.transact(agent, encrypted_message, {"from": trader})
+        pg_contract.register.transact(agent, encrypted_message, {"from": user2})
+
+        # ban
+        account_list = [trader, user1, user2]
+        results = pg_contract.bulkBan.call(account_list, {"from": agent})
+        tx = pg_contract.bulkBan.transact(account_list, {"from": agent})
+
+        # assertion
+        assert results == [True, False, True]
+
+        assert pg_contract.payment_accounts(trader, agent)[3] == 4
+        assert pg_contract.payment_accounts(user1, agent)[3] == 0
+        assert pg_contract.payment_accounts(user2, agent)[3] == 4
+
+        assert len(tx.events["Ban"]) == 2
+        assert tx.events["Ban"][0]["account_address"] == trader.address
+        assert tx.events["Ban"][0]["agent_address"] == agent.address
+        assert tx.events["Ban"][1]["account_address"] == user2.address
+        assert tx.events["Ban"][1]["agent_address"] == agent.address
+
+
+# TEST_accountApprovedBatch
+class TestAccountApprovedBatch:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    def test_normal_1(self, PaymentGateway, users):
+        admin = users["admin"]
+        trader = users["trader"]
+        user1 = users["user1"]
+        user2 = users["user2"]
+        agent = users["agent"]
+
+        # deploy
+        pg_contract = admin.deploy(PaymentGateway)
+
+        # register
+        pg_contract.register.transact(agent, encrypted_message, {"from": trader})
+        pg_contract.register.transact(agent, encrypted_message, {"from": user1})
+        pg_contract.register.transact(agent, encrypted_message, {"from": user2})
+
+        # approve & warn
+        pg_contract.bulkApprove.transact([trader, user2], {"from": agent})
+        pg_contract.warn.transact(user2, {"from": agent})
+
+        # assertion
+        account_approved = pg_contract.accountApprovedBatch(
+            [trader, user1, user2, admin], agent
+        )
+        assert account_approved == [True, False, False, False]
+
+    # Normal_2
+    # Empty list
+    def test_normal_2(self, PaymentGateway, users):
+        admin = users["admin"]
+        agent = users["agent"]
+
+        # deploy
+        pg_contract = admin.deploy(PaymentGateway)
+
+        # assertion
+        assert pg_contract.accountApprovedBatch([], agent) == []
+
+
 # TEST_addAgent
 class TestAddAgent:
     #######################################
@@ -21,6 +21,21 @@ import brownie
 import brownie_utils
 import pytest
 
+# tradableExchange と移転制御フラグのスロット
+# owner: 0, name: 1, symbol: 2, totalSupply: 3, contactInformation: 4,
+# privacyPolicy: 5, balances: 6, tradableExchange: 7
+TRANSFER_FLAGS_SLOT = 7
+
+# 移転制御フラグの更新関数（スロット内の配置順: byte 20 - 25）
+TRANSFER_FLAG_SETTERS = [
+    "setStatus",
+    "setRequirePersonalInfoRegistered",
+    "setTransferable",
+    "setTransferApprovalRequired",
+    "setHolderIndexEnabled",
+    "changeOfferingStatus",
+]
+
 
 def init_args():
     name = "test_bond"
@@ -808,6 +823,313 @@ class TestBalanceOf:
         assert balance == deploy_args[3]
 
 
+# TEST_balancesOf
+class TestBalancesOf:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    def test_normal_1(self, users, IbetStraightBond):
+        issuer = users["issuer"]
+        user1 = users["user1"]
+        user2 = users["user2"]
+
+        # issue token
+        deploy_args = init_args()
+        bond_token = brownie_utils.force_deploy(issuer, IbetStraightBond, *deploy_args)
+
+        # transfer to account
+        bond_token.transferFrom.transact(issuer, user1, 30, {"from": issuer})
+
+        # assertion
+        assert bond_token.balancesOf([issuer, user1, user2]) == [
+            deploy_args[2] - 30,
+            30,
+            0,
+        ]
+        assert bond_token.balancesOf([]) == []
+
+
+# TEST_lockedOfBatch
+class TestLockedOfBatch:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    def test_normal_1(self, users, IbetStraightBond):
+        issuer = users["issuer"]
+        user1 = users["user1"]
+        user2 = users["user2"]
+        lock_eoa_1 = users["agent"]
+        lock_eoa_2 = users["trader"]
+
+        # issue token
+        deploy_args = init_args()
+        bond_token = brownie_utils.force_deploy(issuer, IbetStraightBond, *deploy_args)
+
+        # lock
+        bond_token.transferFrom.transact(issuer, user1, 30, {"from": issuer})
+        bond_token.lock.transact(lock_eoa_1, 10, "", {"from": user1})
+        bond_token.lock.transact(lock_eoa_2, 20, "", {"from": user1})
+
+        # assertion
+        assert bond_token.lockedOfBatch(
+            [lock_eoa_1, lock_eoa_2, lock_eoa_1], [user1, user1, user2]
+        ) == [10, 20, 0]
+
+    #######################################
+    # Error
+    #######################################
+
+    # Error_1
+    # The lengths of the lists don't match
+    def test_error_1(self, users, IbetStraightBond):
+        issuer = users["issuer"]
+
+        # issue token
+        deploy_args = init_args()
+        bond_token = brownie_utils.force_deploy(issuer, IbetStraightBond, *deploy_args)
+
+        # assertion
+        with brownie.reverts(revert_msg="121801"):
+            bond_token.lockedOfBatch(
+                [users["agent"], users["trader"]], [users["user1"]]
+            )
+
+
+# TEST_pendingTransfersOf
+class TestPendingTransfersOf:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    def test_normal_1(self, users, personal_info):
+        issuer = users["issuer"]
+        to_address = users["user1"]
+        transfer_amount = 100
+
+        # issue token
+        bond_token, deploy_args = issue_transferable_bond_token(
+            issuer=issuer,
+            exchange_address=brownie.ZERO_ADDRESS,
+            personal_info_address=personal_info.address,
+        )
+        bond_token.setTransferApprovalRequired(True, {"from": issuer})
+
+        # register personal information (to_address)
+        personal_info.register(issuer, "encrypted_message", {"from": to_address})
+
+        # apply for transfer
+        bond_token.applyForTransfer(to_address, transfer_amount, "", {"from": issuer})
+
+        # assertion
+        assert bond_token.pendingTransfersOf([issuer, to_address]) == [
+            transfer_amount,
+            0,
+        ]
+
+
+# TEST_setHolderIndexEnabled
+class TestSetHolderIndexEnabled:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    def test_normal_1(self, users, IbetStraightBond):
+        issuer = users["issuer"]
+
+        # issue token
+        deploy_args = init_args()
+        bond_token = brownie_utils.force_deploy(issuer, IbetStraightBond, *deploy_args)
+
+        # update
+        tx = bond_token.setHolderIndexEnabled.transact(True, {"from": issuer})
+
+        # assertion
+        assert bond_token.holderIndexEnabled() is True
+        assert tx.events["ChangeHolderIndexEnabled"]["enabled"] is True
+
+    #######################################
+    # Error
+    #######################################
+
+    # Error_1
+    # Not authorized
+    def test_error_1(self, users, IbetStraightBond):
+        issuer = users["issuer"]
+
+        # issue token
+        deploy_args = init_args()
+        bond_token = brownie_utils.force_deploy(issuer, IbetStraightBond, *deploy_args)
+
+        # update
+        with brownie.reverts(revert_msg="500001"):
+            bond_token.setHolderIndexEnabled.transact(True, {"from": users["user1"]})
+
+        # assertion
+        assert bond_token.holderIndexEnabled() is False
+
+
+# TEST_syncHolderIndex
+class TestSyncHolderIndex:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # Register holders before the index is enabled
+    def test_normal_1(self, users, IbetStraightBond):
+        issuer = users["issuer"]
+        user1 = users["user1"]
+        user2 = users["user2"]
+
+        # issue token
+        deploy_args = init_args()
+        bond_token = brownie_utils.force_deploy(issuer, IbetStraightBond, *deploy_args)
+        bond_token.transferFrom.transact(issuer, user1, 30, {"from": issuer})
+
+        # enable & sync
+        bond_token.setHolderIndexEnabled.transact(True, {"from": issuer})
+        bond_token.syncHolderIndex.transact([issuer, user1, user2], {"from": issuer})
+
+        # assertion
+        assert bond_token.holderCount() == 2
+        assert bond_token.getHolders(0, 10) == [issuer, user1]
+
+    #######################################
+    # Error
+    #######################################
+
+    # Error_1
+    # Not authorized
+    def test_error_1(self, users, IbetStraightBond):
+        issuer = users["issuer"]
+
+        # issue token
+        deploy_args = init_args()
+        bond_token = brownie_utils.force_deploy(issuer, IbetStraightBond, *deploy_args)
+
+        # sync
+        with brownie.reverts(revert_msg="500001"):
+            bond_token.syncHolderIndex.transact([issuer], {"from": users["user1"]})
+
+        # assertion
+        assert bond_token.holderCount() == 0
+
+
+# TEST_holderCount/getHolders
+class TestGetHolders:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # Holders are added and removed as balances change
+    def test_normal_1(self, users, IbetStraightBond):
+        issuer = users["issuer"]
+        user1 = users["user1"]
+        user2 = users["user2"]
+
+        # issue token
+        deploy_args = init_args()
+        bond_token = brownie_utils.force_deploy(issuer, IbetStraightBond, *deploy_args)
+        bond_token.setHolderIndexEnabled.transact(True, {"from": issuer})
+        bond_token.syncHolderIndex.transact([issuer], {"from": issuer})
+
+        # transfer
+        bond_token.transferFrom.transact(issuer, user1, 30, {"from": issuer})
+        bond_token.transferFrom.transact(issuer, user2, 10, {"from": issuer})
+
+        # assertion
+        assert bond_token.holderCount() == 3
+        assert bond_token.getHolders(0, 10) == [issuer, user1, user2]
+        assert bond_token.getHolders(1, 1) == [user1]
+        assert bond_token.getHolders(3, 10) == []
+
+        # redeem all balance of user2
+        bond_token.redeemFrom.transact(
+            user2, brownie.ZERO_ADDRESS, 10, {"from": issuer}
+        )
+
+        # assertion
+        brownie_utils.assert_holders(bond_token, [issuer, user1])
+
+    # Normal_2
+    # Accounts with locked balance remain holders
+    def test_normal_2(self, users, IbetStraightBond):
+        issuer = users["issuer"]
+        user1 = users["user1"]
+        user2 = users["user2"]
+        lock_eoa = users["agent"]
+
+        # issue token
+        deploy_args = init_args()
+        bond_token = brownie_utils.force_deploy(issuer, IbetStraightBond, *deploy_args)
+        bond_token.setHolderIndexEnabled.transact(True, {"from": issuer})
+        bond_token.syncHolderIndex.transact([issuer], {"from": issuer})
+        bond_token.transferFrom.transact(issuer, user1, 30, {"from": issuer})
+
+        # lock all balance of user1
+        bond_token.lock.transact(lock_eoa, 30, "", {"from": user1})
+
+        # assertion
+        assert bond_token.balanceOf(user1) == 0
+        brownie_utils.assert_holders(bond_token, [issuer, user1])
+
+        # unlock all locked balance to user2
+        bond_token.unlock.transact(user1, user2, 30, "", {"from": lock_eoa})
+
+        # assertion
+        brownie_utils.assert_holders(bond_token, [issuer, user2])
+
+    # Normal_3
+    # Issuing to or redeeming from locked balance updates the holders
+    def test_normal_3(self, users, IbetStraightBond):
+        issuer = users["issuer"]
+        user1 = users["user1"]
+        lock_eoa = users["agent"]
+
+        # issue token
+        deploy_args = init_args()
+        bond_token = brownie_utils.force_deploy(issuer, IbetStraightBond, *deploy_args)
+        bond_token.setHolderIndexEnabled.transact(True, {"from": issuer})
+        bond_token.syncHolderIndex.transact([issuer], {"from": issuer})
+
+        # issue to locked balance of user1
+        bond_token.issueFrom.transact(user1, lock_eoa, 20, {"from": issuer})
+
+        # assertion
+        assert bond_token.balanceOf(user1) == 0
+        brownie_utils.assert_holders(bond_token, [issuer, user1])
+
+        # redeem all locked balance of user1
+        bond_token.redeemFrom.transact(user1, lock_eoa, 20, {"from": issuer})
+
+        # assertion
+        brownie_utils.assert_holders(bond_token, [issuer])
+
+    # Normal_4
+    # The index is not updated while disabled
+    def test_normal_4(self, users, IbetStraightBond):
+        issuer = users["issuer"]
+        user1 = users["user1"]
+
+        # issue token
+        deploy_args = init_args()
+        bond_token = brownie_utils.force_deploy(issuer, IbetStraightBond, *deploy_args)
+
+        # transfer
+        bond_token.transferFrom.transact(issuer, user1, 30, {"from": issuer})
+
+        # assertion
+        assert bond_token.holderCount() == 0
+        assert bond_token.getHolders(0, 10) == []
+
+
 # TEST_setTradableExchange
 class TestSetTradableExchange:
     #######################################
@@ -2076,6 +2398,127 @@ class TestForceChangeLockedAccount:
         assert bond_token.lockedOf(lock_eoa, user2) == 0
 
 
+# TEST_getLocksByLockAddress
+class TestGetLocksByLockAddress:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # Locks are added and removed as locked balances change
+    def test_normal_1(self, users, IbetStraightBond):
+        issuer = users["issuer"]
+        user1 = users["user1"]
+        user2 = users["user2"]
+        lock_eoa = users["agent"]
+
+        # issue token
+        deploy_args = init_args()
+        bond_token = brownie_utils.force_deploy(issuer, IbetStraightBond, *deploy_args)
+
+        # transfer & lock
+        bond_token.transferFrom.transact(issuer, user1, 30, {"from": issuer})
+        bond_token.transferFrom.transact(issuer, user2, 30, {"from": issuer})
+        bond_token.lock.transact(lock_eoa, 10, "", {"from": user1})
+        bond_token.lock.transact(lock_eoa, 20, "", {"from": user2})
+        bond_token.lock.transact(lock_eoa, 5, "", {"from": user1})
+
+        # assertion
+        assert bond_token.getLockCountByLockAddress(lock_eoa) == 2
+        assert bond_token.getLocksByLockAddress(lock_eoa, 0, 10) == (
+            [user1, user2],
+            [15, 20],
+        )
+        assert bond_token.getLocksByLockAddress(lock_eoa, 1, 1) == ([user2], [20])
+        assert bond_token.getLocksByLockAddress(lock_eoa, 2, 10) == ([], [])
+
+        # unlock all locked balance of user1
+        bond_token.unlock.transact(user1, user1, 15, "", {"from": lock_eoa})
+
+        # assertion
+        assert bond_token.getLockCountByLockAddress(lock_eoa) == 1
+        assert bond_token.getLocksByLockAddress(lock_eoa, 0, 10) == ([user2], [20])
+
+    # Normal_2
+    # Locks are updated by forceChangeLockedAccount, issueFrom and redeemFrom
+    def test_normal_2(self, users, IbetStraightBond):
+        issuer = users["issuer"]
+        user1 = users["user1"]
+        user2 = users["user2"]
+        lock_eoa = users["agent"]
+
+        # issue token
+        deploy_args = init_args()
+        bond_token = brownie_utils.force_deploy(issuer, IbetStraightBond, *deploy_args)
+
+        # transfer & lock
+        bond_token.transferFrom.transact(issuer, user1, 30, {"from": issuer})
+        bond_token.lock.transact(lock_eoa, 10, "", {"from": user1})
+
+        # change locked account
+        bond_token.forceChangeLockedAccount.transact(
+            lock_eoa, user1, user2, 10, "", {"from": issuer}
+        )
+
+        # assertion
+        assert bond_token.getLocksByLockAddress(lock_eoa, 0, 10) == ([user2], [10])
+
+        # redeem all locked balance of user2
+        bond_token.redeemFrom.transact(user2, lock_eoa, 10, {"from": issuer})
+
+        # assertion
+        assert bond_token.getLockCountByLockAddress(lock_eoa) == 0
+        assert bond_token.getLocksByLockAddress(lock_eoa, 0, 10) == ([], [])
+
+
+# TEST_getLocksByAccount
+class TestGetLocksByAccount:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # Locks are listed for each lock address
+    def test_normal_1(self, users, IbetStraightBond):
+        issuer = users["issuer"]
+        user1 = users["user1"]
+        lock_eoa1 = users["agent"]
+        lock_eoa2 = users["user2"]
+        lock_eoa3 = users["trader"]
+
+        # issue token
+        deploy_args = init_args()
+        bond_token = brownie_utils.force_deploy(issuer, IbetStraightBond, *deploy_args)
+
+        # transfer & lock
+        bond_token.transferFrom.transact(issuer, user1, 60, {"from": issuer})
+        bond_token.lock.transact(lock_eoa1, 10, "", {"from": user1})
+        bond_token.lock.transact(lock_eoa2, 20, "", {"from": user1})
+        bond_token.forceLock.transact(lock_eoa3, user1, 30, "", {"from": issuer})
+
+        # assertion
+        assert bond_token.getLockCountByAccount(user1) == 3
+        assert bond_token.getLocksByAccount(user1, 0, 10) == (
+            [lock_eoa1, lock_eoa2, lock_eoa3],
+            [10, 20, 30],
+        )
+        assert bond_token.getLocksByAccount(user1, 1, 1) == ([lock_eoa2], [20])
+
+        # unlock all locked balance from the first lock address
+        bond_token.forceUnlock.transact(
+            lock_eoa1, user1, user1, 10, "", {"from": issuer}
+        )
+
+        # assertion
+        # - the last element is moved to the removed position
+        assert bond_token.getLockCountByAccount(user1) == 2
+        assert bond_token.getLocksByAccount(user1, 0, 10) == (
+            [lock_eoa3, lock_eoa2],
+            [30, 20],
+        )
+        assert bond_token.getLocksByAccount(issuer, 0, 10) == ([], [])
+
+
 # TEST_issueFrom
 class TestIssueFrom:
     #######################################
@@ -3822,3 +4265,49 @@ class TestApproveTransfer:
             transfer_amount,
             False,
         )
+
+
+# TEST_storageLayout
+class TestStorageLayout:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # tradableExchange and the transfer flags are packed into one slot
+    def test_normal_1(self, web3, users, IbetStraightBond):
+        issuer = users["issuer"]
+        exchange = users["agent"]
+
+        # issue token
+        deploy_args = init_args()
+        bond_token = issuer.deploy(IbetStraightBond, *deploy_args)
+
+        # update
+        bond_token.setTradableExchange(exchange, {"from": issuer})
+        for setter in TRANSFER_FLAG_SETTERS:
+            getattr(bond_token, setter)(True, {"from": issuer})
+
+        # assertion
+        slot = web3.eth.get_storage_at(bond_token.address, TRANSFER_FLAGS_SLOT)
+        assert slot[12:] == bytes.fromhex(exchange.address[2:])  # byte 0 - 19
+        assert slot[6:12] == bytes([1] * len(TRANSFER_FLAG_SETTERS))  # byte 20 - 25
+        assert slot[:6] == bytes(6)
+
+    # Normal_2
+    # each transfer flag is stored at its own byte offset
+    def test_normal_2(self, web3, users, IbetStraightBond):
+        issuer = users["issuer"]
+
+        # issue token
+        deploy_args = init_args()
+        bond_token = issuer.deploy(IbetStraightBond, *deploy_args)
+        bond_token.setTradableExchange(brownie.ZERO_ADDRESS, {"from": issuer})
+
+        for i, setter in enumerate(TRANSFER_FLAG_SETTERS):
+            for other in TRANSFER_FLAG_SETTERS:
+                getattr(bond_token, other)(other == setter, {"from": issuer})
+
+            # assertion
+            slot = web3.eth.get_storage_at(bond_token.address, TRANSFER_FLAGS_SLOT)
+            assert int.from_bytes(slot, "big") == 1 << (8 * (20 + i))
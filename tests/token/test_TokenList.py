@@ -155,6 +155,46 @@ class TestChangeOwner:
             new_owner.address,
         )
 
+    # Normal_2
+    # Owner index is updated
+    def test_normal_2(self, users, TokenList, IbetStandardToken):
+        admin = users["admin"]
+        issuer = users["issuer"]
+        new_owner = users["user1"]
+
+        # deploy
+        token_list = admin.deploy(TokenList)
+
+        # issue token & register to list
+        tokens = []
+        for _ in range(3):
+            token = issuer.deploy(IbetStandardToken, *deploy_args)
+            token_list.register.transact(
+                token.address, "IbetStandardToken", {"from": issuer}
+            )
+            tokens.append(token)
+
+        # change token owner
+        token_list.changeOwner.transact(
+            tokens[0].address, new_owner.address, {"from": issuer}
+        )
+
+        # assertion
+        assert token_list.getListLengthByOwner(issuer) == 2
+        assert token_list.getTokensByOwner(issuer, 0, 10) == [
+            (tokens[2].address, "IbetStandardToken", issuer.address),
+            (tokens[1].address, "IbetStandardToken", issuer.address),
+        ]
+        assert token_list.getListLengthByOwner(new_owner) == 1
+        assert token_list.getTokensByOwner(new_owner, 0, 10) == [
+            (tokens[0].address, "IbetStandardToken", new_owner.address),
+        ]
+        assert token_list.getTokenByNum(0) == (
+            tokens[0].address,
+            "IbetStandardToken",
+            new_owner.address,
+        )
+
     #######################################
     # Error
     #######################################
@@ -333,3 +373,129 @@ class TestGetTokenByAddress:
             "IbetStandardToken",
             issuer.address,
         )
+
+
+# TEST_getTokens
+class TestGetTokens:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    def test_normal_1(self, users, TokenList, IbetStandardToken):
+        admin = users["admin"]
+        issuer = users["issuer"]
+
+        # deploy
+        token_list = admin.deploy(TokenList)
+
+        # issue token & register to list
+        tokens = []
+        for _ in range(3):
+            token = issuer.deploy(IbetStandardToken, *deploy_args)
+            token_list.register.transact(
+                token.address, "IbetStandardToken", {"from": issuer}
+            )
+            tokens.append(token)
+
+        # assertion
+        assert token_list.getTokens(0, 2) == [
+            (tokens[0].address, "IbetStandardToken", issuer.address),
+            (tokens[1].address, "IbetStandardToken", issuer.address),
+        ]
+        assert token_list.getTokens(2, 2) == [
+            (tokens[2].address, "IbetStandardToken", issuer.address),
+        ]
+
+    # Normal_2
+    # Offset exceeds the list length
+    def test_normal_2(self, users, TokenList, IbetStandardToken):
+        admin = users["admin"]
+        issuer = users["issuer"]
+
+        # deploy
+        token_list = admin.deploy(TokenList)
+
+        # issue token & register to list
+        token = issuer.deploy(IbetStandardToken, *deploy_args)
+        token_list.register.transact(
+            token.address, "IbetStandardToken", {"from": issuer}
+        )
+
+        # assertion
+        assert token_list.getTokens(1, 10) == []
+
+
+# TEST_getTokensByTemplate
+class TestGetTokensByTemplate:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    def test_normal_1(self, users, TokenList, IbetStandardToken):
+        admin = users["admin"]
+        issuer = users["issuer"]
+
+        # deploy
+        token_list = admin.deploy(TokenList)
+
+        # issue token & register to list
+        tokens = []
+        for template in ["IbetStandardToken", "IbetShare", "IbetStandardToken"]:
+            token = issuer.deploy(IbetStandardToken, *deploy_args)
+            token_list.register.transact(token.address, template, {"from": issuer})
+            tokens.append(token)
+
+        # assertion
+        assert token_list.getListLengthByTemplate("IbetStandardToken") == 2
+        assert token_list.getTokensByTemplate("IbetStandardToken", 0, 10) == [
+            (tokens[0].address, "IbetStandardToken", issuer.address),
+            (tokens[2].address, "IbetStandardToken", issuer.address),
+        ]
+        assert token_list.getTokensByTemplate("IbetStandardToken", 1, 1) == [
+            (tokens[2].address, "IbetStandardToken", issuer.address),
+        ]
+        assert token_list.getListLengthByTemplate("IbetShare") == 1
+        assert token_list.getTokensByTemplate("IbetShare", 0, 10) == [
+            (tokens[1].address, "IbetShare", issuer.address),
+        ]
+        assert token_list.getListLengthByTemplate("IbetCoupon") == 0
+        assert token_list.getTokensByTemplate("IbetCoupon", 0, 10) == []
+
+
+# TEST_getTokensByOwner
+class TestGetTokensByOwner:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    def test_normal_1(self, users, TokenList, IbetStandardToken):
+        admin = users["admin"]
+        issuer = users["issuer"]
+        other_issuer = users["user1"]
+
+        # deploy
+        token_list = admin.deploy(TokenList)
+
+        # issue token & register to list
+        token_1 = issuer.deploy(IbetStandardToken, *deploy_args)
+        token_list.register.transact(
+            token_1.address, "IbetStandardToken", {"from": issuer}
+        )
+        token_2 = other_issuer.deploy(IbetStandardToken, *deploy_args)
+        token_list.register.transact(
+            token_2.address, "IbetStandardToken", {"from": other_issuer}
+        )
+
+        # assertion
+        assert token_list.getListLengthByOwner(issuer) == 1
+        assert token_list.getTokensByOwner(issuer, 0, 10) == [
+            (token_1.address, "IbetStandardToken", issuer.address),
+        ]
+        assert token_list.getListLengthByOwner(other_issuer) == 1
+        assert token_list.getTokensByOwner(other_issuer, 0, 10) == [
+            (token_2.address, "IbetStandardToken", other_issuer.address),
+        ]
+        assert token_list.getTokensByOwner(issuer, 1, 10) == []
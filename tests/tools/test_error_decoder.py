@@ -0,0 +1,71 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import brownie
+from brownie import E2EMessaging
+from eth_abi import encode
+
+from tools.error_decoder import (
+    ERROR_STRING_SELECTOR,
+    IBET_ERROR_SELECTOR,
+    decode_error_code,
+)
+
+
+# TEST_decode_error_code
+class TestDecodeErrorCode:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # IbetError(uint256)
+    def test_normal_1(self):
+        data = IBET_ERROR_SELECTOR + encode(["uint256"], [110401])
+
+        assert decode_error_code(data) == "110401"
+        assert decode_error_code("0x" + data.hex()) == "110401"
+
+    # Normal_2
+    # Error(string) of the contracts deployed before the migration
+    def test_normal_2(self):
+        data = ERROR_STRING_SELECTOR + encode(["string"], ["110401"])
+
+        assert decode_error_code(data) == "110401"
+
+    # Normal_3
+    # Other revert data
+    def test_normal_3(self):
+        panic = bytes.fromhex("4e487b71") + encode(["uint256"], [0x11])
+
+        assert decode_error_code(panic) is None
+        assert decode_error_code(b"") is None
+
+    # Normal_4
+    # The selector matches the ABI of the compiled contracts
+    def test_normal_4(self, users):
+        e2e_messaging = users["admin"].deploy(E2EMessaging)
+
+        assert {
+            "type": "error",
+            "name": "IbetError",
+            "inputs": [{"internalType": "uint256", "name": "code", "type": "uint256"}],
+        } in E2EMessaging.abi
+        with brownie.reverts(revert_msg="610001"):
+            e2e_messaging.getLastMessage(users["user1"])
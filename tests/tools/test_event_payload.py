@@ -0,0 +1,143 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+
+import pytest
+from brownie import E2EMessagingLite, FreezeLogLite
+from eth_utils import keccak
+
+from tools.event_payload import (
+    FrozenLog,
+    Message,
+    PayloadMismatchError,
+    PayloadReader,
+    verify,
+)
+
+
+@pytest.fixture()
+def reader(web3, tmp_path):
+    # tools/json_filter.py の出力と同じ形式でABIを配置する
+    for contract in (E2EMessagingLite, FreezeLogLite):
+        with open(tmp_path / f"{contract._name}.json", "w") as f:
+            json.dump({"abi": contract.abi}, f)
+    return PayloadReader(web3, abi_dir=str(tmp_path))
+
+
+# TEST_get_messages
+class TestGetMessages:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # Message texts are read from the logs
+    def test_normal_1(self, users, reader):
+        admin = users["admin"]
+        sender = users["user1"]
+        receiver = users["user2"]
+
+        # deploy & send messages
+        e2e_messaging = admin.deploy(E2EMessagingLite)
+        txs = [
+            e2e_messaging.sendMessage.transact(
+                receiver, f"test_message_{i}", {"from": sender}
+            )
+            for i in range(3)
+        ]
+        # 他の受信者宛のメッセージ
+        e2e_messaging.sendMessage.transact(sender, "other", {"from": receiver})
+        e2e_messaging.clearMessage.transact(receiver, 1, {"from": sender})
+
+        # get messages
+        messages = reader.get_messages(e2e_messaging.address, receiver.address)
+
+        # assertion
+        assert messages == [
+            Message(
+                index=i,
+                sender=sender.address,
+                text=None if i == 1 else f"test_message_{i}",
+                time=tx.events["Message"]["time"],
+            )
+            for i, tx in enumerate(txs)
+        ]
+        assert reader.get_messages(e2e_messaging.address, receiver.address, 2, 3) == [
+            messages[2]
+        ]
+        assert reader.get_messages(e2e_messaging.address, receiver.address, 3) == []
+
+
+# TEST_get_log
+class TestGetLog:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # The latest log text is read from the logs
+    def test_normal_1(self, users, reader):
+        admin = users["admin"]
+        recorder = users["user1"]
+
+        # deploy & record logs
+        freeze_log = admin.deploy(FreezeLogLite)
+        tx = freeze_log.recordLog("test_log_0", 10, {"from": recorder})
+        freeze_log.recordLog("test_log_1", 10, {"from": recorder})
+        freeze_log.updateLog(0, "test_log_0_updated", {"from": recorder})
+
+        # get log
+        log = reader.get_log(freeze_log.address, recorder.address, 0)
+
+        # assertion
+        assert log == FrozenLog(
+            index=0,
+            log="test_log_0_updated",
+            created_block_number=tx.block_number,
+            freezing_grace_block_count=10,
+        )
+        assert reader.get_log(freeze_log.address, recorder.address, 1).log == (
+            "test_log_1"
+        )
+
+    #######################################
+    # Error
+    #######################################
+
+    # Error_1
+    # The log does not exist
+    def test_error_1(self, users, reader):
+        admin = users["admin"]
+        recorder = users["user1"]
+
+        # deploy
+        freeze_log = admin.deploy(FreezeLogLite)
+
+        # get log
+        with pytest.raises(ValueError):
+            reader.get_log(freeze_log.address, recorder.address, 0)
+
+    # Error_2
+    # The log text does not match the stored hash
+    def test_error_2(self):
+        with pytest.raises(PayloadMismatchError):
+            verify("test_log_altered", keccak(text="test_log"), "log 0")
+        with pytest.raises(PayloadMismatchError):
+            verify(None, keccak(text="test_log"), "log 0")
@@ -0,0 +1,172 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+
+import pytest
+from brownie import IbetStandardToken, Multicall, PersonalInfo
+
+from tools.multicall import BASE_GAS, Call, CallResult, MulticallClient, estimate_gas
+
+deploy_args = [
+    "test_token",  # name
+    "test_symbol",  # symbol
+    100000,  # total supply
+    "0x0000000000000000000000000000000000000000",  # tradable exchange
+    "test_contact_information",
+    "test_privacy_policy",
+]
+
+
+@pytest.fixture()
+def abi_dir(tmp_path):
+    # tools/json_filter.py の出力と同じ形式でABIを配置する
+    for contract in (IbetStandardToken, Multicall, PersonalInfo):
+        with open(tmp_path / f"{contract._name}.json", "w") as f:
+            json.dump({"abi": contract.abi}, f)
+    return str(tmp_path)
+
+
+# TEST_call
+class TestCall:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # Results are returned in the order of the calls
+    def test_normal_1(self, web3, users, personal_info, abi_dir):
+        admin = users["admin"]
+        issuer = users["issuer"]
+        user1 = users["user1"]
+
+        # deploy
+        multicall = admin.deploy(Multicall)
+        token = issuer.deploy(IbetStandardToken, *deploy_args)
+        personal_info.register.transact(issuer, "encrypted_message", {"from": user1})
+
+        # call
+        client = MulticallClient(web3, multicall.address, abi_dir=abi_dir)
+        results = client.call(
+            [
+                Call(
+                    "IbetStandardToken", token.address, "balanceOf", (issuer.address,)
+                ),
+                Call("IbetStandardToken", token.address, "name"),
+                Call(
+                    "PersonalInfo",
+                    personal_info.address,
+                    "isRegistered",
+                    (user1.address, issuer.address),
+                ),
+                Call("IbetStandardToken", token.address, "owner"),
+            ]
+        )
+
+        # assertion
+        assert results == [
+            CallResult(success=True, value=100000),
+            CallResult(success=True, value="test_token"),
+            CallResult(success=True, value=True),
+            CallResult(success=True, value=issuer.address),
+        ]
+
+    # Normal_2
+    # Calls are split into chunks under the gas limit
+    def test_normal_2(self, web3, users, abi_dir):
+        admin = users["admin"]
+        issuer = users["issuer"]
+
+        # deploy
+        multicall = admin.deploy(Multicall)
+        token = issuer.deploy(IbetStandardToken, *deploy_args)
+
+        # call
+        calls = [
+            Call("IbetStandardToken", token.address, "balanceOf", (issuer.address,))
+            for _ in range(5)
+        ]
+        client = MulticallClient(web3, multicall.address, abi_dir=abi_dir)
+        encoded = [(call, client.encode(call)) for call in calls]
+        # 2件ずつ実行できるガスリミット
+        client.gas_limit = BASE_GAS + estimate_gas(*encoded[0]) * 2
+        results = client.call(calls)
+
+        # assertion
+        assert [len(chunk) for chunk in client.chunk(encoded)] == [2, 2, 1]
+        assert results == [CallResult(success=True, value=100000)] * 5
+
+    # Normal_3
+    # Failed calls do not affect the other calls
+    def test_normal_3(self, web3, users, personal_info, abi_dir):
+        admin = users["admin"]
+        issuer = users["issuer"]
+
+        # deploy
+        multicall = admin.deploy(Multicall)
+        token = issuer.deploy(IbetStandardToken, *deploy_args)
+
+        # call
+        client = MulticallClient(web3, multicall.address, abi_dir=abi_dir)
+        results = client.call(
+            [
+                # PersonalInfo に存在しない関数
+                Call("IbetStandardToken", personal_info.address, "name"),
+                Call("IbetStandardToken", token.address, "name"),
+            ]
+        )
+
+        # assertion
+        assert results == [
+            CallResult(success=False, value=b""),
+            CallResult(success=True, value="test_token"),
+        ]
+
+    # Normal_4
+    # Calls that run out of the estimated gas are retried without a gas limit
+    def test_normal_4(self, web3, users, abi_dir):
+        admin = users["admin"]
+        issuer = users["issuer"]
+
+        # deploy
+        multicall = admin.deploy(Multicall)
+        token = issuer.deploy(IbetStandardToken, *deploy_args)
+
+        # call
+        client = MulticallClient(web3, multicall.address, abi_dir=abi_dir)
+        results = client.call(
+            [
+                Call("IbetStandardToken", token.address, "name", gas=100),
+                Call(
+                    "IbetStandardToken",
+                    token.address,
+                    "balanceOf",
+                    (issuer.address,),
+                    gas=100,
+                ),
+                Call("IbetStandardToken", token.address, "symbol"),
+            ]
+        )
+
+        # assertion
+        assert results == [
+            CallResult(success=True, value="test_token"),
+            CallResult(success=True, value=100000),
+            CallResult(success=True, value="test_symbol"),
+        ]
@@ -61,6 +61,43 @@ class TestRegister:
         assert tx.events["Registered"]["contractType"] == "IbetStandardToken"
         assert tx.events["Registered"]["contractOwner"] == issuer.address
 
+    # Normal_2
+    # Re-register after the ownership is transferred
+    def test_normal_2(self, users, ContractRegistry, IbetStandardToken):
+        admin = users["admin"]
+        issuer = users["issuer"]
+        new_issuer = users["user1"]
+
+        # deploy
+        contract_registry = admin.deploy(ContractRegistry)
+
+        # issue token & register
+        token = issuer.deploy(IbetStandardToken, *deploy_args)
+        contract_registry.register.transact(
+            token.address, "IbetStandardToken", {"from": issuer}
+        )
+
+        # transfer ownership & register again
+        token.transferOwnership.transact(new_issuer, {"from": issuer})
+        contract_registry.register.transact(
+            token.address, "IbetStandardTokenV2", {"from": new_issuer}
+        )
+
+        # assertion
+        assert contract_registry.getRegistry(token.address) == (
+            "IbetStandardTokenV2",
+            new_issuer.address,
+        )
+        assert contract_registry.getContractCount() == 1
+        assert contract_registry.getContractCountByType("IbetStandardToken") == 0
+        assert contract_registry.getContractsByType("IbetStandardTokenV2", 0, 10) == [
+            token.address
+        ]
+        assert contract_registry.getContractCountByOwner(issuer) == 0
+        assert contract_registry.getContractsByOwner(new_issuer, 0, 10) == [
+            token.address
+        ]
+
     #######################################
     # Error
     #######################################
@@ -125,3 +162,153 @@ class TestGetRegistry:
             "IbetStandardToken",
             issuer.address,
         )
+
+
+def register_tokens(contract_registry, IbetStandardToken, owners_and_types):
+    tokens = []
+    for owner, contract_type in owners_and_types:
+        token = owner.deploy(IbetStandardToken, *deploy_args)
+        contract_registry.register.transact(
+            token.address, contract_type, {"from": owner}
+        )
+        tokens.append(token)
+    return tokens
+
+
+# TEST_getRegistries
+class TestGetRegistries:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    def test_normal_1(self, users, ContractRegistry, IbetStandardToken):
+        admin = users["admin"]
+        issuer = users["issuer"]
+        user1 = users["user1"]
+
+        # deploy
+        contract_registry = admin.deploy(ContractRegistry)
+        tokens = register_tokens(
+            contract_registry,
+            IbetStandardToken,
+            [(issuer, "IbetStandardToken"), (user1, "IbetShare")],
+        )
+
+        # assertion
+        assert contract_registry.getRegistries(
+            [tokens[0].address, brownie.ZERO_ADDRESS, tokens[1].address]
+        ) == (
+            ["IbetStandardToken", "", "IbetShare"],
+            [issuer.address, brownie.ZERO_ADDRESS, user1.address],
+        )
+
+
+# TEST_getContracts
+class TestGetContracts:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # Paginated listing
+    def test_normal_1(self, users, ContractRegistry, IbetStandardToken):
+        admin = users["admin"]
+        issuer = users["issuer"]
+
+        # deploy
+        contract_registry = admin.deploy(ContractRegistry)
+        tokens = register_tokens(
+            contract_registry,
+            IbetStandardToken,
+            [(issuer, "IbetStandardToken")] * 3,
+        )
+        addresses = [token.address for token in tokens]
+
+        # assertion
+        assert contract_registry.getContractCount() == 3
+        assert contract_registry.getContracts(0, 2) == addresses[0:2]
+        assert contract_registry.getContracts(2, 2) == addresses[2:3]
+        assert contract_registry.getContracts(3, 2) == []
+
+    # Normal_2
+    # No contracts
+    def test_normal_2(self, users, ContractRegistry):
+        admin = users["admin"]
+
+        # deploy
+        contract_registry = admin.deploy(ContractRegistry)
+
+        # assertion
+        assert contract_registry.getContractCount() == 0
+        assert contract_registry.getContracts(0, 10) == []
+
+
+# TEST_getContractsByType
+class TestGetContractsByType:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    def test_normal_1(self, users, ContractRegistry, IbetStandardToken):
+        admin = users["admin"]
+        issuer = users["issuer"]
+
+        # deploy
+        contract_registry = admin.deploy(ContractRegistry)
+        tokens = register_tokens(
+            contract_registry,
+            IbetStandardToken,
+            [
+                (issuer, "IbetStandardToken"),
+                (issuer, "IbetShare"),
+                (issuer, "IbetStandardToken"),
+            ],
+        )
+
+        # assertion
+        assert contract_registry.getContractCountByType("IbetStandardToken") == 2
+        assert contract_registry.getContractsByType("IbetStandardToken", 0, 10) == [
+            tokens[0].address,
+            tokens[2].address,
+        ]
+        assert contract_registry.getContractsByType("IbetShare", 0, 1) == [
+            tokens[1].address
+        ]
+        assert contract_registry.getContractsByType("IbetCoupon", 0, 10) == []
+
+
+# TEST_getContractsByOwner
+class TestGetContractsByOwner:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    def test_normal_1(self, users, ContractRegistry, IbetStandardToken):
+        admin = users["admin"]
+        issuer = users["issuer"]
+        user1 = users["user1"]
+
+        # deploy
+        contract_registry = admin.deploy(ContractRegistry)
+        tokens = register_tokens(
+            contract_registry,
+            IbetStandardToken,
+            [
+                (issuer, "IbetStandardToken"),
+                (user1, "IbetStandardToken"),
+                (issuer, "IbetShare"),
+            ],
+        )
+
+        # assertion
+        assert contract_registry.getContractCountByOwner(issuer) == 2
+        assert contract_registry.getContractsByOwner(issuer, 1, 10) == [
+            tokens[2].address
+        ]
+        assert contract_registry.getContractsByOwner(user1, 0, 10) == [
+            tokens[1].address
+        ]
+        assert contract_registry.getContractsByOwner(admin, 0, 10) == []
@@ -281,6 +281,104 @@ class TestGetMessageByIndex:
         assert message[2] == 0
 
 
+class TestGetMessages:
+    ##########################################################
+    # Normal
+    ##########################################################
+
+    # Normal_1
+    def test_normal_1(self, E2EMessaging, users):
+        admin = users["admin"]
+        sender_1 = users["user1"]
+        sender_2 = users["trader"]
+        receiver = users["user2"]
+
+        # Deploy contract
+        e2e_messaging = admin.deploy(E2EMessaging)
+
+        # Send messages
+        txs = [
+            e2e_messaging.sendMessage.transact(
+                receiver, f"test_message_{i}", {"from": sender}
+            )
+            for i, sender in enumerate([sender_1, sender_2, sender_1])
+        ]
+
+        # Assertion
+        messages = e2e_messaging.getMessages(receiver, 1, 3)
+        assert messages[0] == [sender_2, sender_1]
+        assert messages[1] == ["test_message_1", "test_message_2"]
+        assert messages[2] == [
+            txs[1].events["Message"]["time"],
+            txs[2].events["Message"]["time"],
+        ]
+
+    # Normal_2
+    # To index is capped at the last index
+    def test_normal_2(self, E2EMessaging, users):
+        admin = users["admin"]
+        sender = users["user1"]
+        receiver = users["user2"]
+
+        # Deploy contract
+        e2e_messaging = admin.deploy(E2EMessaging)
+
+        # Send messages
+        for i in range(3):
+            e2e_messaging.sendMessage.transact(
+                receiver, f"test_message_{i}", {"from": sender}
+            )
+
+        # Assertion
+        messages = e2e_messaging.getMessages(receiver, 2, 100)
+        assert messages[0] == [sender]
+        assert messages[1] == ["test_message_2"]
+
+        messages = e2e_messaging.getMessages(receiver, 3, 100)
+        assert messages == ([], [], [])
+
+    # Normal_3
+    # Cleared messages are returned with empty text
+    def test_normal_3(self, E2EMessaging, users):
+        admin = users["admin"]
+        sender = users["user1"]
+        receiver = users["user2"]
+
+        # Deploy contract
+        e2e_messaging = admin.deploy(E2EMessaging)
+
+        # Send messages
+        for i in range(2):
+            e2e_messaging.sendMessage.transact(
+                receiver, f"test_message_{i}", {"from": sender}
+            )
+
+        # Clear message
+        e2e_messaging.clearMessage.transact(receiver, 0, {"from": sender})
+
+        # Assertion
+        messages = e2e_messaging.getMessages(receiver, 0, 2)
+        assert messages[0] == [sender, sender]
+        assert messages[1] == ["", "test_message_1"]
+
+    ##########################################################
+    # Error
+    ##########################################################
+
+    # Error_1
+    # From index is greater than to index
+    def test_error_1(self, E2EMessaging, users):
+        admin = users["admin"]
+        receiver = users["user2"]
+
+        # Deploy contract
+        e2e_messaging = admin.deploy(E2EMessaging)
+
+        # Assertion
+        with brownie.reverts(revert_msg="610201"):
+            e2e_messaging.getMessages(receiver, 2, 1)
+
+
 class TestClearMessage:
     ##########################################################
     # Normal
@@ -374,6 +472,46 @@ class TestGetPublicKey:
         assert public_key[1] == "test_key_type"
 
 
+class TestGetPublicKeys:
+    ##########################################################
+    # Normal
+    ##########################################################
+
+    # Normal_1
+    def test_normal_1(self, E2EMessaging, users):
+        admin = users["admin"]
+        who_1 = users["user1"]
+        who_2 = users["user2"]
+        who_3 = users["trader"]
+
+        # Deploy contract
+        e2e_messaging = admin.deploy(E2EMessaging)
+
+        # Set public key
+        e2e_messaging.setPublicKey.transact(
+            "test_key_1", "test_key_type_1", {"from": who_1}
+        )
+        e2e_messaging.setPublicKey.transact(
+            "test_key_3", "test_key_type_3", {"from": who_3}
+        )
+
+        # Assertion
+        public_keys = e2e_messaging.getPublicKeys([who_1, who_2, who_3])
+        assert public_keys[0] == ["test_key_1", "", "test_key_3"]
+        assert public_keys[1] == ["test_key_type_1", "", "test_key_type_3"]
+
+    # Normal_2
+    # No accounts
+    def test_normal_2(self, E2EMessaging, users):
+        admin = users["admin"]
+
+        # Deploy contract
+        e2e_messaging = admin.deploy(E2EMessaging)
+
+        # Assertion
+        assert e2e_messaging.getPublicKeys([]) == ([], [])
+
+
 class TestSetPublicKey:
     ##########################################################
     # Normal
@@ -0,0 +1,227 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import brownie
+from eth_utils import keccak
+
+
+class TestSendMessage:
+    ##########################################################
+    # Normal
+    ##########################################################
+
+    # Normal_1
+    # Only the hash is stored and the message text is emitted.
+    def test_normal_1(self, E2EMessagingLite, users):
+        admin = users["admin"]
+        sender = users["user1"]
+        receiver = users["user2"]
+
+        test_message = "test_message"
+
+        # Deploy contract
+        e2e_messaging = admin.deploy(E2EMessagingLite)
+
+        # Send message
+        tx = e2e_messaging.sendMessage.transact(
+            receiver, test_message, {"from": sender}
+        )
+
+        # Assertion
+        assert tx.events["Message"]["sender"] == sender
+        assert tx.events["Message"]["receiver"] == receiver
+        assert tx.events["Message"]["index"] == 0
+        assert tx.events["Message"]["textHash"] == keccak(text=test_message)
+        assert tx.events["Message"]["text"] == test_message
+
+        assert e2e_messaging.lastIndex(receiver) == 1
+        message = e2e_messaging.getMessageByIndex(receiver, 0)
+        assert message == (
+            sender,
+            keccak(text=test_message),
+            tx.events["Message"]["time"],
+            tx.block_number,
+        )
+        assert e2e_messaging.getLastMessage(receiver) == message
+
+
+class TestGetLastMessage:
+    ##########################################################
+    # Error
+    ##########################################################
+
+    # Error_1
+    # No message
+    def test_error_1(self, E2EMessagingLite, users):
+        admin = users["admin"]
+        receiver = users["user2"]
+
+        # Deploy contract
+        e2e_messaging = admin.deploy(E2EMessagingLite)
+
+        with brownie.reverts(revert_msg="650001"):
+            e2e_messaging.getLastMessage(receiver)
+
+
+class TestGetMessages:
+    ##########################################################
+    # Normal
+    ##########################################################
+
+    # Normal_1
+    def test_normal_1(self, E2EMessagingLite, users):
+        admin = users["admin"]
+        sender = users["user1"]
+        receiver = users["user2"]
+
+        # Deploy contract
+        e2e_messaging = admin.deploy(E2EMessagingLite)
+
+        # Send messages
+        txs = [
+            e2e_messaging.sendMessage.transact(
+                receiver, f"test_message_{i}", {"from": sender}
+            )
+            for i in range(3)
+        ]
+
+        # Assertion
+        messages = e2e_messaging.getMessages(receiver, 1, 100)
+        assert messages[0] == [sender, sender]
+        assert messages[1] == [
+            keccak(text="test_message_1"),
+            keccak(text="test_message_2"),
+        ]
+        assert messages[2] == [
+            txs[1].events["Message"]["time"],
+            txs[2].events["Message"]["time"],
+        ]
+        assert messages[3] == [txs[1].block_number, txs[2].block_number]
+
+    ##########################################################
+    # Error
+    ##########################################################
+
+    # Error_1
+    # From index is greater than to index
+    def test_error_1(self, E2EMessagingLite, users):
+        admin = users["admin"]
+        receiver = users["user2"]
+
+        # Deploy contract
+        e2e_messaging = admin.deploy(E2EMessagingLite)
+
+        with brownie.reverts(revert_msg="650201"):
+            e2e_messaging.getMessages(receiver, 2, 1)
+
+
+class TestVerifyMessage:
+    ##########################################################
+    # Normal
+    ##########################################################
+
+    # Normal_1
+    def test_normal_1(self, E2EMessagingLite, users):
+        admin = users["admin"]
+        sender = users["user1"]
+        receiver = users["user2"]
+
+        # Deploy contract
+        e2e_messaging = admin.deploy(E2EMessagingLite)
+
+        # Send message
+        e2e_messaging.sendMessage.transact(receiver, "test_message", {"from": sender})
+
+        # Assertion
+        assert e2e_messaging.verifyMessage(receiver, 0, "test_message") is True
+        assert e2e_messaging.verifyMessage(receiver, 0, "altered") is False
+        assert e2e_messaging.verifyMessage(receiver, 1, "") is False
+
+
+class TestClearMessage:
+    ##########################################################
+    # Normal
+    ##########################################################
+
+    # Normal_1
+    def test_normal_1(self, E2EMessagingLite, users):
+        admin = users["admin"]
+        sender = users["user1"]
+        receiver = users["user2"]
+
+        # Deploy contract
+        e2e_messaging = admin.deploy(E2EMessagingLite)
+
+        # Send & Clear message
+        e2e_messaging.sendMessage.transact(receiver, "test_message", {"from": sender})
+        tx = e2e_messaging.clearMessage.transact(receiver, 0, {"from": sender})
+
+        # Assertion
+        assert tx.events["MessageCleared"]["sender"] == sender
+        assert tx.events["MessageCleared"]["receiver"] == receiver
+        assert tx.events["MessageCleared"]["index"] == 0
+
+        message = e2e_messaging.getMessageByIndex(receiver, 0)
+        assert message[0] == sender
+        assert message[1] == "0x" + "00" * 32
+        assert e2e_messaging.verifyMessage(receiver, 0, "test_message") is False
+
+    ##########################################################
+    # Error
+    ##########################################################
+
+    # Error_1
+    # msg.sender must be the sender of the message.
+    def test_error_1(self, E2EMessagingLite, users):
+        admin = users["admin"]
+        sender = users["user1"]
+        receiver = users["user2"]
+
+        # Deploy contract
+        e2e_messaging = admin.deploy(E2EMessagingLite)
+
+        # Send message
+        e2e_messaging.sendMessage.transact(receiver, "test_message", {"from": sender})
+
+        with brownie.reverts(revert_msg="650101"):
+            e2e_messaging.clearMessage.transact(receiver, 0, {"from": receiver})
+
+
+class TestSetPublicKey:
+    ##########################################################
+    # Normal
+    ##########################################################
+
+    # Normal_1
+    def test_normal_1(self, E2EMessagingLite, users):
+        admin = users["admin"]
+        who = users["user1"]
+
+        # Deploy contract
+        e2e_messaging = admin.deploy(E2EMessagingLite)
+
+        # Set public key
+        tx = e2e_messaging.setPublicKey.transact(
+            "test_key", "test_key_type", {"from": who}
+        )
+
+        # Assertion
+        assert tx.events["PublicKeyUpdated"]["who"] == who
+        assert e2e_messaging.getPublicKey(who) == ("test_key", "test_key_type")
+        assert e2e_messaging.getPublicKeys([who]) == (["test_key"], ["test_key_type"])
@@ -0,0 +1,159 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import brownie
+from eth_utils import keccak
+
+
+class TestRecordLog:
+    ##########################################################
+    # Normal
+    ##########################################################
+
+    # Normal_1
+    # Only the hash is stored and the log text is emitted.
+    def test_normal_1(self, FreezeLogLite, users, web3):
+        admin = users["admin"]
+        user = users["user1"]
+
+        # Deploy contract
+        freeze_log = admin.deploy(FreezeLogLite)
+        test_block = web3.eth.block_number + 1
+        test_message = "test_message"
+        test_freezing_grace_block_count = 5
+
+        # Record Log
+        tx = freeze_log.recordLog(
+            test_message, test_freezing_grace_block_count, {"from": user}
+        )
+
+        # Assertion
+        assert tx.events["Recorded"]["recorder"] == user
+        assert tx.events["Recorded"]["index"] == 0
+        assert tx.events["Recorded"]["logHash"] == keccak(text=test_message)
+        assert tx.events["Recorded"]["log"] == test_message
+
+        log = freeze_log.getLog(user.address, 0)
+        assert log == (
+            test_block,
+            test_freezing_grace_block_count,
+            keccak(text=test_message),
+            test_block,
+        )
+        assert freeze_log.lastLogIndex(user) == 1
+
+
+class TestUpdateLog:
+    ##########################################################
+    # Normal
+    ##########################################################
+
+    # Normal_1
+    # Update the log within the freezing grace period.
+    def test_normal_1(self, FreezeLogLite, users, web3):
+        admin = users["admin"]
+        user = users["user1"]
+
+        # Deploy contract
+        freeze_log = admin.deploy(FreezeLogLite)
+        test_block = web3.eth.block_number + 1
+        test_freezing_grace_block_count = 5
+
+        # Record & Update Log
+        freeze_log.recordLog(
+            "test_message", test_freezing_grace_block_count, {"from": user}
+        )
+        tx = freeze_log.updateLog(0, "test_message_updated", {"from": user})
+
+        # Assertion
+        assert tx.events["Updated"]["recorder"] == user
+        assert tx.events["Updated"]["index"] == 0
+        assert tx.events["Updated"]["log"] == "test_message_updated"
+
+        log = freeze_log.getLog(user.address, 0)
+        assert log == (
+            test_block,
+            test_freezing_grace_block_count,
+            keccak(text="test_message_updated"),
+            tx.block_number,
+        )
+
+    ##########################################################
+    # Error
+    ##########################################################
+
+    # Error_1
+    # Trying to update log of non-existent index, but fail.
+    def test_error_1(self, FreezeLogLite, users):
+        admin = users["admin"]
+        user = users["user1"]
+
+        # Deploy contract
+        freeze_log = admin.deploy(FreezeLogLite)
+
+        with brownie.reverts(revert_msg="660001"):
+            freeze_log.updateLog(10, "test_message", {"from": user})
+
+    # Error_2
+    # Trying to update a frozen log, but fail.
+    def test_error_2(self, FreezeLogLite, users):
+        admin = users["admin"]
+        user = users["user1"]
+
+        # Deploy contract
+        freeze_log = admin.deploy(FreezeLogLite)
+
+        # Record Log
+        tx = freeze_log.recordLog("test_message", 0, {"from": user})
+
+        # Trying to update a frozen log.
+        with brownie.reverts(revert_msg="660001"):
+            freeze_log.updateLog(0, "test_message_updated", {"from": user})
+
+        log = freeze_log.getLog(user.address, 0)
+        assert log[2] == keccak(text="test_message")
+        assert log[3] == tx.block_number
+
+
+class TestVerifyLog:
+    ##########################################################
+    # Normal
+    ##########################################################
+
+    # Normal_1
+    def test_normal_1(self, FreezeLogLite, users):
+        admin = users["admin"]
+        user = users["user1"]
+
+        # Deploy contract
+        freeze_log = admin.deploy(FreezeLogLite)
+
+        # Record Log
+        freeze_log.recordLog("test_message", 0, {"from": user})
+
+        # Assertion
+        assert freeze_log.verifyLog(user, 0, "test_message") is True
+        assert freeze_log.verifyLog(user, 0, "test_message_altered") is False
+
+    # Normal_2
+    # Non-existent log
+    def test_normal_2(self, FreezeLogLite, users):
+        admin = users["admin"]
+        user = users["user1"]
+
+        # Deploy contract
+        freeze_log = admin.deploy(FreezeLogLite)
+
+        # Assertion
+        assert freeze_log.verifyLog(user, 0, "") is False
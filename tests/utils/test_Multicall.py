@@ -0,0 +1,215 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import brownie
+
+from tools.error_decoder import decode_error_code
+
+deploy_args = [
+    "test_token",  # name
+    "test_symbol",  # symbol
+    100000,  # total supply
+    brownie.ZERO_ADDRESS,  # tradable exchange
+    "test_contact_information",
+    "test_privacy_policy",
+]
+
+# 存在しない関数のセレクタ
+UNKNOWN_SELECTOR = "0x12345678"
+
+
+# TEST_aggregate
+class TestAggregate:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # Calls to multiple contracts are executed at once
+    def test_normal_1(
+        self, web3, users, personal_info, payment_gateway, Multicall, IbetStandardToken
+    ):
+        admin = users["admin"]
+        issuer = users["issuer"]
+        user1 = users["user1"]
+        agent = users["agent"]
+
+        # deploy
+        multicall = admin.deploy(Multicall)
+        token = issuer.deploy(IbetStandardToken, *deploy_args)
+
+        # register personal info
+        personal_info.register.transact(issuer, "encrypted_message", {"from": user1})
+
+        # aggregate
+        block_number, return_data = multicall.aggregate(
+            [
+                (token.address, token.balanceOf.encode_input(issuer), 0),
+                (
+                    personal_info.address,
+                    personal_info.isRegistered.encode_input(user1, issuer),
+                    0,
+                ),
+                (
+                    payment_gateway.address,
+                    payment_gateway.accountApproved.encode_input(user1, agent),
+                    0,
+                ),
+            ]
+        )
+
+        # assertion
+        # NOTE: Hardhatは最新ブロックの次のブロックでeth_callを実行する
+        assert block_number in (web3.eth.block_number, web3.eth.block_number + 1)
+        assert token.balanceOf.decode_output(return_data[0]) == 100000
+        assert personal_info.isRegistered.decode_output(return_data[1]) is True
+        assert payment_gateway.accountApproved.decode_output(return_data[2]) is False
+
+    # Normal_2
+    # No calls
+    def test_normal_2(self, web3, users, Multicall):
+        multicall = users["admin"].deploy(Multicall)
+
+        # aggregate
+        block_number, return_data = multicall.aggregate([])
+
+        # assertion
+        # NOTE: Hardhatは最新ブロックの次のブロックでeth_callを実行する
+        assert block_number in (web3.eth.block_number, web3.eth.block_number + 1)
+        assert return_data == []
+
+    #######################################
+    # Error
+    #######################################
+
+    # Error_1
+    # One of the calls failed
+    def test_error_1(self, users, personal_info, Multicall, IbetStandardToken):
+        admin = users["admin"]
+        issuer = users["issuer"]
+
+        # deploy
+        multicall = admin.deploy(Multicall)
+        token = issuer.deploy(IbetStandardToken, *deploy_args)
+
+        # aggregate
+        with brownie.reverts(revert_msg="640001"):
+            multicall.aggregate(
+                [
+                    (token.address, token.balanceOf.encode_input(issuer), 0),
+                    (personal_info.address, UNKNOWN_SELECTOR, 0),
+                ]
+            )
+
+
+# TEST_tryAggregate
+class TestTryAggregate:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # Failed calls are recorded in the results
+    def test_normal_1(self, web3, users, Multicall, E2EMessaging, IbetStandardToken):
+        admin = users["admin"]
+        issuer = users["issuer"]
+        user1 = users["user1"]
+
+        # deploy
+        multicall = admin.deploy(Multicall)
+        e2e_messaging = admin.deploy(E2EMessaging)
+        token = issuer.deploy(IbetStandardToken, *deploy_args)
+
+        # try aggregate
+        block_number, results = multicall.tryAggregate(
+            False,
+            [
+                (token.address, token.balanceOf.encode_input(issuer), 0),
+                (
+                    e2e_messaging.address,
+                    e2e_messaging.getLastMessage.encode_input(user1),
+                    0,
+                ),
+                (token.address, UNKNOWN_SELECTOR, 0),
+                (token.address, token.balanceOf.encode_input(user1), 0),
+            ],
+        )
+
+        # assertion
+        # NOTE: Hardhatは最新ブロックの次のブロックでeth_callを実行する
+        assert block_number in (web3.eth.block_number, web3.eth.block_number + 1)
+        assert len(results) == 4
+        assert results[0][0] is True
+        assert token.balanceOf.decode_output(results[0][1]) == 100000
+        assert results[1][0] is False
+        assert decode_error_code(results[1][1]) == "610001"
+        assert results[2] == (False, "0x")
+        assert results[3][0] is True
+        assert token.balanceOf.decode_output(results[3][1]) == 0
+
+    # Normal_2
+    # A call that runs out of its gas limit does not affect the following calls
+    def test_normal_2(self, users, Multicall, IbetStandardToken):
+        admin = users["admin"]
+        issuer = users["issuer"]
+
+        # deploy
+        multicall = admin.deploy(Multicall)
+        token = issuer.deploy(IbetStandardToken, *deploy_args)
+
+        # try aggregate
+        _, results = multicall.tryAggregate(
+            False,
+            [
+                (token.address, token.name.encode_input(), 100),
+                (token.address, token.name.encode_input(), 0),
+                (token.address, token.balanceOf.encode_input(issuer), 100000),
+            ],
+        )
+
+        # assertion
+        assert results[0] == (False, "0x")
+        assert results[1][0] is True
+        assert token.name.decode_output(results[1][1]) == "test_token"
+        assert results[2][0] is True
+        assert token.balanceOf.decode_output(results[2][1]) == 100000
+
+    #######################################
+    # Error
+    #######################################
+
+    # Error_1
+    # One of the calls failed with requireSuccess
+    def test_error_1(self, users, Multicall, IbetStandardToken):
+        admin = users["admin"]
+        issuer = users["issuer"]
+
+        # deploy
+        multicall = admin.deploy(Multicall)
+        token = issuer.deploy(IbetStandardToken, *deploy_args)
+
+        # try aggregate
+        with brownie.reverts(revert_msg="640101"):
+            multicall.tryAggregate(
+                True,
+                [
+                    (token.address, token.balanceOf.encode_input(issuer), 0),
+                    (token.address, UNKNOWN_SELECTOR, 0),
+                ],
+            )
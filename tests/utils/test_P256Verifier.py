@@ -0,0 +1,201 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import brownie
+import pytest
+from Crypto.Hash import SHA256
+from Crypto.PublicKey import ECC
+from Crypto.Signature import DSS
+from eth_utils import keccak
+
+# secp256r1 order
+N = 0xFFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551
+
+# 1 + 64 points * (x, y) * 32 bytes
+TABLE_CODE_SIZE = 1 + 64 * 2 * 32
+
+
+class _RawHash:
+    block_size = 64
+    digest_size = 32
+    oid = SHA256.new(b"").oid
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    @classmethod
+    def new(cls, data=b""):
+        return cls(data)
+
+    def update(self, data: bytes):
+        self._data += data
+
+    def copy(self):
+        return self.__class__(self._data)
+
+    def digest(self):
+        return self._data
+
+
+def _sign(private_key, message_hash: bytes):
+    signer = DSS.new(private_key, "deterministic-rfc6979", encoding="binary")
+    signature = signer.sign(_RawHash(message_hash))
+    return (
+        int.from_bytes(signature[:32], byteorder="big"),
+        int.from_bytes(signature[32:], byteorder="big"),
+    )
+
+
+@pytest.fixture()
+def verifier(WalletTestVerifier, users):
+    return users["admin"].deploy(WalletTestVerifier)
+
+
+@pytest.fixture()
+def signature():
+    """(hash, r, s, x, y)"""
+    private_key = ECC.generate(curve="P-256")
+    message_hash = keccak(text="test_message")
+    sig_r, sig_s = _sign(private_key, message_hash)
+    return (
+        message_hash,
+        sig_r,
+        sig_s,
+        int(private_key.pointQ.x),
+        int(private_key.pointQ.y),
+    )
+
+
+# TEST_verify
+class TestVerify:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # valid signature
+    def test_normal_1(self, verifier, signature):
+        assert verifier.verify(*signature) is True
+
+    # Normal_2
+    # signature of another message
+    def test_normal_2(self, verifier, signature):
+        _, sig_r, sig_s, pubkey_x, pubkey_y = signature
+        message_hash = keccak(text="another_message")
+
+        assert verifier.verify(message_hash, sig_r, sig_s, pubkey_x, pubkey_y) is False
+
+    # Normal_3
+    # signature of another key
+    def test_normal_3(self, verifier, signature):
+        message_hash, sig_r, sig_s, _, _ = signature
+        other_key = ECC.generate(curve="P-256")
+
+        assert (
+            verifier.verify(
+                message_hash,
+                sig_r,
+                sig_s,
+                int(other_key.pointQ.x),
+                int(other_key.pointQ.y),
+            )
+            is False
+        )
+
+    # Normal_4
+    # r and s are out of range
+    def test_normal_4(self, verifier, signature):
+        message_hash, sig_r, sig_s, pubkey_x, pubkey_y = signature
+
+        assert verifier.verify(message_hash, 0, sig_s, pubkey_x, pubkey_y) is False
+        assert verifier.verify(message_hash, sig_r, 0, pubkey_x, pubkey_y) is False
+        assert verifier.verify(message_hash, N, sig_s, pubkey_x, pubkey_y) is False
+        assert verifier.verify(message_hash, sig_r, N, pubkey_x, pubkey_y) is False
+
+    # Normal_5
+    # public key is not on the curve
+    def test_normal_5(self, verifier, signature):
+        message_hash, sig_r, sig_s, pubkey_x, pubkey_y = signature
+
+        assert verifier.verify(message_hash, sig_r, sig_s, 1, 2) is False
+        assert (
+            verifier.verify(message_hash, sig_r, sig_s, pubkey_x, pubkey_y + 1) is False
+        )
+
+
+# TEST_verifyWithPrecompile
+# Hardhat（hardfork: osaka）のP256VERIFYプリコンパイルとSolidity実装の結果の比較
+class TestVerifyWithPrecompile:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # valid signature
+    def test_normal_1(self, verifier, signature):
+        assert verifier.verifyWithPrecompile(*signature) is True
+        assert verifier.verify(*signature) is True
+
+    # Normal_2
+    # invalid signatures
+    def test_normal_2(self, verifier, signature):
+        message_hash, sig_r, sig_s, pubkey_x, pubkey_y = signature
+        invalid_signatures = [
+            (keccak(text="another_message"), sig_r, sig_s, pubkey_x, pubkey_y),
+            (message_hash, 0, sig_s, pubkey_x, pubkey_y),
+            (message_hash, sig_r, N, pubkey_x, pubkey_y),
+            (message_hash, sig_r, sig_s, 1, 2),
+        ]
+        for invalid_signature in invalid_signatures:
+            assert verifier.verifyWithPrecompile(*invalid_signature) is False
+            assert verifier.verify(*invalid_signature) is False
+
+
+# TEST_deployTable
+class TestDeployTable:
+    #######################################
+    # Normal
+    #######################################
+
+    # Normal_1
+    # signatures are verified with the stored table
+    def test_normal_1(self, web3, users, verifier, signature):
+        message_hash, sig_r, sig_s, pubkey_x, pubkey_y = signature
+
+        tx = verifier.deployTable(pubkey_x, pubkey_y, {"from": users["admin"]})
+        table = tx.events["TableDeployed"]["table"]
+
+        assert table != brownie.ZERO_ADDRESS
+        assert len(web3.eth.get_code(table)) == TABLE_CODE_SIZE
+
+        assert verifier.verifyWithTable(message_hash, sig_r, sig_s, table) is True
+        assert (
+            verifier.verifyWithTable(
+                keccak(text="another_message"), sig_r, sig_s, table
+            )
+            is False
+        )
+        assert verifier.verifyWithTable(message_hash, sig_r, 0, table) is False
+
+    # Normal_2
+    # public key is not on the curve
+    def test_normal_2(self, users, verifier):
+        tx = verifier.deployTable(1, 2, {"from": users["admin"]})
+
+        assert tx.events["TableDeployed"]["table"] == brownie.ZERO_ADDRESS
@@ -22,6 +22,8 @@ import pytest
 from Crypto.Hash import SHA256
 from Crypto.PublicKey import ECC
 from Crypto.Signature import DSS
+from eth_abi import encode
+from eth_utils import keccak, to_bytes
 
 
 class _RawHash:
@@ -93,6 +95,25 @@ class TestDeploy:
         with pytest.raises(ValueError):
             admin.deploy(P256Wallet, 2, 0)
 
+    # Normal_2
+    # precomputed table is stored only if the precompile is not available
+    def test_normal_2(self, P256Wallet, WalletTestVerifier, users):
+        admin = users["admin"]
+        private_key, pubkey_x, pubkey_y = _generate_p256_keypair()
+        wallet = admin.deploy(P256Wallet, pubkey_x, pubkey_y)
+
+        verifier = admin.deploy(WalletTestVerifier)
+        tx_hash = wallet.getTransactionHash.call(users["user1"], 0, "0x", 0)
+        sig_r, sig_s = _generate_p256_signature(private_key, tx_hash)
+        precompile_available = verifier.verifyWithPrecompile(
+            tx_hash, sig_r, sig_s, pubkey_x, pubkey_y
+        )
+
+        if precompile_available:
+            assert wallet.verifierTable() == brownie.ZERO_ADDRESS
+        else:
+            assert wallet.verifierTable() != brownie.ZERO_ADDRESS
+
 
 # TEST_getTransactionHash
 class TestGetTransactionHash:
@@ -184,3 +205,171 @@ class TestExecute:
                 sig_s,
                 {"from": users["user1"]},
             )
+
+
+# TEST_getBatchTransactionHash
+class TestGetBatchTransactionHash:
+    # Normal_1
+    # hash binds the ordered calls and the nonce
+    def test_normal_1(self, P256Wallet, users, chain):
+        admin = users["admin"]
+        wallet = admin.deploy(P256Wallet, 10, 20)
+
+        targets = [users["user1"].address, users["user2"].address]
+        values = [123, 0]
+        data = ["0x11223344", "0x"]
+        nonce = 7
+
+        tx_hash = wallet.getBatchTransactionHash.call(targets, values, data, nonce)
+
+        calls_hash = keccak(
+            encode(
+                ["address[]", "uint256[]", "bytes32[]"],
+                [targets, values, [keccak(to_bytes(hexstr=d)) for d in data]],
+            )
+        )
+        expected = keccak(
+            b"\x19\x02"
+            + chain.id.to_bytes(32, "big")
+            + to_bytes(hexstr=wallet.address)
+            + calls_hash
+            + nonce.to_bytes(32, "big")
+        )
+        assert tx_hash == "0x" + expected.hex()
+
+        # the order of the calls changes the hash
+        assert tx_hash != wallet.getBatchTransactionHash.call(
+            targets[::-1], values[::-1], data[::-1], nonce
+        )
+        # a single call batch differs from the single call hash
+        assert wallet.getBatchTransactionHash.call(
+            targets[:1], values[:1], data[:1], nonce
+        ) != wallet.getTransactionHash.call(targets[0], values[0], data[0], nonce)
+
+
+# TEST_executeBatch
+class TestExecuteBatch:
+    # Normal_1
+    # all calls are executed in order with one signature
+    def test_normal_1(self, P256Wallet, WalletTestReceiver, users):
+        admin = users["admin"]
+        receiver_1 = admin.deploy(WalletTestReceiver)
+        receiver_2 = admin.deploy(WalletTestReceiver)
+        targets = [receiver_1.address, receiver_2.address, receiver_1.address]
+        values = [0, 0, 0]
+        data = [
+            receiver_1.setValue.encode_input(1),
+            receiver_2.setValue.encode_input(2),
+            receiver_1.setValue.encode_input(3),
+        ]
+
+        private_key, pubkey_x, pubkey_y = _generate_p256_keypair()
+        wallet = admin.deploy(P256Wallet, pubkey_x, pubkey_y)
+        tx_hash = wallet.getBatchTransactionHash.call(targets, values, data, 0)
+        sig_r, sig_s = _generate_p256_signature(private_key, tx_hash)
+
+        return_data = wallet.executeBatch.call(
+            targets, values, data, sig_r, sig_s, {"from": users["user1"]}
+        )
+        tx = wallet.executeBatch(
+            targets, values, data, sig_r, sig_s, {"from": users["user1"]}
+        )
+
+        assert return_data == ["0x", "0x", "0x"]
+        assert receiver_1.lastValue() == 3
+        assert receiver_2.lastValue() == 2
+        assert receiver_1.lastCaller() == wallet.address
+        assert wallet.nonce() == 1
+
+        assert len(tx.events["Executed"]) == 3
+        for i, event in enumerate(tx.events["Executed"]):
+            assert event["target"] == targets[i]
+            assert event["value"] == 0
+            assert event["data"] == data[i]
+            assert event["nonce"] == 0
+
+    # Normal_2
+    # signature cannot be replayed after the nonce is incremented
+    def test_normal_2(self, P256Wallet, WalletTestReceiver, users):
+        admin = users["admin"]
+        receiver = admin.deploy(WalletTestReceiver)
+        targets = [receiver.address]
+        values = [0]
+        data = [receiver.setValue.encode_input(1)]
+
+        private_key, pubkey_x, pubkey_y = _generate_p256_keypair()
+        wallet = admin.deploy(P256Wallet, pubkey_x, pubkey_y)
+        tx_hash = wallet.getBatchTransactionHash.call(targets, values, data, 0)
+        sig_r, sig_s = _generate_p256_signature(private_key, tx_hash)
+
+        wallet.executeBatch(
+            targets, values, data, sig_r, sig_s, {"from": users["user1"]}
+        )
+
+        with brownie.reverts(revert_msg="630202"):
+            wallet.executeBatch(
+                targets, values, data, sig_r, sig_s, {"from": users["user1"]}
+            )
+
+    # Error_1
+    # list lengths are not equal
+    def test_error_1(self, P256Wallet, WalletTestReceiver, users):
+        admin = users["admin"]
+        wallet = admin.deploy(P256Wallet, 1, 2)
+        receiver = admin.deploy(WalletTestReceiver)
+
+        call_data = receiver.setValue.encode_input(999)
+
+        with brownie.reverts(revert_msg="630201"):
+            wallet.executeBatch(
+                [receiver.address, receiver.address],
+                [0],
+                [call_data, call_data],
+                0,
+                0,
+                {"from": users["user1"]},
+            )
+
+    # Error_2
+    # invalid signature should always fail
+    def test_error_2(self, P256Wallet, WalletTestReceiver, users):
+        admin = users["admin"]
+        wallet = admin.deploy(P256Wallet, 1, 2)
+        receiver = admin.deploy(WalletTestReceiver)
+
+        call_data = receiver.setValue.encode_input(999)
+
+        with brownie.reverts(revert_msg="630202"):
+            wallet.executeBatch(
+                [receiver.address],
+                [0],
+                [call_data],
+                0,
+                0,
+                {"from": users["user1"]},
+            )
+
+    # Error_3
+    # failure of any call reverts the whole batch
+    def test_error_3(self, P256Wallet, WalletTestReceiver, users):
+        admin = users["admin"]
+        receiver = admin.deploy(WalletTestReceiver)
+        targets = [receiver.address, receiver.address]
+        values = [0, 0]
+        data = [
+            receiver.setValue.encode_input(1),
+            receiver.revertAlways.encode_input(),
+        ]
+
+        private_key, pubkey_x, pubkey_y = _generate_p256_keypair()
+        wallet = admin.deploy(P256Wallet, pubkey_x, pubkey_y)
+        tx_hash = wallet.getBatchTransactionHash.call(targets, values, data, 0)
+        sig_r, sig_s = _generate_p256_signature(private_key, tx_hash)
+
+        with brownie.reverts(revert_msg="630203"):
+            wallet.executeBatch(
+                targets, values, data, sig_r, sig_s, {"from": users["user1"]}
+            )
+
+        assert receiver.lastValue() == 0
+        assert wallet.nonce() == 0
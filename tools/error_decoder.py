@@ -0,0 +1,52 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from eth_abi import decode
+from eth_utils import function_abi_to_4byte_selector
+from hexbytes import HexBytes
+
+# contracts/utils/Errors.sol のカスタムエラー
+IBET_ERROR_ABI = {
+    "type": "error",
+    "name": "IbetError",
+    "inputs": [{"internalType": "uint256", "name": "code", "type": "uint256"}],
+}
+IBET_ERROR_SELECTOR = function_abi_to_4byte_selector(IBET_ERROR_ABI)
+
+# Error(string)：カスタムエラーへの移行前にデプロイされたコントラクトのrevert
+ERROR_STRING_SELECTOR = bytes.fromhex("08c379a0")
+
+
+def decode_error_code(data: bytes | str) -> str | None:
+    """revertデータからエラーコード（docs/Errors.md）を取得する
+
+    - IbetError(uint256): エラーコードを文字列（例："110401"）で返す
+    - Error(string): revert理由の文字列をそのまま返す
+    - それ以外（Panic、空のrevert等）: None
+
+    :param data: revertデータ（bytesまたは16進数文字列）
+    :return: エラーコード
+    """
+    data = bytes(HexBytes(data))
+    selector, payload = data[:4], data[4:]
+    if selector == IBET_ERROR_SELECTOR:
+        return str(decode(["uint256"], payload)[0])
+    if selector == ERROR_STRING_SELECTOR:
+        return decode(["string"], payload)[0]
+    return None
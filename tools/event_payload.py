@@ -0,0 +1,152 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+import os
+from dataclasses import dataclass
+
+from eth_utils import keccak, to_checksum_address
+from web3 import Web3
+
+# E2EMessagingLite / FreezeLogLite はテキストのハッシュ値のみをストレージに保存し、
+# テキスト本文はイベントで記録する。
+# ストレージに記録されたブロック番号のログからテキストを取得し、ハッシュ値で検証する。
+
+
+class PayloadMismatchError(Exception):
+    """イベントのテキストがストレージのハッシュ値と一致しない"""
+
+
+@dataclass(frozen=True)
+class Message:
+    """E2EMessagingLite のメッセージ"""
+
+    index: int
+    sender: str
+    text: str | None  # 削除済みの場合は None
+    time: int
+
+
+@dataclass(frozen=True)
+class FrozenLog:
+    """FreezeLogLite のログ"""
+
+    index: int
+    log: str
+    created_block_number: int
+    freezing_grace_block_count: int
+
+
+class PayloadReader:
+    """イベントからメッセージ・ログのテキストを取得する"""
+
+    def __init__(self, web3: Web3, abi_dir: str = "output"):
+        self.web3 = web3
+        self.abi_dir = abi_dir
+
+    def contract(self, name: str, address: str):
+        with open(os.path.join(self.abi_dir, f"{name}.json"), "r") as f:
+            abi = json.load(f)["abi"]
+        return self.web3.eth.contract(address=to_checksum_address(address), abi=abi)
+
+    def get_messages(
+        self, address: str, who: str, from_index: int = 0, to_index: int | None = None
+    ) -> list[Message]:
+        """受信者のメッセージを取得する
+
+        メッセージのメタデータは getMessages の1回の呼び出しで取得し、
+        テキストはメッセージが記録されたブロック範囲のログから取得する。
+
+        :param address: E2EMessagingLite のアドレス
+        :param who: 受信者のアドレス
+        :param from_index: 最初のメッセージのインデックス
+        :param to_index: 最後のメッセージの次のインデックス（省略時は最新まで）
+        """
+        contract = self.contract("E2EMessagingLite", address)
+        who = to_checksum_address(who)
+        if to_index is None:
+            to_index = contract.functions.lastIndex(who).call()
+        senders, text_hashes, times, block_numbers = contract.functions.getMessages(
+            who, from_index, to_index
+        ).call()
+        if len(senders) == 0:
+            return []
+
+        texts = {}
+        for event in contract.events.Message.get_logs(
+            fromBlock=min(block_numbers),
+            toBlock=max(block_numbers),
+            argument_filters={"receiver": who},
+        ):
+            texts[event["args"]["index"]] = event["args"]["text"]
+
+        messages = []
+        for i, (sender, text_hash, time) in enumerate(zip(senders, text_hashes, times)):
+            index = from_index + i
+            if text_hash == bytes(32):
+                # 削除済み
+                text = None
+            else:
+                text = texts.get(index)
+                verify(text, text_hash, f"message {index}")
+            messages.append(Message(index=index, sender=sender, text=text, time=time))
+        return messages
+
+    def get_log(self, address: str, recorder: str, index: int) -> FrozenLog:
+        """ログを取得する
+
+        ログのテキストは最後に記録・更新されたブロックのイベントから取得する。
+
+        :param address: FreezeLogLite のアドレス
+        :param recorder: 記録者のアドレス
+        :param index: ログのインデックス
+        """
+        contract = self.contract("FreezeLogLite", address)
+        recorder = to_checksum_address(recorder)
+        created, grace, log_hash, updated = contract.functions.getLog(
+            recorder, index
+        ).call()
+        if created == 0:
+            raise ValueError(f"log {index} of {recorder} does not exist")
+
+        text = None
+        for event_type in (contract.events.Recorded, contract.events.Updated):
+            for event in event_type.get_logs(
+                fromBlock=updated,
+                toBlock=updated,
+                argument_filters={"recorder": recorder},
+            ):
+                if event["args"]["index"] == index:
+                    # 同じブロックで複数回更新された場合は最後のイベントが有効
+                    text = event["args"]["log"]
+        verify(text, log_hash, f"log {index}")
+        return FrozenLog(
+            index=index,
+            log=text,
+            created_block_number=created,
+            freezing_grace_block_count=grace,
+        )
+
+
+def verify(text: str | None, text_hash: bytes, name: str):
+    """テキストがストレージのハッシュ値と一致することを確認する"""
+    if text is None:
+        raise PayloadMismatchError(f"{name}: event not found")
+    if keccak(text=text) != bytes(text_hash):
+        raise PayloadMismatchError(f"{name}: hash mismatch")
@@ -17,32 +17,167 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 
+import argparse
+import hashlib
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+
+# 入力ディレクトリと出力する項目
+SOURCES = {
+    "build/contracts": ("abi", "bytecode", "deployedBytecode"),
+    "build/interfaces": ("abi",),
+}
+OUTPUT_DIR = "output"
+
+# 前回出力時の入力ファイルのハッシュ値
+# NOTE: output/*.json のABIを読み込むツールと区別するためドットファイルとする
+MANIFEST_PATH = os.path.join(OUTPUT_DIR, ".manifest.json")
 
 
 def main():
-    # Contract
-    _path = "build/contracts"
-    file_list = os.listdir(_path)
-    for file in file_list:
-        if os.path.isfile(os.path.join(_path, file)):
-            contract_json = json.load(open(f"build/contracts/{file}", "r"))
-            output = {
-                "abi": contract_json["abi"],
-                "bytecode": contract_json["bytecode"],
-                "deployedBytecode": contract_json["deployedBytecode"],
-            }
-            with open(f"output/{file}", "w") as f:
-                json.dump(output, f, indent=2)
-
-    # Interface
-    file_list = os.listdir("build/interfaces")
-    for file in file_list:
-        contract_json = json.load(open(f"build/interfaces/{file}", "r"))
-        output = {"abi": contract_json["abi"]}
-        with open(f"output/{file}", "w") as f:
-            json.dump(output, f, indent=2)
+    parser = argparse.ArgumentParser(
+        description="Export ABIs and bytecodes from build/ to output/"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Export all artifacts even if unchanged"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Number of worker processes"
+    )
+    parser.add_argument(
+        "--bundle",
+        default=None,
+        help="Path to write a combined ABI bundle with selector/topic indexes",
+    )
+    args = parser.parse_args()
+
+    # NOTE: --force の場合も、前回の出力の削除には前回のマニフェストを利用する
+    previous_manifest = load_manifest()
+    manifest = {} if args.force else previous_manifest
+
+    # 出力先ごとの入力ファイル
+    # NOTE: 同名のファイルは後の入力ディレクトリ（build/interfaces）の内容で出力する
+    outputs = {}
+    for source_dir, keys in SOURCES.items():
+        for file in sorted(os.listdir(source_dir)):
+            path = os.path.join(source_dir, file)
+            if not os.path.isfile(path):
+                continue
+            output_path = os.path.join(OUTPUT_DIR, file)
+            if output_path in outputs:
+                print(f"warning: {outputs[output_path][0]} is overridden by {path}")
+            outputs[output_path] = (path, keys)
+
+    # 入力ファイルのハッシュ値を比較し、変更されたファイルのみを出力する
+    # NOTE: マニフェストは入力ファイルのパスをキーとする
+    tasks, hashes = [], {}
+    for output_path, (path, keys) in outputs.items():
+        hashes[path] = file_hash(path)
+        if manifest.get(path) == hashes[path] and os.path.exists(output_path):
+            continue
+        tasks.append((path, output_path, keys))
+
+    if tasks:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            futures = [executor.submit(export_artifact, *task) for task in tasks]
+            for future in futures:
+                future.result()
+
+    # 入力ファイルが無くなった出力を削除する
+    pruned = prune_outputs(previous_manifest, set(outputs))
+
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(hashes, f, indent=2, sort_keys=True)
+    print(
+        f"exported {len(tasks)} artifacts ({len(hashes) - len(tasks)} unchanged, "
+        f"{len(pruned)} removed)"
+    )
+
+    if args.bundle is not None:
+        write_bundle(args.bundle, sorted(os.path.basename(path) for path in outputs))
+
+
+def load_manifest() -> dict:
+    if not os.path.exists(MANIFEST_PATH):
+        return {}
+    with open(MANIFEST_PATH, "r") as f:
+        return json.load(f)
+
+
+def file_hash(path: str) -> str:
+    """ファイル全体を読み込まずにSHA-256を計算する"""
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def prune_outputs(manifest: dict, outputs: set[str]) -> list[str]:
+    """前回出力したファイルのうち、今回の出力対象に含まれないものを削除する"""
+    pruned = []
+    for path in sorted(manifest):
+        output_path = os.path.join(OUTPUT_DIR, os.path.basename(path))
+        if output_path in outputs or not os.path.exists(output_path):
+            continue
+        os.remove(output_path)
+        pruned.append(output_path)
+    return pruned
+
+
+def export_artifact(path: str, output_path: str, keys: tuple):
+    """ビルド成果物から必要な項目のみを出力する"""
+    with open(path, "r") as f:
+        artifact = json.load(f)
+    output = json.dumps({key: artifact[key] for key in keys}, indent=2)
+
+    # 内容が変わらない場合は書き込まない
+    if os.path.exists(output_path):
+        with open(output_path, "r") as f:
+            if f.read() == output:
+                return
+    with open(output_path, "w") as f:
+        f.write(output)
+
+
+def write_bundle(bundle_path: str, files: list[str]):
+    """全コントラクトのABIとセレクタ・トピックの索引を1ファイルに出力する
+
+    - contracts: コントラクト名 => ABI
+    - selectors: 関数セレクタ => [{"contract", "signature"}]
+    - topics: イベントトピック => [{"contract", "signature"}]
+    """
+    from eth_utils import (
+        event_abi_to_log_topic,
+        function_abi_to_4byte_selector,
+        to_hex,
+    )
+    from eth_utils.abi import collapse_if_tuple
+
+    bundle = {"contracts": {}, "selectors": {}, "topics": {}}
+    for file in files:
+        contract = file[: -len(".json")]
+        with open(os.path.join(OUTPUT_DIR, file), "r") as f:
+            abi = json.load(f)["abi"]
+        bundle["contracts"][contract] = abi
+
+        for item in abi:
+            if item.get("type") == "function":
+                key = to_hex(function_abi_to_4byte_selector(item))
+                index = bundle["selectors"]
+            elif item.get("type") == "event" and not item.get("anonymous"):
+                key = to_hex(event_abi_to_log_topic(item))
+                index = bundle["topics"]
+            else:
+                continue
+            types = ",".join(collapse_if_tuple(i) for i in item.get("inputs", []))
+            index.setdefault(key, []).append(
+                {"contract": contract, "signature": f"{item['name']}({types})"}
+            )
+
+    with open(bundle_path, "w") as f:
+        json.dump(bundle, f, separators=(",", ":"), sort_keys=True)
 
 
 if __name__ == "__main__":
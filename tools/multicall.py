@@ -0,0 +1,227 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Any
+
+from eth_abi import decode, encode
+from eth_abi.grammar import ABIType, TupleType, parse
+from eth_utils import function_abi_to_4byte_selector, to_checksum_address
+from eth_utils.abi import collapse_if_tuple
+from web3 import Web3
+from web3.exceptions import ContractLogicError
+
+# hardhat.config.js の blockGasLimit
+BLOCK_GAS_LIMIT = 16777216
+
+# トランザクションの基本ガス量
+BASE_GAS = 21000
+
+# 1件の呼び出しで消費するガス量の見積もり（Call.gas で個別に指定できる）
+DEFAULT_CALL_GAS = 100000
+
+# Multicallが1件の呼び出しごとに消費するガス量（staticcall、戻り値のコピー等）
+CALL_OVERHEAD_GAS = 5000
+
+# 呼び出しデータ1バイトあたりのガス量
+CALLDATA_GAS_PER_BYTE = 16
+
+
+@dataclass(frozen=True)
+class Call:
+    """参照系関数の呼び出し
+
+    - contract: output/ のABIファイル名（例："IbetShare"）
+    - address: コントラクトアドレス
+    - function: 関数名
+    - args: 関数の引数
+    - gas: 呼び出しで消費するガス量の見積もり（Multicallで呼び出しに割り当てるガス量）
+    """
+
+    contract: str
+    address: str
+    function: str
+    args: tuple = ()
+    gas: int = DEFAULT_CALL_GAS
+
+
+@dataclass(frozen=True)
+class CallResult:
+    """呼び出し結果（失敗した場合、valueはリバートデータ）"""
+
+    success: bool
+    value: Any
+
+
+class MulticallClient:
+    """複数の参照系関数の呼び出しをMulticallコントラクトで一括実行する
+
+    呼び出しはブロックガスリミットを超えないように分割し、分割ごとに1回のeth_callで実行する。
+    ガス量の見積もりを超えて失敗した場合は、分割数を増やして再実行する。
+    各呼び出しには見積もりのガス量を割り当てるため、1件のガス不足は他の呼び出しに影響しない。
+    戻り値の無い失敗（ガス不足の可能性がある）は、ガス量を制限せずに1件ずつ再実行する。
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        address: str,
+        abi_dir: str = "output",
+        gas_limit: int = BLOCK_GAS_LIMIT,
+    ):
+        self.web3 = web3
+        self.abi_dir = abi_dir
+        self.gas_limit = gas_limit
+        self.multicall = web3.eth.contract(
+            address=to_checksum_address(address), abi=self.load_abi("Multicall")
+        )
+        self._abis: dict[str, list] = {}
+        self._functions: dict[tuple, dict] = {}
+
+    def load_abi(self, contract: str) -> list:
+        """tools/json_filter.py が出力したABIを読み込む"""
+        with open(os.path.join(self.abi_dir, f"{contract}.json"), "r") as f:
+            return json.load(f)["abi"]
+
+    def call(
+        self, calls: list[Call], block_identifier: str | int = "latest"
+    ) -> list[CallResult]:
+        """呼び出しを一括実行する
+
+        :param calls: 呼び出しのリスト
+        :param block_identifier: 実行するブロック
+        :return: 呼び出し結果のリスト（callsと同じ順序）
+        """
+        encoded = [(call, self.encode(call)) for call in calls]
+        results = []
+        for chunk in self.chunk(encoded):
+            results.extend(self.execute(chunk, block_identifier))
+        return results
+
+    def chunk(self, encoded: list[tuple[Call, bytes]]) -> list[list]:
+        """ブロックガスリミットを超えないように呼び出しを分割する"""
+        chunks, current, gas = [], [], BASE_GAS
+        for call, data in encoded:
+            cost = estimate_gas(call, data)
+            if len(current) > 0 and gas + cost > self.gas_limit:
+                chunks.append(current)
+                current, gas = [], BASE_GAS
+            current.append((call, data))
+            gas += cost
+        if len(current) > 0:
+            chunks.append(current)
+        return chunks
+
+    def execute(
+        self, chunk: list[tuple[Call, bytes]], block_identifier: str | int
+    ) -> list[CallResult]:
+        calls = [
+            (to_checksum_address(call.address), data, call.gas) for call, data in chunk
+        ]
+        try:
+            _, results = self.multicall.functions.tryAggregate(False, calls).call(
+                {"gas": self.gas_limit}, block_identifier=block_identifier
+            )
+        except (ValueError, ContractLogicError):
+            # ガス量の見積もりを超えた場合は分割して再実行する
+            if len(chunk) == 1:
+                raise
+            middle = len(chunk) // 2
+            return self.execute(chunk[:middle], block_identifier) + self.execute(
+                chunk[middle:], block_identifier
+            )
+
+        return [
+            self.result(call, success, data)
+            if success or len(data) > 0
+            else self.retry(call, encoded, block_identifier)
+            for (call, encoded), (success, data) in zip(chunk, results)
+        ]
+
+    def retry(
+        self, call: Call, encoded: bytes, block_identifier: str | int
+    ) -> CallResult:
+        """ガス量を制限せずに1件の呼び出しを再実行する"""
+        target = to_checksum_address(call.address)
+        _, results = self.multicall.functions.tryAggregate(
+            False, [(target, encoded, 0)]
+        ).call({"gas": self.gas_limit}, block_identifier=block_identifier)
+        success, data = results[0]
+        return self.result(call, success, data)
+
+    def result(self, call: Call, success: bool, data: bytes) -> CallResult:
+        if success:
+            return CallResult(success=True, value=self.decode(call, data))
+        return CallResult(success=False, value=data)
+
+    def function_abi(self, call: Call) -> dict:
+        key = (call.contract, call.function, len(call.args))
+        if key not in self._functions:
+            if call.contract not in self._abis:
+                self._abis[call.contract] = self.load_abi(call.contract)
+            self._functions[key] = next(
+                item
+                for item in self._abis[call.contract]
+                if item.get("type") == "function"
+                and item["name"] == call.function
+                and len(item["inputs"]) == len(call.args)
+            )
+        return self._functions[key]
+
+    def encode(self, call: Call) -> bytes:
+        abi = self.function_abi(call)
+        types = [collapse_if_tuple(i) for i in abi["inputs"]]
+        return function_abi_to_4byte_selector(abi) + encode(types, call.args)
+
+    def decode(self, call: Call, data: bytes) -> Any:
+        """戻り値をデコードする（戻り値が1つの場合はその値を返す）"""
+        abi = self.function_abi(call)
+        types = [collapse_if_tuple(o) for o in abi["outputs"]]
+        values = [
+            normalize(parse(t), value) for t, value in zip(types, decode(types, data))
+        ]
+        return values[0] if len(values) == 1 else tuple(values)
+
+
+def normalize(abi_type: ABIType, value: Any) -> Any:
+    """デコードした値のアドレスをチェックサム付きアドレスに変換する
+
+    web3.pyのコントラクト呼び出しと同じく、配列はlist、タプルはtupleで返す。
+    """
+    if abi_type.is_array:
+        return [normalize(abi_type.item_type, item) for item in value]
+    if isinstance(abi_type, TupleType):
+        return tuple(
+            normalize(component, item)
+            for component, item in zip(abi_type.components, value)
+        )
+    if abi_type.base == "address":
+        return to_checksum_address(value)
+    return value
+
+
+def estimate_gas(call: Call, data: bytes) -> int:
+    """1件の呼び出しで消費するガス量を見積もる
+
+    呼び出しデータはアドレス・オフセット・長さ（4ワード）と共に32バイト単位でエンコードされる。
+    """
+    calldata_size = (len(data) + 31) // 32 * 32 + 4 * 32
+    return call.gas + CALL_OVERHEAD_GAS + calldata_size * CALLDATA_GAS_PER_BYTE